@@ -7,6 +7,7 @@ from passlib.context import CryptContext
 
 # Database imports
 from podcast_outreach.database.queries import people as people_queries
+from podcast_outreach.database.connection import workload_scope, WORKLOAD_ANALYTICS
 # from podcast_outreach.database.connection import get_db_pool # Only if not using lifespan for DB init
 
 logger = logging.getLogger(__name__)
@@ -128,4 +129,12 @@ def get_staff_user(request: Request) -> Dict[str, Any]:
     if user.get("role") not in ["staff", "admin"]:
         logger.warning(f"User '{user.get('username')}' with role '{user.get('role')}' attempted staff/admin access.")
         raise HTTPException(status_code=403, detail="Staff or Admin privileges required")
-    return user
\ No newline at end of file
+    return user
+
+async def analytics_workload():
+    """
+    Dependency routing the request's queries to the analytics pool, so
+    reporting scans do not compete with interactive requests for connections.
+    """
+    with workload_scope(WORKLOAD_ANALYTICS):
+        yield
\ No newline at end of file
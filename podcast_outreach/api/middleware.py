@@ -7,6 +7,7 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import RedirectResponse
 
 from podcast_outreach.logging_config import get_logger
+from podcast_outreach.database.loaders import loader_scope
 
 logger = get_logger(__name__)
 
@@ -88,4 +89,17 @@ class AuthMiddleware(BaseHTTPMiddleware):
         # The dependencies in routers are the primary gatekeepers for roles.
 
         logger.debug(f"Path {path} is not public. Proceeding to next handler/endpoint dependencies.")
-        return await call_next(request)
\ No newline at end of file
+        return await call_next(request)
+
+class LoaderScopeMiddleware:
+    """Gives every HTTP request its own batch loaders (see database.loaders)."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        with loader_scope():
+            await self.app(scope, receive, send)
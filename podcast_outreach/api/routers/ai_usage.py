@@ -10,12 +10,12 @@ from datetime import datetime, date
 from podcast_outreach.services.ai.tracker import tracker as ai_tracker
 
 # Import dependencies for authentication
-from api.dependencies import get_admin_user
+from api.dependencies import get_admin_user, analytics_workload
 
 import logging
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/ai-usage", tags=["AI Usage & Cost"])
+router = APIRouter(prefix="/ai-usage", tags=["AI Usage & Cost"], dependencies=[Depends(analytics_workload)])
 
 # Initialize Jinja2Templates for HTML rendering (if this router serves HTML)
 # Assuming templates are relative to the project root, or configured in main.py and passed.
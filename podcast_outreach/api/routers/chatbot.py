@@ -1,8 +1,9 @@
 # podcast_outreach/api/routers/chatbot.py
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, UUID4
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, AsyncIterator
 import json
 import logging
 
@@ -68,6 +69,13 @@ class ConversationHistoryItem(BaseModel):
     started_at: Optional[str]
     completed_at: Optional[str]
 
+class ConversationMessagesPage(BaseModel):
+    conversation_id: str
+    messages: List[Dict[str, Any]]
+    message_count: int
+    has_more: bool
+    next_before_seq: Optional[int] = None
+
 # Initialize conversation engine as singleton
 conversation_engine = None
 
@@ -171,6 +179,70 @@ async def send_chatbot_message(
             detail=f"Failed to process message: {str(e)}"
         )
 
+def _sse_event(event: str, data: Dict[str, Any]) -> str:
+    """Format one Server-Sent Events frame"""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+@router.post("/message/stream",
+             summary="Send Chatbot Message (streaming)",
+             description="Process a user message and stream progress over Server-Sent Events. "
+                         "Emits 'stage' per processing step, 'message' with the bot reply as soon as "
+                         "it is ready, then 'done' with the full ChatbotMessageResponse once "
+                         "enrichment and saving have finished ('error' on failure).")
+async def stream_chatbot_message(
+    campaign_id: UUID4,
+    body: ChatbotMessageRequest,
+    request: Request,
+    user: Dict[str, Any] = Depends(get_current_user)
+):
+    """Process a user message and stream the bot response as it is produced"""
+    # Verify user owns this conversation before the stream starts
+    conv = await conv_queries.get_conversation_by_id(body.conversation_id)
+    if not conv:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Conversation not found"
+        )
+    
+    if conv['person_id'] != user.get("person_id"):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied"
+        )
+    
+    if str(conv['campaign_id']) != str(campaign_id):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Campaign ID mismatch"
+        )
+    
+    engine = get_conversation_engine()
+    
+    async def event_stream() -> AsyncIterator[str]:
+        try:
+            async for event in engine.process_message_stream(
+                str(body.conversation_id),
+                body.message,
+                defer_enrichment=True
+            ):
+                if event['type'] == 'stage':
+                    yield _sse_event("stage", {"stage": event['node']})
+                elif event['type'] == 'response':
+                    # A revised message replaces the previous one (sent once deferred enrichment finishes)
+                    yield _sse_event("message", {"bot_message": event['text'], "revised": event.get('revised', False)})
+                elif event['type'] == 'complete':
+                    yield _sse_event("done", ChatbotMessageResponse(**event['response']).model_dump())
+        except Exception as e:
+            # Headers are already sent, so errors are reported in-band
+            logger.exception(f"Error streaming chatbot message: {e}")
+            yield _sse_event("error", {"detail": f"Failed to process message: {str(e)}"})
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @router.get("/summary", response_model=ConversationSummaryResponse,
             summary="Get Conversation Summary",
             description="Get summary of extracted data from conversation")
@@ -199,7 +271,6 @@ async def get_conversation_summary(
         
         # Parse extracted data
         extracted_data = json.loads(conv_summary['extracted_data'])
-        messages = json.loads(conv_summary['messages'])
         
         # Get keyword counts by type
         keywords_summary = {}
@@ -212,7 +283,7 @@ async def get_conversation_summary(
             status=conv_summary['status'],
             progress=conv_summary['progress'],
             phase=conv_summary['conversation_phase'],
-            messages_count=len(messages),
+            messages_count=conv_summary['message_count'],
             keywords_summary=keywords_summary,
             stories_count=len(extracted_data.get('stories', [])),
             achievements_count=len(extracted_data.get('achievements', [])),
@@ -230,6 +301,61 @@ async def get_conversation_summary(
             detail=f"Failed to get summary: {str(e)}"
         )
 
+@router.get("/messages", response_model=ConversationMessagesPage,
+            summary="Get Conversation Messages",
+            description="Page backwards through a conversation's messages, newest page first")
+async def get_conversation_messages(
+    campaign_id: UUID4,
+    conversation_id: UUID4,
+    request: Request,
+    limit: int = Query(50, ge=1, le=200, description="Number of messages to return"),
+    before_seq: Optional[int] = Query(None, ge=0, description="Return messages older than this sequence number"),
+    user: Dict[str, Any] = Depends(get_current_user)
+):
+    """Get a page of conversation messages in chronological order"""
+    try:
+        conv = await conv_queries.get_conversation_by_id(conversation_id)
+        if not conv:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Conversation not found"
+            )
+        
+        if user.get("role") == "client" and conv['person_id'] != user.get("person_id"):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Access denied"
+            )
+        
+        if str(conv['campaign_id']) != str(campaign_id):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Campaign ID mismatch"
+            )
+        
+        messages = await conv_queries.get_conversation_messages(
+            conversation_id, limit=limit, before_seq=before_seq
+        )
+        oldest_seq = messages[0]['seq'] if messages else None
+        has_more = oldest_seq is not None and oldest_seq > 0
+        
+        return ConversationMessagesPage(
+            conversation_id=str(conversation_id),
+            messages=messages,
+            message_count=conv['message_count'],
+            has_more=has_more,
+            next_before_seq=oldest_seq if has_more else None
+        )
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception(f"Error getting conversation messages: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to get messages: {str(e)}"
+        )
+
 @router.post("/complete", 
              summary="Complete Chatbot Session",
              description="Complete the chatbot session and trigger processing")
@@ -389,7 +515,7 @@ async def resume_conversation(
         
         # If conversation is already active, just return it
         if conv['status'] == 'active':
-            messages = json.loads(conv['messages'])
+            messages = await conv_queries.get_conversation_messages(conv['conversation_id'])
             last_bot_message = None
             for msg in reversed(messages):
                 if msg['type'] == 'bot':
@@ -424,7 +550,7 @@ async def resume_conversation(
             )
         
         # Get last bot message
-        messages = json.loads(conv['messages'])
+        messages = await conv_queries.get_conversation_messages(conv['conversation_id'])
         last_bot_message = None
         for msg in reversed(messages):
             if msg['type'] == 'bot':
@@ -526,7 +652,7 @@ async def get_latest_conversation(
             }
         
         # Get last bot message
-        messages = json.loads(conv['messages'])
+        messages = await conv_queries.get_conversation_messages(conv['conversation_id'])
         last_bot_message = None
         for msg in reversed(messages):
             if msg['type'] == 'bot':
@@ -583,7 +709,7 @@ async def get_latest_completed_conversation(
                 }
         
         # Parse the conversation data
-        messages = json.loads(conv.get('messages', '[]'))
+        messages = await conv_queries.get_conversation_messages(conv['conversation_id'])
         extracted_data = json.loads(conv.get('extracted_data', '{}'))
         
         # Get conversation summary if available
@@ -5,7 +5,7 @@ from typing import List, Optional, Dict, Any
 from datetime import datetime, timezone # ENSURED THIS IS PRESENT
 import asyncio # For concurrent API calls
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, status, Query
 
 from podcast_outreach.api.dependencies import get_current_user
 from podcast_outreach.api.dependencies_email_verification import get_verified_user
@@ -200,7 +200,6 @@ async def client_discover_podcast_previews(campaign_id: uuid.UUID, current_user:
              summary="Start full discovery with enrichment and vetting")
 async def client_discover_podcasts(
     campaign_id: uuid.UUID,
-    background_tasks: BackgroundTasks,
     max_matches: int = Query(50, ge=1, le=100, description="Maximum matches to discover"),
     current_user: dict = Depends(get_current_user)
 ):
@@ -252,15 +251,14 @@ async def client_discover_podcasts(
     from podcast_outreach.config_modules.discovery_config import get_max_discoveries_for_plan
     max_discoveries = get_max_discoveries_for_plan(profile.get('plan_type', 'free'))
     
-    # Run the enhanced discovery pipeline in the background
+    # Run the enhanced discovery pipeline as a background task (on a worker process when this instance only serves the API)
+    from podcast_outreach.services.tasks.manager import task_manager
+    
     logger.info(f"Starting client discovery for campaign {campaign_id} (person_id: {person_id}, max_matches: {max_matches})")
-    background_tasks.add_task(
-        _run_client_discovery_pipeline,
-        campaign_id,
-        person_id,
-        max_matches,
-        max_discoveries
-    )
+    task_id = task_manager.new_task_id(f"client_discovery_{campaign_id}")
+    await task_manager.submit(task_id, "client_campaign_discovery", "run_client_campaign_discovery",
+                              campaign_id=str(campaign_id), person_id=person_id,
+                              max_matches=max_matches, max_discoveries=max_discoveries)
     
     # Return immediately with tracking information
     return schemas.DiscoveryStartResponse(
@@ -271,136 +269,6 @@ async def client_discover_podcasts(
         max_matches=max_matches
     )
 
-# Background task for client discovery
-async def _run_client_discovery_pipeline(
-    campaign_id: uuid.UUID,
-    person_id: int,
-    max_matches: int,
-    max_discoveries: int
-):
-    """
-    Client version of the enhanced discovery pipeline.
-    Includes match limit checking and client-specific notifications.
-    """
-    from podcast_outreach.services.events.notification_service import get_notification_service
-    from podcast_outreach.services.business_logic.enhanced_discovery_workflow import EnhancedDiscoveryWorkflow
-    from podcast_outreach.services.enrichment.discovery import DiscoveryService
-    
-    notification_service = get_notification_service()
-    campaign_id_str = str(campaign_id)
-    
-    try:
-        logger.info(f"Starting client discovery pipeline for campaign {campaign_id} (person_id: {person_id})")
-        
-        # Send pipeline started notification
-        await notification_service.send_client_event(
-            person_id,
-            "client.discovery.started",
-            {
-                "campaign_id": campaign_id_str,
-                "max_matches": max_matches,
-                "estimated_completion": 5
-            }
-        )
-        
-        # Step 1: Run discovery to find podcasts (unlimited discoveries)
-        service = DiscoveryService()
-        discovery_results = await service.discover_for_campaign(
-            str(campaign_id), 
-            max_matches=max_discoveries,  # Discover more than we might match
-            is_client=True,
-            person_id=person_id
-        )
-        
-        logger.info(f"Discovery completed for campaign {campaign_id}: {len(discovery_results)} new media found")
-        
-        # Initialize enhanced workflow
-        enhanced_workflow = EnhancedDiscoveryWorkflow()
-        
-        # Step 2: Process discoveries through enrichment and vetting
-        processed_count = 0
-        matches_created = 0
-        limit_reached = False
-        
-        for media_id, discovery_keyword in discovery_results:
-            try:
-                if media_id:
-                    # Send progress notification
-                    await notification_service.send_client_event(
-                        person_id,
-                        "client.enrichment.progress",
-                        {
-                            "campaign_id": campaign_id_str,
-                            "completed": processed_count,
-                            "total": len(discovery_results),
-                            "matches_created": matches_created,
-                            "in_progress": 1
-                        }
-                    )
-                    
-                    # Run the enhanced pipeline with client tracking
-                    pipeline_result = await enhanced_workflow.process_discovery(
-                        campaign_id=campaign_id,
-                        media_id=media_id,
-                        discovery_keyword=discovery_keyword,
-                        is_client=True,
-                        person_id=person_id
-                    )
-                    
-                    processed_count += 1
-                    
-                    # Check if a match was created
-                    if pipeline_result.get('match_id'):
-                        matches_created += 1
-                    
-                    # Check if limit was reached
-                    if pipeline_result.get('match_limit_reached'):
-                        limit_reached = True
-                        logger.info(f"Match limit reached for person_id {person_id}")
-                        break
-                    
-                    logger.info(f"Client pipeline result for media {media_id}: {pipeline_result['status']}")
-                    
-            except Exception as media_error:
-                logger.error(f"Error processing media {media_id} in client pipeline: {media_error}")
-                processed_count += 1
-                continue
-        
-        # Send completion notification
-        completion_data = {
-            "campaign_id": campaign_id_str,
-            "total_discovered": len(discovery_results),
-            "total_processed": processed_count,
-            "matches_created": matches_created,
-            "limit_reached": limit_reached
-        }
-        
-        if limit_reached:
-            await notification_service.send_client_event(
-                person_id,
-                "client.limit.reached",
-                completion_data
-            )
-        
-        await notification_service.send_client_event(
-            person_id,
-            "client.matches.ready",
-            completion_data
-        )
-        
-        logger.info(f"Client discovery pipeline completed for campaign {campaign_id}: {matches_created} matches created")
-        
-    except Exception as e:
-        logger.error(f"Error in client discovery pipeline for campaign {campaign_id}: {e}")
-        await notification_service.send_client_event(
-            person_id,
-            "client.discovery.failed",
-            {
-                "campaign_id": campaign_id_str,
-                "error": str(e)
-            }
-        )
-
 # --- GET /client/campaigns/{campaign_id}/discovery-status ---
 @router.get("/client/campaigns/{campaign_id}/discovery-status",
             summary="Track discovery progress for a campaign")
@@ -496,11 +364,10 @@ async def toggle_auto_discovery(
     # If enabling, trigger immediate discovery check for this campaign
     if enabled and campaign.get('ideal_podcast_description'):
         from podcast_outreach.services.tasks.manager import task_manager
-        import time
         
-        task_id = f"auto_discovery_toggle_{campaign_id}_{int(time.time())}"
-        task_manager.start_task(task_id, "manual_campaign_auto_discovery")
-        task_manager.run_single_campaign_auto_discovery(task_id, str(campaign_id))
+        task_id = task_manager.new_task_id(f"auto_discovery_toggle_{campaign_id}")
+        await task_manager.submit(task_id, "manual_campaign_auto_discovery",
+                                  "run_single_campaign_auto_discovery", campaign_id=str(campaign_id))
         
         message = "Auto-discovery enabled and discovery process started"
     else:
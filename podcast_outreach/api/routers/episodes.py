@@ -5,6 +5,7 @@ import uuid
 
 from podcast_outreach.api.schemas import episode_schemas # Assuming schemas exist or will be created
 from podcast_outreach.database.queries import episodes as episode_queries
+from podcast_outreach.database.queries import projections
 from podcast_outreach.api.dependencies import get_current_user # Assuming this dependency for auth
 
 logger = logging.getLogger(__name__)
@@ -27,7 +28,8 @@ async def list_episodes_for_media(
         episodes_db = await episode_queries.get_episodes_for_media_paginated(
             media_id=media_id, 
             offset=skip, 
-            limit=limit
+            limit=limit,
+            profile=projections.WITH_TRANSCRIPT # EpisodeInDB includes the transcript
         )
         
         if not episodes_db:
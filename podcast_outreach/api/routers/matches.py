@@ -1,7 +1,7 @@
 # podcast_outreach/api/routers/matches.py
 
 import uuid
-from fastapi import APIRouter, HTTPException, Depends, status, Query, BackgroundTasks
+from fastapi import APIRouter, HTTPException, Depends, status, Query
 from typing import List, Optional, Dict, Any
 import logging
 
@@ -16,7 +16,6 @@ from podcast_outreach.database.queries import media as media_queries # For valid
 from podcast_outreach.database.queries import people as people_queries # For enrichment
 
 # Import services
-from podcast_outreach.services.enrichment.discovery import DiscoveryService
 from podcast_outreach.services.business_logic.discovery_processing import process_discovery_workflow
 from podcast_outreach.database.queries import campaign_media_discoveries as cmd_queries
 
@@ -33,7 +32,6 @@ router = APIRouter(prefix="/match-suggestions", tags=["Match Suggestions"])
              summary="Discover podcasts with automated pipeline")
 async def discover_matches_for_campaign_enhanced(
     campaign_id: uuid.UUID, 
-    background_tasks: BackgroundTasks,
     max_matches: Optional[int] = Query(None, description="Maximum number of new match suggestions to create for this discovery run.", ge=1),
     user: dict = Depends(get_current_user)
 ):
@@ -60,13 +58,14 @@ async def discover_matches_for_campaign_enhanced(
         )
 
     # Start discovery with enhanced automated pipeline
-    service = DiscoveryService()
+    from podcast_outreach.services.tasks.manager import task_manager
     try:
-        # Add the enhanced discovery task to background
-        background_tasks.add_task(
-            _run_enhanced_discovery_pipeline, 
-            campaign_id, 
-            max_matches or 50  # Default max matches
+        # Runs on a worker process when this instance only serves the API
+        task_id = task_manager.new_task_id(f"campaign_discovery_{campaign_id}")
+        await task_manager.submit(
+            task_id, "campaign_discovery", "run_campaign_discovery",
+            campaign_id=str(campaign_id),
+            max_matches=max_matches or 50  # Default max matches
         )
         
         return DiscoveryResponse(
@@ -85,84 +84,6 @@ async def discover_matches_for_campaign_enhanced(
             detail=f"Failed to start discovery pipeline: {str(e)}"
         )
 
-# Background task function for enhanced discovery
-async def _run_enhanced_discovery_pipeline(campaign_id: uuid.UUID, max_matches: int):
-    """
-    Enhanced background task that runs the full automated pipeline:
-    Discovery → Enrichment → Vetting → Match Creation → Review Tasks
-    
-    Now includes real-time notifications for progress tracking.
-    """
-    from podcast_outreach.services.events.notification_service import get_notification_service
-    from podcast_outreach.services.business_logic.enhanced_discovery_workflow import EnhancedDiscoveryWorkflow
-    from podcast_outreach.database.queries import media as media_queries
-    
-    notification_service = get_notification_service()
-    campaign_id_str = str(campaign_id)
-    
-    try:
-        logger.info(f"Starting enhanced discovery pipeline for campaign {campaign_id}")
-        
-        # Send pipeline started notification
-        await notification_service.send_discovery_started(campaign_id_str, estimated_completion=5)
-        
-        # Step 1: Run traditional discovery to find podcasts
-        service = DiscoveryService()
-        discovery_results = await service.discover_for_campaign(str(campaign_id), max_matches)
-        
-        logger.info(f"Discovery completed for campaign {campaign_id}: {len(discovery_results)} new media IDs found")
-        
-        # Initialize enhanced workflow
-        enhanced_workflow = EnhancedDiscoveryWorkflow()
-        
-        # Step 2: Process each discovered podcast through enhanced automated pipeline
-        processed_count = 0
-        reviews_ready = 0
-        
-        # Track each discovered media through campaign_media_discoveries
-        for media_id, discovery_keyword in discovery_results:
-            try:
-                if media_id:
-                    # Send progress notification
-                    await notification_service.send_pipeline_progress(
-                        campaign_id_str, 
-                        completed=processed_count, 
-                        total=len(discovery_results), 
-                        in_progress=1
-                    )
-                    
-                    # Run the enhanced automated pipeline for this discovery
-                    pipeline_result = await enhanced_workflow.process_discovery(
-                        campaign_id=campaign_id,
-                        media_id=media_id,
-                        discovery_keyword=discovery_keyword
-                    )
-                    
-                    processed_count += 1
-                    
-                    # Check if this resulted in a review task
-                    if pipeline_result.get('review_task_id'):
-                        reviews_ready += 1
-                    
-                    logger.info(f"Pipeline result for media {media_id}: {pipeline_result['status']}, steps: {pipeline_result.get('steps_completed', [])}")
-                    
-            except Exception as media_error:
-                logger.error(f"Error processing media {media_id} in pipeline: {media_error}")
-                processed_count += 1
-                continue
-        
-        # Send completion notification
-        await notification_service.send_discovery_completed(
-            campaign_id_str, 
-            total_discovered=len(discovery_results), 
-            reviews_ready=reviews_ready
-        )
-        
-        logger.info(f"Enhanced discovery pipeline completed for campaign {campaign_id}")
-        
-    except Exception as e:
-        logger.error(f"Error in enhanced discovery pipeline for campaign {campaign_id}: {e}")
-
 @router.get("/campaigns/{campaign_id}/discoveries/status",
            response_model=DiscoveryStatusList,
            summary="Track discovery progress")
@@ -130,12 +130,10 @@ async def trigger_single_enrichment(media_id: int, background_tasks: BackgroundT
 
     # Use the new TaskManager for enrichment
     from podcast_outreach.services.tasks.manager import task_manager
-    import time
 
     logger.info(f"Admin user {user['username']} triggered manual enrichment for media_id: {media_id}")
-    task_id = f"enrichment_{media_id}_{int(time.time())}"
-    task_manager.start_task(task_id, f"enrichment_media_{media_id}")
-    task_manager.run_enrichment_pipeline(task_id, media_id=media_id)
+    task_id = task_manager.new_task_id(f"enrichment_{media_id}")
+    await task_manager.submit(task_id, f"enrichment_media_{media_id}", "run_enrichment_pipeline", media_id=media_id)
     
     return {"message": "Enrichment task started in the background.", "media_id": media_id}
 
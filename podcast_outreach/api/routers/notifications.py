@@ -80,20 +80,22 @@ async def websocket_endpoint(
                 message = json.loads(data)
                 
                 # Handle different message types
+                # Replies go through the connection's send queue so they never
+                # interleave with notifications being written by its sender task
                 if message.get("type") == "ping":
-                    await websocket.send_text(json.dumps({"type": "pong", "timestamp": datetime.utcnow().isoformat()}))
+                    await notification_service.websocket_manager.send_to_socket(
+                        websocket, user_id, {"type": "pong", "timestamp": datetime.utcnow().isoformat()}
+                    )
                 elif message.get("type") == "subscribe_campaign":
                     # Allow dynamic campaign subscription
                     new_campaign_id = message.get("campaign_id")
                     if new_campaign_id:
-                        if user_id not in notification_service.websocket_manager.campaign_subscriptions:
-                            notification_service.websocket_manager.campaign_subscriptions[user_id] = set()
-                        notification_service.websocket_manager.campaign_subscriptions[user_id].add(new_campaign_id)
-                        await websocket.send_text(json.dumps({
+                        notification_service.websocket_manager.subscribe(user_id, new_campaign_id)
+                        await notification_service.websocket_manager.send_to_socket(websocket, user_id, {
                             "type": "subscription_confirmed",
                             "campaign_id": new_campaign_id,
                             "timestamp": datetime.utcnow().isoformat()
-                        }))
+                        })
                 
         except WebSocketDisconnect:
             logger.info(f"WebSocket disconnected normally for user {user_id}")
@@ -7,6 +7,7 @@ from datetime import datetime
 
 from podcast_outreach.api.schemas import pitch_template_schemas as schemas # Import new schemas
 from podcast_outreach.database.queries import pitch_templates as queries # Import new queries
+from podcast_outreach.services.ai.template_registry import template_registry
 from podcast_outreach.api.dependencies import get_current_user, get_admin_user, get_staff_user # Assuming these exist
 
 logger = logging.getLogger(__name__)
@@ -86,6 +87,7 @@ async def update_pitch_template(
     # update_data['modified_by'] = current_user.get('username')
 
     updated_template = await queries.update_template(template_id_str, update_data)
+    template_registry.invalidate_pitch_template(template_id_str)
     if not updated_template:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -103,6 +105,7 @@ async def delete_pitch_template(
     # You'd add `Depends(get_admin_user)` here and remove it from router if other endpoints are staff-ok.
     
     deleted = await queries.delete_template(template_id_str)
+    template_registry.invalidate_pitch_template(template_id_str)
     if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, # Or 500 if deletion failed for other reasons
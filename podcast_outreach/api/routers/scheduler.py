@@ -1,12 +1,13 @@
 # podcast_outreach/api/routers/scheduler.py
 
 import logging
-from typing import Dict, Any
-from fastapi import APIRouter, HTTPException, Depends, status
+from typing import Dict, Any, List, Optional
+from fastapi import APIRouter, HTTPException, Depends, Query, status
 from pydantic import BaseModel
 
 from podcast_outreach.services.scheduler.task_scheduler import get_scheduler
 from podcast_outreach.api.dependencies import get_admin_user
+from podcast_outreach.config import RUNS_BACKGROUND_WORK, PROCESS_ROLE
 
 logger = logging.getLogger(__name__)
 
@@ -23,8 +24,25 @@ async def get_scheduler_status(user: dict = Depends(get_admin_user)):
     if not scheduler:
         raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Scheduler not initialized")
     
+    if not scheduler.running:
+        # Runs happen in another process; report what it persisted
+        await scheduler.refresh_states()
     return scheduler.get_task_status()
 
+@router.get("/runs", response_model=List[Dict[str, Any]], summary="Get Scheduled Task Run History")
+async def get_scheduler_runs(
+    task_name: Optional[str] = Query(None, description="Only runs of this task"),
+    limit: int = Query(50, ge=1, le=500),
+    before_run_id: Optional[int] = Query(None, description="Only runs older than this run, for paging"),
+    user: dict = Depends(get_admin_user)
+):
+    """Get recorded runs of scheduled tasks across all instances, newest first."""
+    scheduler = get_scheduler()
+    if not scheduler:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Scheduler not initialized")
+    
+    return await scheduler.get_run_history(task_name, limit, before_run_id)
+
 @router.post("/control", summary="Control Scheduled Tasks")
 async def control_scheduled_task(
     request: TaskControlRequest,
@@ -36,13 +54,14 @@ async def control_scheduled_task(
         raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Scheduler not initialized")
     
     if request.action == "enable":
-        scheduler.enable_task(request.task_name)
-        return {"message": f"Task '{request.task_name}' enabled", "status": "success"}
+        changed = await scheduler.enable_task(request.task_name)
     elif request.action == "disable":
-        scheduler.disable_task(request.task_name)
-        return {"message": f"Task '{request.task_name}' disabled", "status": "success"}
+        changed = await scheduler.disable_task(request.task_name)
     else:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Action must be 'enable' or 'disable'")
+    if not changed:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Scheduled task '{request.task_name}' not found")
+    return {"message": f"Task '{request.task_name}' {request.action}d", "status": "success"}
 
 @router.post("/start", summary="Start Task Scheduler")
 async def start_scheduler(user: dict = Depends(get_admin_user)):
@@ -53,6 +72,10 @@ async def start_scheduler(user: dict = Depends(get_admin_user)):
     
     if scheduler.running:
         return {"message": "Scheduler is already running", "status": "already_running"}
+    if not RUNS_BACKGROUND_WORK:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT,
+                            detail=f"This process only serves the API (PROCESS_ROLE={PROCESS_ROLE}); "
+                                   f"the scheduler runs in worker processes")
     
     await scheduler.start()
     return {"message": "Scheduler started", "status": "started"}
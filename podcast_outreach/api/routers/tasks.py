@@ -7,6 +7,7 @@ from fastapi import APIRouter, HTTPException, Depends, status, Query
 
 # Import the task manager
 from podcast_outreach.services.tasks.manager import task_manager
+from podcast_outreach.database.queries import background_tasks as background_task_queries
 
 # Import dependencies for authentication
 from ..dependencies import get_current_user
@@ -48,59 +49,67 @@ async def trigger_automation_api(
     if action not in valid_actions:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid automation action: {action}")
 
-    task_manager.start_task(task_id, action)
+    # Map the action to its task manager method and arguments
+    params = {}
+    if action == "generate_bio_angles":
+        if not campaign_id:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="'campaign_id' is required for 'generate_bio_angles' action.")
+        method, params = "run_angles_bio_generation", {"campaign_id_str": str(campaign_id)}
     
-    # Route to appropriate task manager method
-    try:
-        if action == "generate_bio_angles":
-            if not campaign_id:
-                task_manager.cleanup_task(task_id)
-                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="'campaign_id' is required for 'generate_bio_angles' action.")
-            task_manager.run_angles_bio_generation(task_id, str(campaign_id))
-        
-        elif action == "fetch_podcast_episodes":
-            task_manager.run_episode_sync(task_id)
-        
-        elif action == "transcribe_podcast":
-            task_manager.run_transcription(task_id)
-        
-        elif action == "enrichment_pipeline":
-            task_manager.run_enrichment_pipeline(task_id)
-        
-        elif action == "pitch_writer":
-            task_manager.run_pitch_generation(task_id)
-        
-        elif action == "send_pitch":
-            task_manager.run_pitch_sending(task_id)
-        
-        elif action == "process_campaign_content":
-            if not campaign_id:
-                task_manager.cleanup_task(task_id)
-                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="'campaign_id' is required for 'process_campaign_content' action.")
-            task_manager.run_campaign_content_processing(task_id, str(campaign_id))
-        
-        elif action == "qualitative_match_assessment":
-            task_manager.run_qualitative_match_assessment(task_id)
-        
-        elif action == "score_potential_matches":
-            if not campaign_id and media_id is None:
-                task_manager.cleanup_task(task_id)
-                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Either 'campaign_id' or 'media_id' is required for 'score_potential_matches' action.")
-            task_manager.run_score_potential_matches(task_id, str(campaign_id) if campaign_id else None, media_id)
-        
-        elif action == "run_vetting_pipeline":
-            task_manager.run_vetting_pipeline(task_id)
-        
-        elif action == "create_matches_for_enriched_media":
-            task_manager.run_create_matches_for_enriched_media(task_id)
-        
-        elif action == "workflow_health_check":
-            task_manager.run_workflow_health_check(task_id)
+    elif action == "fetch_podcast_episodes":
+        method = "run_episode_sync"
+    
+    elif action == "transcribe_podcast":
+        method = "run_transcription"
+    
+    elif action == "enrichment_pipeline":
+        method = "run_enrichment_pipeline"
+    
+    elif action == "pitch_writer":
+        method = "run_pitch_generation"
+    
+    elif action == "send_pitch":
+        method = "run_pitch_sending"
+    
+    elif action == "process_campaign_content":
+        if not campaign_id:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="'campaign_id' is required for 'process_campaign_content' action.")
+        method, params = "run_campaign_content_processing", {"campaign_id_str": str(campaign_id)}
+    
+    elif action == "qualitative_match_assessment":
+        method = "run_qualitative_match_assessment"
+    
+    elif action == "score_potential_matches":
+        if not campaign_id and media_id is None:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Either 'campaign_id' or 'media_id' is required for 'score_potential_matches' action.")
+        method, params = "run_score_potential_matches", {
+            "campaign_id_str": str(campaign_id) if campaign_id else None,
+            "media_id_int": media_id
+        }
+    
+    elif action == "run_vetting_pipeline":
+        method = "run_vetting_pipeline"
     
+    elif action == "create_matches_for_enriched_media":
+        method = "run_create_matches_for_enriched_media"
+    
+    elif action == "workflow_health_check":
+        method = "run_workflow_health_check"
+    
+    # Runs here, or is queued for a worker process when this process only serves the API
+    try:
+        handle = await task_manager.submit(task_id, action, method, **params)
     except Exception as e:
-        task_manager.cleanup_task(task_id)
         logger.error(f"Error starting task {task_id} for action '{action}': {e}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to start task: {str(e)}")
+    
+    if handle is None:
+        logger.info(f"Queued task {task_id} for action '{action}'")
+        return {
+            "message": f"Automation '{action}' queued",
+            "task_id": task_id,
+            "status": "queued"
+        }
     logger.info(f"Started task {task_id} for action '{action}'")
     
     return {
@@ -111,21 +120,33 @@ async def trigger_automation_api(
 
 @router.post("/{task_id}/stop", status_code=status.HTTP_200_OK, summary="Stop a Running Task")
 async def stop_task_api(task_id: str, user: dict = Depends(get_current_user)):
-    """Signals a running background task to stop."""
-    if task_manager.stop_task(task_id):
+    """
+    Signals a background task to stop, on whichever instance runs it. Running
+    tasks stop cooperatively after their current item; queued tasks are cancelled.
+    """
+    if await background_task_queries.cancel_queued_task(task_id):
+        logger.info(f"Queued task {task_id} was cancelled by user {user['username']}")
+        return {"message": f"Task {task_id} was cancelled before it started", "status": "cancelled"}
+    if await task_manager.stop_task(task_id):
         logger.info(f"Task {task_id} is being stopped by user {user['username']}")
         return {"message": f"Task {task_id} is being stopped", "status": "stopping"}
-    raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Task {task_id} not found.")
+    raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Task {task_id} not found or not running.")
 
 @router.get("/{task_id}/status", response_model=Dict[str, Any], summary="Get Task Status")
 async def get_task_status_api(task_id: str, user: dict = Depends(get_current_user)):
-    """Retrieves the current status of a specific background task."""
-    status_info = task_manager.get_task_status(task_id)
+    """Retrieves the status, progress, timings and error of a background task run by any instance."""
+    status_info = await task_manager.get_task_status(task_id)
     if status_info:
         return status_info
     raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Task {task_id} not found.")
 
-@router.get("/", response_model=List[Dict[str, Any]], summary="List All Running Tasks")
-async def list_tasks_api(user: dict = Depends(get_current_user)):
-    """Lists all currently running background tasks."""
-    return list(task_manager.list_tasks().values())
\ No newline at end of file
+@router.get("/", response_model=List[Dict[str, Any]], summary="List Tasks")
+async def list_tasks_api(
+    task_status: Optional[List[str]] = Query(None, alias="status", description="Only tasks in these statuses (queued, running, completed, failed, cancelled); default queued and running"),
+    action: Optional[str] = Query(None, description="Only tasks whose action starts with this"),
+    limit: int = Query(50, ge=1, le=200),
+    before: Optional[str] = Query(None, description="task_id of the last task of the previous page"),
+    user: dict = Depends(get_current_user)
+):
+    """Lists background tasks of all instances, newest first."""
+    return await task_manager.list_tasks(task_status, action, limit, before)
@@ -47,6 +47,7 @@ class ReviewTaskResponse(ReviewTaskBase):
 
 class PaginatedReviewTaskList(BaseModel):
     items: List[ReviewTaskResponse]
-    total: int
+    total: int  # Cached for a short time; may be a planner estimate when unfiltered
     page: int
-    size: int 
\ No newline at end of file
+    size: int
+    next_cursor: Optional[str] = Field(None, description="Pass as `cursor` to fetch the next page; null on the last page") 
\ No newline at end of file
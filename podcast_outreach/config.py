@@ -100,3 +100,127 @@ ORCHESTRATOR_CONFIG = {
 # Transcription configuration
 MAX_EPISODE_DURATION_SEC = int(os.getenv("MAX_EPISODE_DURATION_SEC", "7200"))  # 2 hours default
 TRANSCRIPTION_MEMORY_THRESHOLD = float(os.getenv("TRANSCRIPTION_MEMORY_THRESHOLD", "80.0"))  # 80% default
+
+# Real-time notification delivery
+NOTIFICATION_SEND_QUEUE_SIZE = int(os.getenv("NOTIFICATION_SEND_QUEUE_SIZE", "100"))  # Per-connection pending messages
+NOTIFICATION_SEND_TIMEOUT = float(os.getenv("NOTIFICATION_SEND_TIMEOUT", "5.0"))  # Seconds before a slow socket is dropped
+NOTIFICATION_PG_BRIDGE_ENABLED = os.getenv("NOTIFICATION_PG_BRIDGE_ENABLED", "false").lower() == "true"
+NOTIFICATION_PG_CHANNEL = os.getenv("NOTIFICATION_PG_CHANNEL", "pgl_notifications")
+
+# Agentic chatbot session state cache
+CHATBOT_SESSION_STORE = os.getenv("CHATBOT_SESSION_STORE", "postgres").lower()  # "postgres" or "memory"
+CHATBOT_SESSION_CACHE_SIZE = int(os.getenv("CHATBOT_SESSION_CACHE_SIZE", "200"))  # Max sessions held per process
+CHATBOT_SESSION_CACHE_TTL_SECONDS = int(os.getenv("CHATBOT_SESSION_CACHE_TTL_SECONDS", "1800"))
+CHATBOT_SESSION_RETENTION_HOURS = int(os.getenv("CHATBOT_SESSION_RETENTION_HOURS", str(24 * 7)))  # Stored sessions idle longer than this are pruned
+
+# Embedding batching and cache
+EMBEDDING_BATCH_MAX_INPUTS = int(os.getenv("EMBEDDING_BATCH_MAX_INPUTS", "256"))  # Inputs per embeddings request (API max 2048)
+EMBEDDING_BATCH_MAX_TOKENS = int(os.getenv("EMBEDDING_BATCH_MAX_TOKENS", "250000"))  # Estimated tokens per request (API max 300k)
+EMBEDDING_MAX_INPUT_TOKENS = int(os.getenv("EMBEDDING_MAX_INPUT_TOKENS", "8000"))  # Per-input limit is 8191 tokens
+EMBEDDING_CACHE_ENABLED = os.getenv("EMBEDDING_CACHE_ENABLED", "true").lower() == "true"
+EMBEDDING_BACKFILL_BATCH_SIZE = int(os.getenv("EMBEDDING_BACKFILL_BATCH_SIZE", "200"))  # Episodes per backfill round
+EMBEDDING_BACKFILL_SUMMARY_CONCURRENCY = int(os.getenv("EMBEDDING_BACKFILL_SUMMARY_CONCURRENCY", "5"))  # Transcripts summarized at once per round
+
+# Bulk pitch generation
+PITCH_BATCH_MAX_MATCHES = int(os.getenv("PITCH_BATCH_MAX_MATCHES", "200"))  # Approved matches taken per run
+PITCH_BATCH_CONCURRENCY = int(os.getenv("PITCH_BATCH_CONCURRENCY", "8"))  # Pitches generated at once
+PITCH_BATCH_PER_CAMPAIGN_CONCURRENCY = int(os.getenv("PITCH_BATCH_PER_CAMPAIGN_CONCURRENCY", "2"))  # Cap so one campaign cannot take every slot
+PITCH_BATCH_WRITE_SIZE = int(os.getenv("PITCH_BATCH_WRITE_SIZE", "25"))  # Drafts per bulk insert
+PITCH_BATCH_EPISODES_PER_MEDIA = int(os.getenv("PITCH_BATCH_EPISODES_PER_MEDIA", "50"))  # Newest candidates considered for best-episode selection
+PITCH_BATCH_RETRY_BACKOFF_MINUTES = int(os.getenv("PITCH_BATCH_RETRY_BACKOFF_MINUTES", "30"))  # Wait after a failed attempt, doubled per further failure
+PITCH_BATCH_RETRY_MAX_HOURS = int(os.getenv("PITCH_BATCH_RETRY_MAX_HOURS", "24"))  # Longest wait between attempts for one match
+
+# Local token counting
+TOKEN_COUNT_CACHE_SIZE = int(os.getenv("TOKEN_COUNT_CACHE_SIZE", "4096"))  # Cached counts keyed by text hash
+
+# Review task queue
+REVIEW_TASK_COUNT_CACHE_TTL_SECONDS = int(os.getenv("REVIEW_TASK_COUNT_CACHE_TTL_SECONDS", "30"))  # How long list totals are reused
+REVIEW_TASK_COUNT_ESTIMATE_THRESHOLD = int(os.getenv("REVIEW_TASK_COUNT_ESTIMATE_THRESHOLD", "100000"))  # Unfiltered totals above this use the planner estimate
+
+# Gemini client
+GEMINI_MODEL_CONCURRENCY = int(os.getenv("GEMINI_MODEL_CONCURRENCY", "8"))  # In-flight GeminiService requests per model, per event loop
+GEMINI_CLIENT_CACHE_SIZE = int(os.getenv("GEMINI_CLIENT_CACHE_SIZE", "64"))  # Cached model / structured-output chain instances
+
+# Batched episode analysis
+EPISODE_ANALYSIS_FETCH_SIZE = int(os.getenv("EPISODE_ANALYSIS_FETCH_SIZE", "50"))  # Episodes taken per analysis round
+EPISODE_ANALYSIS_BATCH_TOKEN_BUDGET = int(os.getenv("EPISODE_ANALYSIS_BATCH_TOKEN_BUDGET", "12000"))  # Content tokens packed into one request
+EPISODE_ANALYSIS_BATCH_MAX_EPISODES = int(os.getenv("EPISODE_ANALYSIS_BATCH_MAX_EPISODES", "10"))
+EPISODE_ANALYSIS_SOLO_TOKENS = int(os.getenv("EPISODE_ANALYSIS_SOLO_TOKENS", "4000"))  # Longer content (e.g. transcripts) is analyzed alone
+
+# Transcript reduction before LLM analysis/summarization
+TRANSCRIPT_REDUCTION_TOKEN_BUDGET = int(os.getenv("TRANSCRIPT_REDUCTION_TOKEN_BUDGET", "6000"))  # Tokens of transcript sent to the LLM
+TRANSCRIPT_REDUCTION_SEGMENT_CHARS = int(os.getenv("TRANSCRIPT_REDUCTION_SEGMENT_CHARS", "600"))  # Approximate size of ranked spans
+
+# LLM response cache (opt-in per workflow, "workflow:ttl_seconds" pairs)
+LLM_RESPONSE_CACHE_ENABLED = os.getenv("LLM_RESPONSE_CACHE_ENABLED", "true").lower() == "true"
+LLM_RESPONSE_CACHE_WORKFLOWS = os.getenv(
+    "LLM_RESPONSE_CACHE_WORKFLOWS",
+    "generate_listennotes_genre_ids:2592000,generate_podscan_category_ids:2592000,"
+    "keyword_refinement_podcast:604800,media_kit_keywords:604800,podcast_description_generation:604800"
+)
+LLM_RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("LLM_RESPONSE_CACHE_MAX_ENTRIES", "50000"))
+LLM_RESPONSE_CACHE_PRUNE_INTERVAL_SECONDS = int(os.getenv("LLM_RESPONSE_CACHE_PRUNE_INTERVAL_SECONDS", "3600"))
+
+# Prompt templates
+PROMPT_TEMPLATE_HOT_RELOAD = os.getenv("PROMPT_TEMPLATE_HOT_RELOAD", "true").lower() == "true"  # Recompile prompt files whose mtime changed
+PITCH_TEMPLATE_RECHECK_SECONDS = int(os.getenv("PITCH_TEMPLATE_RECHECK_SECONDS", "30"))  # How long a cached pitch template is trusted before a version check
+
+# Discovery pipeline job queue (enrichment -> AI description -> vetting -> match creation)
+PIPELINE_JOB_QUEUE_ENABLED = os.getenv("PIPELINE_JOB_QUEUE_ENABLED", "true").lower() == "true"  # Replaces the vetting / AI description polling loops
+PIPELINE_ENRICHMENT_WORKERS = int(os.getenv("PIPELINE_ENRICHMENT_WORKERS", "2"))  # Jobs of each stage processed at once in this process
+PIPELINE_AI_DESCRIPTION_WORKERS = int(os.getenv("PIPELINE_AI_DESCRIPTION_WORKERS", "3"))
+PIPELINE_VETTING_WORKERS = int(os.getenv("PIPELINE_VETTING_WORKERS", "3"))
+PIPELINE_MATCH_CREATION_WORKERS = int(os.getenv("PIPELINE_MATCH_CREATION_WORKERS", "2"))
+PIPELINE_ENRICHMENT_VISIBILITY_SECONDS = int(os.getenv("PIPELINE_ENRICHMENT_VISIBILITY_SECONDS", "2700"))  # Enrichment transcribes episodes, so it may take long
+PIPELINE_VISIBILITY_SECONDS = int(os.getenv("PIPELINE_VISIBILITY_SECONDS", "900"))  # Other stages; an unfinished job is retried after this
+PIPELINE_JOB_MAX_ATTEMPTS = int(os.getenv("PIPELINE_JOB_MAX_ATTEMPTS", "3"))
+PIPELINE_RETRY_DELAY_SECONDS = int(os.getenv("PIPELINE_RETRY_DELAY_SECONDS", "60"))  # Doubled on every further attempt
+PIPELINE_POLL_INTERVAL_SECONDS = int(os.getenv("PIPELINE_POLL_INTERVAL_SECONDS", "5"))  # Idle workers check for jobs queued by other processes
+PIPELINE_BACKFILL_INTERVAL_SECONDS = int(os.getenv("PIPELINE_BACKFILL_INTERVAL_SECONDS", "300"))  # Sweep for discoveries waiting without a job
+
+# Host name verification
+HOST_VERIFICATION_BATCH_SIZE = int(os.getenv("HOST_VERIFICATION_BATCH_SIZE", "2000"))  # Media verified per periodic run
+HOST_VERIFICATION_CHUNK_SIZE = int(os.getenv("HOST_VERIFICATION_CHUNK_SIZE", "500"))  # Media loaded and written per query
+HOST_VERIFICATION_EPISODES_PER_MEDIA = int(os.getenv("HOST_VERIFICATION_EPISODES_PER_MEDIA", "10"))  # Latest episodes whose host names are checked
+HOST_NAME_SIMILARITY_CACHE_SIZE = int(os.getenv("HOST_NAME_SIMILARITY_CACHE_SIZE", "100000"))  # Cached name-pair similarity scores
+HOST_NAME_TRIGRAM_THRESHOLD = float(os.getenv("HOST_NAME_TRIGRAM_THRESHOLD", "0"))  # 0.3-1.0 lets host resolution fall back to the closest existing person (needs pg_trgm); 0 = exact normalized names only
+
+# Quality scoring
+QUALITY_SCORE_BATCH_SIZE = int(os.getenv("QUALITY_SCORE_BATCH_SIZE", "500"))  # Stale media re-scored per enrichment cycle (one load, one bulk write)
+QUALITY_SCORE_RECOMPUTE_PAGE_SIZE = int(os.getenv("QUALITY_SCORE_RECOMPUTE_PAGE_SIZE", "5000"))  # Media loaded and written per query when re-scoring the whole catalogue
+
+# Task scheduler (one instance leads via a Postgres advisory lock; state and run history are persisted)
+SCHEDULER_TICK_SECONDS = int(os.getenv("SCHEDULER_TICK_SECONDS", "30"))  # How often due tasks are checked and standby instances retry leadership
+SCHEDULER_JITTER_SECONDS = int(os.getenv("SCHEDULER_JITTER_SECONDS", "120"))  # Max random delay added to each next run (interval tasks: at most 10% of the interval)
+SCHEDULER_RUN_HISTORY_DAYS = int(os.getenv("SCHEDULER_RUN_HISTORY_DAYS", "30"))  # Finished runs older than this are pruned
+
+# Adaptive pipeline scheduling (batch size and run frequency scale with each pipeline's backlog within these bounds)
+PIPELINE_LLM_CALLS_PER_HOUR = int(os.getenv("PIPELINE_LLM_CALLS_PER_HOUR", "0"))  # Estimated LLM calls adaptive pipelines may start per hour; 0 = unlimited
+SCHEDULER_WAKE_DEBOUNCE_SECONDS = int(os.getenv("SCHEDULER_WAKE_DEBOUNCE_SECONDS", "30"))  # Events waking the same pipeline within this window are coalesced
+TRANSCRIPTION_MIN_BATCH_SIZE = int(os.getenv("TRANSCRIPTION_BATCH_SIZE", "1"))  # Episodes per run when idle
+TRANSCRIPTION_MAX_BATCH_SIZE = int(os.getenv("TRANSCRIPTION_MAX_BATCH_SIZE", "5"))  # Episodes are transcribed one after another, so keep this small
+TRANSCRIPTION_MIN_INTERVAL_SECONDS = int(os.getenv("TRANSCRIPTION_MIN_INTERVAL_SECONDS", "300"))  # Interval with a full batch waiting
+TRANSCRIPTION_MAX_INTERVAL_SECONDS = int(os.getenv("TRANSCRIPTION_MAX_INTERVAL_SECONDS", "3600"))  # Interval with nothing waiting
+VETTING_MIN_BATCH_SIZE = int(os.getenv("VETTING_MIN_BATCH_SIZE", "10"))
+VETTING_MAX_BATCH_SIZE = int(os.getenv("VETTING_MAX_BATCH_SIZE", "50"))
+VETTING_MIN_INTERVAL_SECONDS = int(os.getenv("VETTING_MIN_INTERVAL_SECONDS", "120"))
+VETTING_MAX_INTERVAL_SECONDS = int(os.getenv("VETTING_MAX_INTERVAL_SECONDS", "1800"))
+AI_DESCRIPTION_MIN_BATCH_SIZE = int(os.getenv("AI_DESCRIPTION_MIN_BATCH_SIZE", "20"))
+AI_DESCRIPTION_MAX_BATCH_SIZE = int(os.getenv("AI_DESCRIPTION_MAX_BATCH_SIZE", "60"))
+AI_DESCRIPTION_MIN_INTERVAL_SECONDS = int(os.getenv("AI_DESCRIPTION_MIN_INTERVAL_SECONDS", "120"))
+AI_DESCRIPTION_MAX_INTERVAL_SECONDS = int(os.getenv("AI_DESCRIPTION_MAX_INTERVAL_SECONDS", "1800"))
+
+# Process roles: "all" serves the API and runs background work (default); "web" only serves the API and
+# queues its background tasks; "worker" (python -m podcast_outreach.worker) runs the scheduler, pipeline
+# workers, event consumers and queued tasks
+PROCESS_ROLE = os.getenv("PROCESS_ROLE", "all").lower()
+RUNS_BACKGROUND_WORK = PROCESS_ROLE != "web"
+TASK_QUEUE_CONCURRENCY = int(os.getenv("TASK_QUEUE_CONCURRENCY", "4"))  # Queued tasks a process runs at once
+TASK_QUEUE_POLL_INTERVAL_SECONDS = int(os.getenv("TASK_QUEUE_POLL_INTERVAL_SECONDS", "10"))  # Fallback when a NOTIFY is missed; also how often running tasks save progress
+TASK_QUEUE_STALE_SECONDS = int(os.getenv("TASK_QUEUE_STALE_SECONDS", "300"))  # Running tasks without a heartbeat for this long are marked failed
+TASK_HISTORY_DAYS = int(os.getenv("TASK_HISTORY_DAYS", "14"))  # Finished background tasks older than this are pruned
+
+# Process pool for CPU-bound parsing and audio work (RSS/HTML parsing, audio decoding/encoding, embedding comparison)
+PROCESS_POOL_WORKERS = int(os.getenv("PROCESS_POOL_WORKERS", str(min(4, os.cpu_count() or 1))))  # 0 = run that work in threads instead
+PROCESS_POOL_AUDIO_LIMIT = int(os.getenv("PROCESS_POOL_AUDIO_LIMIT", "2"))  # Audio files decoded/encoded at once; each can take hundreds of MB
+PROCESS_POOL_PARSE_LIMIT = int(os.getenv("PROCESS_POOL_PARSE_LIMIT", "0"))  # RSS/HTML/embedding tasks at once; 0 = one per worker
@@ -3,13 +3,28 @@
 import os
 import asyncpg
 import logging
-from typing import Optional
+import contextvars
+import functools
+from contextlib import contextmanager
+from typing import Optional, Iterator
 
 logger = logging.getLogger(__name__)
 
 # --- Connection Pool Management ---
 DB_POOL: Optional[asyncpg.Pool] = None
 BACKGROUND_TASK_POOL: Optional[asyncpg.Pool] = None
+ANALYTICS_POOL: Optional[asyncpg.Pool] = None
+
+# --- Workload Routing ---
+# get_db_pool() resolves the pool from the current context, so query helpers
+# run on the pool of whoever called them: API requests on the frontend pool,
+# scheduled/background jobs on the background pool, reporting on the analytics pool.
+WORKLOAD_FRONTEND = "frontend"
+WORKLOAD_BACKGROUND = "background"
+WORKLOAD_ANALYTICS = "analytics"
+
+_current_workload: contextvars.ContextVar[str] = contextvars.ContextVar("db_workload", default=WORKLOAD_FRONTEND)
+_pool_override: contextvars.ContextVar[Optional[asyncpg.Pool]] = contextvars.ContextVar("db_pool_override", default=None)
 
 async def init_db_pool():
     """Initializes the global PostgreSQL connection pool for frontend requests."""
@@ -83,12 +98,120 @@ async def init_background_task_pool():
             raise
     return BACKGROUND_TASK_POOL
 
-async def get_db_pool() -> asyncpg.Pool:
+async def init_analytics_pool():
+    """Initializes a small pool for long-running reporting and analytics queries."""
+    global ANALYTICS_POOL
+    if ANALYTICS_POOL is None or ANALYTICS_POOL._closed:
+        try:
+            user = os.getenv("PGUSER")
+            password = os.getenv("PGPASSWORD")
+            host = os.getenv("PGHOST")
+            port = os.getenv("PGPORT")
+            dbname = os.getenv("PGDATABASE")
+            connect_timeout_seconds = 30
+            pool_acquire_timeout_seconds = 30
+
+            if not all([user, password, host, port, dbname]):
+                logger.error("Database connection parameters missing.")
+                raise ValueError("DB connection parameters missing for DSN.")
+
+            dsn = f"postgresql://{user}:{password}@{host}:{port}/{dbname}?connect_timeout={connect_timeout_seconds}&command_timeout=300"
+            
+            logger.info(f"Initializing analytics DB pool with DSN (connect_timeout={connect_timeout_seconds}s, acquire_timeout={pool_acquire_timeout_seconds}s)")
+
+            ANALYTICS_POOL = await asyncpg.create_pool(
+                dsn=dsn,
+                min_size=1,         # Reports are occasional
+                max_size=4,         # Cap concurrent heavy scans
+                command_timeout=300, # Aggregations can take minutes
+                timeout=pool_acquire_timeout_seconds,
+                max_queries=10000,
+                max_inactive_connection_lifetime=300
+            )
+            logger.info("Analytics database connection pool initialized successfully.")
+        except Exception as e:
+            logger.error(f"Error initializing analytics database pool: {e}", exc_info=True)
+            raise
+    return ANALYTICS_POOL
+
+async def get_frontend_pool() -> asyncpg.Pool:
     """Returns the frontend PostgreSQL connection pool, initializing it if necessary."""
     if DB_POOL is None or DB_POOL._closed:
         return await init_db_pool()
     return DB_POOL
 
+async def get_analytics_pool() -> asyncpg.Pool:
+    """Returns the analytics PostgreSQL connection pool, initializing it if necessary."""
+    if ANALYTICS_POOL is None or ANALYTICS_POOL._closed:
+        return await init_analytics_pool()
+    return ANALYTICS_POOL
+
+async def get_pool_for_workload(workload: str) -> asyncpg.Pool:
+    """Returns the pool serving a workload class."""
+    if workload == WORKLOAD_BACKGROUND:
+        return await get_background_task_pool()
+    if workload == WORKLOAD_ANALYTICS:
+        return await get_analytics_pool()
+    return await get_frontend_pool()
+
+async def get_db_pool() -> asyncpg.Pool:
+    """
+    Returns the connection pool for the current context.
+    
+    This is the frontend pool unless the caller runs inside workload_scope()
+    (or a task created with workload_context()), in which case it is that
+    workload's pool, or the explicitly pinned pool.
+    """
+    override = _pool_override.get()
+    if override is not None and not override._closed:
+        return override
+    return await get_pool_for_workload(_current_workload.get())
+
+def current_workload() -> str:
+    """Returns the workload class of the current context."""
+    return _current_workload.get()
+
+@contextmanager
+def workload_scope(workload: str, pool: Optional[asyncpg.Pool] = None) -> Iterator[None]:
+    """
+    Route get_db_pool() to a workload's pool for the enclosed code.
+    
+    The setting is context-local: concurrent requests are unaffected, and
+    tasks created inside the block inherit it.
+    
+    Args:
+        workload: WORKLOAD_FRONTEND, WORKLOAD_BACKGROUND or WORKLOAD_ANALYTICS
+        pool: Pin a specific pool instead (e.g. a DatabaseService's pool)
+    """
+    workload_token = _current_workload.set(workload)
+    pool_token = _pool_override.set(pool)
+    try:
+        yield
+    finally:
+        _pool_override.reset(pool_token)
+        _current_workload.reset(workload_token)
+
+def workload_context(workload: str, pool: Optional[asyncpg.Pool] = None) -> contextvars.Context:
+    """
+    Returns a copy of the current context routed to a workload, for
+    loop.create_task(coro, context=...) when spawning background work
+    from a request.
+    """
+    context = contextvars.copy_context()
+    context.run(_current_workload.set, workload)
+    context.run(_pool_override.set, pool)
+    return context
+
+def run_as_workload(workload: str):
+    """Decorator running an async function inside workload_scope(workload)."""
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            with workload_scope(workload):
+                return await func(*args, **kwargs)
+        return wrapper
+    return decorator
+
 async def get_background_task_pool() -> asyncpg.Pool:
     """Returns the background task PostgreSQL connection pool, initializing it if necessary."""
     if BACKGROUND_TASK_POOL is None or BACKGROUND_TASK_POOL._closed:
@@ -129,10 +252,38 @@ async def close_background_task_pool():
         BACKGROUND_TASK_POOL = None
         logger.info("Background task database connection pool closed.")
 
+async def close_analytics_pool():
+    """Closes the analytics PostgreSQL connection pool."""
+    global ANALYTICS_POOL
+    if ANALYTICS_POOL and not ANALYTICS_POOL._closed:
+        await ANALYTICS_POOL.close()
+        ANALYTICS_POOL = None
+        logger.info("Analytics database connection pool closed.")
+
 async def close_all_pools():
-    """Closes both frontend and background task connection pools."""
+    """Closes the frontend, background task and analytics connection pools."""
     await close_db_pool()
     await close_background_task_pool()
+    await close_analytics_pool()
+
+async def create_dedicated_connection() -> asyncpg.Connection:
+    """
+    Opens a standalone connection outside of the pools.
+    Used for long-lived sessions such as LISTEN/NOTIFY listeners that would
+    otherwise pin a pooled connection indefinitely.
+    """
+    user = os.getenv("PGUSER")
+    password = os.getenv("PGPASSWORD")
+    host = os.getenv("PGHOST")
+    port = os.getenv("PGPORT")
+    dbname = os.getenv("PGDATABASE")
+
+    if not all([user, password, host, port, dbname]):
+        logger.error("Database connection parameters missing.")
+        raise ValueError("DB connection parameters missing for DSN.")
+
+    dsn = f"postgresql://{user}:{password}@{host}:{port}/{dbname}?connect_timeout=30"
+    return await asyncpg.connect(dsn=dsn)
 
 # FastAPI dependency (if needed for routers to inject a connection)
 # async def get_db_connection_dependency() -> asyncpg.Connection:
@@ -0,0 +1,188 @@
+# podcast_outreach/database/loaders.py
+
+"""
+Request- and job-scoped batch loaders for rows fetched by id.
+
+A BatchLoader collects the keys requested during one event-loop tick and
+resolves them with a single `= ANY($1)` query, then remembers the rows for
+the rest of its scope. Code that walks N discoveries, media or episodes asks
+a loader instead of calling get_X_by_id N times:
+
+    with loader_scope() as loaders:
+        campaigns = await loaders.campaigns().load_many(campaign_ids)
+        ...
+        campaign = await get_loaders().campaigns().load(campaign_id)  # memoized
+
+HTTP requests get a scope from LoaderScopeMiddleware, pipeline jobs from
+PipelineWorker, and batch entry points via run_in_loader_scope. Outside a
+scope get_loaders() returns a fresh, unshared set, so lookups still batch
+within a load_many() call but nothing is remembered.
+
+Memoized rows are not refreshed by writes. Code that updates a row and then
+reads it again in the same scope should clear() the key first or query the
+table directly.
+"""
+
+import asyncio
+import contextvars
+import functools
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Set, Tuple
+
+from podcast_outreach.logging_config import get_logger
+from podcast_outreach.database.queries import projections
+from podcast_outreach.database.queries import media as media_queries
+from podcast_outreach.database.queries import campaigns as campaign_queries
+from podcast_outreach.database.queries import episodes as episode_queries
+
+logger = get_logger(__name__)
+
+BatchFn = Callable[[List[Any]], Awaitable[Dict[Any, Any]]]
+
+class BatchLoader:
+    """
+    Batches and memoizes lookups of one kind of row.
+
+    Args:
+        batch_fn: Async function taking a list of keys and returning a dict
+            keyed by them; keys missing from the dict load as None.
+        name: Used in log messages.
+        max_batch_size: Largest number of keys sent to batch_fn at once.
+    """
+
+    def __init__(self, batch_fn: BatchFn, name: str = "loader", max_batch_size: int = 500):
+        self._batch_fn = batch_fn
+        self.name = name
+        self.max_batch_size = max(1, max_batch_size)
+        self._futures: Dict[Hashable, asyncio.Future] = {}
+        self._queue: List[Tuple[Hashable, asyncio.Future]] = []
+        self._dispatch_scheduled = False
+        self._inflight: Set[asyncio.Task] = set()
+
+    def _future_for(self, key: Hashable) -> asyncio.Future:
+        future = self._futures.get(key)
+        if future is not None:
+            return future
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._futures[key] = future
+        self._queue.append((key, future))
+        if not self._dispatch_scheduled:
+            # Runs after the callbacks already queued for this tick, so keys
+            # requested by sibling tasks (e.g. under gather) share the batch
+            self._dispatch_scheduled = True
+            loop.call_soon(self._dispatch)
+        return future
+
+    def _dispatch(self) -> None:
+        self._dispatch_scheduled = False
+        queue, self._queue = self._queue, []
+        for start in range(0, len(queue), self.max_batch_size):
+            task = asyncio.ensure_future(self._resolve(queue[start:start + self.max_batch_size]))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _resolve(self, batch: List[Tuple[Hashable, asyncio.Future]]) -> None:
+        try:
+            values = await self._batch_fn([key for key, _ in batch])
+        except Exception as e:
+            logger.warning(f"Batch loader {self.name} failed for {len(batch)} keys: {e}")
+            for key, future in batch:
+                # Failed keys are not memoized; the next load() tries again
+                if self._futures.get(key) is future:
+                    del self._futures[key]
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for key, future in batch:
+            if not future.done():
+                future.set_result(values.get(key))
+
+    async def load(self, key: Hashable) -> Optional[Any]:
+        """The row for key, or None if it does not exist."""
+        # Shielded so a cancelled caller does not cancel the future other callers share
+        return await asyncio.shield(self._future_for(key))
+
+    async def load_many(self, keys: Iterable[Hashable]) -> List[Optional[Any]]:
+        """Rows for keys, in order, with None for keys that do not exist."""
+        futures = [self._future_for(key) for key in keys]
+        if not futures:
+            return []
+        return list(await asyncio.shield(asyncio.gather(*futures)))
+
+    def prime(self, key: Hashable, value: Any) -> None:
+        """Remember a row obtained elsewhere (e.g. just inserted), replacing any memoized one."""
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(value)
+        self._futures[key] = future
+
+    def clear(self, key: Optional[Hashable] = None) -> None:
+        """Forget one memoized key, or all of them."""
+        if key is None:
+            self._futures.clear()
+        else:
+            self._futures.pop(key, None)
+
+class Loaders:
+    """The batch loaders of one request or job, created on first use."""
+
+    def __init__(self, pool: Optional[Any] = None):
+        self.pool = pool
+        self._loaders: Dict[str, BatchLoader] = {}
+
+    def _get(self, name: str, batch_fn: BatchFn) -> BatchLoader:
+        loader = self._loaders.get(name)
+        if loader is None:
+            loader = self._loaders[name] = BatchLoader(batch_fn, name=name)
+        return loader
+
+    def media(self, profile: str = projections.DETAIL) -> BatchLoader:
+        """Media rows by media_id."""
+        return self._get(f"media:{profile}", functools.partial(
+            media_queries.get_media_by_ids, pool=self.pool, profile=profile))
+
+    def campaigns(self, profile: str = projections.DETAIL) -> BatchLoader:
+        """Campaign rows by campaign_id."""
+        return self._get(f"campaigns:{profile}", functools.partial(
+            campaign_queries.get_campaigns_by_ids, pool=self.pool, profile=profile))
+
+    def episodes(self, profile: str = projections.DETAIL) -> BatchLoader:
+        """Episode rows by episode_id."""
+        return self._get(f"episodes:{profile}", functools.partial(
+            episode_queries.get_episodes_by_ids, pool=self.pool, profile=profile))
+
+    def clear(self) -> None:
+        """Forget everything memoized in this scope."""
+        for loader in self._loaders.values():
+            loader.clear()
+
+_current_loaders: contextvars.ContextVar[Optional[Loaders]] = contextvars.ContextVar("db_loaders", default=None)
+
+@contextmanager
+def loader_scope(pool: Optional[Any] = None) -> Iterator[Loaders]:
+    """
+    Give the enclosed code (and tasks created inside it) its own loaders.
+
+    Args:
+        pool: Pool the loaders query with; by default get_db_pool() picks the
+            pool of the current workload when a batch is sent.
+    """
+    loaders = Loaders(pool)
+    token = _current_loaders.set(loaders)
+    try:
+        yield loaders
+    finally:
+        _current_loaders.reset(token)
+
+def get_loaders() -> Loaders:
+    """The loaders of the current scope, or a fresh unshared set outside one."""
+    loaders = _current_loaders.get()
+    return loaders if loaders is not None else Loaders()
+
+def run_in_loader_scope(func):
+    """Decorator running an async function inside its own loader_scope()."""
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        with loader_scope():
+            return await func(*args, **kwargs)
+    return wrapper
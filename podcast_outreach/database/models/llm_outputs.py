@@ -41,4 +41,14 @@ class EpisodeAnalysisOutput(BaseModel):
     guest_names_identified: Optional[List[str]] = Field(None, description="Names of the guests identified in the episode content.")
     episode_themes: Optional[List[str]] = Field(None, description="Key themes or topics discussed in the episode.")
     episode_keywords: Optional[List[str]] = Field(None, description="Important keywords extracted from the episode content.")
-    ai_analysis_summary: Optional[str] = Field(None, description="A brief summary of the AI's findings or overall analysis of the episode content.")
\ No newline at end of file
+    ai_analysis_summary: Optional[str] = Field(None, description="A brief summary of the AI's findings or overall analysis of the episode content.")
+
+class BatchedEpisodeAnalysisItem(EpisodeAnalysisOutput):
+    """One episode's analysis inside a batched request, tied back by its reference number."""
+    episode_ref: int = Field(..., description="The reference number given for the episode in the input (e.g. 3 for [EPISODE 3]).")
+
+class BatchedEpisodeAnalysisOutput(BaseModel):
+    """
+    Structured output for analyzing several short episodes in one LLM request.
+    """
+    episodes: List[BatchedEpisodeAnalysisItem] = Field(..., description="One analysis per input episode, in any order.")
@@ -88,11 +88,14 @@ async def get_ai_usage_logs(
     related_pitch_gen_id: Optional[int] = None,
     related_campaign_id: Optional[uuid.UUID] = None,
     related_media_id: Optional[int] = None,
-    group_by_column: Optional[str] = None
+    group_by_column: Optional[str] = None,
+    cache_endpoint: Optional[str] = None
 ) -> List[Dict[str, Any]]:
     """
     Fetches AI usage logs, with optional filtering and grouping.
-    If group_by_column is provided, returns aggregated data.
+    If group_by_column is provided, returns aggregated data. With cache_endpoint,
+    rows logged under it (responses served from the LLM response cache) are
+    counted as cache_hits instead of calls and left out of the average time.
     """
     base_query = """
     SELECT
@@ -130,14 +133,20 @@ async def get_ai_usage_logs(
         base_query += " AND " + " AND ".join(where_clauses)
 
     if group_by_column and group_by_column in ['workflow', 'model', 'endpoint', 'related_pitch_gen_id', 'related_campaign_id', 'related_media_id']:
+        api_call = "TRUE"
+        if cache_endpoint:
+            api_call = f"endpoint IS DISTINCT FROM ${param_idx}"
+            query_params.append(cache_endpoint)
+            param_idx += 1
         select_cols = f"""
             {group_by_column},
-            COUNT(*) AS calls,
+            COUNT(*) FILTER (WHERE {api_call}) AS calls,
+            COUNT(*) FILTER (WHERE NOT ({api_call})) AS cache_hits,
             SUM(tokens_in) AS tokens_in,
             SUM(tokens_out) AS tokens_out,
             SUM(total_tokens) AS total_tokens,
             SUM(cost) AS cost,
-            AVG(execution_time_sec) AS avg_execution_time_sec
+            AVG(execution_time_sec) FILTER (WHERE {api_call}) AS avg_execution_time_sec
         """
         group_by_clause = f" GROUP BY {group_by_column} ORDER BY {group_by_column}"
     else:
@@ -160,14 +169,18 @@ async def get_total_ai_usage(
     end_date: Optional[date] = None,
     related_pitch_gen_id: Optional[int] = None,
     related_campaign_id: Optional[uuid.UUID] = None,
-    related_media_id: Optional[int] = None
+    related_media_id: Optional[int] = None,
+    cache_endpoint: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Calculates total AI usage (tokens, cost, calls) for a given period/entity.
+    With cache_endpoint, rows logged under it (responses served from the LLM
+    response cache) are counted as total_cache_hits instead of calls.
     """
     query = """
     SELECT
-        COUNT(*) AS total_calls,
+        COUNT(*) FILTER (WHERE $1::text IS NULL OR endpoint IS DISTINCT FROM $1) AS total_calls,
+        COUNT(*) FILTER (WHERE endpoint = $1) AS total_cache_hits,
         SUM(tokens_in) AS total_tokens_in,
         SUM(tokens_out) AS total_tokens_out,
         SUM(total_tokens) AS total_tokens,
@@ -178,8 +191,8 @@ async def get_total_ai_usage(
     """
     
     where_clauses = []
-    query_params = []
-    param_idx = 1
+    query_params = [cache_endpoint]
+    param_idx = 2
 
     if start_date:
         where_clauses.append(f"timestamp >= ${param_idx}")
@@ -210,12 +223,44 @@ async def get_total_ai_usage(
         async with pool.acquire() as conn:
             row = await conn.fetchrow(query, *query_params)
             return dict(row) if row else {
-                'total_calls': 0, 'total_tokens_in': 0, 'total_tokens_out': 0,
+                'total_calls': 0, 'total_cache_hits': 0, 'total_tokens_in': 0, 'total_tokens_out': 0,
                 'total_tokens': 0, 'total_cost': 0.0, 'total_execution_time_sec': 0.0
             }
     except Exception as e:
         logger.exception(f"Error getting total AI usage: {e}")
         return {
-            'total_calls': 0, 'total_tokens_in': 0, 'total_tokens_out': 0,
+            'total_calls': 0, 'total_cache_hits': 0, 'total_tokens_in': 0, 'total_tokens_out': 0,
             'total_tokens': 0, 'total_cost': 0.0, 'total_execution_time_sec': 0.0
         }
+
+async def get_cache_hit_rates(
+    cache_endpoint: str,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None
+) -> List[Dict[str, Any]]:
+    """
+    Per-workflow counts of calls served from the LLM response cache (logged under
+    cache_endpoint) and real API calls, for workflows with at least one hit.
+    """
+    query = """
+    SELECT
+        workflow,
+        COUNT(*) FILTER (WHERE endpoint = $1) AS hits,
+        COUNT(*) FILTER (WHERE endpoint IS DISTINCT FROM $1) AS api_calls
+    FROM ai_usage_logs
+    WHERE ($2::timestamptz IS NULL OR timestamp >= $2)
+      AND ($3::timestamptz IS NULL OR timestamp < $3)
+    GROUP BY workflow
+    HAVING COUNT(*) FILTER (WHERE endpoint = $1) > 0
+    ORDER BY workflow;
+    """
+    start_ts = datetime.combine(start_date, datetime.min.time()) if start_date else None
+    end_ts = datetime.combine(end_date + timedelta(days=1), datetime.min.time()) if end_date else None
+    try:
+        pool = await get_db_pool()
+        async with pool.acquire() as conn:
+            rows = await conn.fetch(query, cache_endpoint, start_ts, end_ts)
+            return [dict(row) for row in rows]
+    except Exception as e:
+        logger.exception(f"Error getting LLM response cache hit rates: {e}")
+        return []
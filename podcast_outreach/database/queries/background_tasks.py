@@ -0,0 +1,268 @@
+# podcast_outreach/database/queries/background_tasks.py
+
+import json
+from typing import Any, Dict, List, Optional
+
+from podcast_outreach.logging_config import get_logger
+from podcast_outreach.database.connection import get_db_pool
+
+logger = get_logger(__name__)
+
+def _to_dict(row) -> Dict[str, Any]:
+    task = dict(row)
+    if isinstance(task.get('params'), str):
+        task['params'] = json.loads(task['params'])
+    return task
+
+async def enqueue_task(task_id: str, action: str, method: str, params: Dict[str, Any], channel: str,
+                       pool: Optional[Any] = None) -> bool:
+    """
+    Queues a task for a worker process and announces it on channel.
+
+    Returns:
+        False if task_id is already in use, in which case nothing is queued.
+    """
+    query = """
+    WITH queued AS (
+        INSERT INTO background_tasks (task_id, action, method, params)
+        VALUES ($1, $2, $3, $4::jsonb)
+        ON CONFLICT (task_id) DO NOTHING
+        RETURNING task_id
+    )
+    SELECT pg_notify($5, task_id) FROM queued;
+    """
+    pool = pool or await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            result = await conn.execute(query, task_id, action, method, json.dumps(params), channel)
+            return int(result.split()[-1]) > 0
+        except Exception as e:
+            logger.exception(f"Error queueing background task {task_id} ({method}): {e}")
+            raise
+
+async def claim_tasks(worker_id: str, limit: int, pool: Optional[Any] = None) -> List[Dict[str, Any]]:
+    """Claims up to `limit` queued tasks, oldest first, with FOR UPDATE SKIP LOCKED."""
+    query = """
+    WITH next_tasks AS (
+        SELECT task_id
+        FROM background_tasks
+        WHERE status = 'queued'
+        ORDER BY queued_at
+        LIMIT $1
+        FOR UPDATE SKIP LOCKED
+    )
+    UPDATE background_tasks t
+    SET status = 'running',
+        worker_id = $2,
+        started_at = NOW(),
+        heartbeat_at = NOW()
+    FROM next_tasks
+    WHERE t.task_id = next_tasks.task_id
+    RETURNING t.*;
+    """
+    pool = pool or await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            rows = await conn.fetch(query, limit, worker_id)
+            return [_to_dict(row) for row in rows]
+        except Exception as e:
+            logger.exception(f"Error claiming background tasks: {e}")
+            raise
+
+async def start_task(task_id: str, action: str, method: str, params: Dict[str, Any], worker_id: str,
+                     pool: Optional[Any] = None) -> bool:
+    """
+    Records a task starting on worker_id; a queued task keeps its row and queue time.
+
+    Returns:
+        False if task_id belongs to a task that has finished (or is running
+        on another worker); its row is left as it is.
+    """
+    query = """
+    INSERT INTO background_tasks (task_id, action, method, params, status, worker_id, started_at, heartbeat_at)
+    VALUES ($1, $2, $3, $4::jsonb, 'running', $5, NOW(), NOW())
+    ON CONFLICT (task_id) DO UPDATE
+        SET status = 'running',
+            worker_id = EXCLUDED.worker_id,
+            started_at = COALESCE(background_tasks.started_at, NOW()),
+            heartbeat_at = NOW()
+        WHERE background_tasks.finished_at IS NULL
+          AND (background_tasks.status = 'queued' OR background_tasks.worker_id = EXCLUDED.worker_id);
+    """
+    pool = pool or await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            result = await conn.execute(query, task_id, action, method, json.dumps(params), worker_id)
+            return int(result.split()[-1]) > 0
+        except Exception as e:
+            logger.exception(f"Error recording start of background task {task_id} ({method}): {e}")
+            raise
+
+async def heartbeat_tasks(worker_id: str, task_ids: List[str], progress_done: List[int],
+                          progress_total: List[Optional[int]], progress_messages: List[Optional[str]],
+                          pool: Optional[Any] = None) -> List[str]:
+    """
+    Marks a worker's running tasks as still alive and saves their progress.
+
+    Returns:
+        Ids of those tasks that were asked to stop.
+    """
+    if not task_ids:
+        return []
+    query = """
+    UPDATE background_tasks t
+    SET heartbeat_at = NOW(),
+        progress_done = p.done,
+        progress_total = p.total,
+        progress_message = p.message
+    FROM unnest($1::varchar[], $2::int[], $3::int[], $4::text[]) AS p(task_id, done, total, message)
+    WHERE t.task_id = p.task_id AND t.worker_id = $5 AND t.status = 'running'
+    RETURNING t.task_id, t.stop_requested;
+    """
+    pool = pool or await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            rows = await conn.fetch(query, task_ids, progress_done, progress_total, progress_messages, worker_id)
+            return [row['task_id'] for row in rows if row['stop_requested']]
+        except Exception as e:
+            logger.exception(f"Error refreshing background task heartbeats: {e}")
+            raise
+
+async def finish_task(task_id: str, status: str, error: Optional[str] = None,
+                      progress_done: Optional[int] = None, progress_total: Optional[int] = None,
+                      pool: Optional[Any] = None) -> None:
+    """Records the outcome, duration and final progress of a task; a task already finished keeps its outcome."""
+    query = """
+    UPDATE background_tasks
+    SET status = $2,
+        error = $3,
+        progress_done = COALESCE($4, progress_done),
+        progress_total = COALESCE($5, progress_total),
+        finished_at = NOW(),
+        duration_ms = (EXTRACT(EPOCH FROM NOW() - COALESCE(started_at, NOW())) * 1000)::int
+    WHERE task_id = $1 AND finished_at IS NULL;
+    """
+    pool = pool or await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            await conn.execute(query, task_id, status, error[:2000] if error else None,
+                               progress_done, progress_total)
+        except Exception as e:
+            logger.exception(f"Error finishing background task {task_id}: {e}")
+            raise
+
+async def fail_stale_tasks(stale_seconds: int, pool: Optional[Any] = None) -> int:
+    """
+    Marks running tasks whose worker stopped sending heartbeats as failed.
+    They are not retried, as a task may have had side effects (e.g. sent pitches).
+
+    Returns:
+        Number of tasks marked failed.
+    """
+    query = """
+    UPDATE background_tasks
+    SET status = 'failed', error = 'Worker stopped responding', finished_at = NOW(),
+        duration_ms = (EXTRACT(EPOCH FROM NOW() - started_at) * 1000)::int
+    WHERE status = 'running' AND heartbeat_at < NOW() - make_interval(secs => $1);
+    """
+    pool = pool or await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            result = await conn.execute(query, stale_seconds)
+            return int(result.split()[-1])
+        except Exception as e:
+            logger.exception(f"Error failing stale background tasks: {e}")
+            raise
+
+async def cancel_queued_task(task_id: str, pool: Optional[Any] = None) -> bool:
+    """Cancels a task that no worker has claimed yet. Returns False if it is not queued."""
+    query = """
+    UPDATE background_tasks SET status = 'cancelled', finished_at = NOW()
+    WHERE task_id = $1 AND status = 'queued';
+    """
+    pool = pool or await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            result = await conn.execute(query, task_id)
+            return int(result.split()[-1]) > 0
+        except Exception as e:
+            logger.exception(f"Error cancelling background task {task_id}: {e}")
+            raise
+
+async def get_task(task_id: str, pool: Optional[Any] = None) -> Optional[Dict[str, Any]]:
+    """A queued task by id, or None."""
+    pool = pool or await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            row = await conn.fetchrow("SELECT * FROM background_tasks WHERE task_id = $1;", task_id)
+            return _to_dict(row) if row else None
+        except Exception as e:
+            logger.exception(f"Error fetching background task {task_id}: {e}")
+            raise
+
+async def request_stop(task_id: str, channel: str, pool: Optional[Any] = None) -> bool:
+    """
+    Asks a running task to stop, wherever it runs, and notifies workers on
+    channel so the instance running it sees the request without waiting for
+    its next heartbeat. Returns False if the task is not running.
+    """
+    query = """
+    WITH stopping AS (
+        UPDATE background_tasks SET stop_requested = TRUE
+        WHERE task_id = $1 AND status = 'running'
+        RETURNING task_id
+    )
+    SELECT pg_notify($2, task_id) FROM stopping;
+    """
+    pool = pool or await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            rows = await conn.fetch(query, task_id, channel)
+            return bool(rows)
+        except Exception as e:
+            logger.exception(f"Error requesting stop of background task {task_id}: {e}")
+            raise
+
+async def list_tasks(statuses: Optional[List[str]] = None, action: Optional[str] = None, limit: int = 50,
+                     before_task_id: Optional[str] = None, pool: Optional[Any] = None) -> List[Dict[str, Any]]:
+    """
+    Tasks, newest first.
+
+    Args:
+        statuses: Only tasks in one of these statuses.
+        action: Only tasks whose action starts with this.
+        before_task_id: Only tasks queued before this one, for paging.
+    """
+    query = """
+    SELECT * FROM background_tasks t
+    WHERE ($1::varchar[] IS NULL OR t.status = ANY($1))
+    AND ($2::varchar IS NULL OR t.action LIKE $2 || '%')
+    AND ($3::varchar IS NULL OR (t.queued_at, t.task_id) < (
+        SELECT queued_at, task_id FROM background_tasks WHERE task_id = $3
+    ))
+    ORDER BY t.queued_at DESC, t.task_id DESC
+    LIMIT $4;
+    """
+    pool = pool or await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            rows = await conn.fetch(query, statuses, action, before_task_id, limit)
+            return [_to_dict(row) for row in rows]
+        except Exception as e:
+            logger.exception(f"Error listing background tasks: {e}")
+            raise
+
+async def prune_tasks(keep_days: int, pool: Optional[Any] = None) -> int:
+    """Deletes finished tasks older than keep_days. Returns the number deleted."""
+    query = """
+    DELETE FROM background_tasks
+    WHERE finished_at IS NOT NULL AND finished_at < NOW() - make_interval(days => $1);
+    """
+    pool = pool or await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            result = await conn.execute(query, keep_days)
+            return int(result.split()[-1])
+        except Exception as e:
+            logger.exception(f"Error pruning background tasks: {e}")
+            raise
@@ -562,6 +562,49 @@ async def cleanup_stale_ai_description_locks(stale_minutes: int = 60) -> int:
             logger.error(f"Error cleaning up stale AI description locks: {e}")
             return 0
 
+async def count_discoveries_ready_for_vetting() -> int:
+    """Number of discoveries acquire_vetting_work_batch() could still acquire."""
+    query = """
+    SELECT COUNT(*)
+    FROM campaign_media_discoveries cmd
+    JOIN media m ON cmd.media_id = m.media_id
+    JOIN campaigns c ON cmd.campaign_id = c.campaign_id
+    WHERE cmd.enrichment_status = 'completed'
+    AND cmd.vetting_status = 'pending'
+    AND m.ai_description IS NOT NULL
+    AND c.ideal_podcast_description IS NOT NULL
+    AND (cmd.vetting_error IS NULL OR cmd.vetting_error NOT LIKE 'PROCESSING:%')
+    AND EXISTS (SELECT 1 FROM episodes e WHERE e.media_id = m.media_id);
+    """
+    pool = await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            return await conn.fetchval(query)
+        except Exception as e:
+            logger.exception(f"Error counting discoveries ready for vetting: {e}")
+            raise
+
+async def count_discoveries_needing_ai_description() -> int:
+    """Number of discoveries acquire_ai_description_work_batch() could still acquire."""
+    query = """
+    SELECT COUNT(*)
+    FROM campaign_media_discoveries cmd
+    JOIN media m ON cmd.media_id = m.media_id
+    JOIN campaigns c ON cmd.campaign_id = c.campaign_id
+    WHERE cmd.enrichment_status = 'completed'
+    AND cmd.vetting_status = 'pending'
+    AND (m.ai_description IS NULL OR m.ai_description = '')
+    AND m.total_episodes > 0
+    AND (cmd.enrichment_error IS NULL OR cmd.enrichment_error NOT LIKE 'PROCESSING:%');
+    """
+    pool = await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            return await conn.fetchval(query)
+        except Exception as e:
+            logger.exception(f"Error counting discoveries needing AI descriptions: {e}")
+            raise
+
 async def cleanup_stale_vetting_locks(stale_minutes: int = 60) -> int:
     """
     Clean up stale vetting processing locks that are older than specified minutes.
@@ -6,6 +6,7 @@ from datetime import date, datetime, timezone # Ensure timezone is imported
 
 from podcast_outreach.logging_config import get_logger
 from podcast_outreach.database.connection import get_db_pool, get_background_task_pool
+from podcast_outreach.database.queries import projections
 import asyncpg
 
 logger = get_logger(__name__)
@@ -101,13 +102,15 @@ async def create_campaign_in_db(campaign_data: Dict[str, Any]) -> Optional[Dict[
             logger.exception(f"Error creating campaign (ID: {campaign_data.get('campaign_id')}) in DB: {e}")
             raise
 
-async def get_campaign_by_id(campaign_id: uuid.UUID, pool: Optional[asyncpg.Pool] = None) -> Optional[Dict[str, Any]]:
-    query = "SELECT * FROM campaigns WHERE campaign_id = $1;"
+async def get_campaign_by_id(campaign_id: uuid.UUID, pool: Optional[asyncpg.Pool] = None,
+                             profile: str = projections.DETAIL) -> Optional[Dict[str, Any]]:
+    """Fetches one campaign with the columns of the given projection profile (no embedding by default)."""
     if pool is None:
         pool = await get_db_pool()
     async with pool.acquire() as conn:
         try:
-            row = await conn.fetchrow(query, campaign_id)
+            columns = await projections.select_list(conn, "campaigns", profile)
+            row = await conn.fetchrow(f"SELECT {columns} FROM campaigns WHERE campaign_id = $1;", campaign_id)
             if not row:
                 logger.warning(f"Campaign not found: {campaign_id}")
                 return None
@@ -117,10 +120,27 @@ async def get_campaign_by_id(campaign_id: uuid.UUID, pool: Optional[asyncpg.Pool
             logger.exception(f"Error fetching campaign {campaign_id}: {e}")
             raise
 
-async def get_campaigns_by_person_id(person_id: int, limit: int = 1000) -> List[Dict[str, Any]]:
+async def get_campaigns_by_ids(campaign_ids: List[uuid.UUID], pool: Optional[asyncpg.Pool] = None,
+                               profile: str = projections.DETAIL) -> Dict[uuid.UUID, Dict[str, Any]]:
+    """Fetches many campaigns in one query, keyed by campaign_id. Missing ids are simply absent."""
+    if not campaign_ids:
+        return {}
+    if pool is None:
+        pool = await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            columns = await projections.select_list(conn, "campaigns", profile)
+            rows = await conn.fetch(f"SELECT {columns} FROM campaigns WHERE campaign_id = ANY($1::uuid[]);", list(campaign_ids))
+            return {row['campaign_id']: _process_campaign_row(row, row['campaign_id']) for row in rows}
+        except Exception as e:
+            logger.exception(f"Error fetching {len(campaign_ids)} campaigns by id: {e}")
+            raise
+
+async def get_campaigns_by_person_id(person_id: int, limit: int = 1000,
+                                     profile: str = projections.DETAIL) -> List[Dict[str, Any]]:
     """Get campaigns for a specific person with a safety limit."""
     query = """
-    SELECT * FROM campaigns 
+    SELECT {columns} FROM campaigns 
     WHERE person_id = $1
     ORDER BY created_at DESC
     LIMIT $2;
@@ -129,7 +149,8 @@ async def get_campaigns_by_person_id(person_id: int, limit: int = 1000) -> List[
     pool = await get_db_pool()
     async with pool.acquire() as conn:
         try:
-            rows = await conn.fetch(query, person_id, limit)
+            columns = await projections.select_list(conn, "campaigns", profile)
+            rows = await conn.fetch(query.format(columns=columns), person_id, limit)
             return [_process_campaign_row(row) for row in rows]
         except Exception as e:
             logger.exception(f"Error fetching campaigns for person {person_id}: {e}")
@@ -138,7 +159,8 @@ async def get_campaigns_by_person_id(person_id: int, limit: int = 1000) -> List[
 async def get_all_campaigns_from_db(
     skip: int = 0, 
     limit: int = 100,
-    person_id: Optional[int] = None # New parameter
+    person_id: Optional[int] = None, # New parameter
+    profile: str = projections.DETAIL
 ) -> List[Dict[str, Any]]:
     """Fetches campaigns with pagination, optionally filtered by person_id."""
     params = [skip, limit]
@@ -175,7 +197,7 @@ async def get_all_campaigns_from_db(
     limit_param_num = current_param_idx
     offset_param_num = current_param_idx + 1
 
-    query = f"""SELECT * FROM campaigns 
+    query = f"""SELECT {{columns}} FROM campaigns 
                  {final_where_sql} 
                  ORDER BY created_at DESC 
                  LIMIT ${limit_param_num} OFFSET ${offset_param_num};"""
@@ -183,7 +205,8 @@ async def get_all_campaigns_from_db(
     pool = await get_db_pool()
     async with pool.acquire() as conn:
         try:
-            rows = await conn.fetch(query, *final_params)
+            columns = await projections.select_list(conn, "campaigns", profile)
+            rows = await conn.fetch(query.format(columns=columns), *final_params)
             processed_rows = []
             for row in rows:
                 processed_row = dict(row)
@@ -69,39 +69,130 @@ async def get_conversation_with_campaign_data(conversation_id: UUID) -> Optional
             logger.exception(f"Error fetching conversation with campaign data: {e}")
             raise
 
-async def update_conversation(conversation_id: UUID, messages: List[Dict], 
-                            extracted_data: Dict, conversation_metadata: Dict, 
-                            conversation_phase: str, progress: int) -> Optional[Dict[str, Any]]:
-    """Updates a conversation with new messages and extracted data."""
-    query = """
+async def append_messages(conversation_id: UUID, messages: List[Dict[str, Any]],
+                          extracted_data_patch: Optional[Dict[str, Any]] = None,
+                          removed_extracted_keys: Optional[List[str]] = None,
+                          metadata_patch: Optional[Dict[str, Any]] = None,
+                          conversation_phase: Optional[str] = None,
+                          progress: Optional[int] = None) -> Optional[int]:
+    """
+    Appends messages to a conversation and applies incremental state patches.
+    
+    Messages are inserted into chatbot_messages; the conversation row only gets
+    its counters and the top-level keys that changed, so per-turn write cost
+    does not grow with the length of the conversation.
+    
+    Returns:
+        The new message_count, or None if the conversation does not exist.
+    """
+    extracted_data_patch = extracted_data_patch or {}
+    removed_extracted_keys = removed_extracted_keys or []
+    metadata_patch = metadata_patch or {}
+    
+    # Unchanged JSONB columns are assigned to themselves so their stored value is reused
+    update_query = """
     UPDATE chatbot_conversations
-    SET messages = $1,
-        extracted_data = $2,
-        conversation_metadata = $3,
-        conversation_phase = $4,
-        progress = $5,
+    SET message_count = message_count + $2,
+        extracted_data = CASE
+            WHEN $3::text[] = '{}' AND $4::jsonb = '{}'::jsonb THEN extracted_data
+            ELSE (COALESCE(extracted_data, '{}'::jsonb) - $3::text[]) || $4::jsonb
+        END,
+        conversation_metadata = CASE
+            WHEN $5::jsonb = '{}'::jsonb THEN conversation_metadata
+            ELSE COALESCE(conversation_metadata, '{}'::jsonb) || $5::jsonb
+        END,
+        conversation_phase = COALESCE($6, conversation_phase),
+        progress = COALESCE($7, progress),
         last_activity_at = CURRENT_TIMESTAMP
-    WHERE conversation_id = $6
-    RETURNING *;
+    WHERE conversation_id = $1
+    RETURNING message_count;
+    """
+    insert_query = """
+    INSERT INTO chatbot_messages (conversation_id, seq, message_type, content, message)
+    VALUES ($1, $2, $3, $4, $5);
     """
     pool = await get_db_pool()
     async with pool.acquire() as conn:
         try:
-            row = await conn.fetchrow(
-                query, 
-                json.dumps(messages), 
-                json.dumps(extracted_data),
-                json.dumps(conversation_metadata),
-                conversation_phase,
-                progress,
-                conversation_id
-            )
-            if row:
-                logger.debug(f"Updated conversation {conversation_id}")
-                return dict(row)
-            return None
+            async with conn.transaction():
+                # The UPDATE row lock serializes concurrent appends to the same conversation
+                new_count = await conn.fetchval(
+                    update_query,
+                    conversation_id,
+                    len(messages),
+                    removed_extracted_keys,
+                    json.dumps(extracted_data_patch),
+                    json.dumps(metadata_patch),
+                    conversation_phase,
+                    progress
+                )
+                if new_count is None:
+                    logger.warning(f"Cannot append messages, conversation not found: {conversation_id}")
+                    return None
+                
+                if messages:
+                    first_seq = new_count - len(messages)
+                    await conn.executemany(insert_query, [
+                        (conversation_id, first_seq + i, msg.get('type', 'unknown'),
+                         msg.get('content'), json.dumps(msg))
+                        for i, msg in enumerate(messages)
+                    ])
+            logger.debug(f"Appended {len(messages)} messages to conversation {conversation_id}")
+            return new_count
+        except Exception as e:
+            logger.exception(f"Error appending messages to conversation {conversation_id}: {e}")
+            raise
+
+async def get_conversation_messages(conversation_id: UUID, limit: Optional[int] = None,
+                                    before_seq: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Fetches conversation messages in chronological order.
+    
+    Args:
+        conversation_id: Conversation to read
+        limit: Return only the latest `limit` messages (all when None)
+        before_seq: Only return messages older than this sequence number (for paging backwards)
+    """
+    query = """
+    SELECT seq, message FROM chatbot_messages
+    WHERE conversation_id = $1
+    AND ($2::INTEGER IS NULL OR seq < $2)
+    ORDER BY seq DESC
+    LIMIT $3;
+    """
+    pool = await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            rows = await conn.fetch(query, conversation_id, before_seq, limit)
+            messages = []
+            for row in reversed(rows):
+                message = json.loads(row['message'])
+                message['seq'] = row['seq']
+                messages.append(message)
+            return messages
+        except Exception as e:
+            logger.exception(f"Error fetching messages for conversation {conversation_id}: {e}")
+            raise
+
+async def get_last_message_of_type(conversation_id: UUID, message_type: str) -> Optional[Dict[str, Any]]:
+    """Fetches the most recent message of a given type ('user' or 'bot')."""
+    query = """
+    SELECT seq, message FROM chatbot_messages
+    WHERE conversation_id = $1 AND message_type = $2
+    ORDER BY seq DESC
+    LIMIT 1;
+    """
+    pool = await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            row = await conn.fetchrow(query, conversation_id, message_type)
+            if not row:
+                return None
+            message = json.loads(row['message'])
+            message['seq'] = row['seq']
+            return message
         except Exception as e:
-            logger.exception(f"Error updating conversation {conversation_id}: {e}")
+            logger.exception(f"Error fetching last {message_type} message for conversation {conversation_id}: {e}")
             raise
 
 async def complete_conversation(conversation_id: UUID) -> Optional[Dict[str, Any]]:
@@ -171,8 +262,7 @@ async def get_conversations_by_campaign(campaign_id: UUID) -> List[Dict[str, Any
     """Gets all conversations for a campaign."""
     query = """
     SELECT conversation_id, status, conversation_phase, progress,
-           started_at, completed_at, person_id,
-           jsonb_array_length(messages) as message_count
+           started_at, completed_at, person_id, message_count
     FROM chatbot_conversations
     WHERE campaign_id = $1
     ORDER BY started_at DESC;
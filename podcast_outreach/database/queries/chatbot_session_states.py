@@ -0,0 +1,103 @@
+# podcast_outreach/database/queries/chatbot_session_states.py
+
+from typing import Dict, Any, Optional
+
+from podcast_outreach.logging_config import get_logger
+from podcast_outreach.database.connection import get_db_pool
+
+logger = get_logger(__name__)
+
+async def get_session_state(session_id: str) -> Optional[Dict[str, Any]]:
+    """Fetches the serialized agentic session state and its version."""
+    query = "SELECT session_id, state, version, updated_at FROM chatbot_session_states WHERE session_id = $1;"
+    pool = await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            row = await conn.fetchrow(query, session_id)
+            return dict(row) if row else None
+        except Exception as e:
+            logger.exception(f"Error fetching session state {session_id}: {e}")
+            raise
+
+async def get_session_state_version(session_id: str) -> Optional[int]:
+    """Fetches only the version of a stored session state (cheap freshness check)."""
+    query = "SELECT version FROM chatbot_session_states WHERE session_id = $1;"
+    pool = await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            return await conn.fetchval(query, session_id)
+        except Exception as e:
+            logger.exception(f"Error fetching session state version {session_id}: {e}")
+            raise
+
+async def save_session_state(session_id: str, state_json: str, expected_version: int) -> Optional[int]:
+    """
+    Saves a session state with an optimistic version check.
+    
+    Args:
+        session_id: Session identifier
+        state_json: Serialized state
+        expected_version: Version the caller last read (0 for a brand new session)
+    
+    Returns:
+        The new version, or None if another writer saved a newer version first.
+    """
+    if expected_version == 0:
+        query = """
+        INSERT INTO chatbot_session_states (session_id, state, version)
+        VALUES ($1, $2, 1)
+        ON CONFLICT (session_id) DO NOTHING
+        RETURNING version;
+        """
+        params = (session_id, state_json)
+    else:
+        query = """
+        UPDATE chatbot_session_states
+        SET state = $2,
+            version = version + 1,
+            updated_at = CURRENT_TIMESTAMP
+        WHERE session_id = $1 AND version = $3
+        RETURNING version;
+        """
+        params = (session_id, state_json, expected_version)
+    
+    pool = await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            new_version = await conn.fetchval(query, *params)
+            if new_version is None:
+                logger.warning(f"Version conflict saving session state {session_id} (expected {expected_version})")
+            return new_version
+        except Exception as e:
+            logger.exception(f"Error saving session state {session_id}: {e}")
+            raise
+
+async def delete_session_state(session_id: str) -> bool:
+    """Deletes a stored session state."""
+    query = "DELETE FROM chatbot_session_states WHERE session_id = $1;"
+    pool = await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            result = await conn.execute(query, session_id)
+            return result == "DELETE 1"
+        except Exception as e:
+            logger.exception(f"Error deleting session state {session_id}: {e}")
+            raise
+
+async def delete_stale_session_states(hours_inactive: int = 24 * 7) -> int:
+    """Deletes session states not updated within the given number of hours."""
+    query = """
+    DELETE FROM chatbot_session_states
+    WHERE updated_at < NOW() - make_interval(hours => $1);
+    """
+    pool = await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            result = await conn.execute(query, hours_inactive)
+            deleted = int(result.split(" ")[1]) if result.startswith("DELETE ") else 0
+            if deleted:
+                logger.info(f"Deleted {deleted} stale chatbot session states")
+            return deleted
+        except Exception as e:
+            logger.exception(f"Error deleting stale session states: {e}")
+            raise
@@ -0,0 +1,72 @@
+# podcast_outreach/database/queries/embedding_cache.py
+
+from typing import Dict, List, Tuple
+
+from podcast_outreach.logging_config import get_logger
+from podcast_outreach.database.connection import get_db_pool
+
+logger = get_logger(__name__)
+
+async def get_cached_embeddings(model: str, content_hashes: List[str]) -> Dict[str, List[float]]:
+    """
+    Fetches cached embeddings for a set of content hashes in one round trip.
+    
+    Returns:
+        Mapping of content_hash -> embedding for the hashes that were found.
+    """
+    if not content_hashes:
+        return {}
+    query = """
+    SELECT content_hash, embedding
+    FROM embedding_cache
+    WHERE model = $1 AND content_hash = ANY($2::text[]);
+    """
+    # Refresh last_used_at at most once a day per entry so hits stay read-mostly
+    touch_query = """
+    UPDATE embedding_cache
+    SET last_used_at = CURRENT_TIMESTAMP
+    WHERE model = $1 AND content_hash = ANY($2::text[])
+      AND last_used_at < CURRENT_TIMESTAMP - INTERVAL '1 day';
+    """
+    pool = await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            rows = await conn.fetch(query, model, content_hashes)
+            found = {row['content_hash']: list(row['embedding']) for row in rows}
+            if found:
+                await conn.execute(touch_query, model, list(found.keys()))
+            return found
+        except Exception as e:
+            logger.exception(f"Error fetching cached embeddings for model {model}: {e}")
+            raise
+
+async def store_embeddings(model: str, entries: List[Tuple[str, List[float]]]) -> None:
+    """Stores (content_hash, embedding) pairs; existing entries are left untouched."""
+    if not entries:
+        return
+    query = """
+    INSERT INTO embedding_cache (content_hash, model, embedding)
+    VALUES ($1, $2, $3)
+    ON CONFLICT (content_hash, model) DO NOTHING;
+    """
+    pool = await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            await conn.executemany(query, [(content_hash, model, embedding) for content_hash, embedding in entries])
+        except Exception as e:
+            logger.exception(f"Error storing {len(entries)} embeddings for model {model}: {e}")
+            raise
+
+async def prune_embedding_cache(unused_days: int = 90) -> int:
+    """Deletes cache entries not used for the given number of days; returns the count removed."""
+    query = "DELETE FROM embedding_cache WHERE last_used_at < CURRENT_TIMESTAMP - make_interval(days => $1);"
+    pool = await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            result = await conn.execute(query, unused_days)
+            deleted = int(result.split()[-1]) if result else 0
+            logger.info(f"Pruned {deleted} embedding cache entries unused for {unused_days} days")
+            return deleted
+        except Exception as e:
+            logger.exception(f"Error pruning embedding cache: {e}")
+            raise
@@ -8,6 +8,7 @@ from datetime import datetime, date
 import asyncpg
  
 from podcast_outreach.database.connection import get_db_pool, get_background_task_pool
+from podcast_outreach.database.queries import projections
  
 logger = logging.getLogger(__name__)
  
@@ -185,10 +186,25 @@ async def fetch_episodes_for_transcription(limit: int = 20, pool: Optional[Any]
             logger.exception("Error fetching episodes for transcription: %s", e)
             return []
 
+async def count_episodes_for_transcription(pool: Optional[Any] = None) -> int:
+    """Number of episodes fetch_episodes_for_transcription() would still return."""
+    query = """
+    SELECT COUNT(*) FROM episodes
+    WHERE transcribe = TRUE AND (transcript IS NULL OR transcript = '');
+    """
+    pool = pool or await get_background_task_pool()
+    async with pool.acquire() as conn:
+        try:
+            return await conn.fetchval(query)
+        except Exception as e:
+            logger.exception("Error counting episodes for transcription: %s", e)
+            raise
+
 async def fetch_episodes_for_analysis(limit: int = 20, pool: Optional[Any] = None) -> list[Dict[str, Any]]:
     """Return episodes that need AI analysis (have transcript/summary but no analysis done)."""
     query = """
-    SELECT episode_id, media_id, title, transcript, ai_episode_summary, episode_summary
+    SELECT episode_id, media_id, title, transcript, ai_episode_summary, episode_summary,
+           reduced_transcript, reduced_transcript_key
     FROM episodes
     WHERE ai_analysis_done = FALSE 
     AND (transcript IS NOT NULL OR ai_episode_summary IS NOT NULL OR episode_summary IS NOT NULL)
@@ -337,20 +353,36 @@ async def update_episode_audio_url(episode_id: int, audio_url: str, pool: Option
         logger.error(f"Error updating audio URL for episode {episode_id}: {e}")
         return False
 
-async def get_episode_by_id(episode_id: int, pool: Optional[Any] = None) -> Optional[Dict[str, Any]]:
-    """Get episode by ID."""
-    query = "SELECT * FROM episodes WHERE episode_id = $1"
+async def get_episode_by_id(episode_id: int, pool: Optional[Any] = None,
+                            profile: str = projections.DETAIL) -> Optional[Dict[str, Any]]:
+    """Get episode by ID. The default profile leaves out the transcript and embedding (see has_transcript)."""
     try:
         if pool is None:
             pool_to_use = await get_db_pool()
         else:
             pool_to_use = pool
         async with pool_to_use.acquire() as conn:
-            row = await conn.fetchrow(query, episode_id)
+            columns = await projections.select_list(conn, "episodes", profile)
+            row = await conn.fetchrow(f"SELECT {columns} FROM episodes WHERE episode_id = $1", episode_id)
             return dict(row) if row else None
     except Exception as e:
         logger.error(f"Error fetching episode {episode_id}: {e}")
         return None
+
+async def get_episodes_by_ids(episode_ids: List[int], pool: Optional[Any] = None,
+                              profile: str = projections.DETAIL) -> Dict[int, Dict[str, Any]]:
+    """Fetches many episodes in one query, keyed by episode_id. Missing ids are simply absent."""
+    if not episode_ids:
+        return {}
+    pool = pool or await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            columns = await projections.select_list(conn, "episodes", profile)
+            rows = await conn.fetch(f"SELECT {columns} FROM episodes WHERE episode_id = ANY($1::int[])", list(episode_ids))
+            return {row['episode_id']: dict(row) for row in rows}
+        except Exception as e:
+            logger.exception(f"Error fetching {len(episode_ids)} episodes by id: {e}")
+            raise
  
 async def get_episodes_for_media_with_content(media_id: int, limit: int = None) -> List[Dict[str, Any]]:
     """
@@ -401,6 +433,44 @@ async def get_episodes_for_media_with_content(media_id: int, limit: int = None)
         logger.exception(f"Error fetching episodes with content for media_id {media_id}: {e}")
         return []
 
+async def get_episodes_with_content_for_media_ids(media_ids: List[int], per_media_limit: Optional[int] = None,
+                                                  pool: Optional[Any] = None) -> Dict[int, List[Dict[str, Any]]]:
+    """
+    Set-based variant of get_episodes_for_media_with_content: one query for many media,
+    newest first, optionally capped per media. Returns episodes grouped by media_id.
+    """
+    if not media_ids:
+        return {}
+    query = """
+    SELECT media_id, episode_id, title, publish_date, episode_summary, ai_episode_summary, transcript, embedding
+    FROM (
+        SELECT e.*, ROW_NUMBER() OVER (PARTITION BY e.media_id ORDER BY e.publish_date DESC) AS rn
+        FROM episodes e
+        WHERE e.media_id = ANY($1::int[]) AND (e.ai_episode_summary IS NOT NULL OR e.transcript IS NOT NULL)
+    ) ranked
+    WHERE $2::int IS NULL OR rn <= $2
+    ORDER BY media_id, rn;
+    """
+    pool_to_use = pool or await get_db_pool()
+    try:
+        async with pool_to_use.acquire() as conn:
+            rows = await conn.fetch(query, list(media_ids), per_media_limit)
+    except Exception as e:
+        logger.exception(f"Error fetching episodes with content for {len(media_ids)} media: {e}")
+        raise
+
+    grouped: Dict[int, List[Dict[str, Any]]] = {}
+    for row in rows:
+        episode = dict(row)
+        if episode.get('embedding') and isinstance(episode['embedding'], str):
+            try:
+                episode['embedding'] = np.array(json.loads(episode['embedding']))
+            except (ValueError, TypeError):
+                logger.warning(f"Could not parse embedding for episode {episode['episode_id']}")
+                episode['embedding'] = None
+        grouped.setdefault(episode['media_id'], []).append(episode)
+    return grouped
+
 async def get_existing_episode_identifiers(media_id: int) -> Set[Tuple[str, datetime.date]]:
     """
     Fetches a set of (title, publish_date) tuples for existing episodes of a given media.
@@ -418,19 +488,6 @@ async def get_existing_episode_identifiers(media_id: int) -> Set[Tuple[str, date
             logger.exception(f"Error fetching existing episode identifiers for media_id {media_id}: {e}")
             return set()
 
-# NEW: Function to fetch a single episode by ID
-async def get_episode_by_id(episode_id: int) -> Optional[Dict[str, Any]]:
-    """Fetches a single episode record by its ID."""
-    query = "SELECT * FROM episodes WHERE episode_id = $1;"
-    pool = await get_db_pool()
-    async with pool.acquire() as conn:
-        try:
-            row = await conn.fetchrow(query, episode_id)
-            return dict(row) if row else None
-        except Exception as e:
-            logger.exception(f"Error fetching episode {episode_id}: {e}")
-            return None
-
 # NEW: Function to update episode analysis data
 async def update_episode_analysis_data(
     episode_id: int,
@@ -484,10 +541,67 @@ async def update_episode_analysis_data(
             logger.exception(f"Error updating episode analysis data for episode {episode_id}: {e}")
             return None
 
-async def fetch_episodes_for_embedding_generation(limit: int = 20, pool: Optional[Any] = None) -> List[Dict[str, Any]]:
+async def bulk_update_episode_analysis_data(updates: List[Dict[str, Any]], pool: Optional[Any] = None) -> int:
+    """
+    Bulk version of update_episode_analysis_data: one UPDATE for many episodes.
+
+    Args:
+        updates: Dicts with episode_id and optional host_names, guest_names, episode_themes,
+                 episode_keywords and ai_analysis_done (default True). A missing/None
+                 field keeps the stored value, as in the single-row function.
+
+    Returns:
+        Number of episodes updated.
+    """
+    if not updates:
+        return 0
+    payload = []
+    for update in updates:
+        guest_names = update.get('guest_names')
+        payload.append({
+            'episode_id': update['episode_id'],
+            'host_names': update.get('host_names'),
+            # guest_names is TEXT, not TEXT[]
+            'guest_names': ', '.join(guest_names) if isinstance(guest_names, list) else guest_names,
+            'episode_themes': update.get('episode_themes'),
+            'episode_keywords': update.get('episode_keywords'),
+            'ai_analysis_done': update.get('ai_analysis_done', True)
+        })
+    # Per-row TEXT[] values cannot go through unnest, so rows travel as one JSON array
+    query = """
+    UPDATE episodes AS e
+    SET host_names = CASE WHEN jsonb_typeof(v.host_names) = 'array'
+                          THEN ARRAY(SELECT jsonb_array_elements_text(v.host_names)) ELSE e.host_names END,
+        guest_names = COALESCE(v.guest_names, e.guest_names),
+        episode_themes = CASE WHEN jsonb_typeof(v.episode_themes) = 'array'
+                              THEN ARRAY(SELECT jsonb_array_elements_text(v.episode_themes)) ELSE e.episode_themes END,
+        episode_keywords = CASE WHEN jsonb_typeof(v.episode_keywords) = 'array'
+                                THEN ARRAY(SELECT jsonb_array_elements_text(v.episode_keywords)) ELSE e.episode_keywords END,
+        ai_analysis_done = v.ai_analysis_done,
+        updated_at = NOW()
+    FROM jsonb_to_recordset($1::jsonb) AS v(
+        episode_id int, host_names jsonb, guest_names text,
+        episode_themes jsonb, episode_keywords jsonb, ai_analysis_done boolean
+    )
+    WHERE e.episode_id = v.episode_id;
+    """
+    pool_to_use = pool or await get_db_pool()
+    async with pool_to_use.acquire() as conn:
+        try:
+            result = await conn.execute(query, json.dumps(payload))
+            return int(result.split()[-1]) if result else 0
+        except Exception as e:
+            logger.exception(f"Error bulk updating analysis data for {len(updates)} episodes: {e}")
+            raise
+
+async def fetch_episodes_for_embedding_generation(limit: int = 20, pool: Optional[Any] = None,
+                                                  exclude_episode_ids: Optional[List[int]] = None) -> List[Dict[str, Any]]:
     """
     Return episodes that have content but are missing embeddings.
     
+    exclude_episode_ids lets a draining caller skip episodes that already
+    failed in the current run instead of fetching them again.
+    
     IMPORTANT: When no pool is provided, this function uses get_background_task_pool()
     instead of get_db_pool() because it's called from background embedding generation
     tasks. Using the frontend pool can cause timeout errors during AI operations.
@@ -500,6 +614,7 @@ async def fetch_episodes_for_embedding_generation(limit: int = 20, pool: Optiona
     WHERE embedding IS NULL 
     AND (transcript IS NOT NULL OR ai_episode_summary IS NOT NULL OR episode_summary IS NOT NULL)
     AND (transcript != '' OR ai_episode_summary != '' OR episode_summary != '')
+    AND NOT (episode_id = ANY($2::int[]))
     ORDER BY created_at ASC
     LIMIT $1;
     """
@@ -510,12 +625,82 @@ async def fetch_episodes_for_embedding_generation(limit: int = 20, pool: Optiona
         pool_to_use = pool
     async with pool_to_use.acquire() as conn:
         try:
-            rows = await conn.fetch(query, limit)
+            rows = await conn.fetch(query, limit, exclude_episode_ids or [])
             return [dict(row) for row in rows]
         except Exception as e:
             logger.exception("Error fetching episodes for embedding generation: %s", e)
             return []
 
+async def bulk_update_episode_embeddings(updates: List[Dict[str, Any]], pool: Optional[Any] = None) -> int:
+    """
+    Write embeddings (and optionally generated summaries) for many episodes in one statement.
+    
+    Args:
+        updates: Dicts with episode_id, embedding and optional ai_episode_summary.
+                 A missing/None summary keeps the stored one.
+        pool: Optional pool; defaults to the background task pool like the
+              fetch above, since this runs from embedding backfills.
+    
+    Returns:
+        Number of episodes updated.
+    """
+    if not updates:
+        return 0
+    query = """
+    UPDATE episodes AS e
+    SET embedding = v.embedding::vector,
+        ai_episode_summary = COALESCE(v.ai_episode_summary, e.ai_episode_summary),
+        updated_at = NOW()
+    FROM unnest($1::int[], $2::text[], $3::text[]) AS v(episode_id, embedding, ai_episode_summary)
+    WHERE e.episode_id = v.episode_id;
+    """
+    episode_ids = [update['episode_id'] for update in updates]
+    embeddings = ['[' + ','.join(map(str, update['embedding'])) + ']' for update in updates]
+    summaries = [update.get('ai_episode_summary') for update in updates]
+    
+    pool_to_use = pool or await get_background_task_pool()
+    async with pool_to_use.acquire() as conn:
+        try:
+            result = await conn.execute(query, episode_ids, embeddings, summaries)
+            return int(result.split()[-1]) if result else 0
+        except Exception as e:
+            logger.exception(f"Error bulk updating embeddings for {len(updates)} episodes: {e}")
+            raise
+
+async def bulk_save_reduced_transcripts(rows: List[Dict[str, Any]], pool: Optional[Any] = None) -> int:
+    """
+    Cache reduced transcripts for many episodes in one statement.
+
+    Args:
+        rows: Dicts with episode_id, reduced_transcript and reduced_transcript_key.
+
+    Returns:
+        Number of episodes updated.
+    """
+    if not rows:
+        return 0
+    # updated_at is left alone: this is a derived cache, not an edit of the episode
+    query = """
+    UPDATE episodes AS e
+    SET reduced_transcript = v.reduced_transcript,
+        reduced_transcript_key = v.reduced_transcript_key
+    FROM unnest($1::int[], $2::text[], $3::text[]) AS v(episode_id, reduced_transcript, reduced_transcript_key)
+    WHERE e.episode_id = v.episode_id;
+    """
+    pool_to_use = pool or await get_db_pool()
+    async with pool_to_use.acquire() as conn:
+        try:
+            result = await conn.execute(
+                query,
+                [row['episode_id'] for row in rows],
+                [row['reduced_transcript'] for row in rows],
+                [row['reduced_transcript_key'] for row in rows]
+            )
+            return int(result.split()[-1]) if result else 0
+        except Exception as e:
+            logger.exception(f"Error caching reduced transcripts for {len(rows)} episodes: {e}")
+            raise
+
 async def get_episodes_for_media_with_embeddings(media_id: int, limit: int = 5) -> List[Dict[str, Any]]:
     """
     Fetches recent episodes for a given media_id that have embeddings.
@@ -553,10 +738,11 @@ async def get_episodes_for_media_with_embeddings(media_id: int, limit: int = 5)
             logger.error(f"Error fetching episodes with embeddings for media_id {media_id}: {e}", exc_info=True)
             return []
 
-async def get_episodes_for_media_paginated(media_id: int, offset: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
+async def get_episodes_for_media_paginated(media_id: int, offset: int = 0, limit: int = 100,
+                                          profile: str = projections.DETAIL) -> List[Dict[str, Any]]:
     """Fetches episodes for a given media_id with pagination, ordered by publish_date descending."""
     query = """
-    SELECT *
+    SELECT {columns}
     FROM episodes
     WHERE media_id = $1
     ORDER BY publish_date DESC, episode_id DESC
@@ -565,22 +751,25 @@ async def get_episodes_for_media_paginated(media_id: int, offset: int = 0, limit
     pool = await get_db_pool()
     async with pool.acquire() as conn:
         try:
-            rows = await conn.fetch(query, media_id, limit, offset)
+            columns = await projections.select_list(conn, "episodes", profile)
+            rows = await conn.fetch(query.format(columns=columns), media_id, limit, offset)
             return [dict(row) for row in rows]
         except Exception as e:
             logger.error(f"Error fetching paginated episodes for media_id {media_id}: {e}", exc_info=True)
             return []
 
-async def get_episode_by_api_id(api_episode_id: str, media_id: int, source_api: str) -> Optional[Dict[str, Any]]:
+async def get_episode_by_api_id(api_episode_id: str, media_id: int, source_api: str,
+                                profile: str = projections.DETAIL) -> Optional[Dict[str, Any]]:
     """Fetches a single episode by its API-specific ID, media_id, and source_api."""
     query = """
-    SELECT * FROM episodes 
+    SELECT {columns} FROM episodes 
     WHERE api_episode_id = $1 AND media_id = $2 AND source_api = $3;
     """
     pool = await get_db_pool()
     async with pool.acquire() as conn:
         try:
-            row = await conn.fetchrow(query, api_episode_id, media_id, source_api)
+            columns = await projections.select_list(conn, "episodes", profile)
+            row = await conn.fetchrow(query.format(columns=columns), api_episode_id, media_id, source_api)
             return dict(row) if row else None
         except Exception as e:
             logger.exception(f"Error fetching episode by api_episode_id '{api_episode_id}' for media_id {media_id}: {e}")
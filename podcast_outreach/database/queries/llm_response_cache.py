@@ -0,0 +1,80 @@
+# podcast_outreach/database/queries/llm_response_cache.py
+
+from typing import Any, Dict, Optional
+
+from podcast_outreach.logging_config import get_logger
+from podcast_outreach.database.connection import get_db_pool
+
+logger = get_logger(__name__)
+
+async def get_cached_response(cache_key: str) -> Optional[Dict[str, Any]]:
+    """
+    Fetches an unexpired cached response and records the hit.
+
+    Returns:
+        Dict with response, tokens_in and tokens_out, or None on a miss.
+    """
+    query = """
+    UPDATE llm_response_cache
+    SET hit_count = hit_count + 1,
+        last_used_at = CURRENT_TIMESTAMP
+    WHERE cache_key = $1 AND expires_at > CURRENT_TIMESTAMP
+    RETURNING response, tokens_in, tokens_out;
+    """
+    pool = await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            row = await conn.fetchrow(query, cache_key)
+            return dict(row) if row else None
+        except Exception as e:
+            logger.exception(f"Error fetching cached LLM response {cache_key}: {e}")
+            raise
+
+async def store_response(cache_key: str, workflow: str, model: str, response: str,
+                         ttl_seconds: int, tokens_in: int = 0, tokens_out: int = 0) -> None:
+    """Stores a response for ttl_seconds, replacing an existing (e.g. expired) entry."""
+    query = """
+    INSERT INTO llm_response_cache (cache_key, workflow, model, response, tokens_in, tokens_out, expires_at)
+    VALUES ($1, $2, $3, $4, $5, $6, CURRENT_TIMESTAMP + make_interval(secs => $7))
+    ON CONFLICT (cache_key) DO UPDATE
+    SET response = EXCLUDED.response,
+        tokens_in = EXCLUDED.tokens_in,
+        tokens_out = EXCLUDED.tokens_out,
+        created_at = CURRENT_TIMESTAMP,
+        last_used_at = CURRENT_TIMESTAMP,
+        expires_at = EXCLUDED.expires_at;
+    """
+    pool = await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            await conn.execute(query, cache_key, workflow, model, response, tokens_in, tokens_out, float(ttl_seconds))
+        except Exception as e:
+            logger.exception(f"Error storing LLM response for workflow {workflow}: {e}")
+            raise
+
+async def prune_llm_response_cache(max_entries: int) -> int:
+    """
+    Deletes expired entries, then the least recently used ones beyond max_entries.
+    Returns the count removed.
+    """
+    expired_query = "DELETE FROM llm_response_cache WHERE expires_at <= CURRENT_TIMESTAMP;"
+    overflow_query = """
+    DELETE FROM llm_response_cache
+    WHERE cache_key IN (
+        SELECT cache_key FROM llm_response_cache
+        ORDER BY last_used_at DESC
+        OFFSET $1
+    );
+    """
+    pool = await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            expired = await conn.execute(expired_query)
+            overflow = await conn.execute(overflow_query, max_entries)
+            deleted = sum(int(result.split()[-1]) for result in (expired, overflow) if result)
+            if deleted:
+                logger.info(f"Pruned {deleted} LLM response cache entries")
+            return deleted
+        except Exception as e:
+            logger.exception(f"Error pruning LLM response cache: {e}")
+            raise
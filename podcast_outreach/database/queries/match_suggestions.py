@@ -286,3 +286,75 @@ async def get_matches_needing_vetting(limit: int = 10) -> List[Dict[str, Any]]:
         except Exception as e:
             logger.error(f"Error fetching matches needing vetting: {e}", exc_info=True)
             return []
+
+async def get_approved_matches_without_pitches(limit: int = 100, campaign_id: Optional[uuid.UUID] = None,
+                                               pool: Optional[Any] = None,
+                                               retry_backoff_minutes: int = 30,
+                                               retry_max_hours: int = 24) -> List[Dict[str, Any]]:
+    """
+    Fetches client-approved match suggestions that have no pitch yet, oldest approval first.
+    Same set as the /matches/approved-without-pitches listing, except that matches whose
+    generation failed wait retry_backoff_minutes, doubled per further failure and capped
+    at retry_max_hours, before they are taken again, and come after never-tried matches.
+    """
+    query = """
+    SELECT ms.*
+    FROM match_suggestions ms
+    WHERE (ms.status = 'client_approved' OR ms.status = 'approved')
+    AND ms.client_approved = TRUE
+    AND NOT EXISTS (
+        SELECT 1 FROM pitches p
+        WHERE p.campaign_id = ms.campaign_id AND p.media_id = ms.media_id
+    )
+    AND ($2::uuid IS NULL OR ms.campaign_id = $2)
+    AND (
+        ms.last_pitch_attempt_at IS NULL
+        OR ms.last_pitch_attempt_at <= NOW() - LEAST(
+            $3::int * power(2, LEAST(GREATEST(ms.pitch_attempts - 1, 0), 16)), $4::int * 60
+        ) * INTERVAL '1 minute'
+    )
+    ORDER BY ms.pitch_attempts ASC, ms.approved_at ASC NULLS LAST, ms.match_id ASC
+    LIMIT $1;
+    """
+    if pool is None:
+        pool = await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            rows = await conn.fetch(query, limit, campaign_id, retry_backoff_minutes, retry_max_hours)
+            return [dict(row) for row in rows]
+        except Exception as e:
+            logger.exception(f"Error fetching approved matches without pitches: {e}")
+            raise
+
+async def record_pitch_failures(failures: List[Dict[str, Any]], pool: Optional[Any] = None) -> int:
+    """
+    Counts a failed pitch generation attempt for each match, so
+    get_approved_matches_without_pitches backs off from it.
+
+    Args:
+        failures: Dicts with match_id and error, as in BatchPitchGenerator's summary.
+
+    Returns:
+        Number of matches updated.
+    """
+    if not failures:
+        return 0
+    query = """
+    UPDATE match_suggestions AS ms
+    SET pitch_attempts = ms.pitch_attempts + 1,
+        last_pitch_attempt_at = NOW(),
+        last_pitch_error = f.error
+    FROM unnest($1::int[], $2::text[]) AS f(match_id, error)
+    WHERE ms.match_id = f.match_id;
+    """
+    match_ids = [failure['match_id'] for failure in failures]
+    errors = [str(failure.get('error') or '')[:1000] for failure in failures]
+    if pool is None:
+        pool = await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            result = await conn.execute(query, match_ids, errors)
+            return int(result.split()[-1]) if result else 0
+        except Exception as e:
+            logger.exception(f"Error recording pitch failures for {len(failures)} matches: {e}")
+            raise
@@ -1,23 +1,26 @@
 # podcast_outreach/database/queries/media.py
 
 import logging
-from typing import Any, Dict, Optional, List
+from typing import Any, Dict, Optional, List, Tuple
 from datetime import datetime, date
 import uuid # For UUID types if needed for related entities
 
 from podcast_outreach.logging_config import get_logger
 from podcast_outreach.database.connection import get_db_pool, get_background_task_pool
+from podcast_outreach.database.queries import projections
 import asyncpg
 
 logger = get_logger(__name__)
 
-async def get_media_by_id_from_db(media_id: int, pool: Optional[asyncpg.Pool] = None) -> Optional[Dict[str, Any]]:
-    query = "SELECT * FROM media WHERE media_id = $1;"
+async def get_media_by_id_from_db(media_id: int, pool: Optional[asyncpg.Pool] = None,
+                                  profile: str = projections.DETAIL) -> Optional[Dict[str, Any]]:
+    """Fetches one media row with the columns of the given projection profile (no embedding by default)."""
     if pool is None:
         pool = await get_db_pool()
     async with pool.acquire() as conn:
         try:
-            row = await conn.fetchrow(query, media_id)
+            columns = await projections.select_list(conn, "media", profile)
+            row = await conn.fetchrow(f"SELECT {columns} FROM media WHERE media_id = $1;", media_id)
             if not row:
                 logger.debug(f"Media not found: {media_id}")
                 return None
@@ -26,13 +29,30 @@ async def get_media_by_id_from_db(media_id: int, pool: Optional[asyncpg.Pool] =
             logger.exception(f"Error fetching media {media_id}: {e}")
             raise
 
-async def get_media_by_rss_url_from_db(rss_url: str, pool: Optional[asyncpg.Pool] = None) -> Optional[Dict[str, Any]]:
-    query = "SELECT * FROM media WHERE rss_url = $1;"
+async def get_media_by_ids(media_ids: List[int], pool: Optional[asyncpg.Pool] = None,
+                           profile: str = projections.DETAIL) -> Dict[int, Dict[str, Any]]:
+    """Fetches many media rows in one query, keyed by media_id. Missing ids are simply absent."""
+    if not media_ids:
+        return {}
+    if pool is None:
+        pool = await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            columns = await projections.select_list(conn, "media", profile)
+            rows = await conn.fetch(f"SELECT {columns} FROM media WHERE media_id = ANY($1::int[]);", list(media_ids))
+            return {row['media_id']: dict(row) for row in rows}
+        except Exception as e:
+            logger.exception(f"Error fetching {len(media_ids)} media by id: {e}")
+            raise
+
+async def get_media_by_rss_url_from_db(rss_url: str, pool: Optional[asyncpg.Pool] = None,
+                                      profile: str = projections.DETAIL) -> Optional[Dict[str, Any]]:
     if pool is None:
         pool = await get_db_pool()
     async with pool.acquire() as conn:
         try:
-            row = await conn.fetchrow(query, rss_url)
+            columns = await projections.select_list(conn, "media", profile)
+            row = await conn.fetchrow(f"SELECT {columns} FROM media WHERE rss_url = $1;", rss_url)
             if not row:
                 logger.debug(f"Media not found by RSS URL: {rss_url}")
                 return None
@@ -41,12 +61,12 @@ async def get_media_by_rss_url_from_db(rss_url: str, pool: Optional[asyncpg.Pool
             logger.exception(f"Error fetching media by RSS URL {rss_url}: {e}")
             raise
 
-async def get_all_media_from_db(skip: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
-    query = "SELECT * FROM media ORDER BY created_at DESC OFFSET $1 LIMIT $2;"
+async def get_all_media_from_db(skip: int = 0, limit: int = 100, profile: str = projections.DETAIL) -> List[Dict[str, Any]]:
     pool = await get_db_pool()
     async with pool.acquire() as conn:
         try:
-            rows = await conn.fetch(query, skip, limit)
+            columns = await projections.select_list(conn, "media", profile)
+            rows = await conn.fetch(f"SELECT {columns} FROM media ORDER BY created_at DESC OFFSET $1 LIMIT $2;", skip, limit)
             return [dict(row) for row in rows]
         except Exception as e:
             logger.exception(f"Error fetching all media: {e}")
@@ -226,7 +246,7 @@ async def get_media_for_enrichment(batch_size: int = 10, enriched_before_hours:
     if only_new:
         # Core enrichment: only media that have never been enriched
         query = """
-        SELECT *
+        SELECT {columns}
         FROM media
         WHERE last_enriched_timestamp IS NULL
         ORDER BY created_at ASC
@@ -235,7 +255,8 @@ async def get_media_for_enrichment(batch_size: int = 10, enriched_before_hours:
         pool = await get_db_pool()
         async with pool.acquire() as conn:
             try:
-                rows = await conn.fetch(query, batch_size)
+                columns = await projections.select_list(conn, "media", projections.DETAIL)
+                rows = await conn.fetch(query.format(columns=columns), batch_size)
                 return [dict(row) for row in rows]
             except Exception as e:
                 logger.exception(f"Error fetching new media for core enrichment: {e}")
@@ -243,7 +264,7 @@ async def get_media_for_enrichment(batch_size: int = 10, enriched_before_hours:
     else:
         # Regular enrichment: includes re-enrichment of old data
         query = """
-        SELECT *
+        SELECT {columns}
         FROM media
         WHERE last_enriched_timestamp IS NULL OR last_enriched_timestamp < NOW() - INTERVAL '%d hours'
         ORDER BY last_enriched_timestamp ASC NULLS FIRST
@@ -252,7 +273,8 @@ async def get_media_for_enrichment(batch_size: int = 10, enriched_before_hours:
         pool = await get_db_pool()
         async with pool.acquire() as conn:
             try:
-                rows = await conn.fetch(query, batch_size)
+                columns = await projections.select_list(conn, "media", projections.DETAIL)
+                rows = await conn.fetch(query.format(columns=columns), batch_size)
                 return [dict(row) for row in rows]
             except Exception as e:
                 logger.exception(f"Error fetching media for enrichment: {e}")
@@ -299,7 +321,7 @@ async def get_media_for_quality_score_update(batch_size: int = 20, stale_hours:
     Only returns enriched media with sufficient episodes for scoring.
     """
     query = """
-    SELECT m.*
+    SELECT {columns}
     FROM media m
     WHERE m.last_enriched_timestamp IS NOT NULL  -- Must be enriched first
     AND (
@@ -318,7 +340,8 @@ async def get_media_for_quality_score_update(batch_size: int = 20, stale_hours:
     pool = await get_db_pool()
     async with pool.acquire() as conn:
         try:
-            rows = await conn.fetch(query, batch_size)
+            columns = await projections.select_list(conn, "media", projections.DETAIL, alias="m")
+            rows = await conn.fetch(query.format(columns=columns), batch_size)
             return [dict(row) for row in rows]
         except Exception as e:
             logger.exception(f"Error fetching media for quality score update: {e}")
@@ -588,6 +611,145 @@ async def update_media_quality_score(media_id: int, quality_score: float) -> boo
             logger.exception(f"Error updating media {media_id} quality score: {e}")
             raise
 
+# Scoring inputs per media. Day counts are computed here so the scorer only sees numbers.
+_QUALITY_SCORE_INPUT_COLUMNS = """
+    m.media_id,
+    (CASE WHEN m.latest_episode_date IS NOT NULL THEN CURRENT_DATE - m.latest_episode_date
+          ELSE floor(EXTRACT(EPOCH FROM NOW() - m.last_posted_at) / 86400) END)::float8 AS days_since_last,
+    (m.latest_episode_date - m.first_episode_date)::float8 AS episode_span_days,
+    m.publishing_frequency_days, m.total_episodes,
+    m.listen_score, m.audience_size,
+    m.itunes_rating_average, m.itunes_rating_count,
+    m.spotify_rating_average, m.spotify_rating_count,
+    m.twitter_followers, m.instagram_followers, m.youtube_subscribers,
+    m.tiktok_followers, m.facebook_likes
+"""
+
+async def _fetch_quality_score_inputs(query: str, args: List[Any], pool: Optional[asyncpg.Pool]) -> Dict[str, List[Any]]:
+    pool = pool or await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            rows = await conn.fetch(query.format(columns=_QUALITY_SCORE_INPUT_COLUMNS), *args)
+        except Exception as e:
+            logger.exception(f"Error fetching quality score inputs: {e}")
+            raise
+    if not rows:
+        return {}
+    return {key: [row[key] for row in rows] for key in rows[0].keys()}
+
+async def get_quality_score_inputs(media_ids: List[int], pool: Optional[asyncpg.Pool] = None) -> Dict[str, List[Any]]:
+    """
+    Quality score inputs of the given media as columns.
+
+    Returns:
+        Dict mapping media_id, days_since_last, episode_span_days and the raw
+        frequency, audience and social columns to equal-length lists (None for
+        NULL); empty if no media matched.
+    """
+    if not media_ids:
+        return {}
+    query = """
+    SELECT {columns}
+    FROM media m
+    WHERE m.media_id = ANY($1::int[])
+    ORDER BY m.media_id;
+    """
+    return await _fetch_quality_score_inputs(query, [list(media_ids)], pool)
+
+async def get_stale_quality_score_inputs(batch_size: int = 500, stale_hours: int = 24 * 7,
+                                         pool: Optional[asyncpg.Pool] = None) -> Dict[str, List[Any]]:
+    """Quality score inputs, as columns, of the media get_media_for_quality_score_update would return."""
+    query = """
+    SELECT {columns}
+    FROM media m
+    WHERE m.last_enriched_timestamp IS NOT NULL
+    AND (
+        m.quality_score IS NULL OR
+        m.updated_at < NOW() - make_interval(hours => $2)
+    )
+    AND EXISTS (
+        SELECT 1 FROM episodes e
+        WHERE e.media_id = m.media_id
+        AND (e.transcript IS NOT NULL OR e.ai_episode_summary IS NOT NULL)
+    )
+    ORDER BY m.updated_at ASC NULLS FIRST
+    LIMIT $1;
+    """
+    return await _fetch_quality_score_inputs(query, [batch_size, int(stale_hours)], pool)
+
+async def get_quality_score_inputs_page(after_media_id: int = 0, limit: int = 5000,
+                                        pool: Optional[asyncpg.Pool] = None) -> Dict[str, List[Any]]:
+    """
+    Quality score inputs, as columns, of the next `limit` enriched media with
+    media_id > after_media_id. Used to walk the whole catalogue by keyset.
+    """
+    query = """
+    SELECT {columns}
+    FROM media m
+    WHERE m.last_enriched_timestamp IS NOT NULL
+    AND m.media_id > $1
+    ORDER BY m.media_id
+    LIMIT $2;
+    """
+    return await _fetch_quality_score_inputs(query, [after_media_id, limit], pool)
+
+async def bulk_update_media_quality_scores(scores: Dict[str, Any], compile_episode_summaries: bool = True,
+                                           pool: Optional[asyncpg.Pool] = None) -> int:
+    """
+    Writes quality scores and their components for many media in one statement.
+
+    Args:
+        scores: Equal-length sequences keyed media_id, quality_score,
+            quality_score_recency, quality_score_frequency,
+            quality_score_audience and quality_score_social.
+        compile_episode_summaries: Also rebuild episode_summaries_compiled, as
+            update_media_quality_score does. Media without summarized
+            episodes keep their current value.
+
+    Returns:
+        Number of media rows updated.
+    """
+    media_ids = [int(media_id) for media_id in scores.get("media_id", [])]
+    if not media_ids:
+        return 0
+    query = """
+    UPDATE media AS m
+    SET quality_score = u.quality_score,
+        quality_score_recency = u.recency,
+        quality_score_frequency = u.frequency,
+        quality_score_audience = u.audience,
+        quality_score_social = u.social,
+        quality_score_last_calculated = NOW(),
+        episode_summaries_compiled = COALESCE(es.compiled_summaries, m.episode_summaries_compiled),
+        updated_at = NOW()
+    FROM unnest($1::int[], $2::float8[], $3::float8[], $4::float8[], $5::float8[], $6::float8[])
+        AS u(media_id, quality_score, recency, frequency, audience, social)
+    LEFT JOIN LATERAL (
+        SELECT string_agg(
+            COALESCE(e.ai_episode_summary, e.episode_summary, ''),
+            E'\n\n---\n\n'
+            ORDER BY e.publish_date DESC
+        ) AS compiled_summaries
+        FROM episodes e
+        WHERE $7 AND e.media_id = u.media_id
+        AND (e.ai_episode_summary IS NOT NULL OR e.episode_summary IS NOT NULL)
+    ) es ON TRUE
+    WHERE m.media_id = u.media_id;
+    """
+    columns = [
+        [float(value) for value in scores[key]]
+        for key in ("quality_score", "quality_score_recency", "quality_score_frequency",
+                    "quality_score_audience", "quality_score_social")
+    ]
+    pool = pool or await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            result = await conn.execute(query, media_ids, *columns, compile_episode_summaries)
+            return int(result.split()[-1])
+        except Exception as e:
+            logger.exception(f"Error bulk updating quality scores for {len(media_ids)} media: {e}")
+            raise
+
 async def count_transcribed_episodes_for_media(media_id: int) -> int:
     """Counts the number of episodes for a media item that have a transcript."""
     query = """
@@ -623,7 +785,7 @@ async def get_media_for_recommendation(limit: int = 3, min_quality_score: Option
             
             # Order by quality_score desc (if available), then by recency of last_posted_at or creation
             query = f"""
-                SELECT * FROM media
+                SELECT {await projections.select_list(conn, "media", projections.DETAIL)} FROM media
                 {where_clause}
                 ORDER BY quality_score DESC NULLS LAST, last_posted_at DESC NULLS LAST, created_at DESC
                 LIMIT ${len(params) + 1};
@@ -656,6 +818,32 @@ async def link_person_to_media(media_id: int, person_id: int, role: str) -> bool
             logger.error(f"Error linking person {person_id} to media {media_id}: {e}", exc_info=True)
             return False
 
+async def link_people_to_media(links: List[Tuple[int, int]], role: str, pool: Optional[asyncpg.Pool] = None) -> int:
+    """
+    Links many (media_id, person_id) pairs in media_people with one insert.
+    Existing links are left as they are.
+
+    Returns:
+        Number of links created.
+    """
+    links = list(dict.fromkeys(links))
+    if not links:
+        return 0
+    query = """
+    INSERT INTO media_people (media_id, person_id, show_role)
+    SELECT media_id, person_id, $3
+    FROM unnest($1::int[], $2::int[]) AS l(media_id, person_id)
+    ON CONFLICT (media_id, person_id) DO NOTHING;
+    """
+    pool = pool or await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            result = await conn.execute(query, [m for m, _ in links], [p for _, p in links], role)
+            return int(result.split()[-1])
+        except Exception as e:
+            logger.exception(f"Error linking {len(links)} people to media: {e}")
+            raise
+
 async def check_campaign_media_discovery_exists(campaign_id: uuid.UUID, media_id: int, pool: Optional[asyncpg.Pool] = None) -> bool:
     """
     Check if a campaign-media discovery record already exists.
@@ -774,4 +962,94 @@ async def update_media_embedding(media_id: int, embedding: list) -> bool:
             return True
         except Exception as e:
             logger.error(f"Error updating embedding for media {media_id}: {e}")
-            return False
\ No newline at end of file
+            return False
+
+async def get_host_verification_inputs(media_ids: List[int], episodes_per_media: int = 10,
+                                       pool: Optional[asyncpg.Pool] = None) -> Dict[int, Dict[str, Any]]:
+    """
+    Loads what host verification reads for many media: their host-related
+    columns and the host_names of their latest episodes (one windowed query).
+    Transcripts and embeddings are not read.
+
+    Returns:
+        Dict keyed by media_id; each row has an 'episodes' list of
+        {'host_names', 'has_transcript'} dicts, newest first.
+    """
+    if not media_ids:
+        return {}
+    media_query = """
+    SELECT media_id, host_names, host_names_discovery_confidence, rss_owner_name, description
+    FROM media
+    WHERE media_id = ANY($1::int[]);
+    """
+    # octet_length reads the stored size, so transcripts are not decompressed
+    episodes_query = """
+    SELECT media_id, host_names, has_transcript
+    FROM (
+        SELECT e.media_id, e.host_names,
+               COALESCE(octet_length(e.transcript), 0) > 0 AS has_transcript,
+               ROW_NUMBER() OVER (PARTITION BY e.media_id ORDER BY e.publish_date DESC, e.episode_id DESC) AS rn
+        FROM episodes e
+        WHERE e.media_id = ANY($1::int[])
+    ) ranked
+    WHERE rn <= $2
+    ORDER BY media_id, rn;
+    """
+    pool = pool or await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            media_rows = await conn.fetch(media_query, list(media_ids))
+            inputs = {row['media_id']: {**dict(row), 'episodes': []} for row in media_rows}
+            for row in await conn.fetch(episodes_query, list(inputs), episodes_per_media):
+                inputs[row['media_id']]['episodes'].append(
+                    {'host_names': row['host_names'], 'has_transcript': row['has_transcript']}
+                )
+            return inputs
+        except Exception as e:
+            logger.exception(f"Error loading host verification inputs for {len(media_ids)} media: {e}")
+            raise
+
+async def bulk_update_host_verification(results: List[Dict[str, Any]], pool: Optional[asyncpg.Pool] = None) -> int:
+    """
+    Writes host verification results for many media in one statement.
+
+    Args:
+        results: Dicts with media_id, host_names (list), discovery_sources
+            (list) and confidence_scores (dict name -> score).
+
+    Returns:
+        Number of media rows updated.
+    """
+    if not results:
+        return 0
+    import json
+    payload = [
+        {
+            "media_id": r["media_id"],
+            "host_names": r["host_names"],
+            "discovery_sources": r["discovery_sources"],
+            "confidence_scores": r["confidence_scores"],
+        }
+        for r in results
+    ]
+    # Per-row TEXT[] values cannot go through unnest, so rows travel as one JSON array
+    query = """
+    UPDATE media AS m
+    SET host_names = ARRAY(SELECT jsonb_array_elements_text(v.host_names)),
+        host_names_discovery_sources = v.discovery_sources,
+        host_names_discovery_confidence = v.confidence_scores,
+        host_names_last_verified = NOW(),
+        updated_at = NOW()
+    FROM jsonb_to_recordset($1::jsonb) AS v(
+        media_id int, host_names jsonb, discovery_sources jsonb, confidence_scores jsonb
+    )
+    WHERE m.media_id = v.media_id;
+    """
+    pool = pool or await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            result = await conn.execute(query, json.dumps(payload))
+            return int(result.split()[-1])
+        except Exception as e:
+            logger.exception(f"Error bulk updating host verification for {len(results)} media: {e}")
+            raise
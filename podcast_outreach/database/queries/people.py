@@ -114,6 +114,93 @@ async def get_person_by_email_from_db(email: str) -> Optional[Dict[str, Any]]:
             logger.exception(f"Error fetching person by email {email}: {e}")
             raise
 
+async def resolve_people_by_names(names: List[str], role: str = "host", create_missing: bool = True,
+                                  trigram_threshold: Optional[float] = None,
+                                  pool: Optional[Any] = None) -> Dict[str, int]:
+    """
+    Resolves many names to person_ids in one transaction.
+
+    Names are compared by normalize_person_name() against the indexed
+    people.normalized_name, so case, titles and punctuation do not matter.
+    With trigram_threshold (0.3-1.0, needs pg_trgm), names without an exact
+    normalized match take the most similar person at or above it. Remaining
+    names are inserted in one statement with the given role, one person per
+    normalized name. Inserts take an advisory lock per normalized name, so
+    concurrent enrichments do not create the same host twice.
+
+    Returns:
+        Dict mapping each input name to its person_id. Names that normalize to
+        nothing, or are unmatched with create_missing False, are absent.
+    """
+    names = list(dict.fromkeys(n for n in names if n and isinstance(n, str)))
+    if not names:
+        return {}
+    lookup_query = """
+    SELECT n.name, normalize_person_name(n.name) AS name_key, p.person_id
+    FROM unnest($1::text[]) AS n(name)
+    LEFT JOIN LATERAL (
+        SELECT person_id FROM people
+        WHERE normalized_name = normalize_person_name(n.name)
+        ORDER BY person_id
+        LIMIT 1
+    ) p ON TRUE;
+    """
+    trigram_query = """
+    SELECT DISTINCT ON (n.name_key) n.name_key, p.person_id
+    FROM unnest($1::text[]) AS n(name_key)
+    JOIN people p ON p.normalized_name % n.name_key
+    WHERE similarity(p.normalized_name, n.name_key) >= $2
+    ORDER BY n.name_key, similarity(p.normalized_name, n.name_key) DESC, p.person_id;
+    """
+    lock_query = """
+    SELECT pg_advisory_xact_lock(hashtext('person_name:' || name_key))
+    FROM unnest($1::text[]) AS name_key
+    ORDER BY name_key;
+    """
+    recheck_query = """
+    SELECT DISTINCT ON (normalized_name) normalized_name AS name_key, person_id
+    FROM people
+    WHERE normalized_name = ANY($1::text[])
+    ORDER BY normalized_name, person_id;
+    """
+    insert_query = """
+    INSERT INTO people (full_name, role)
+    SELECT DISTINCT ON (normalize_person_name(n.name)) n.name, $2
+    FROM unnest($1::text[]) WITH ORDINALITY AS n(name, ord)
+    ORDER BY normalize_person_name(n.name), n.ord
+    RETURNING normalized_name AS name_key, person_id;
+    """
+    pool = pool or await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            async with conn.transaction():
+                rows = await conn.fetch(lookup_query, names)
+                name_keys = {row['name']: row['name_key'] for row in rows if row['name_key']}
+                resolved = {row['name_key']: row['person_id'] for row in rows if row['person_id'] is not None}
+
+                missing = sorted({key for key in name_keys.values() if key not in resolved})
+                if missing and trigram_threshold:
+                    for row in await conn.fetch(trigram_query, missing, float(trigram_threshold)):
+                        resolved[row['name_key']] = row['person_id']
+                    missing = [key for key in missing if key not in resolved]
+
+                if missing and create_missing:
+                    await conn.execute(lock_query, missing)
+                    # Another transaction may have created some while we waited for the locks
+                    for row in await conn.fetch(recheck_query, missing):
+                        resolved[row['name_key']] = row['person_id']
+                    to_insert = [name for name, key in name_keys.items() if key in missing and key not in resolved]
+                    if to_insert:
+                        created = await conn.fetch(insert_query, to_insert, role)
+                        for row in created:
+                            resolved[row['name_key']] = row['person_id']
+                        logger.info(f"Created {len(created)} people with role '{role}'")
+
+                return {name: resolved[key] for name, key in name_keys.items() if key in resolved}
+        except Exception as e:
+            logger.exception(f"Error resolving {len(names)} people by name: {e}")
+            raise
+
 async def get_all_people_from_db(skip: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
     query = "SELECT * FROM people ORDER BY created_at DESC OFFSET $1 LIMIT $2;"
     pool = await get_db_pool()
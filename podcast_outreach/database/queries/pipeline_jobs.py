@@ -0,0 +1,266 @@
+# podcast_outreach/database/queries/pipeline_jobs.py
+
+from typing import Any, Dict, List, Optional
+
+from podcast_outreach.logging_config import get_logger
+from podcast_outreach.database.connection import get_db_pool
+
+logger = get_logger(__name__)
+
+async def enqueue_jobs(stage: str, discovery_ids: List[int], max_attempts: int = 3,
+                       delay_seconds: float = 0, pool: Optional[Any] = None) -> int:
+    """
+    Queues a stage for each discovery. A discovery that already has a queued or
+    running job for the stage is skipped.
+
+    Returns:
+        Number of jobs created.
+    """
+    if not discovery_ids:
+        return 0
+    query = """
+    INSERT INTO pipeline_jobs (stage, discovery_id, max_attempts, visible_at)
+    SELECT $1, discovery_id, $3, NOW() + make_interval(secs => $4)
+    FROM unnest($2::int[]) AS discovery_id
+    ON CONFLICT (stage, discovery_id) WHERE status IN ('queued', 'running') DO NOTHING;
+    """
+    pool = pool or await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            result = await conn.execute(query, stage, list(discovery_ids), max_attempts, float(delay_seconds))
+            return int(result.split()[-1])
+        except Exception as e:
+            logger.exception(f"Error enqueueing {len(discovery_ids)} '{stage}' jobs: {e}")
+            raise
+
+async def claim_jobs(stage: str, limit: int, visibility_timeout_seconds: int, worker_id: str,
+                     pool: Optional[Any] = None) -> List[Dict[str, Any]]:
+    """
+    Claims up to `limit` visible jobs of a stage with FOR UPDATE SKIP LOCKED.
+
+    A claimed job is hidden for visibility_timeout_seconds; if the worker does
+    not complete or fail it in time, the job becomes claimable again. Jobs whose
+    timeout expired on their last attempt are marked failed instead.
+
+    Returns:
+        One dict per job: the campaign_media_discoveries row with job_id, stage,
+        attempts, max_attempts, media_name and ai_description added.
+    """
+    expire_query = """
+    UPDATE pipeline_jobs
+    SET status = 'failed',
+        last_error = COALESCE(last_error, 'Visibility timeout expired'),
+        locked_by = NULL,
+        updated_at = NOW()
+    WHERE stage = $1
+    AND status = 'running'
+    AND visible_at <= NOW()
+    AND attempts >= max_attempts;
+    """
+    claim_query = """
+    WITH next_jobs AS (
+        SELECT job_id
+        FROM pipeline_jobs
+        WHERE stage = $1
+        AND status IN ('queued', 'running')
+        AND visible_at <= NOW()
+        AND attempts < max_attempts
+        ORDER BY visible_at, job_id
+        LIMIT $2
+        FOR UPDATE SKIP LOCKED
+    ), claimed AS (
+        UPDATE pipeline_jobs j
+        SET status = 'running',
+            attempts = j.attempts + 1,
+            visible_at = NOW() + make_interval(secs => $3),
+            locked_by = $4,
+            updated_at = NOW()
+        FROM next_jobs
+        WHERE j.job_id = next_jobs.job_id
+        RETURNING j.job_id, j.stage, j.discovery_id, j.attempts, j.max_attempts
+    )
+    SELECT cmd.*, claimed.job_id, claimed.stage, claimed.attempts, claimed.max_attempts,
+           m.name AS media_name, m.ai_description
+    FROM claimed
+    JOIN campaign_media_discoveries cmd ON cmd.id = claimed.discovery_id
+    JOIN media m ON m.media_id = cmd.media_id
+    ORDER BY claimed.job_id;
+    """
+    pool = pool or await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            await conn.execute(expire_query, stage)
+            rows = await conn.fetch(claim_query, stage, limit, float(visibility_timeout_seconds), worker_id)
+            return [dict(row) for row in rows]
+        except Exception as e:
+            logger.exception(f"Error claiming '{stage}' jobs: {e}")
+            raise
+
+async def complete_job(job_id: int, worker_id: str, next_stage: Optional[str] = None,
+                       max_attempts: int = 3, pool: Optional[Any] = None) -> bool:
+    """
+    Marks a claimed job done and, in the same transaction, queues the next stage
+    for its discovery.
+
+    Returns:
+        False if the job was no longer held by this worker (its visibility
+        timeout expired and it was claimed again); nothing is changed then.
+    """
+    done_query = """
+    UPDATE pipeline_jobs
+    SET status = 'done',
+        completed_at = NOW(),
+        updated_at = NOW(),
+        last_error = NULL
+    WHERE job_id = $1 AND locked_by = $2 AND status = 'running'
+    RETURNING discovery_id;
+    """
+    next_query = """
+    INSERT INTO pipeline_jobs (stage, discovery_id, max_attempts)
+    VALUES ($1, $2, $3)
+    ON CONFLICT (stage, discovery_id) WHERE status IN ('queued', 'running') DO NOTHING;
+    """
+    pool = pool or await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            async with conn.transaction():
+                discovery_id = await conn.fetchval(done_query, job_id, worker_id)
+                if discovery_id is None:
+                    return False
+                if next_stage:
+                    await conn.execute(next_query, next_stage, discovery_id, max_attempts)
+                return True
+        except Exception as e:
+            logger.exception(f"Error completing pipeline job {job_id}: {e}")
+            raise
+
+async def fail_job(job_id: int, worker_id: str, error: str, retry_delay_seconds: float,
+                   pool: Optional[Any] = None) -> Optional[str]:
+    """
+    Records a failed attempt. The job is queued again after retry_delay_seconds,
+    doubled for every earlier attempt, until max_attempts is reached.
+
+    Returns:
+        The job's new status ('queued' or 'failed'), or None if this worker no longer held it.
+    """
+    query = """
+    UPDATE pipeline_jobs
+    SET status = CASE WHEN attempts >= max_attempts THEN 'failed' ELSE 'queued' END,
+        visible_at = NOW() + make_interval(secs => $4 * power(2, GREATEST(attempts - 1, 0))),
+        last_error = $3,
+        locked_by = NULL,
+        updated_at = NOW()
+    WHERE job_id = $1 AND locked_by = $2 AND status = 'running'
+    RETURNING status;
+    """
+    pool = pool or await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            return await conn.fetchval(query, job_id, worker_id, error[:2000], float(retry_delay_seconds))
+        except Exception as e:
+            logger.exception(f"Error failing pipeline job {job_id}: {e}")
+            raise
+
+async def enqueue_ready_discoveries(max_attempts: int = 3, limit: int = 500,
+                                    pool: Optional[Any] = None) -> Dict[str, int]:
+    """
+    Queues discoveries that are waiting on a stage but have no live job for it,
+    using the conditions the polling loops used: enriched media without an AI
+    description, discoveries ready for vetting, and vetted discoveries scoring
+    50 or more without a match. Covers rows that predate the queue or were
+    advanced outside the workers.
+
+    Returns:
+        Jobs created per stage.
+    """
+    queries = {
+        "ai_description": """
+        SELECT cmd.id
+        FROM campaign_media_discoveries cmd
+        JOIN media m ON cmd.media_id = m.media_id
+        WHERE cmd.enrichment_status = 'completed'
+        AND cmd.vetting_status = 'pending'
+        AND (m.ai_description IS NULL OR m.ai_description = '')
+        AND m.total_episodes > 0
+        AND (cmd.enrichment_error IS NULL OR cmd.enrichment_error NOT LIKE 'PROCESSING:%')
+        AND NOT EXISTS (
+            SELECT 1 FROM pipeline_jobs j
+            WHERE j.discovery_id = cmd.id AND j.stage = 'ai_description' AND j.status IN ('queued', 'running')
+        )
+        ORDER BY cmd.enrichment_completed_at ASC
+        LIMIT $1
+        """,
+        "vetting": """
+        SELECT cmd.id
+        FROM campaign_media_discoveries cmd
+        JOIN media m ON cmd.media_id = m.media_id
+        JOIN campaigns c ON cmd.campaign_id = c.campaign_id
+        WHERE cmd.enrichment_status = 'completed'
+        AND cmd.vetting_status = 'pending'
+        AND m.ai_description IS NOT NULL
+        AND c.ideal_podcast_description IS NOT NULL
+        AND EXISTS (SELECT 1 FROM episodes e WHERE e.media_id = m.media_id)
+        AND NOT EXISTS (
+            SELECT 1 FROM pipeline_jobs j
+            WHERE j.discovery_id = cmd.id AND j.stage = 'vetting' AND j.status IN ('queued', 'running')
+        )
+        ORDER BY cmd.enrichment_completed_at ASC
+        LIMIT $1
+        """,
+        "match_creation": """
+        SELECT cmd.id
+        FROM campaign_media_discoveries cmd
+        WHERE cmd.vetting_status = 'completed'
+        AND cmd.vetting_score >= 50
+        AND COALESCE(cmd.match_created, FALSE) = FALSE
+        AND NOT EXISTS (
+            SELECT 1 FROM pipeline_jobs j
+            WHERE j.discovery_id = cmd.id AND j.stage = 'match_creation' AND j.status IN ('queued', 'running')
+        )
+        ORDER BY cmd.vetted_at ASC
+        LIMIT $1
+        """
+    }
+    pool = pool or await get_db_pool()
+    created: Dict[str, int] = {}
+    async with pool.acquire() as conn:
+        try:
+            for stage, query in queries.items():
+                discovery_ids = [row['id'] for row in await conn.fetch(query, limit)]
+                if not discovery_ids:
+                    created[stage] = 0
+                    continue
+                result = await conn.execute("""
+                INSERT INTO pipeline_jobs (stage, discovery_id, max_attempts)
+                SELECT $1, discovery_id, $3 FROM unnest($2::int[]) AS discovery_id
+                ON CONFLICT (stage, discovery_id) WHERE status IN ('queued', 'running') DO NOTHING;
+                """, stage, discovery_ids, max_attempts)
+                created[stage] = int(result.split()[-1])
+            return created
+        except Exception as e:
+            logger.exception(f"Error enqueueing ready discoveries: {e}")
+            raise
+
+async def get_queue_stats(pool: Optional[Any] = None) -> Dict[str, Dict[str, int]]:
+    """Job counts by stage and status, plus the age in seconds of the oldest visible queued job per stage."""
+    query = """
+    SELECT stage, status, COUNT(*) AS jobs,
+           COALESCE(EXTRACT(EPOCH FROM NOW() - MIN(visible_at)) FILTER (
+               WHERE status = 'queued' AND visible_at <= NOW()
+           ), 0)::int AS oldest_wait_seconds
+    FROM pipeline_jobs
+    WHERE status IN ('queued', 'running') OR updated_at > NOW() - INTERVAL '1 day'
+    GROUP BY stage, status;
+    """
+    pool = pool or await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            stats: Dict[str, Dict[str, int]] = {}
+            for row in await conn.fetch(query):
+                stage_stats = stats.setdefault(row['stage'], {'oldest_wait_seconds': 0})
+                stage_stats[row['status']] = row['jobs']
+                stage_stats['oldest_wait_seconds'] = max(stage_stats['oldest_wait_seconds'], row['oldest_wait_seconds'])
+            return stats
+        except Exception as e:
+            logger.exception(f"Error fetching pipeline queue stats: {e}")
+            raise
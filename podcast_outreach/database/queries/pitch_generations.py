@@ -50,6 +50,117 @@ async def create_pitch_generation_in_db(pitch_gen_data: Dict[str, Any]) -> Optio
             logger.exception(f"Error creating pitch generation record for campaign {pitch_gen_data.get('campaign_id')} and media {pitch_gen_data.get('media_id')}: {e}")
             raise
 
+async def bulk_create_pitch_drafts(drafts: List[Dict[str, Any]], pool: Optional[Any] = None) -> List[Dict[str, Any]]:
+    """
+    Writes many generated pitches in one transaction: the pitch_generations rows,
+    their initial pitches records and pending pitch_review tasks.
+
+    Args:
+        drafts: Dicts with campaign_id, media_id, template_id, draft_text, subject_line,
+                ai_model_used, pitch_topic, temperature, match_score, matched_keywords
+                and review_notes. (campaign_id, media_id) pairs must be unique.
+        pool: Optional pool; defaults to the contextual pool.
+
+    Returns:
+        One dict per written draft with campaign_id, media_id, pitch_gen_id, pitch_id
+        and review_task_id. Pairs that gained a pitch in the meantime are skipped.
+    """
+    if not drafts:
+        return []
+    pool = pool or await get_db_pool()
+    async with pool.acquire() as conn:
+        async with conn.transaction():
+            try:
+                # Another run (or a manual /pitches/generate) may have pitched a pair since it was fetched
+                existing = await conn.fetch(
+                    """
+                    SELECT DISTINCT p.campaign_id, p.media_id
+                    FROM pitches p
+                    JOIN unnest($1::uuid[], $2::int[]) AS d(campaign_id, media_id)
+                      ON p.campaign_id = d.campaign_id AND p.media_id = d.media_id;
+                    """,
+                    [d['campaign_id'] for d in drafts], [d['media_id'] for d in drafts]
+                )
+                already_pitched = {(row['campaign_id'], row['media_id']) for row in existing}
+                if already_pitched:
+                    logger.info(f"Skipping {len(already_pitched)} drafts whose match already has a pitch")
+                drafts = [d for d in drafts if (d['campaign_id'], d['media_id']) not in already_pitched]
+                if not drafts:
+                    return []
+
+                gen_rows = await conn.fetch(
+                    """
+                    INSERT INTO pitch_generations (
+                        campaign_id, media_id, template_id, draft_text, ai_model_used,
+                        pitch_topic, temperature, send_ready_bool, generation_status
+                    )
+                    SELECT campaign_id, media_id, template_id, draft_text, ai_model_used,
+                           pitch_topic, temperature, FALSE, 'draft'
+                    FROM unnest($1::uuid[], $2::int[], $3::text[], $4::text[], $5::text[], $6::text[], $7::float8[])
+                        AS d(campaign_id, media_id, template_id, draft_text, ai_model_used, pitch_topic, temperature)
+                    RETURNING pitch_gen_id, campaign_id, media_id;
+                    """,
+                    [d['campaign_id'] for d in drafts],
+                    [d['media_id'] for d in drafts],
+                    [d['template_id'] for d in drafts],
+                    [d['draft_text'] for d in drafts],
+                    [d.get('ai_model_used') for d in drafts],
+                    [d.get('pitch_topic') for d in drafts],
+                    [d.get('temperature') for d in drafts]
+                )
+                gen_ids = {(row['campaign_id'], row['media_id']): row['pitch_gen_id'] for row in gen_rows}
+
+                # matched_keywords is TEXT[] per row, which unnest cannot carry, so pitches go through executemany
+                await conn.executemany(
+                    """
+                    INSERT INTO pitches (
+                        campaign_id, media_id, attempt_no, match_score, matched_keywords,
+                        score_evaluated_at, outreach_type, subject_line, body_snippet,
+                        reply_bool, pitch_gen_id, pitch_state, client_approval_status, created_by
+                    ) VALUES ($1, $2, 1, $3, $4, NOW(), 'cold_email', $5, $6, FALSE, $7, 'generated', 'pending_review', 'system_ai');
+                    """,
+                    [
+                        (d['campaign_id'], d['media_id'], d.get('match_score'), d.get('matched_keywords'),
+                         d.get('subject_line'), (d['draft_text'] or '')[:250], gen_ids[(d['campaign_id'], d['media_id'])])
+                        for d in drafts
+                    ]
+                )
+                pitch_rows = await conn.fetch(
+                    "SELECT pitch_id, pitch_gen_id FROM pitches WHERE pitch_gen_id = ANY($1::int[]);",
+                    list(gen_ids.values())
+                )
+                pitch_ids = {row['pitch_gen_id']: row['pitch_id'] for row in pitch_rows}
+
+                task_rows = await conn.fetch(
+                    """
+                    INSERT INTO review_tasks (task_type, related_id, campaign_id, status, notes)
+                    SELECT 'pitch_review', related_id, campaign_id, 'pending', notes
+                    FROM unnest($1::int[], $2::uuid[], $3::text[]) AS t(related_id, campaign_id, notes)
+                    RETURNING review_task_id, related_id;
+                    """,
+                    [gen_ids[(d['campaign_id'], d['media_id'])] for d in drafts],
+                    [d['campaign_id'] for d in drafts],
+                    [d.get('review_notes') for d in drafts]
+                )
+                task_ids = {row['related_id']: row['review_task_id'] for row in task_rows}
+            except Exception as e:
+                logger.exception(f"Error bulk creating {len(drafts)} pitch drafts: {e}")
+                raise
+
+    review_tasks.invalidate_review_task_counts()
+    written = []
+    for d in drafts:
+        pitch_gen_id = gen_ids[(d['campaign_id'], d['media_id'])]
+        written.append({
+            "campaign_id": d['campaign_id'],
+            "media_id": d['media_id'],
+            "pitch_gen_id": pitch_gen_id,
+            "pitch_id": pitch_ids.get(pitch_gen_id),
+            "review_task_id": task_ids.get(pitch_gen_id)
+        })
+    logger.info(f"Bulk created {len(written)} pitch drafts with review tasks")
+    return written
+
 async def get_pitch_generation_by_id(pitch_gen_id: int) -> Optional[Dict[str, Any]]:
     """Fetches a pitch generation record by its ID."""
     query = "SELECT * FROM pitch_generations WHERE pitch_gen_id = $1;"
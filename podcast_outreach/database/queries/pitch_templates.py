@@ -51,6 +51,17 @@ async def get_template_by_id(template_id_str: str) -> Optional[Dict[str, Any]]:
             logger.exception(f"Error fetching pitch template by ID '{template_id_str}': {e}")
             return None # Or raise
 
+async def get_template_version(template_id_str: str) -> Optional[int]:
+    """Fetches only a template's version, for revalidating cached copies."""
+    query = "SELECT version FROM pitch_templates WHERE template_id = $1;"
+    pool = await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            return await conn.fetchval(query, template_id_str)
+        except Exception as e:
+            logger.exception(f"Error fetching version of pitch template '{template_id_str}': {e}")
+            return None
+
 async def list_templates(skip: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
     """Lists pitch templates with pagination."""
     query = "SELECT * FROM pitch_templates ORDER BY created_at DESC OFFSET $1 LIMIT $2;"
@@ -0,0 +1,132 @@
+# podcast_outreach/database/queries/projections.py
+
+"""
+Named column profiles for the wide media, episodes and campaigns tables.
+
+`SELECT *` on these tables ships 1536-dim embeddings (as text) and, for
+episodes, full transcripts to every caller. Query helpers take a `profile`
+instead and build their select list with select_list():
+
+    summary          ids, names and the few fields lists and pickers show
+    detail           every column except embeddings and transcripts (default)
+    with_embedding   detail plus the embedding
+    with_transcript  detail plus the transcript columns
+    full             every column
+
+Column names come from the catalog once per table and process, so columns
+added by migrations are included without touching this module. Episode rows
+fetched without their transcript carry a has_transcript flag instead.
+"""
+
+import threading
+from typing import Dict, Iterable, Optional, Tuple
+
+SUMMARY = "summary"
+DETAIL = "detail"
+WITH_EMBEDDING = "with_embedding"
+WITH_TRANSCRIPT = "with_transcript"
+FULL = "full"
+PROFILES = (SUMMARY, DETAIL, WITH_EMBEDDING, WITH_TRANSCRIPT, FULL)
+
+SUMMARY_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "media": (
+        "media_id", "name", "title", "image_url", "category", "language", "website", "rss_url",
+        "contact_email", "host_names", "total_episodes", "latest_episode_date", "last_posted_at",
+        "listen_score", "audience_size", "quality_score", "created_at", "updated_at",
+    ),
+    "episodes": (
+        "episode_id", "media_id", "title", "publish_date", "duration_sec", "episode_url",
+        "direct_audio_url", "transcribe", "downloaded", "ai_analysis_done", "audio_url_status",
+        "created_at", "updated_at",
+    ),
+    "campaigns": (
+        "campaign_id", "person_id", "campaign_name", "campaign_type", "campaign_keywords",
+        "start_date", "end_date", "media_kit_url", "instantly_campaign_id", "created_at",
+        "auto_discovery_enabled", "auto_discovery_status",
+    ),
+}
+EMBEDDING_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "media": ("embedding",),
+    "episodes": ("embedding",),
+    "campaigns": ("embedding",),
+}
+TRANSCRIPT_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "episodes": ("transcript", "reduced_transcript"),
+}
+
+_table_columns: Dict[str, Tuple[str, ...]] = {}
+_select_lists: Dict[Tuple[str, str, Optional[str]], str] = {}
+_lock = threading.Lock()
+
+def _quote(column: str, alias: Optional[str]) -> str:
+    return f'{alias}."{column}"' if alias else f'"{column}"'
+
+def _profile_columns(table: str, profile: str, all_columns: Iterable[str]) -> Tuple[str, ...]:
+    embedding = set(EMBEDDING_COLUMNS.get(table, ()))
+    transcript = set(TRANSCRIPT_COLUMNS.get(table, ()))
+    if profile == SUMMARY:
+        wanted = set(SUMMARY_COLUMNS[table])
+        return tuple(c for c in all_columns if c in wanted)
+    if profile == DETAIL:
+        excluded = embedding | transcript
+    elif profile == WITH_EMBEDDING:
+        excluded = transcript
+    elif profile == WITH_TRANSCRIPT:
+        excluded = embedding
+    else:
+        excluded = set()
+    return tuple(c for c in all_columns if c not in excluded)
+
+async def _load_columns(conn, table: str) -> Tuple[str, ...]:
+    columns = _table_columns.get(table)
+    if columns is None:
+        rows = await conn.fetch(
+            """
+            SELECT attname FROM pg_attribute
+            WHERE attrelid = $1::regclass AND attnum > 0 AND NOT attisdropped
+            ORDER BY attnum;
+            """,
+            table
+        )
+        columns = tuple(row['attname'] for row in rows)
+        with _lock:
+            _table_columns[table] = columns
+    return columns
+
+async def select_list(conn, table: str, profile: str = DETAIL, alias: Optional[str] = None) -> str:
+    """
+    SQL select list for a table under a profile, e.g. 'm."media_id", m."name", ...'.
+
+    Args:
+        conn: Connection used to read the table's columns the first time.
+        table: "media", "episodes" or "campaigns".
+        profile: One of PROFILES.
+        alias: Table alias to qualify the columns with.
+    """
+    if profile not in PROFILES:
+        raise ValueError(f"Unknown column profile '{profile}'")
+    if profile == FULL:
+        return f"{alias}.*" if alias else "*"
+
+    key = (table, profile, alias)
+    cached = _select_lists.get(key)
+    if cached is not None:
+        return cached
+
+    columns = _profile_columns(table, profile, await _load_columns(conn, table))
+    parts = [_quote(column, alias) for column in columns]
+    transcript_columns = TRANSCRIPT_COLUMNS.get(table)
+    if transcript_columns and transcript_columns[0] not in columns:
+        transcript = _quote(transcript_columns[0], alias)
+        # octet_length reads the stored size, so the transcript is never decompressed
+        parts.append(f"COALESCE(octet_length({transcript}), 0) > 0 AS has_transcript")
+    sql = ", ".join(parts)
+    with _lock:
+        _select_lists[key] = sql
+    return sql
+
+def reset_cache() -> None:
+    """Forget loaded column lists (e.g. after a migration in a long-running process)."""
+    with _lock:
+        _table_columns.clear()
+        _select_lists.clear()
@@ -1,7 +1,14 @@
 import logging
-from typing import Any, Dict, Optional, List
+import base64
+import json
+from decimal import Decimal
+from typing import Any, Dict, Optional, List, Tuple
 from datetime import datetime
 
+from cachetools import TTLCache
+
+from podcast_outreach.config import REVIEW_TASK_COUNT_CACHE_TTL_SECONDS, REVIEW_TASK_COUNT_ESTIMATE_THRESHOLD
+
 from podcast_outreach.database.connection import get_db_pool
 from podcast_outreach.database.queries import match_suggestions # For process_match_suggestion_approval
 
@@ -28,6 +35,7 @@ async def create_review_task_in_db(task_data: Dict[str, Any]) -> Optional[Dict[s
                 task_data.get('notes')
             )
             if row:
+                _count_cache.clear()
                 logger.info(f"ReviewTask created for type '{row['task_type']}' related_id {row['related_id']}")
                 return dict(row)
             return None
@@ -59,6 +67,7 @@ async def update_review_task_status_in_db(review_task_id: int, status: str, note
         try:
             row = await conn.fetchrow(query, *values)
             if row:
+                _count_cache.clear()
                 logger.info(f"ReviewTask ID {review_task_id} updated to status '{status}'.")
                 return dict(row)
             logger.warning(f"ReviewTask ID {review_task_id} not found for update.")
@@ -122,117 +131,194 @@ async def process_match_suggestion_approval(review_task_id: int, new_status: str
 
     return True
 
-async def get_all_review_tasks_paginated(
-    page: int = 1,
-    size: int = 20,
-    task_type: Optional[str] = None,
-    status: Optional[str] = None,
-    assigned_to_id: Optional[int] = None,
-    campaign_id: Optional[str] = None 
-) -> tuple[List[Dict[str, Any]], int]:
-    """Fetches review tasks with filtering, pagination, and enrichment for pitch_review tasks."""
-    offset = (page - 1) * size
-    
-    select_clauses = [
-        "rt.*",
-        "c.campaign_name",
-        "p.full_name AS client_name",
-        # Media name - from either pitch or match suggestion
-        "COALESCE(m_pitch.name, m_match.name) AS media_name",
-        # Pitch review fields
-        "pg.draft_text",
-        "pch.subject_line", 
-        "pg.media_id AS pitch_media_id",
-        # Match suggestion AI fields
-        "ms.ai_reasoning",
-        "ms.vetting_score",
-        "ms.vetting_reasoning",
-        "ms.vetting_checklist",
-        "ms.match_score",
-        "ms.media_id AS match_media_id"
-    ]
-    
-    joins = [
-        "LEFT JOIN campaigns c ON rt.campaign_id = c.campaign_id",
-        "LEFT JOIN people p ON c.person_id = p.person_id",
-        # Conditional joins for pitch_review related data
-        "LEFT JOIN pitch_generations pg ON rt.task_type = 'pitch_review' AND rt.related_id = pg.pitch_gen_id",
-        "LEFT JOIN pitches pch ON pg.pitch_gen_id = pch.pitch_gen_id",
-        "LEFT JOIN media m_pitch ON pg.media_id = m_pitch.media_id",
-        # Conditional joins for match_suggestion related data
-        "LEFT JOIN match_suggestions ms ON rt.task_type = 'match_suggestion' AND rt.related_id = ms.match_id",
-        "LEFT JOIN media m_match ON ms.media_id = m_match.media_id"
-    ]
-    
-    # Note: If task_type is 'match_suggestion', media_name would come from a different join:
-    # LEFT JOIN match_suggestions ms ON rt.task_type = 'match_suggestion' AND rt.related_id = ms.match_id
-    # LEFT JOIN media m_match ON ms.media_id = m_match.media_id (and select m_match.name)
-    # For simplicity, this query prioritizes enrichment for 'pitch_review'. 
-    # A more complex query or separate functions might be needed for fully polymorphic enrichment.
+# Enrichment for a page of review tasks. Media name comes from either the pitch or the match suggestion.
+_ENRICHED_SELECT = """
+    rt.*,
+    c.campaign_name,
+    p.full_name AS client_name,
+    COALESCE(m_pitch.name, m_match.name) AS media_name,
+    pg.draft_text,
+    pch.subject_line,
+    pg.media_id AS pitch_media_id,
+    ms.ai_reasoning,
+    ms.vetting_score,
+    ms.vetting_reasoning,
+    ms.vetting_checklist,
+    ms.match_score,
+    ms.media_id AS match_media_id
+"""
 
-    conditions = []
-    params = []
-    param_idx = 1
+_ENRICHMENT_JOINS = """
+    LEFT JOIN campaigns c ON rt.campaign_id = c.campaign_id
+    LEFT JOIN people p ON c.person_id = p.person_id
+    LEFT JOIN pitch_generations pg ON rt.task_type = 'pitch_review' AND rt.related_id = pg.pitch_gen_id
+    LEFT JOIN pitches pch ON pg.pitch_gen_id = pch.pitch_gen_id
+    LEFT JOIN media m_pitch ON pg.media_id = m_pitch.media_id
+    LEFT JOIN match_suggestions ms ON rt.task_type = 'match_suggestion' AND rt.related_id = ms.match_id
+    LEFT JOIN media m_match ON ms.media_id = m_match.media_id
+"""
 
+# priority is the denormalized COALESCE(vetting_score, match_score, 0) maintained by triggers (migration 008)
+_QUEUE_ORDER = "rt.priority DESC, rt.created_at DESC, rt.review_task_id DESC"
+
+# Totals per filter combination; the list endpoint asks on every page load
+_count_cache: TTLCache = TTLCache(maxsize=256, ttl=REVIEW_TASK_COUNT_CACHE_TTL_SECONDS)
+
+def invalidate_review_task_counts() -> None:
+    """Drops cached totals; call after inserting review tasks or changing their status outside this module."""
+    _count_cache.clear()
+
+def _review_task_filters(
+    task_type: Optional[str],
+    status: Optional[str],
+    assigned_to_id: Optional[int],
+    campaign_id: Optional[str]
+) -> Tuple[List[str], List[Any]]:
+    """Builds WHERE conditions on review_tasks columns; returns (conditions, params)."""
+    conditions = []
+    params: List[Any] = []
     if task_type:
-        conditions.append(f"rt.task_type = ${param_idx}")
         params.append(task_type)
-        param_idx += 1
+        conditions.append(f"rt.task_type = ${len(params)}")
     if status:
-        conditions.append(f"rt.status = ${param_idx}")
         params.append(status)
-        param_idx += 1
+        conditions.append(f"rt.status = ${len(params)}")
     if assigned_to_id is not None:
-        conditions.append(f"rt.assigned_to = ${param_idx}")
         params.append(assigned_to_id)
-        param_idx += 1
+        conditions.append(f"rt.assigned_to = ${len(params)}")
     if campaign_id:
-        conditions.append(f"rt.campaign_id = ${param_idx}") # campaign_id on review_tasks table
         params.append(campaign_id)
-        param_idx += 1
+        conditions.append(f"rt.campaign_id = ${len(params)}")
+    return conditions, params
+
+def _adapt_review_task_row(row) -> Dict[str, Any]:
+    """Adds the ids and media_id each task type exposes."""
+    r = dict(row)
+    if r.get('task_type') == 'pitch_review':
+        r['pitch_gen_id'] = r.get('related_id')
+        r['media_id'] = r.get('pitch_media_id')
+    elif r.get('task_type') == 'match_suggestion':
+        r['media_id'] = r.get('match_media_id')
+    return r
+
+def encode_review_task_cursor(row: Dict[str, Any]) -> str:
+    """Opaque cursor pointing just after this row in queue order."""
+    payload = [str(row['priority']), row['created_at'].isoformat(), row['review_task_id']]
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+def decode_review_task_cursor(cursor: str) -> Tuple[Decimal, datetime, int]:
+    """Raises ValueError for a malformed cursor."""
+    try:
+        priority, created_at, review_task_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return Decimal(priority), datetime.fromisoformat(created_at), int(review_task_id)
+    except Exception as e:
+        raise ValueError(f"Invalid review task cursor: {cursor}") from e
 
+async def _fetch_review_task_page(conn, conditions: List[str], params: List[Any], size: int, offset: int = 0) -> List[Dict[str, Any]]:
+    """Selects one page of task ids by the indexed queue order, then enriches only those rows."""
     where_clause = " AND ".join(conditions) if conditions else "1=1"
+    params = params + [size, offset]
+    query = f"""
+    WITH page AS (
+        SELECT rt.*
+        FROM review_tasks rt
+        WHERE {where_clause}
+        ORDER BY {_QUEUE_ORDER}
+        LIMIT ${len(params) - 1} OFFSET ${len(params)}
+    )
+    SELECT {_ENRICHED_SELECT}
+    FROM page rt
+    {_ENRICHMENT_JOINS}
+    ORDER BY {_QUEUE_ORDER};
+    """
+    rows = await conn.fetch(query, *params)
+    return [_adapt_review_task_row(row) for row in rows]
 
-    query_string = f"""
-    SELECT {', '.join(select_clauses)}
-    FROM review_tasks rt
-    {' '.join(joins)}
-    WHERE {where_clause}
-    ORDER BY COALESCE(ms.vetting_score, ms.match_score, 0) DESC, rt.created_at DESC
-    LIMIT ${param_idx} OFFSET ${param_idx + 1};
+async def count_review_tasks(
+    task_type: Optional[str] = None,
+    status: Optional[str] = None,
+    assigned_to_id: Optional[int] = None,
+    campaign_id: Optional[str] = None
+) -> int:
     """
-    params_for_query = params + [size, offset]
-    
-    count_query_string = f"""
-    SELECT COUNT(rt.*) AS total
-    FROM review_tasks rt
-    {' '.join(joins)}  -- Apply same joins for accurate count if filters span joined tables, though less critical for base count
-    WHERE {where_clause};
+    Total for a filter combination, cached for REVIEW_TASK_COUNT_CACHE_TTL_SECONDS.
+    Filters are all on review_tasks, so no joins are needed. Unfiltered totals on a
+    large table use the planner estimate instead of a full count.
     """
-    params_for_count = params # Count query doesn't need limit/offset params
+    cache_key = (task_type, status, assigned_to_id, str(campaign_id) if campaign_id else None)
+    cached = _count_cache.get(cache_key)
+    if cached is not None:
+        return cached
 
+    conditions, params = _review_task_filters(task_type, status, assigned_to_id, campaign_id)
     pool = await get_db_pool()
     async with pool.acquire() as conn:
         try:
-            rows = await conn.fetch(query_string, *params_for_query)
-            total_record = await conn.fetchrow(count_query_string, *params_for_count)
-            total = total_record['total'] if total_record else 0
-            
-            # Adapt the returned dictionary to include appropriate IDs and media_id for different task types
-            results = []
-            for row in rows:
-                r = dict(row)
-                if r.get('task_type') == 'pitch_review':
-                    r['pitch_gen_id'] = r.get('related_id')
-                    r['media_id'] = r.get('pitch_media_id')
-                elif r.get('task_type') == 'match_suggestion':
-                    r['media_id'] = r.get('match_media_id')
-                    # The AI fields are already included from the SELECT clause
-                results.append(r)
-            return results, total
+            total = None
+            if not conditions:
+                estimate = await conn.fetchval("SELECT reltuples::bigint FROM pg_class WHERE oid = 'review_tasks'::regclass;")
+                if estimate is not None and estimate >= REVIEW_TASK_COUNT_ESTIMATE_THRESHOLD:
+                    total = int(estimate)
+            if total is None:
+                where_clause = " AND ".join(conditions) if conditions else "1=1"
+                total = await conn.fetchval(f"SELECT COUNT(*) FROM review_tasks rt WHERE {where_clause};", *params) or 0
+        except Exception as e:
+            logger.exception(f"Error counting review tasks: {e}")
+            return 0
+    _count_cache[cache_key] = total
+    return total
+
+async def get_all_review_tasks_paginated(
+    page: int = 1,
+    size: int = 20,
+    task_type: Optional[str] = None,
+    status: Optional[str] = None,
+    assigned_to_id: Optional[int] = None,
+    campaign_id: Optional[str] = None 
+) -> tuple[List[Dict[str, Any]], int]:
+    """Fetches review tasks with filtering, offset pagination, and enrichment. Prefer get_review_tasks_keyset for deep pages."""
+    offset = (page - 1) * size
+    conditions, params = _review_task_filters(task_type, status, assigned_to_id, campaign_id)
+
+    pool = await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            results = await _fetch_review_task_page(conn, conditions, params, size, offset)
         except Exception as e:
             logger.exception(f"Error fetching paginated and enriched review tasks: {e}")
             return [], 0
+    total = await count_review_tasks(task_type, status, assigned_to_id, campaign_id)
+    return results, total
+
+async def get_review_tasks_keyset(
+    size: int = 20,
+    cursor: Optional[str] = None,
+    task_type: Optional[str] = None,
+    status: Optional[str] = None,
+    assigned_to_id: Optional[int] = None,
+    campaign_id: Optional[str] = None
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    Fetches the page of enriched review tasks after `cursor` in queue order
+    (priority, then newest). Returns (tasks, next_cursor); next_cursor is None on the last page.
+    Raises ValueError for a malformed cursor.
+    """
+    conditions, params = _review_task_filters(task_type, status, assigned_to_id, campaign_id)
+    if cursor:
+        params.extend(decode_review_task_cursor(cursor))
+        n = len(params)
+        conditions.append(f"(rt.priority, rt.created_at, rt.review_task_id) < (${n - 2}, ${n - 1}, ${n})")
+
+    pool = await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            # One extra row tells us whether another page exists
+            rows = await _fetch_review_task_page(conn, conditions, params, size + 1)
+        except Exception as e:
+            logger.exception(f"Error fetching keyset page of review tasks: {e}")
+            raise
+    next_cursor = encode_review_task_cursor(rows[size - 1]) if len(rows) > size else None
+    return rows[:size], next_cursor
 
 async def count_review_tasks_by_status(status: str, person_id: Optional[int] = None) -> int:
     """Counts review tasks by status, optionally filtered by person_id (via campaign)."""
@@ -296,6 +382,7 @@ async def complete_review_tasks_for_match(match_id: int, completion_notes: str =
             completed_count = len(results)
             
             if completed_count > 0:
+                _count_cache.clear()
                 logger.info(f"Completed {completed_count} review tasks for match {match_id}")
                 return True
             else:
@@ -0,0 +1,298 @@
+# podcast_outreach/database/queries/scheduled_tasks.py
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from podcast_outreach.logging_config import get_logger
+from podcast_outreach.database.connection import get_db_pool
+
+logger = get_logger(__name__)
+
+async def sync_task_states(first_runs: Dict[str, datetime], latest_runs: Dict[str, datetime],
+                           pool: Optional[Any] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Creates state rows for newly registered tasks and returns the state of all
+    given tasks, keyed by task name.
+
+    Args:
+        first_runs: First run time per task, used only for tasks without a row.
+        latest_runs: Upper bound on the next run of tasks that have a row (one
+            interval from now), so a shortened schedule takes effect without
+            waiting out the old one; a run missed while no scheduler was up
+            stays due, and other runs keep their time.
+    """
+    if not first_runs:
+        return {}
+    names = list(first_runs.keys())
+    query = """
+    WITH input AS (
+        SELECT * FROM unnest($1::varchar[], $2::timestamptz[], $3::timestamptz[]) AS t(task_name, first_run, latest_run)
+    ), updated AS (
+        UPDATE scheduled_task_state s
+        SET next_run_at = LEAST(s.next_run_at, input.latest_run)
+        FROM input
+        WHERE s.task_name = input.task_name
+        RETURNING s.*
+    ), inserted AS (
+        INSERT INTO scheduled_task_state (task_name, next_run_at)
+        SELECT task_name, first_run FROM input
+        WHERE task_name NOT IN (SELECT task_name FROM updated)
+        ON CONFLICT (task_name) DO NOTHING
+        RETURNING *
+    )
+    SELECT * FROM updated
+    UNION ALL
+    SELECT * FROM inserted;
+    """
+    pool = pool or await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            rows = await conn.fetch(query, names, [first_runs[n] for n in names], [latest_runs[n] for n in names])
+            return {row['task_name']: dict(row) for row in rows}
+        except Exception as e:
+            logger.exception(f"Error syncing scheduled task state: {e}")
+            raise
+
+async def get_task_states(pool: Optional[Any] = None) -> Dict[str, Dict[str, Any]]:
+    """State rows of all scheduled tasks, keyed by task name."""
+    pool = pool or await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            rows = await conn.fetch("SELECT * FROM scheduled_task_state;")
+            return {row['task_name']: dict(row) for row in rows}
+        except Exception as e:
+            logger.exception(f"Error fetching scheduled task state: {e}")
+            raise
+
+async def claim_task_run(task_name: str, next_run_at: datetime, instance_id: str,
+                         batch_size: Optional[int] = None, backlog: Optional[int] = None,
+                         pool: Optional[Any] = None) -> Optional[Dict[str, Any]]:
+    """
+    Claims the due run of a task and records it as running.
+
+    The task's next_run_at moves to next_run_at in the statement that checks
+    it is due, so concurrent claims for the same run cannot both succeed.
+    batch_size and backlog are recorded on the run for adaptive tasks.
+
+    Returns:
+        Dict with run_id and scheduled_for, or None if the task is disabled,
+        not due, or the run was claimed elsewhere.
+    """
+    query = """
+    WITH due AS (
+        SELECT task_name, next_run_at AS scheduled_for
+        FROM scheduled_task_state
+        WHERE task_name = $1 AND enabled AND next_run_at <= NOW()
+        FOR UPDATE
+    ), claimed AS (
+        UPDATE scheduled_task_state s
+        SET next_run_at = $2,
+            last_run_at = NOW(),
+            last_status = 'running',
+            last_error = NULL,
+            last_instance = $3,
+            updated_at = NOW()
+        FROM due
+        WHERE s.task_name = due.task_name
+        RETURNING due.scheduled_for
+    )
+    INSERT INTO scheduled_task_runs (task_name, instance_id, scheduled_for, batch_size, backlog)
+    SELECT $1, $3, scheduled_for, $4, $5 FROM claimed
+    RETURNING run_id, scheduled_for;
+    """
+    pool = pool or await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            row = await conn.fetchrow(query, task_name, next_run_at, instance_id, batch_size, backlog)
+            return dict(row) if row else None
+        except Exception as e:
+            logger.exception(f"Error claiming run of scheduled task '{task_name}': {e}")
+            raise
+
+async def defer_task(task_name: str, next_run_at: datetime, pool: Optional[Any] = None) -> None:
+    """Moves a task's next run to next_run_at without running it (e.g. while its budget is spent)."""
+    query = """
+    UPDATE scheduled_task_state SET next_run_at = $2, updated_at = NOW()
+    WHERE task_name = $1;
+    """
+    pool = pool or await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            await conn.execute(query, task_name, next_run_at)
+        except Exception as e:
+            logger.exception(f"Error deferring scheduled task '{task_name}': {e}")
+            raise
+
+async def wake_task(task_name: str, min_interval_seconds: int, channel: str,
+                    pool: Optional[Any] = None) -> bool:
+    """
+    Brings a task's next run forward to now, or to min_interval_seconds after
+    its last run if that is later, and notifies the leading scheduler on
+    channel so it does not wait for its next tick.
+
+    Returns:
+        True if the next run moved; False if it was already that soon or the
+        task is disabled.
+    """
+    query = """
+    WITH woken AS (
+        UPDATE scheduled_task_state
+        SET next_run_at = GREATEST(NOW(), last_run_at + make_interval(secs => $2)),
+            updated_at = NOW()
+        WHERE task_name = $1 AND enabled
+        AND next_run_at > GREATEST(NOW(), last_run_at + make_interval(secs => $2))
+        RETURNING task_name
+    )
+    SELECT pg_notify($3, task_name) FROM woken;
+    """
+    pool = pool or await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            rows = await conn.fetch(query, task_name, min_interval_seconds, channel)
+            return bool(rows)
+        except Exception as e:
+            logger.exception(f"Error waking scheduled task '{task_name}': {e}")
+            raise
+
+async def get_recent_batch_totals(window_seconds: int = 3600, pool: Optional[Any] = None) -> Dict[str, int]:
+    """Items given to runs started in the last window_seconds, per task (adaptive tasks only)."""
+    query = """
+    SELECT task_name, SUM(batch_size)::int AS items
+    FROM scheduled_task_runs
+    WHERE batch_size IS NOT NULL AND started_at > NOW() - make_interval(secs => $1)
+    GROUP BY task_name;
+    """
+    pool = pool or await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            rows = await conn.fetch(query, window_seconds)
+            return {row['task_name']: row['items'] for row in rows}
+        except Exception as e:
+            logger.exception(f"Error summing recent scheduled task batches: {e}")
+            raise
+
+async def finish_task_run(run_id: int, status: str, error: Optional[str] = None,
+                          pool: Optional[Any] = None) -> None:
+    """Records the outcome and duration of a run, and on its task unless a newer run has started."""
+    query = """
+    WITH run AS (
+        UPDATE scheduled_task_runs
+        SET status = $2,
+            error = $3,
+            finished_at = NOW(),
+            duration_ms = (EXTRACT(EPOCH FROM NOW() - started_at) * 1000)::int
+        WHERE run_id = $1
+        RETURNING task_name, status, error, duration_ms
+    )
+    UPDATE scheduled_task_state s
+    SET last_status = run.status,
+        last_error = run.error,
+        last_duration_ms = run.duration_ms,
+        updated_at = NOW()
+    FROM run
+    WHERE s.task_name = run.task_name
+    AND NOT EXISTS (
+        SELECT 1 FROM scheduled_task_runs newer
+        WHERE newer.task_name = run.task_name AND newer.run_id > $1
+    );
+    """
+    pool = pool or await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            await conn.execute(query, run_id, status, error[:2000] if error else None)
+        except Exception as e:
+            logger.exception(f"Error finishing scheduled task run {run_id}: {e}")
+            raise
+
+async def abandon_task_runs(instance_id: str, pool: Optional[Any] = None) -> int:
+    """
+    Marks runs still recorded as running by other instances as abandoned. Called
+    by a scheduler taking over leadership; a run that does finish later still
+    records its real outcome.
+
+    Returns:
+        Number of runs marked abandoned.
+    """
+    query = """
+    WITH abandoned AS (
+        UPDATE scheduled_task_runs
+        SET status = 'abandoned', finished_at = NOW()
+        WHERE status = 'running' AND instance_id <> $1
+        RETURNING task_name
+    ), state AS (
+        UPDATE scheduled_task_state
+        SET last_status = 'abandoned', updated_at = NOW()
+        WHERE last_status = 'running' AND last_instance <> $1
+    )
+    SELECT COUNT(*) FROM abandoned;
+    """
+    pool = pool or await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            return await conn.fetchval(query, instance_id)
+        except Exception as e:
+            logger.exception(f"Error abandoning scheduled task runs: {e}")
+            raise
+
+async def set_task_enabled(task_name: str, enabled: bool, first_run: datetime, pool: Optional[Any] = None) -> bool:
+    """
+    Enables or disables a task for all instances. A task no leader has synced
+    yet gets its state row here, due at first_run, so the setting is not lost
+    when the first sync creates the row.
+    """
+    query = """
+    INSERT INTO scheduled_task_state (task_name, enabled, next_run_at)
+    VALUES ($1, $2, $3)
+    ON CONFLICT (task_name) DO UPDATE
+        SET enabled = EXCLUDED.enabled, updated_at = NOW();
+    """
+    pool = pool or await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            result = await conn.execute(query, task_name, enabled, first_run)
+            return int(result.split()[-1]) > 0
+        except Exception as e:
+            logger.exception(f"Error setting enabled={enabled} on scheduled task '{task_name}': {e}")
+            raise
+
+async def get_task_runs(task_name: Optional[str] = None, limit: int = 50, before_run_id: Optional[int] = None,
+                        pool: Optional[Any] = None) -> List[Dict[str, Any]]:
+    """
+    Run history, newest first.
+
+    Args:
+        task_name: Only runs of this task.
+        before_run_id: Only runs older than this one, for paging.
+    """
+    query = """
+    SELECT run_id, task_name, instance_id, status, scheduled_for, started_at, finished_at, duration_ms, error,
+           batch_size, backlog
+    FROM scheduled_task_runs
+    WHERE ($1::varchar IS NULL OR task_name = $1)
+    AND ($2::bigint IS NULL OR run_id < $2)
+    ORDER BY run_id DESC
+    LIMIT $3;
+    """
+    pool = pool or await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            rows = await conn.fetch(query, task_name, before_run_id, limit)
+            return [dict(row) for row in rows]
+        except Exception as e:
+            logger.exception(f"Error fetching scheduled task runs: {e}")
+            raise
+
+async def prune_task_runs(keep_days: int, pool: Optional[Any] = None) -> int:
+    """Deletes finished runs older than keep_days. Returns the number deleted."""
+    query = """
+    DELETE FROM scheduled_task_runs
+    WHERE status <> 'running' AND started_at < NOW() - make_interval(days => $1);
+    """
+    pool = pool or await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            result = await conn.execute(query, keep_days)
+            return int(result.split()[-1])
+        except Exception as e:
+            logger.exception(f"Error pruning scheduled task runs: {e}")
+            raise
@@ -103,6 +103,20 @@ def create_companies_table(conn):
     execute_sql(conn, sql_statement)
     print("Table COMPANIES created/ensured.")
  
+def create_person_name_normalization_function(conn):
+    """normalize_person_name(), used by people.normalized_name (same SQL as migration 013)."""
+    sql_statement = r"""
+    CREATE OR REPLACE FUNCTION normalize_person_name(name TEXT)
+    RETURNS TEXT AS $$
+        SELECT NULLIF(btrim(regexp_replace(
+            regexp_replace(lower(btrim(name)), '^(dr|mr|mrs|ms|prof|professor)\.?\s+', ''),
+            '[^[:alnum:]]+', ' ', 'g'
+        )), '');
+    $$ LANGUAGE sql IMMUTABLE PARALLEL SAFE;
+    """
+    execute_sql(conn, sql_statement)
+    print("Function NORMALIZE_PERSON_NAME created/ensured.")
+
 def create_people_table(conn):
     sql_statement = """
     CREATE TABLE people (
@@ -128,9 +142,10 @@ def create_people_table(conn):
         profile_banner_url        TEXT,
         notification_settings     JSONB DEFAULT '{}'::jsonb,
         privacy_settings          JSONB DEFAULT '{}'::jsonb,
-        stripe_customer_id        VARCHAR(255) UNIQUE
+        stripe_customer_id        VARCHAR(255) UNIQUE,
+        normalized_name           TEXT GENERATED ALWAYS AS (normalize_person_name(full_name)) STORED
     );
-
+    CREATE INDEX IF NOT EXISTS idx_people_normalized_name ON people (normalized_name);
     """
     execute_sql(conn, sql_statement)
     print("Table PEOPLE created/ensured.")
@@ -379,7 +394,11 @@ def create_episodes_table(conn):
         audio_url_failure_count INTEGER DEFAULT 0,
         audio_url_last_error TEXT,
         transcription_batch_id UUID,
-        transcription_batch_position INTEGER
+        transcription_batch_position INTEGER,
+
+        -- Extractive transcript reduction sent to the LLM, keyed by a hash of its inputs
+        reduced_transcript TEXT,
+        reduced_transcript_key CHAR(64)
     );
     CREATE INDEX IF NOT EXISTS idx_episodes_media_id ON episodes (media_id);
     CREATE INDEX IF NOT EXISTS idx_episodes_embedding_hnsw ON episodes USING hnsw (embedding vector_cosine_ops);
@@ -411,7 +430,11 @@ def create_match_suggestions(conn):
         vetting_checklist JSONB,
         last_vetted_at TIMESTAMPTZ,
         -- *** NEW CLIENT TRACKING FIELD ***
-        created_by_client BOOLEAN DEFAULT FALSE  -- Track if match was created by client discovery
+        created_by_client BOOLEAN DEFAULT FALSE,  -- Track if match was created by client discovery
+        -- Failed batch pitch generations, for retry backoff
+        pitch_attempts INTEGER NOT NULL DEFAULT 0,
+        last_pitch_attempt_at TIMESTAMPTZ,
+        last_pitch_error TEXT
     );
     CREATE INDEX IF NOT EXISTS idx_match_suggestions_campaign_id ON match_suggestions (campaign_id);
     CREATE INDEX IF NOT EXISTS idx_match_suggestions_media_id ON match_suggestions (media_id);
@@ -437,8 +460,24 @@ def create_pitch_templates_table(conn):
         tone VARCHAR(100),
         prompt_body TEXT,
         created_by TEXT,
-        created_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP
+        created_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP,
+        version INTEGER NOT NULL DEFAULT 1 -- Bumped on every change; lets caches revalidate cheaply
     );
+
+    CREATE OR REPLACE FUNCTION bump_pitch_template_version()
+    RETURNS TRIGGER AS $$
+    BEGIN
+        NEW.version := OLD.version + 1;
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql;
+
+    DROP TRIGGER IF EXISTS trigger_bump_pitch_template_version ON pitch_templates;
+    CREATE TRIGGER trigger_bump_pitch_template_version
+    BEFORE UPDATE ON pitch_templates
+    FOR EACH ROW
+    WHEN (OLD.* IS DISTINCT FROM NEW.*)
+    EXECUTE FUNCTION bump_pitch_template_version();
     """
     execute_sql(conn, sql_statement)
     print("Table PITCH_TEMPLATES created/ensured.")
@@ -557,13 +596,61 @@ def create_review_tasks(conn):
         status VARCHAR(50) DEFAULT 'pending',
         created_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP,
         completed_at TIMESTAMPTZ,
-        notes TEXT
+        notes TEXT,
+        priority NUMERIC NOT NULL DEFAULT 0 -- COALESCE(vetting_score, match_score, 0) of the related match, kept by triggers
     );
     CREATE INDEX IF NOT EXISTS idx_review_tasks_campaign_id ON review_tasks (campaign_id);
     CREATE INDEX IF NOT EXISTS idx_review_tasks_assigned_to ON review_tasks (assigned_to);
+    CREATE INDEX IF NOT EXISTS idx_review_tasks_status_priority ON review_tasks (status, priority, created_at, review_task_id);
+    CREATE INDEX IF NOT EXISTS idx_review_tasks_priority ON review_tasks (priority, created_at, review_task_id);
     """
     execute_sql(conn, sql_statement)
     print("Table REVIEW_TASKS created/ensured.")
+
+def create_review_task_priority_triggers(conn):
+    """Keeps review_tasks.priority in sync with match suggestion scores (same SQL as migration 008)."""
+    sql_statement = """
+    CREATE OR REPLACE FUNCTION set_review_task_priority()
+    RETURNS TRIGGER AS $$
+    BEGIN
+        IF NEW.task_type = 'match_suggestion' THEN
+            SELECT COALESCE(ms.vetting_score, ms.match_score, 0)
+            INTO NEW.priority
+            FROM match_suggestions ms
+            WHERE ms.match_id = NEW.related_id;
+            NEW.priority := COALESCE(NEW.priority, 0);
+        END IF;
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql;
+
+    CREATE OR REPLACE FUNCTION sync_review_task_priority_from_match()
+    RETURNS TRIGGER AS $$
+    BEGIN
+        UPDATE review_tasks
+        SET priority = COALESCE(NEW.vetting_score, NEW.match_score, 0)
+        WHERE task_type = 'match_suggestion'
+          AND related_id = NEW.match_id
+          AND priority IS DISTINCT FROM COALESCE(NEW.vetting_score, NEW.match_score, 0);
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+
+    DROP TRIGGER IF EXISTS trigger_set_review_task_priority ON review_tasks;
+    CREATE TRIGGER trigger_set_review_task_priority
+    BEFORE INSERT OR UPDATE OF task_type, related_id ON review_tasks
+    FOR EACH ROW
+    EXECUTE FUNCTION set_review_task_priority();
+
+    DROP TRIGGER IF EXISTS trigger_sync_review_task_priority ON match_suggestions;
+    CREATE TRIGGER trigger_sync_review_task_priority
+    AFTER UPDATE OF vetting_score, match_score ON match_suggestions
+    FOR EACH ROW
+    WHEN (OLD.vetting_score IS DISTINCT FROM NEW.vetting_score OR OLD.match_score IS DISTINCT FROM NEW.match_score)
+    EXECUTE FUNCTION sync_review_task_priority_from_match();
+    """
+    execute_sql(conn, sql_statement)
+    print("Review task priority triggers created/ensured.")
  
 def create_ai_usage_logs_table(conn):
     sql_statement = """
@@ -872,7 +959,8 @@ def create_chatbot_conversations_table(conn):
         person_id INTEGER REFERENCES people(person_id) ON DELETE CASCADE,
         status VARCHAR(50) DEFAULT 'active' CHECK (status IN ('active', 'paused', 'completed', 'abandoned')),
         conversation_phase VARCHAR(50) DEFAULT 'introduction',
-        messages JSONB DEFAULT '[]'::jsonb,
+        messages JSONB DEFAULT '[]'::jsonb, -- Legacy; messages now live in CHATBOT_MESSAGES
+        message_count INTEGER NOT NULL DEFAULT 0,
         extracted_data JSONB DEFAULT '{}'::jsonb,
         conversation_metadata JSONB DEFAULT '{}'::jsonb,
         progress INTEGER DEFAULT 0,
@@ -891,6 +979,167 @@ def create_chatbot_conversations_table(conn):
     print("Table CHATBOT_CONVERSATIONS created/ensured.")
     apply_timestamp_update_trigger(conn, "chatbot_conversations")
 
+def create_chatbot_messages_table(conn):
+    """Create append-only chatbot_messages table holding each conversation turn"""
+    sql_statement = """
+    CREATE TABLE IF NOT EXISTS chatbot_messages (
+        message_id BIGSERIAL PRIMARY KEY,
+        conversation_id UUID NOT NULL REFERENCES chatbot_conversations(conversation_id) ON DELETE CASCADE,
+        seq INTEGER NOT NULL, -- 0-based position within the conversation
+        message_type VARCHAR(20) NOT NULL, -- 'user', 'bot'
+        content TEXT,
+        message JSONB NOT NULL, -- Full message object as returned to clients
+        created_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP,
+        UNIQUE (conversation_id, seq)
+    );
+    """
+    execute_sql(conn, sql_statement)
+    print("Table CHATBOT_MESSAGES created/ensured.")
+
+def create_chatbot_session_states_table(conn):
+    """Create chatbot_session_states table holding serialized agentic session state"""
+    sql_statement = """
+    CREATE TABLE IF NOT EXISTS chatbot_session_states (
+        session_id VARCHAR(255) PRIMARY KEY, -- Conversation ID as string
+        state JSONB NOT NULL,
+        version INTEGER NOT NULL DEFAULT 1, -- Optimistic concurrency counter
+        created_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP
+    );
+    CREATE INDEX IF NOT EXISTS idx_chatbot_session_states_updated_at ON chatbot_session_states(updated_at);
+    """
+    execute_sql(conn, sql_statement)
+    print("Table CHATBOT_SESSION_STATES created/ensured.")
+
+def create_embedding_cache_table(conn):
+    """Create embedding_cache table so unchanged texts are not re-embedded"""
+    sql_statement = """
+    CREATE TABLE IF NOT EXISTS embedding_cache (
+        content_hash CHAR(64) NOT NULL, -- SHA-256 of the normalized input text
+        model VARCHAR(100) NOT NULL,
+        embedding REAL[] NOT NULL, -- Array rather than VECTOR so any model dimension fits
+        created_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP,
+        last_used_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (content_hash, model)
+    );
+    CREATE INDEX IF NOT EXISTS idx_embedding_cache_last_used_at ON embedding_cache(last_used_at);
+    """
+    execute_sql(conn, sql_statement)
+    print("Table EMBEDDING_CACHE created/ensured.")
+
+def create_llm_response_cache_table(conn):
+    """Create llm_response_cache table for responses of deterministic LLM workflows"""
+    sql_statement = """
+    CREATE TABLE IF NOT EXISTS llm_response_cache (
+        cache_key CHAR(64) PRIMARY KEY, -- SHA-256 of model, prompt and generation config
+        workflow VARCHAR(100) NOT NULL,
+        model VARCHAR(100) NOT NULL,
+        response TEXT NOT NULL,
+        tokens_in INTEGER NOT NULL DEFAULT 0, -- Tokens of the original call, saved on each hit
+        tokens_out INTEGER NOT NULL DEFAULT 0,
+        hit_count INTEGER NOT NULL DEFAULT 0,
+        created_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP,
+        last_used_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP,
+        expires_at TIMESTAMPTZ NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_llm_response_cache_expires_at ON llm_response_cache(expires_at);
+    CREATE INDEX IF NOT EXISTS idx_llm_response_cache_last_used_at ON llm_response_cache(last_used_at);
+    """
+    execute_sql(conn, sql_statement)
+    print("Table LLM_RESPONSE_CACHE created/ensured.")
+
+def create_pipeline_jobs_table(conn):
+    """Create pipeline_jobs table, the queue that moves discoveries from enrichment to match creation"""
+    sql_statement = """
+    CREATE TABLE IF NOT EXISTS pipeline_jobs (
+        job_id BIGSERIAL PRIMARY KEY,
+        stage VARCHAR(50) NOT NULL, -- 'enrichment', 'ai_description', 'vetting', 'match_creation'
+        discovery_id INTEGER NOT NULL REFERENCES campaign_media_discoveries(id) ON DELETE CASCADE,
+        status VARCHAR(20) NOT NULL DEFAULT 'queued', -- 'queued', 'running', 'done', 'failed'
+        attempts INTEGER NOT NULL DEFAULT 0,
+        max_attempts INTEGER NOT NULL DEFAULT 3,
+        visible_at TIMESTAMPTZ NOT NULL DEFAULT NOW(), -- Claimable from this time; for running jobs, the visibility timeout
+        locked_by VARCHAR(100),
+        last_error TEXT,
+        created_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP,
+        completed_at TIMESTAMPTZ
+    );
+    CREATE UNIQUE INDEX IF NOT EXISTS idx_pipeline_jobs_active
+        ON pipeline_jobs(stage, discovery_id) WHERE status IN ('queued', 'running');
+    CREATE INDEX IF NOT EXISTS idx_pipeline_jobs_claim
+        ON pipeline_jobs(stage, visible_at) WHERE status IN ('queued', 'running');
+    CREATE INDEX IF NOT EXISTS idx_pipeline_jobs_discovery_id ON pipeline_jobs(discovery_id);
+    """
+    execute_sql(conn, sql_statement)
+    print("Table PIPELINE_JOBS created/ensured.")
+
+def create_background_tasks_table(conn):
+    """Create background_tasks table, the registry of TaskManager tasks and queue of tasks the API hands to worker processes"""
+    sql_statement = """
+    CREATE TABLE IF NOT EXISTS background_tasks (
+        task_id VARCHAR(255) PRIMARY KEY,
+        action VARCHAR(255) NOT NULL, -- Label shown in task status
+        method VARCHAR(100) NOT NULL, -- TaskManager method that runs it
+        params JSONB NOT NULL DEFAULT '{}'::jsonb,
+        status VARCHAR(20) NOT NULL DEFAULT 'queued', -- 'queued', 'running', 'completed', 'failed', 'cancelled'
+        worker_id VARCHAR(100),
+        error TEXT,
+        queued_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+        started_at TIMESTAMPTZ,
+        heartbeat_at TIMESTAMPTZ, -- Refreshed by the worker while the task runs
+        finished_at TIMESTAMPTZ,
+        duration_ms INTEGER,
+        progress_done INTEGER NOT NULL DEFAULT 0, -- Saved with each heartbeat
+        progress_total INTEGER,
+        progress_message TEXT,
+        stop_requested BOOLEAN NOT NULL DEFAULT FALSE -- Set to stop the task cooperatively from any instance
+    );
+    CREATE INDEX IF NOT EXISTS idx_background_tasks_queued
+        ON background_tasks(queued_at) WHERE status = 'queued';
+    CREATE INDEX IF NOT EXISTS idx_background_tasks_running
+        ON background_tasks(heartbeat_at) WHERE status = 'running';
+    CREATE INDEX IF NOT EXISTS idx_background_tasks_recent
+        ON background_tasks(queued_at DESC, task_id DESC);
+    """
+    execute_sql(conn, sql_statement)
+    print("Table BACKGROUND_TASKS created/ensured.")
+
+def create_scheduler_tables(conn):
+    """Create scheduled_task_state and scheduled_task_runs, the task scheduler's persisted state and run history"""
+    sql_statement = """
+    CREATE TABLE IF NOT EXISTS scheduled_task_state (
+        task_name VARCHAR(100) PRIMARY KEY,
+        enabled BOOLEAN NOT NULL DEFAULT TRUE,
+        next_run_at TIMESTAMPTZ NOT NULL,
+        last_run_at TIMESTAMPTZ,
+        last_status VARCHAR(20), -- 'running', 'succeeded', 'failed', 'cancelled', 'abandoned'
+        last_duration_ms INTEGER,
+        last_error TEXT,
+        last_instance VARCHAR(100),
+        updated_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP
+    );
+    CREATE TABLE IF NOT EXISTS scheduled_task_runs (
+        run_id BIGSERIAL PRIMARY KEY,
+        task_name VARCHAR(100) NOT NULL,
+        instance_id VARCHAR(100) NOT NULL,
+        status VARCHAR(20) NOT NULL DEFAULT 'running', -- 'running', 'succeeded', 'failed', 'cancelled', 'abandoned'
+        scheduled_for TIMESTAMPTZ,
+        started_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+        finished_at TIMESTAMPTZ,
+        duration_ms INTEGER,
+        error TEXT,
+        batch_size INTEGER, -- Items the run was given, for adaptive tasks
+        backlog INTEGER -- Backlog measured when the run was planned
+    );
+    CREATE INDEX IF NOT EXISTS idx_scheduled_task_runs_task_started
+        ON scheduled_task_runs(task_name, started_at DESC);
+    CREATE INDEX IF NOT EXISTS idx_scheduled_task_runs_running
+        ON scheduled_task_runs(run_id) WHERE status = 'running';
+    """
+    execute_sql(conn, sql_statement)
+    print("Tables SCHEDULED_TASK_STATE and SCHEDULED_TASK_RUNS created/ensured.")
+
 def create_conversation_insights_table(conn):
     """Create conversation_insights table for storing extracted insights from chatbot conversations"""
     sql_statement = """
@@ -915,6 +1164,8 @@ def drop_all_tables(conn):
     # or essentially reverse of creation order. CASCADE should make the order less critical, but explicit order can help.
     table_names_in_drop_order = [
         "CONVERSATION_INSIGHTS", # FK to CHATBOT_CONVERSATIONS
+        "CHATBOT_MESSAGES",   # FK to CHATBOT_CONVERSATIONS
+        "CHATBOT_SESSION_STATES", # No FKs
         "CHATBOT_CONVERSATIONS", # FKs to CAMPAIGNS, PEOPLE
         "WEBHOOK_EVENTS",     # No FKs, drop first
         "INVOICES",           # FK to PEOPLE
@@ -994,6 +1245,7 @@ def create_all_tables():
  
         # Create tables in order of dependency
         create_companies_table(conn)
+        create_person_name_normalization_function(conn)
         create_people_table(conn) # Depends on COMPANIES (indirectly via trigger), applies trigger
         create_client_profiles_table(conn) # Depends on PEOPLE
         create_media_table(conn) # Depends on COMPANIES
@@ -1003,6 +1255,7 @@ def create_all_tables():
         create_pitch_templates_table(conn)
         create_match_suggestions(conn) # Depends on CAMPAIGNS, MEDIA
         create_review_tasks(conn) # Depends on CAMPAIGNS, PEOPLE
+        create_review_task_priority_triggers(conn) # Depends on REVIEW_TASKS, MATCH_SUGGESTIONS
         create_pitch_generations_table(conn) # Depends on CAMPAIGNS, MEDIA, PITCH_TEMPLATES
         create_placements_table(conn) # Depends on CAMPAIGNS, MEDIA
         create_pitches_table(conn) # Depends on CAMPAIGNS, MEDIA, PITCH_GENERATIONS, PLACEMENTS
@@ -1019,7 +1272,14 @@ def create_all_tables():
         create_webhook_events_table(conn)
         # Create chatbot-related tables
         create_chatbot_conversations_table(conn) # Depends on CAMPAIGNS, PEOPLE
+        create_chatbot_messages_table(conn) # Depends on CHATBOT_CONVERSATIONS
+        create_chatbot_session_states_table(conn)
         create_conversation_insights_table(conn) # Depends on CHATBOT_CONVERSATIONS
+        create_embedding_cache_table(conn)
+        create_llm_response_cache_table(conn)
+        create_pipeline_jobs_table(conn) # Depends on CAMPAIGN_MEDIA_DISCOVERIES
+        create_scheduler_tables(conn)
+        create_background_tasks_table(conn)
         
         print("All tables checked/created successfully.")
     except psycopg2.Error as e:
@@ -18,7 +18,7 @@ import secrets # For session secret key
 ONE_HOUR_IN_SECONDS = 3600
 
 # Project-specific imports from the new structure
-from podcast_outreach.config import ENABLE_LLM_TEST_DASHBOARD, PORT, FRONTEND_ORIGIN, IS_PRODUCTION # Import FRONTEND_ORIGIN
+from podcast_outreach.config import ENABLE_LLM_TEST_DASHBOARD, PORT, FRONTEND_ORIGIN, IS_PRODUCTION, NOTIFICATION_PG_BRIDGE_ENABLED, PIPELINE_JOB_QUEUE_ENABLED, PROCESS_ROLE, RUNS_BACKGROUND_WORK # Import FRONTEND_ORIGIN
 from podcast_outreach.logging_config import setup_logging, get_logger
 from podcast_outreach.api.dependencies import (
     authenticate_user_details, 
@@ -26,8 +26,8 @@ from podcast_outreach.api.dependencies import (
     get_current_user,
     get_admin_user
 )
-from podcast_outreach.api.middleware import AuthMiddleware 
-from podcast_outreach.database.connection import init_db_pool, close_db_pool  
+from podcast_outreach.api.middleware import AuthMiddleware, LoaderScopeMiddleware 
+from podcast_outreach.database.connection import init_db_pool, close_db_pool, close_analytics_pool  
 from podcast_outreach.services.tasks.manager import task_manager # New path for task_manager
 from podcast_outreach.services.scheduler.task_scheduler import initialize_scheduler
 from podcast_outreach.services.events.event_bus import initialize_event_handlers
@@ -66,7 +66,7 @@ async def _delayed_scheduler_start(scheduler):
     """Delayed scheduler start to prevent memory spikes on startup."""
     await asyncio.sleep(60)  # 60 second delay
     logger.info("Starting task scheduler after startup delay...")
-    scheduler.running = True
+    await scheduler.start()
     logger.info("Task scheduler is now active and processing tasks.")
 
 # Define lifespan context manager before app initialization
@@ -83,6 +83,14 @@ async def lifespan(app: FastAPI):
     await task_manager.initialize()
     logger.info("TaskManager initialized.")
     
+    # Load local tokenizers in the background so prompt budgeting never waits on them
+    from podcast_outreach.services.ai.token_counter import token_counter
+    token_counter.warm_up()
+    
+    # Compile prompt files once instead of reading them on every call
+    from podcast_outreach.services.ai.template_registry import template_registry
+    template_registry.load_all()
+    
     # Initialize event-driven workflow orchestration
     initialize_event_handlers()
     logger.info("Event handlers initialized.")
@@ -92,19 +100,38 @@ async def lifespan(app: FastAPI):
     notification_service = get_notification_service()
     logger.info("Notification service initialized.")
     
-    # Initialize and start task scheduler
+    # Relay notifications across processes (background workers, other web replicas)
+    if NOTIFICATION_PG_BRIDGE_ENABLED:
+        await notification_service.start_bridge()
+    
+    # Initialize task scheduler (an API-only process uses it for status and control)
     scheduler = initialize_scheduler(task_manager)
     
+    if not RUNS_BACKGROUND_WORK:
+        logger.info(f"PROCESS_ROLE={PROCESS_ROLE}: background tasks are queued for worker processes "
+                    f"(python -m podcast_outreach.worker)")
     # In production, delay scheduler start to prevent memory spikes
-    if IS_PRODUCTION:
+    elif IS_PRODUCTION:
         logger.info("Production mode: Implementing 60-second startup delay to prevent memory spikes")
-        # Start scheduler but don't let it run tasks immediately
-        scheduler.running = False
         asyncio.create_task(_delayed_scheduler_start(scheduler))
         logger.info("Task scheduler initialized, will start after delay.")
     else:
         await scheduler.start()
         logger.info("Task scheduler started.")
+    
+    if RUNS_BACKGROUND_WORK:
+        # Start the process pool for CPU-bound parsing and audio work before the pipelines use it
+        from podcast_outreach.services.tasks.process_pool import process_pool
+        await process_pool.warm_up()
+        
+        # Discovery stages are claimed from the pipeline_jobs queue by per-stage workers
+        if PIPELINE_JOB_QUEUE_ENABLED:
+            from podcast_outreach.services.tasks.pipeline_worker import pipeline_worker
+            await pipeline_worker.start()
+        
+        # Tasks queued by API-only replicas
+        from podcast_outreach.services.tasks.task_queue import task_queue_worker
+        await task_queue_worker.start()
 
     if ENABLE_LLM_TEST_DASHBOARD:
         logger.info("ENABLE_LLM_TEST_DASHBOARD is true. Attempting to load test runner routes.")
@@ -152,13 +179,29 @@ async def lifespan(app: FastAPI):
             await scheduler.stop()
             logger.info("Task scheduler stopped.")
         
+        if RUNS_BACKGROUND_WORK:
+            from podcast_outreach.services.tasks.task_queue import task_queue_worker
+            await task_queue_worker.stop()
+            
+            if PIPELINE_JOB_QUEUE_ENABLED:
+                from podcast_outreach.services.tasks.pipeline_worker import pipeline_worker
+                await pipeline_worker.stop()
+        
+        # Stop cross-process notification relay before the pools go away
+        from podcast_outreach.services.events.notification_service import get_notification_service
+        await get_notification_service().stop_bridge()
+        
         # Clean up any running tasks or processes
         if hasattr(task_manager, 'cleanup'):
             await task_manager.cleanup()
         
+        from podcast_outreach.services.tasks.process_pool import process_pool
+        await asyncio.to_thread(process_pool.shutdown)
+        
         # Close any open database connections or services
         await close_db_pool()  # Close DB pool
         logger.info("Database connection pool closed.")
+        await close_analytics_pool()
         
         # Allow some time for graceful cleanup
         await asyncio.sleep(0.5)
@@ -223,6 +266,9 @@ app.add_middleware(ConnectionMonitorMiddleware)
 # Add authentication middleware
 app.add_middleware(AuthMiddleware)
 
+# Outermost, so the request's batch loaders are visible to every layer below
+app.add_middleware(LoaderScopeMiddleware)
+
 # Initialize Jinja2Templates for HTML rendering
 templates = Jinja2Templates(directory="podcast_outreach/templates") # Explicitly set path
 
@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+"""
+Migration to move chatbot messages out of the chatbot_conversations.messages
+JSONB array into an append-only chatbot_messages table.
+
+Appending a turn becomes a two-row insert instead of rewriting the whole
+history, and message_count replaces jsonb_array_length(messages).
+"""
+import asyncpg
+
+async def migrate_up(conn: asyncpg.Connection):
+    """Apply the migration."""
+    print("[005] Adding chatbot_messages table...")
+
+    async with conn.transaction():
+        await conn.execute("""
+        CREATE TABLE IF NOT EXISTS chatbot_messages (
+            message_id BIGSERIAL PRIMARY KEY,
+            conversation_id UUID NOT NULL REFERENCES chatbot_conversations(conversation_id) ON DELETE CASCADE,
+            seq INTEGER NOT NULL,
+            message_type VARCHAR(20) NOT NULL,
+            content TEXT,
+            message JSONB NOT NULL,
+            created_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE (conversation_id, seq)
+        );
+        """)
+
+        await conn.execute("""
+        ALTER TABLE chatbot_conversations
+        ADD COLUMN IF NOT EXISTS message_count INTEGER NOT NULL DEFAULT 0;
+        """)
+
+        # Backfill existing histories, preserving their order
+        await conn.execute("""
+        INSERT INTO chatbot_messages (conversation_id, seq, message_type, content, message)
+        SELECT c.conversation_id,
+               (m.ordinality - 1)::INTEGER,
+               COALESCE(m.value->>'type', 'unknown'),
+               m.value->>'content',
+               m.value
+        FROM chatbot_conversations c
+        CROSS JOIN LATERAL jsonb_array_elements(COALESCE(c.messages, '[]'::jsonb)) WITH ORDINALITY AS m(value, ordinality)
+        ON CONFLICT (conversation_id, seq) DO NOTHING;
+        """)
+
+        await conn.execute("""
+        UPDATE chatbot_conversations
+        SET message_count = jsonb_array_length(COALESCE(messages, '[]'::jsonb)),
+            messages = '[]'::jsonb;
+        """)
+
+    print("[005] chatbot_messages table created and backfilled")
+
+async def migrate_down(conn: asyncpg.Connection):
+    """Rollback the migration."""
+    print("[005] Restoring chatbot messages into chatbot_conversations.messages...")
+
+    async with conn.transaction():
+        await conn.execute("""
+        UPDATE chatbot_conversations c
+        SET messages = COALESCE((
+            SELECT jsonb_agg(m.message ORDER BY m.seq)
+            FROM chatbot_messages m
+            WHERE m.conversation_id = c.conversation_id
+        ), '[]'::jsonb);
+        """)
+        await conn.execute("DROP TABLE IF EXISTS chatbot_messages;")
+        await conn.execute("ALTER TABLE chatbot_conversations DROP COLUMN IF EXISTS message_count;")
+
+    print("[005] chatbot_messages table removed")
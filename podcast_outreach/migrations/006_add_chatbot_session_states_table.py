@@ -0,0 +1,33 @@
+#!/usr/bin/env python
+"""
+Migration to add the chatbot_session_states table.
+Stores serialized agentic conversation state with a version counter so any
+web worker can resume a session and concurrent writers are detected.
+"""
+import asyncpg
+
+async def migrate_up(conn: asyncpg.Connection):
+    """Apply the migration."""
+    print("[006] Adding chatbot_session_states table...")
+
+    await conn.execute("""
+    CREATE TABLE IF NOT EXISTS chatbot_session_states (
+        session_id VARCHAR(255) PRIMARY KEY,
+        state JSONB NOT NULL,
+        version INTEGER NOT NULL DEFAULT 1,
+        created_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP
+    );
+    """)
+    await conn.execute("""
+    CREATE INDEX IF NOT EXISTS idx_chatbot_session_states_updated_at
+    ON chatbot_session_states(updated_at);
+    """)
+
+    print("[006] chatbot_session_states table created")
+
+async def migrate_down(conn: asyncpg.Connection):
+    """Rollback the migration."""
+    print("[006] Dropping chatbot_session_states table...")
+    await conn.execute("DROP TABLE IF EXISTS chatbot_session_states;")
+    print("[006] chatbot_session_states table dropped")
@@ -0,0 +1,34 @@
+#!/usr/bin/env python
+"""
+Migration to add the embedding_cache table.
+Embeddings are keyed by a SHA-256 of the embedded text and the model, so
+unchanged summaries are never sent to the embeddings API twice.
+"""
+import asyncpg
+
+async def migrate_up(conn: asyncpg.Connection):
+    """Apply the migration."""
+    print("[007] Adding embedding_cache table...")
+
+    await conn.execute("""
+    CREATE TABLE IF NOT EXISTS embedding_cache (
+        content_hash CHAR(64) NOT NULL,
+        model VARCHAR(100) NOT NULL,
+        embedding REAL[] NOT NULL,
+        created_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP,
+        last_used_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (content_hash, model)
+    );
+    """)
+    await conn.execute("""
+    CREATE INDEX IF NOT EXISTS idx_embedding_cache_last_used_at
+    ON embedding_cache(last_used_at);
+    """)
+
+    print("[007] embedding_cache table created")
+
+async def migrate_down(conn: asyncpg.Connection):
+    """Rollback the migration."""
+    print("[007] Dropping embedding_cache table...")
+    await conn.execute("DROP TABLE IF EXISTS embedding_cache;")
+    print("[007] embedding_cache table dropped")
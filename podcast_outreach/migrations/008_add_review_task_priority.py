@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+"""
+Migration to add a denormalized priority column to review_tasks.
+The review queue used to sort by COALESCE(ms.vetting_score, ms.match_score, 0)
+through a join on every page; the value is now stored on the task, kept
+current by triggers, and indexed for keyset pagination.
+"""
+import asyncpg
+
+REVIEW_TASK_PRIORITY_FUNCTIONS = """
+CREATE OR REPLACE FUNCTION set_review_task_priority()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF NEW.task_type = 'match_suggestion' THEN
+        SELECT COALESCE(ms.vetting_score, ms.match_score, 0)
+        INTO NEW.priority
+        FROM match_suggestions ms
+        WHERE ms.match_id = NEW.related_id;
+        NEW.priority := COALESCE(NEW.priority, 0);
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION sync_review_task_priority_from_match()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE review_tasks
+    SET priority = COALESCE(NEW.vetting_score, NEW.match_score, 0)
+    WHERE task_type = 'match_suggestion'
+      AND related_id = NEW.match_id
+      AND priority IS DISTINCT FROM COALESCE(NEW.vetting_score, NEW.match_score, 0);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trigger_set_review_task_priority ON review_tasks;
+CREATE TRIGGER trigger_set_review_task_priority
+BEFORE INSERT OR UPDATE OF task_type, related_id ON review_tasks
+FOR EACH ROW
+EXECUTE FUNCTION set_review_task_priority();
+
+DROP TRIGGER IF EXISTS trigger_sync_review_task_priority ON match_suggestions;
+CREATE TRIGGER trigger_sync_review_task_priority
+AFTER UPDATE OF vetting_score, match_score ON match_suggestions
+FOR EACH ROW
+WHEN (OLD.vetting_score IS DISTINCT FROM NEW.vetting_score OR OLD.match_score IS DISTINCT FROM NEW.match_score)
+EXECUTE FUNCTION sync_review_task_priority_from_match();
+"""
+
+async def migrate_up(conn: asyncpg.Connection):
+    """Apply the migration."""
+    print("[008] Adding review_tasks.priority...")
+
+    await conn.execute("""
+    ALTER TABLE review_tasks
+    ADD COLUMN IF NOT EXISTS priority NUMERIC NOT NULL DEFAULT 0;
+    """)
+
+    # Backfill from the scores the old ORDER BY used
+    await conn.execute("""
+    UPDATE review_tasks rt
+    SET priority = COALESCE(ms.vetting_score, ms.match_score, 0)
+    FROM match_suggestions ms
+    WHERE rt.task_type = 'match_suggestion' AND rt.related_id = ms.match_id;
+    """)
+
+    await conn.execute(REVIEW_TASK_PRIORITY_FUNCTIONS)
+
+    # Keyset order: priority DESC, created_at DESC, review_task_id DESC (scanned backwards)
+    await conn.execute("""
+    CREATE INDEX IF NOT EXISTS idx_review_tasks_status_priority
+    ON review_tasks(status, priority, created_at, review_task_id);
+    """)
+    await conn.execute("""
+    CREATE INDEX IF NOT EXISTS idx_review_tasks_priority
+    ON review_tasks(priority, created_at, review_task_id);
+    """)
+
+    print("[008] review_tasks.priority added and backfilled")
+
+async def migrate_down(conn: asyncpg.Connection):
+    """Rollback the migration."""
+    print("[008] Dropping review_tasks.priority...")
+    await conn.execute("DROP TRIGGER IF EXISTS trigger_sync_review_task_priority ON match_suggestions;")
+    await conn.execute("DROP TRIGGER IF EXISTS trigger_set_review_task_priority ON review_tasks;")
+    await conn.execute("DROP FUNCTION IF EXISTS sync_review_task_priority_from_match();")
+    await conn.execute("DROP FUNCTION IF EXISTS set_review_task_priority();")
+    await conn.execute("DROP INDEX IF EXISTS idx_review_tasks_status_priority;")
+    await conn.execute("DROP INDEX IF EXISTS idx_review_tasks_priority;")
+    await conn.execute("ALTER TABLE review_tasks DROP COLUMN IF EXISTS priority;")
+    print("[008] review_tasks.priority dropped")
@@ -0,0 +1,30 @@
+#!/usr/bin/env python
+"""
+Migration to cache reduced transcripts on episodes.
+reduced_transcript holds the extractive reduction sent to the LLM instead of
+the raw transcript; reduced_transcript_key is a SHA-256 of the transcript,
+token budget and reduction version, so a stale copy is recomputed.
+"""
+import asyncpg
+
+async def migrate_up(conn: asyncpg.Connection):
+    """Apply the migration."""
+    print("[009] Adding reduced transcript columns to episodes...")
+
+    await conn.execute("""
+    ALTER TABLE episodes
+        ADD COLUMN IF NOT EXISTS reduced_transcript TEXT,
+        ADD COLUMN IF NOT EXISTS reduced_transcript_key CHAR(64);
+    """)
+
+    print("[009] Reduced transcript columns added")
+
+async def migrate_down(conn: asyncpg.Connection):
+    """Rollback the migration."""
+    print("[009] Dropping reduced transcript columns...")
+    await conn.execute("""
+    ALTER TABLE episodes
+        DROP COLUMN IF EXISTS reduced_transcript,
+        DROP COLUMN IF EXISTS reduced_transcript_key;
+    """)
+    print("[009] Reduced transcript columns dropped")
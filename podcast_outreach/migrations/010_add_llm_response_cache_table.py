@@ -0,0 +1,42 @@
+#!/usr/bin/env python
+"""
+Migration to add the llm_response_cache table.
+Responses of deterministic LLM workflows are keyed by a SHA-256 of the model,
+prompt and generation config, and expire after a per-workflow TTL.
+"""
+import asyncpg
+
+async def migrate_up(conn: asyncpg.Connection):
+    """Apply the migration."""
+    print("[010] Adding llm_response_cache table...")
+
+    await conn.execute("""
+    CREATE TABLE IF NOT EXISTS llm_response_cache (
+        cache_key CHAR(64) PRIMARY KEY,
+        workflow VARCHAR(100) NOT NULL,
+        model VARCHAR(100) NOT NULL,
+        response TEXT NOT NULL,
+        tokens_in INTEGER NOT NULL DEFAULT 0,
+        tokens_out INTEGER NOT NULL DEFAULT 0,
+        hit_count INTEGER NOT NULL DEFAULT 0,
+        created_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP,
+        last_used_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP,
+        expires_at TIMESTAMPTZ NOT NULL
+    );
+    """)
+    await conn.execute("""
+    CREATE INDEX IF NOT EXISTS idx_llm_response_cache_expires_at
+    ON llm_response_cache(expires_at);
+    """)
+    await conn.execute("""
+    CREATE INDEX IF NOT EXISTS idx_llm_response_cache_last_used_at
+    ON llm_response_cache(last_used_at);
+    """)
+
+    print("[010] llm_response_cache table created")
+
+async def migrate_down(conn: asyncpg.Connection):
+    """Rollback the migration."""
+    print("[010] Dropping llm_response_cache table...")
+    await conn.execute("DROP TABLE IF EXISTS llm_response_cache;")
+    print("[010] llm_response_cache table dropped")
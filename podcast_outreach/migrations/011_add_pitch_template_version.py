@@ -0,0 +1,43 @@
+#!/usr/bin/env python
+"""
+Migration to version pitch templates.
+pitch_templates.version is bumped by a trigger whenever a template's content
+changes, so processes caching templates can revalidate with a single lookup.
+"""
+import asyncpg
+
+async def migrate_up(conn: asyncpg.Connection):
+    """Apply the migration."""
+    print("[011] Adding version column to pitch_templates...")
+
+    await conn.execute("""
+    ALTER TABLE pitch_templates
+        ADD COLUMN IF NOT EXISTS version INTEGER NOT NULL DEFAULT 1;
+    """)
+    await conn.execute("""
+    CREATE OR REPLACE FUNCTION bump_pitch_template_version()
+    RETURNS TRIGGER AS $$
+    BEGIN
+        NEW.version := OLD.version + 1;
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+    await conn.execute("""
+    DROP TRIGGER IF EXISTS trigger_bump_pitch_template_version ON pitch_templates;
+    CREATE TRIGGER trigger_bump_pitch_template_version
+    BEFORE UPDATE ON pitch_templates
+    FOR EACH ROW
+    WHEN (OLD.* IS DISTINCT FROM NEW.*)
+    EXECUTE FUNCTION bump_pitch_template_version();
+    """)
+
+    print("[011] pitch_templates.version added")
+
+async def migrate_down(conn: asyncpg.Connection):
+    """Rollback the migration."""
+    print("[011] Dropping pitch_templates.version...")
+    await conn.execute("DROP TRIGGER IF EXISTS trigger_bump_pitch_template_version ON pitch_templates;")
+    await conn.execute("DROP FUNCTION IF EXISTS bump_pitch_template_version();")
+    await conn.execute("ALTER TABLE pitch_templates DROP COLUMN IF EXISTS version;")
+    print("[011] pitch_templates.version dropped")
@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+"""
+Migration to add the pipeline_jobs queue.
+Discovery work (enrichment, AI description, vetting, match creation) is
+claimed from this table with FOR UPDATE SKIP LOCKED. A claimed job stays
+invisible until visible_at; a worker that dies simply lets it expire, so no
+stale-lock cleanup is needed.
+"""
+import asyncpg
+
+async def migrate_up(conn: asyncpg.Connection):
+    """Apply the migration."""
+    print("[012] Creating pipeline_jobs table...")
+
+    await conn.execute("""
+    CREATE TABLE IF NOT EXISTS pipeline_jobs (
+        job_id BIGSERIAL PRIMARY KEY,
+        stage VARCHAR(50) NOT NULL, -- 'enrichment', 'ai_description', 'vetting', 'match_creation'
+        discovery_id INTEGER NOT NULL REFERENCES campaign_media_discoveries(id) ON DELETE CASCADE,
+        status VARCHAR(20) NOT NULL DEFAULT 'queued', -- 'queued', 'running', 'done', 'failed'
+        attempts INTEGER NOT NULL DEFAULT 0,
+        max_attempts INTEGER NOT NULL DEFAULT 3,
+        visible_at TIMESTAMPTZ NOT NULL DEFAULT NOW(), -- Claimable from this time; for running jobs, the visibility timeout
+        locked_by VARCHAR(100),
+        last_error TEXT,
+        created_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP,
+        completed_at TIMESTAMPTZ
+    );
+    """)
+    # One live job per stage and discovery, so enqueueing is idempotent
+    await conn.execute("""
+    CREATE UNIQUE INDEX IF NOT EXISTS idx_pipeline_jobs_active
+        ON pipeline_jobs(stage, discovery_id) WHERE status IN ('queued', 'running');
+    """)
+    await conn.execute("""
+    CREATE INDEX IF NOT EXISTS idx_pipeline_jobs_claim
+        ON pipeline_jobs(stage, visible_at) WHERE status IN ('queued', 'running');
+    """)
+    await conn.execute("""
+    CREATE INDEX IF NOT EXISTS idx_pipeline_jobs_discovery_id ON pipeline_jobs(discovery_id);
+    """)
+
+    print("[012] pipeline_jobs table created")
+
+async def migrate_down(conn: asyncpg.Connection):
+    """Rollback the migration."""
+    print("[012] Dropping pipeline_jobs table...")
+    await conn.execute("DROP TABLE IF EXISTS pipeline_jobs;")
+    print("[012] pipeline_jobs table dropped")
@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+"""
+Migration to index people by a normalized form of their name.
+normalize_person_name() lowercases, drops a leading title (Dr., Mr., ...)
+and collapses punctuation and whitespace, so "Dr. John  Smith" and
+"john smith" resolve to the same host. people.normalized_name is generated
+from full_name and indexed; a trigram index is added when pg_trgm can be
+enabled, for the optional fuzzy fallback of the host resolver.
+"""
+import asyncpg
+
+NORMALIZE_FUNCTION_SQL = r"""
+CREATE OR REPLACE FUNCTION normalize_person_name(name TEXT)
+RETURNS TEXT AS $$
+    SELECT NULLIF(btrim(regexp_replace(
+        regexp_replace(lower(btrim(name)), '^(dr|mr|mrs|ms|prof|professor)\.?\s+', ''),
+        '[^[:alnum:]]+', ' ', 'g'
+    )), '');
+$$ LANGUAGE sql IMMUTABLE PARALLEL SAFE;
+"""
+
+async def migrate_up(conn: asyncpg.Connection):
+    """Apply the migration."""
+    print("[013] Adding normalized_name to people...")
+
+    await conn.execute(NORMALIZE_FUNCTION_SQL)
+    await conn.execute("""
+    ALTER TABLE people
+        ADD COLUMN IF NOT EXISTS normalized_name TEXT GENERATED ALWAYS AS (normalize_person_name(full_name)) STORED;
+    """)
+    await conn.execute("""
+    CREATE INDEX IF NOT EXISTS idx_people_normalized_name ON people(normalized_name);
+    """)
+
+    try:
+        await conn.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm;")
+        await conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_people_normalized_name_trgm
+            ON people USING gin (normalized_name gin_trgm_ops);
+        """)
+        print("[013] Trigram index on people.normalized_name created")
+    except asyncpg.PostgresError as e:
+        print(f"[013] pg_trgm not available, skipping trigram index: {e}")
+
+    print("[013] normalized_name added")
+
+async def migrate_down(conn: asyncpg.Connection):
+    """Rollback the migration."""
+    print("[013] Dropping normalized_name from people...")
+    await conn.execute("DROP INDEX IF EXISTS idx_people_normalized_name_trgm;")
+    await conn.execute("DROP INDEX IF EXISTS idx_people_normalized_name;")
+    await conn.execute("ALTER TABLE people DROP COLUMN IF EXISTS normalized_name;")
+    await conn.execute("DROP FUNCTION IF EXISTS normalize_person_name(TEXT);")
+    print("[013] normalized_name dropped")
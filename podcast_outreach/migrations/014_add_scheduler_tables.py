@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+"""
+Migration to persist the task scheduler's state and run history.
+scheduled_task_state holds one row per scheduled task with its next run
+time, so restarts no longer re-trigger interval tasks. A run is claimed by
+moving next_run_at forward in the same statement that checks it is due, so
+each run happens once across all instances. scheduled_task_runs records
+every run with its duration and outcome.
+"""
+import asyncpg
+
+async def migrate_up(conn: asyncpg.Connection):
+    """Apply the migration."""
+    print("[014] Creating scheduler tables...")
+
+    await conn.execute("""
+    CREATE TABLE IF NOT EXISTS scheduled_task_state (
+        task_name VARCHAR(100) PRIMARY KEY,
+        enabled BOOLEAN NOT NULL DEFAULT TRUE,
+        next_run_at TIMESTAMPTZ NOT NULL,
+        last_run_at TIMESTAMPTZ,
+        last_status VARCHAR(20), -- 'running', 'succeeded', 'failed', 'cancelled', 'abandoned'
+        last_duration_ms INTEGER,
+        last_error TEXT,
+        last_instance VARCHAR(100),
+        updated_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP
+    );
+    """)
+    await conn.execute("""
+    CREATE TABLE IF NOT EXISTS scheduled_task_runs (
+        run_id BIGSERIAL PRIMARY KEY,
+        task_name VARCHAR(100) NOT NULL,
+        instance_id VARCHAR(100) NOT NULL,
+        status VARCHAR(20) NOT NULL DEFAULT 'running', -- 'running', 'succeeded', 'failed', 'cancelled', 'abandoned'
+        scheduled_for TIMESTAMPTZ,
+        started_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+        finished_at TIMESTAMPTZ,
+        duration_ms INTEGER,
+        error TEXT
+    );
+    """)
+    await conn.execute("""
+    CREATE INDEX IF NOT EXISTS idx_scheduled_task_runs_task_started
+        ON scheduled_task_runs(task_name, started_at DESC);
+    """)
+    await conn.execute("""
+    CREATE INDEX IF NOT EXISTS idx_scheduled_task_runs_running
+        ON scheduled_task_runs(run_id) WHERE status = 'running';
+    """)
+
+    print("[014] Scheduler tables created")
+
+async def migrate_down(conn: asyncpg.Connection):
+    """Rollback the migration."""
+    print("[014] Dropping scheduler tables...")
+    await conn.execute("DROP TABLE IF EXISTS scheduled_task_runs;")
+    await conn.execute("DROP TABLE IF EXISTS scheduled_task_state;")
+    print("[014] Scheduler tables dropped")
@@ -0,0 +1,28 @@
+#!/usr/bin/env python
+"""
+Migration to record the batch size and backlog of adaptive scheduler runs.
+Pipelines scheduled by backlog choose a batch size per run; storing it with
+the backlog it was planned for shows how the scheduler reacted, and lets the
+scheduler sum the items started in the last hour against the LLM budget.
+"""
+import asyncpg
+
+async def migrate_up(conn: asyncpg.Connection):
+    """Apply the migration."""
+    print("[015] Adding batch_size and backlog to scheduled_task_runs...")
+    await conn.execute("""
+    ALTER TABLE scheduled_task_runs
+        ADD COLUMN IF NOT EXISTS batch_size INTEGER,
+        ADD COLUMN IF NOT EXISTS backlog INTEGER;
+    """)
+    print("[015] batch_size and backlog added")
+
+async def migrate_down(conn: asyncpg.Connection):
+    """Rollback the migration."""
+    print("[015] Dropping batch_size and backlog from scheduled_task_runs...")
+    await conn.execute("""
+    ALTER TABLE scheduled_task_runs
+        DROP COLUMN IF EXISTS batch_size,
+        DROP COLUMN IF EXISTS backlog;
+    """)
+    print("[015] batch_size and backlog dropped")
@@ -0,0 +1,43 @@
+#!/usr/bin/env python
+"""
+Migration to queue background tasks for worker processes.
+A process running with PROCESS_ROLE=web only serves the API: the tasks it
+starts (enrichment, transcription, discovery, ...) are inserted here and
+announced with NOTIFY, and a worker process claims them with FOR UPDATE
+SKIP LOCKED and records their outcome, so any replica can report status.
+"""
+import asyncpg
+
+async def migrate_up(conn: asyncpg.Connection):
+    """Apply the migration."""
+    print("[016] Creating background_tasks table...")
+    await conn.execute("""
+    CREATE TABLE IF NOT EXISTS background_tasks (
+        task_id VARCHAR(255) PRIMARY KEY,
+        action VARCHAR(255) NOT NULL, -- Label shown in task status
+        method VARCHAR(100) NOT NULL, -- TaskManager method that runs it
+        params JSONB NOT NULL DEFAULT '{}'::jsonb,
+        status VARCHAR(20) NOT NULL DEFAULT 'queued', -- 'queued', 'running', 'completed', 'failed', 'cancelled'
+        worker_id VARCHAR(100),
+        error TEXT,
+        queued_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+        started_at TIMESTAMPTZ,
+        heartbeat_at TIMESTAMPTZ, -- Refreshed by the worker while the task runs
+        finished_at TIMESTAMPTZ
+    );
+    """)
+    await conn.execute("""
+    CREATE INDEX IF NOT EXISTS idx_background_tasks_queued
+        ON background_tasks(queued_at) WHERE status = 'queued';
+    """)
+    await conn.execute("""
+    CREATE INDEX IF NOT EXISTS idx_background_tasks_running
+        ON background_tasks(heartbeat_at) WHERE status = 'running';
+    """)
+    print("[016] background_tasks created")
+
+async def migrate_down(conn: asyncpg.Connection):
+    """Rollback the migration."""
+    print("[016] Dropping background_tasks table...")
+    await conn.execute("DROP TABLE IF EXISTS background_tasks;")
+    print("[016] background_tasks dropped")
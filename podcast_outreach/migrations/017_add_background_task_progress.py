@@ -0,0 +1,41 @@
+#!/usr/bin/env python
+"""
+Migration to make background_tasks the registry of every TaskManager task.
+Tasks started in-process (scheduled pipelines, API-triggered runs) are now
+recorded next to the queued ones, with progress counters saved by the
+heartbeat, a stop flag any instance can set, and the run's duration, so long
+pipeline runs can be followed and stopped from any instance. The index
+serves the newest-first, keyset-paged listing of the tasks API.
+"""
+import asyncpg
+
+async def migrate_up(conn: asyncpg.Connection):
+    """Apply the migration."""
+    print("[017] Adding progress, stop flag and duration to background_tasks...")
+    await conn.execute("""
+    ALTER TABLE background_tasks
+        ADD COLUMN IF NOT EXISTS progress_done INTEGER NOT NULL DEFAULT 0,
+        ADD COLUMN IF NOT EXISTS progress_total INTEGER,
+        ADD COLUMN IF NOT EXISTS progress_message TEXT,
+        ADD COLUMN IF NOT EXISTS stop_requested BOOLEAN NOT NULL DEFAULT FALSE,
+        ADD COLUMN IF NOT EXISTS duration_ms INTEGER;
+    """)
+    await conn.execute("""
+    CREATE INDEX IF NOT EXISTS idx_background_tasks_recent
+        ON background_tasks(queued_at DESC, task_id DESC);
+    """)
+    print("[017] background_tasks progress columns added")
+
+async def migrate_down(conn: asyncpg.Connection):
+    """Rollback the migration."""
+    print("[017] Dropping progress, stop flag and duration from background_tasks...")
+    await conn.execute("DROP INDEX IF EXISTS idx_background_tasks_recent;")
+    await conn.execute("""
+    ALTER TABLE background_tasks
+        DROP COLUMN IF EXISTS progress_done,
+        DROP COLUMN IF EXISTS progress_total,
+        DROP COLUMN IF EXISTS progress_message,
+        DROP COLUMN IF EXISTS stop_requested,
+        DROP COLUMN IF EXISTS duration_ms;
+    """)
+    print("[017] background_tasks progress columns dropped")
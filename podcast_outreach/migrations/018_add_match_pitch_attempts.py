@@ -0,0 +1,32 @@
+#!/usr/bin/env python
+"""
+Migration to record failed pitch generation attempts on match_suggestions.
+Batch pitch generation takes approved matches without a pitch oldest first,
+so a match whose generation keeps failing (missing media, no usable episode,
+a prompt the model rejects) came back at the head of every batch. With the
+attempt count, time and error stored per match, such matches wait out an
+exponential backoff and are ordered after matches never tried.
+"""
+import asyncpg
+
+async def migrate_up(conn: asyncpg.Connection):
+    """Apply the migration."""
+    print("[018] Adding pitch attempt tracking to match_suggestions...")
+    await conn.execute("""
+    ALTER TABLE match_suggestions
+        ADD COLUMN IF NOT EXISTS pitch_attempts INTEGER NOT NULL DEFAULT 0,
+        ADD COLUMN IF NOT EXISTS last_pitch_attempt_at TIMESTAMPTZ,
+        ADD COLUMN IF NOT EXISTS last_pitch_error TEXT;
+    """)
+    print("[018] match_suggestions pitch attempt columns added")
+
+async def migrate_down(conn: asyncpg.Connection):
+    """Rollback the migration."""
+    print("[018] Dropping pitch attempt tracking from match_suggestions...")
+    await conn.execute("""
+    ALTER TABLE match_suggestions
+        DROP COLUMN IF EXISTS pitch_attempts,
+        DROP COLUMN IF EXISTS last_pitch_attempt_at,
+        DROP COLUMN IF EXISTS last_pitch_error;
+    """)
+    print("[018] match_suggestions pitch attempt columns dropped")
@@ -41,6 +41,7 @@ def format_as_text(report: Dict[str, Any]) -> str:
         text_output.append(f"Pitch Generation ID: {report['pitch_gen_id']}")
         text_output.append("-" * 60)
         text_output.append(f"Total API calls: {report['total_calls']}")
+        text_output.append(f"Served from response cache: {report.get('total_cache_hits', 0)}")
         text_output.append(f"Total tokens: {report['total_tokens']:,}")
         text_output.append(f"Total cost: ${report['total_cost']:.4f}")
         text_output.append("-" * 60)
@@ -93,6 +94,7 @@ def format_as_text(report: Dict[str, Any]) -> str:
     # Summary stats
     text_output.append("-" * 60)
     text_output.append(f"Total API calls: {report['total_entries']}")
+    text_output.append(f"Served from response cache: {report.get('total_cache_hits', 0)}")
     text_output.append(f"Total tokens: {report['total_tokens']:,}")
     text_output.append(f"Total cost: ${report['total_cost']:.2f}")
     text_output.append("-" * 60)
@@ -11,10 +11,11 @@ from podcast_outreach.services.media.analyzer import MediaAnalyzerService
 from podcast_outreach.services.matches.match_creation import MatchCreationService
 from podcast_outreach.database.queries import episodes as episode_queries, campaigns as campaign_queries, media as media_queries
 from podcast_outreach.database.connection import init_db_pool, close_db_pool, reset_db_pool
-from podcast_outreach.config import ORCHESTRATOR_CONFIG
+from podcast_outreach.config import ORCHESTRATOR_CONFIG, EMBEDDING_BACKFILL_BATCH_SIZE, EPISODE_ANALYSIS_FETCH_SIZE
+from podcast_outreach.services.media.embedding_backfill import EmbeddingBackfillService
 from podcast_outreach.services.enrichment.quality_score import QualityService
-from podcast_outreach.database.models.media_models import EnrichedPodcastProfile
 from podcast_outreach.utils.memory_monitor import cleanup_memory, get_memory_info
+from podcast_outreach.services.tasks.context import report_progress, stop_requested
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
 logger = logging.getLogger(__name__)
@@ -22,9 +23,10 @@ logger = logging.getLogger(__name__)
 # Reduce batch size to prevent memory issues
 BATCH_SIZE = int(os.getenv("TRANSCRIPTION_BATCH_SIZE", "1"))  # Default to 1 for safety
 
-async def run_transcription_logic(db_service=None):
+async def run_transcription_logic(db_service=None, batch_size=None):
     """
     Core logic for the transcription and analysis process. Can accept a database service or use global pool.
+    batch_size caps the episodes transcribed this run (default BATCH_SIZE).
     """
     # Determine which pool to use for database operations
     if db_service:
@@ -42,10 +44,14 @@ async def run_transcription_logic(db_service=None):
         quality_service = QualityService()
 
         # Process episodes that need transcription
-        to_transcribe = await episode_queries.fetch_episodes_for_transcription(BATCH_SIZE, pool_to_use)
+        to_transcribe = await episode_queries.fetch_episodes_for_transcription(batch_size or BATCH_SIZE, pool_to_use)
         if to_transcribe:
             logger.info(f"Found {len(to_transcribe)} episodes to transcribe.")
+            report_progress(total=len(to_transcribe), message="Transcribing episodes")
             for ep in to_transcribe:
+                if stop_requested():
+                    logger.info("Transcription run stopped on request")
+                    return
                 episode_id = ep["episode_id"]
                 media_id = ep["media_id"]
                 # Check memory before processing
@@ -61,6 +67,7 @@ async def run_transcription_logic(db_service=None):
                 )
                 if not success:
                     logger.error(f"Failed to process episode {episode_id} after all retries")
+                report_progress(advance=1)
                 
                 # Clean up memory after each episode
                 gc.collect()
@@ -69,35 +76,29 @@ async def run_transcription_logic(db_service=None):
         else:
             logger.info("No episodes require transcription at this time.")
         
-        # Process episodes that need embeddings (including Podscan episodes with existing content)
-        to_embed = await episode_queries.fetch_episodes_for_embedding_generation(BATCH_SIZE, pool_to_use)
-        if to_embed:
-            logger.info(f"Found {len(to_embed)} episodes needing embeddings.")
-            for ep in to_embed:
-                episode_id = ep["episode_id"]
-                success = await generate_embedding_for_existing_episode(ep, transcriber, pool_to_use)
-                if success:
-                    logger.info(f"Generated embedding for episode {episode_id}")
-                else:
-                    logger.warning(f"Failed to generate embedding for episode {episode_id}")
+        # Process episodes that need embeddings (including Podscan episodes with existing content).
+        # One large batched round per run; the batched API embeds the whole batch in a few requests.
+        embed_result = await EmbeddingBackfillService(transcriber.openai_service).run(
+            batch_size=EMBEDDING_BACKFILL_BATCH_SIZE, max_batches=1, pool=pool_to_use
+        )
+        if embed_result["embedded"] or embed_result["failed"]:
+            logger.info(f"Generated embeddings for {embed_result['embedded']} episodes ({embed_result['failed']} failed).")
         else:
             logger.info("No episodes need embeddings at this time.")
         
         # Process episodes that need analysis (including Podscan episodes with existing transcripts)
-        to_analyze = await episode_queries.fetch_episodes_for_analysis(BATCH_SIZE, pool_to_use)
+        # Short episodes share LLM calls, so analysis takes a larger batch than transcription
+        to_analyze = await episode_queries.fetch_episodes_for_analysis(EPISODE_ANALYSIS_FETCH_SIZE, pool_to_use)
         if to_analyze:
             logger.info(f"Found {len(to_analyze)} episodes to analyze.")
             media_ids_analyzed = set()
             
-            for ep in to_analyze:
-                episode_id = ep["episode_id"]
-                media_id = ep["media_id"]
-                
-                # Analyze the episode
-                analysis_result = await analyzer.analyze_episode(episode_id)
+            batch_result = await analyzer.analyze_episodes_batch(to_analyze, pool_to_use)
+            for analysis_result in batch_result["results"]:
+                episode_id = analysis_result["episode_id"]
                 if analysis_result.get("status") == "success":
                     logger.info(f"Episode {episode_id} analysis successful.")
-                    media_ids_analyzed.add(media_id)
+                    media_ids_analyzed.add(analysis_result["media_id"])
                 else:
                     logger.warning(f"Episode {episode_id} analysis failed: {analysis_result.get('message')}")
             
@@ -269,13 +270,11 @@ async def process_single_episode_with_retry(
                 min_episodes_needed = ORCHESTRATOR_CONFIG.get("quality_score_min_transcribed_episodes", 3)
                 if transcribed_count >= min_episodes_needed:
                     logger.info(f"Media {media_id} has enough transcripts. Updating quality score.")
-                    media_data = await media_queries.get_media_by_id_from_db(media_id)
-                    if media_data:
-                        profile = EnrichedPodcastProfile(**media_data)
-                        score, components = quality_service.calculate_podcast_quality_score(profile)
-                        if score is not None:
-                            await media_queries.update_media_quality_score(media_id, score)
-                            logger.info(f"Updated quality score for media {media_id} to {score}.")
+                    inputs = await media_queries.get_quality_score_inputs([media_id], pool=pool_to_use)
+                    if inputs:
+                        scores = quality_service.score_batch(inputs)
+                        await media_queries.bulk_update_media_quality_scores(scores, pool=pool_to_use)
+                        logger.info(f"Updated quality score for media {media_id} to {scores['quality_score'][0]}.")
             
             # Success - episode processed successfully
             return True
@@ -333,80 +332,6 @@ async def process_single_episode_with_retry(
     logger.error(f"Episode {episode_id} failed after all {max_retries} retry attempts")
     return False
 
-async def generate_embedding_for_existing_episode(ep, transcriber, pool_to_use) -> bool:
-    """
-    Generate embedding for an episode that already has content but missing embedding.
-    Used for Podscan episodes and other pre-existing content.
-    """
-    episode_id = ep["episode_id"]
-    title = ep.get("title", "")
-    transcript = ep.get("transcript", "")
-    ai_episode_summary = ep.get("ai_episode_summary", "")
-    episode_summary = ep.get("episode_summary", "")
-    
-    try:
-        # Use the best available content for embedding
-        summary_for_embedding = ai_episode_summary or episode_summary or ""
-        
-        if not transcript and not summary_for_embedding:
-            logger.warning(f"Episode {episode_id} has no content for embedding generation")
-            return False
-        
-        # Generate embedding using AI summary only (no transcript truncation)
-        from podcast_outreach.services.ai.openai_client import OpenAIService
-        openai_service = OpenAIService()
-        
-        # Use only title + AI summary for embeddings (semantic-focused)
-        if summary_for_embedding:
-            embedding_text = f"Title: {title}\nSummary: {summary_for_embedding}"
-        else:
-            # Fallback: create summary from transcript if no summary exists
-            logger.info(f"No summary available for episode {episode_id}, creating one from transcript")
-            if transcript:
-                # Use transcriber to create summary for embedding
-                from podcast_outreach.services.media.transcriber import MediaTranscriber
-                transcriber_service = MediaTranscriber()
-                generated_summary = await transcriber_service.summarize_transcript(
-                    transcript=transcript,
-                    episode_title=title,
-                    podcast_name="",  # Could fetch from media table if needed
-                    episode_summary=""
-                )
-                embedding_text = f"Title: {title}\nSummary: {generated_summary}"
-            else:
-                embedding_text = f"Title: {title}"
-        
-        embedding = await openai_service.get_embedding(
-            text=embedding_text, 
-            workflow="episode_embedding", 
-            related_ids={"episode_id": episode_id}
-        )
-        
-        if not embedding:
-            logger.error(f"Failed to generate embedding for episode {episode_id}")
-            return False
-        
-        # Update episode with embedding
-        updated_episode = await episode_queries.update_episode_transcription(
-            episode_id, 
-            transcript or "[NO_TRANSCRIPT]",  # Keep existing transcript or mark as none
-            ai_episode_summary,  # Keep existing AI summary
-            embedding,
-            3,  # max_retries
-            pool_to_use
-        )
-        
-        if updated_episode:
-            logger.info(f"Successfully generated embedding for episode {episode_id}")
-            return True
-        else:
-            logger.error(f"Failed to update episode {episode_id} with embedding")
-            return False
-            
-    except Exception as e:
-        logger.error(f"Error generating embedding for episode {episode_id}: {e}")
-        return False
-
 async def main():
     """Main entry point for running the script directly."""
     await init_db_pool()
@@ -5,8 +5,9 @@ import time
 import logging
 import asyncio # Added for async operations
 import random  # For jitter in exponential backoff
-# import functools # No longer explicitly needed with asyncio.to_thread if other changes are made
-from typing import Optional, Dict, Any
+import weakref
+from typing import Optional, Dict, Any, Tuple
+from cachetools import LRUCache
 from dotenv import load_dotenv
 import google.generativeai as genai
 import uuid
@@ -17,6 +18,9 @@ from google.generativeai.types import HarmCategory, HarmBlockThreshold
 
 # Import our AI usage tracker from its new location
 from podcast_outreach.services.ai.tracker import tracker as ai_tracker
+from podcast_outreach.services.ai.token_counter import token_counter
+from podcast_outreach.services.ai.response_cache import response_cache
+from podcast_outreach.config import GEMINI_MODEL_CONCURRENCY, GEMINI_CLIENT_CACHE_SIZE
 from podcast_outreach.logging_config import get_logger # Use new logging config
 
 
@@ -33,6 +37,31 @@ GEMINI_API_KEY = os.getenv('GEMINI_API_KEY')
 # Set up logging
 logger = get_logger(__name__)
 
+# Model and chain instances are shared by every GeminiService on an event loop;
+# they are stateless per request and costly to build on each attempt. They are
+# kept per loop because their async clients are bound to the loop that first
+# used them, and TaskManager tasks run in threads with loops of their own.
+_generative_models: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, LRUCache]" = weakref.WeakKeyDictionary()
+_structured_chains: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, LRUCache]" = weakref.WeakKeyDictionary()
+# Per event loop, per model request limiters (semaphores cannot cross loops)
+_model_limiters: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]" = weakref.WeakKeyDictionary()
+
+def _loop_cache(caches: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, LRUCache]") -> LRUCache:
+    """The running loop's cache in `caches`."""
+    loop = asyncio.get_running_loop()
+    cache = caches.get(loop)
+    if cache is None:
+        cache = caches[loop] = LRUCache(maxsize=GEMINI_CLIENT_CACHE_SIZE)
+    return cache
+
+def model_limiter(model: str) -> asyncio.Semaphore:
+    """Per event loop cap on in-flight Gemini requests for a model (GEMINI_MODEL_CONCURRENCY)."""
+    limiters = _model_limiters.setdefault(asyncio.get_running_loop(), {})
+    limiter = limiters.get(model)
+    if limiter is None:
+        limiter = limiters[model] = asyncio.Semaphore(GEMINI_MODEL_CONCURRENCY)
+    return limiter
+
 class GeminiService:
     DEFAULT_SAFETY_SETTINGS = [
         {
@@ -64,6 +93,64 @@ class GeminiService:
             logger.error(f"Failed to initialize Gemini client: {e}")
             raise
 
+    # Generation settings used by create_message
+    MESSAGE_GENERATION_CONFIG = {
+        "temperature": 0.01,
+        "top_p": 0.1,
+        "top_k": 1,
+        "max_output_tokens": 10000, # Consider if this should be higher for some tasks
+    }
+
+    def _get_generative_model(self, model: str) -> Any:
+        """Returns the running loop's GenerativeModel for this model name and the message generation config."""
+        key = (model, tuple(sorted(self.MESSAGE_GENERATION_CONFIG.items())))
+        models = _loop_cache(_generative_models)
+        model_instance = models.get(key)
+        if model_instance is None:
+            model_instance = genai.GenerativeModel(
+                model_name=model,
+                generation_config=self.MESSAGE_GENERATION_CONFIG,
+                safety_settings=self.DEFAULT_SAFETY_SETTINGS # Apply safety settings
+            )
+            models[key] = model_instance
+        return model_instance
+
+    def _get_structured_chain(self, model: str, prompt_template_str: str, output_model: Any,
+                              temperature: float) -> Tuple[Any, str]:
+        """Returns the running loop's (prompt | structured LLM) chain and its format instructions."""
+        key = (model, prompt_template_str, output_model, temperature)
+        chains = _loop_cache(_structured_chains)
+        cached = chains.get(key)
+        if cached is not None:
+            return cached
+
+        from langchain_google_genai import ChatGoogleGenerativeAI
+        from langchain_core.output_parsers import PydanticOutputParser 
+        from langchain_core.prompts import PromptTemplate
+
+        format_instructions = PydanticOutputParser(pydantic_object=output_model).get_format_instructions()
+        # Assuming the prompt_template_str will have {user_query} and {format_instructions}
+        # If your actual template files are different, this PromptTemplate needs to match.
+        prompt_template = PromptTemplate(
+            template=prompt_template_str, 
+            input_variables=["user_query"], # Only user_query is dynamic per call here
+            partial_variables={"format_instructions": format_instructions}
+        )
+        # Convert the list of safety settings into the dictionary format LangChain expects
+        safety_settings_dict = {
+            item["category"]: item["threshold"] for item in self.DEFAULT_SAFETY_SETTINGS
+        }
+        llm_for_structured_output = ChatGoogleGenerativeAI(
+            model=model,
+            google_api_key=GEMINI_API_KEY,
+            temperature=temperature,
+            max_output_tokens=2048, # Consider if this should be higher
+            safety_settings=safety_settings_dict
+        )
+        chain = prompt_template | llm_for_structured_output.with_structured_output(output_model)
+        chains[key] = (chain, format_instructions)
+        return chain, format_instructions
+
     async def create_message(self, prompt: str, model: str = 'gemini-2.0-flash',
                              workflow: str = "unknown", related_pitch_gen_id: Optional[int] = None,
                              related_campaign_id: Optional[uuid.UUID] = None, related_media_id: Optional[int] = None,
@@ -73,30 +160,29 @@ class GeminiService:
         last_exception = None
         response_obj = None # To store response object for logging in case of error
 
+        # Deterministic settings make repeated prompts safe to serve from the cache (opt-in per workflow)
+        cached_text = await response_cache.get(
+            workflow, model, prompt, self.MESSAGE_GENERATION_CONFIG,
+            related_pitch_gen_id=related_pitch_gen_id,
+            related_campaign_id=related_campaign_id,
+            related_media_id=related_media_id
+        )
+        if cached_text is not None:
+            return cached_text
+
         while retry_count <= max_retries:
             try:
                 start_time = time.time()
 
-                generation_config = {
-                    "temperature": 0.01,
-                    "top_p": 0.1,
-                    "top_k": 1,
-                    "max_output_tokens": 10000, # Consider if this should be higher for some tasks
-                }
-
-                model_instance = genai.GenerativeModel(
-                    model_name=model,
-                    generation_config=generation_config,
-                    safety_settings=self.DEFAULT_SAFETY_SETTINGS # Apply safety settings
-                )
+                model_instance = self._get_generative_model(model)
                 
-                # Assuming model_instance.generate_content is blocking and needs to_thread
                 # Apply timeout using asyncio.wait_for
                 try:
-                    response_obj = await asyncio.wait_for(
-                        asyncio.to_thread(model_instance.generate_content, prompt),
-                        timeout=timeout
-                    )
+                    async with model_limiter(model):
+                        response_obj = await asyncio.wait_for(
+                            model_instance.generate_content_async(prompt),
+                            timeout=timeout
+                        )
                 except asyncio.TimeoutError:
                     raise google_exceptions.DeadlineExceeded(f"Request timed out after {timeout} seconds")
 
@@ -136,8 +222,9 @@ class GeminiService:
 
                 execution_time = time.time() - start_time
                 
-                tokens_in = len(prompt) // 4 
-                tokens_out = len(content_text) // 4
+                usage = getattr(response_obj, 'usage_metadata', None)
+                tokens_in = getattr(usage, 'prompt_token_count', None) or token_counter.count(prompt, model)
+                tokens_out = getattr(usage, 'candidates_token_count', None) or token_counter.count(content_text, model)
 
                 await ai_tracker.log_usage(
                     workflow=workflow,
@@ -150,6 +237,9 @@ class GeminiService:
                     related_campaign_id=related_campaign_id,
                     related_media_id=related_media_id
                 )
+                await response_cache.put(
+                    workflow, model, prompt, self.MESSAGE_GENERATION_CONFIG, content_text, tokens_in, tokens_out
+                )
                 return content_text
 
             except GeminiSafetyBlockError as e:
@@ -241,20 +331,8 @@ class GeminiService:
                                   related_media_id: Optional[int] = None,
                                   max_retries: int = 3, 
                                   initial_retry_delay: int = 2) -> Optional[Any]:
-        from langchain_google_genai import ChatGoogleGenerativeAI
-        from langchain_core.output_parsers import PydanticOutputParser 
-        from langchain_core.prompts import PromptTemplate
-
-        parser = PydanticOutputParser(pydantic_object=output_model)
-        format_instructions = parser.get_format_instructions()
-        
-        # Assuming the prompt_template_str will have {user_query} and {format_instructions}
-        # If your actual template files are different, this PromptTemplate needs to match.
-        prompt_template = PromptTemplate(
-            template=prompt_template_str, 
-            input_variables=["user_query"], # Only user_query is dynamic per call here
-            partial_variables={"format_instructions": format_instructions}
-        )
+        model_name = "gemini-2.0-flash"
+        chain, format_instructions = self._get_structured_chain(model_name, prompt_template_str, output_model, temperature)
         
         approx_input_for_logging = prompt_template_str + user_query + format_instructions
 
@@ -266,31 +344,17 @@ class GeminiService:
             try:
                 start_time = time.time()
 
-                # Convert the list of safety settings into the dictionary format LangChain expects
-                safety_settings_dict = {
-                    item["category"]: item["threshold"] for item in self.DEFAULT_SAFETY_SETTINGS
-                }
-
-                llm_for_structured_output = ChatGoogleGenerativeAI(
-                    model="gemini-2.0-flash",
-                    google_api_key=GEMINI_API_KEY,
-                    temperature=temperature,
-                    max_output_tokens=2048, # Consider if this should be higher
-                    safety_settings=safety_settings_dict # <-- Pass the correctly formatted dictionary
-                )
-                
-                chain = prompt_template | llm_for_structured_output.with_structured_output(output_model)
-                
                 # The input to invoke should match the input_variables of the prompt_template
-                response_obj = await asyncio.to_thread(chain.invoke, {"user_query": user_query})
+                async with model_limiter(model_name):
+                    response_obj = await chain.ainvoke({"user_query": user_query})
 
                 execution_time = time.time() - start_time
-                tokens_in = len(approx_input_for_logging) // 4 
-                tokens_out = len(response_obj.model_dump_json()) // 4 # Requires output_model to have model_dump_json
+                tokens_in = token_counter.count(approx_input_for_logging, model_name)
+                tokens_out = token_counter.count(response_obj.model_dump_json(), model_name) # Requires output_model to have model_dump_json
 
                 await ai_tracker.log_usage(
                     workflow=workflow,
-                    model=llm_for_structured_output.model, # Use the correct attribute 'model'
+                    model=model_name,
                     tokens_in=tokens_in,
                     tokens_out=tokens_out,
                     execution_time=execution_time,
@@ -311,4 +375,4 @@ class GeminiService:
                     retry_delay *= 2
                 else:
                     logger.error(f"Error in get_structured_data after {max_retries} retries: {e}.{log_suffix}")
-                    raise Exception("Failed to get structured data using Gemini API after {max_retries} retries.") from e
\ No newline at end of file
+                    raise Exception(f"Failed to get structured data using Gemini API after {max_retries} retries.") from e
\ No newline at end of file
@@ -6,6 +6,7 @@ import logging
 import time
 import asyncio # Added for async operations
 import functools # Added for asyncio.to_thread
+import hashlib
 from openai import OpenAI
 from dotenv import load_dotenv
 from pydantic import BaseModel, Field
@@ -16,6 +17,14 @@ import uuid # For UUID types
 from podcast_outreach.services.ai.tracker import tracker as ai_tracker # Corrected import path
 from podcast_outreach.logging_config import get_logger # Use new logging config
 from podcast_outreach.utils.file_manipulation import read_txt_file # Use new utils path
+from podcast_outreach.database.queries import embedding_cache as embedding_cache_queries
+from podcast_outreach.services.ai.response_cache import response_cache
+from podcast_outreach.config import (
+    EMBEDDING_BATCH_MAX_INPUTS,
+    EMBEDDING_BATCH_MAX_TOKENS,
+    EMBEDDING_MAX_INPUT_TOKENS,
+    EMBEDDING_CACHE_ENABLED
+)
 
 # Load .env variables to access your OpenAI API key
 load_dotenv()
@@ -245,25 +254,38 @@ class OpenAIService: # Keeping original class name for compatibility
         retry_count = 0
         retry_delay = initial_retry_delay
         last_exception = None
+        model = "gpt-4o-2024-08-06"
+        generation_config = {"temperature": 0.1}
+        messages = [{
+            "role": "system",
+            "content": system_prompt
+        }, {
+            "role": "user",
+            "content": prompt
+        }]
+
+        cached_message = await response_cache.get(
+            workflow, model, messages, generation_config,
+            related_pitch_gen_id=related_pitch_gen_id,
+            related_campaign_id=related_campaign_id,
+            related_media_id=related_media_id
+        )
+        if cached_message is not None:
+            try:
+                return self._parse_completion(cached_message, parse_json, json_key)
+            except ValueError:
+                logger.warning(f"Discarding unparseable cached response for {workflow}")
 
         while retry_count <= max_retries:
             try:
                 start_time = time.time()
 
-                model = "gpt-4o-2024-08-06"
-
                 # Use asyncio.to_thread for synchronous API call within async function
                 response = await asyncio.to_thread(
                     self.client.chat.completions.create,
                     model=model,
-                    messages=[{
-                        "role": "system",
-                        "content": system_prompt
-                    }, {
-                        "role": "user",
-                        "content": prompt
-                    }],
-                    temperature=0.1,
+                    messages=messages,
+                    **generation_config
                 )
 
                 execution_time = time.time() - start_time
@@ -284,26 +306,12 @@ class OpenAIService: # Keeping original class name for compatibility
                     related_media_id=related_media_id
                 )
 
-                if parse_json:
-                    try:
-                        if "```" in assistant_message:
-                            assistant_message = assistant_message.split("```")[1]
-                            if assistant_message.startswith("json"):
-                                assistant_message = assistant_message[4:]
-
-                        result = json.loads(assistant_message.strip())
-                        if json_key is not None:
-                            if json_key not in result:
-                                raise ValueError(f"Response JSON is missing '{json_key}' field.")
-                            return result[json_key]
-                        return result
-
-                    except json.JSONDecodeError as e:
-                        logger.error(f"Error parsing JSON from response: {e}")
-                        logger.error(f"Raw response: {assistant_message}")
-                        raise ValueError(f"OpenAI response was not valid JSON. Check logs.")
-                
-                return assistant_message
+                # Parse before caching so a malformed response is retried, not stored
+                result = self._parse_completion(assistant_message, parse_json, json_key)
+                await response_cache.put(
+                    workflow, model, messages, generation_config, assistant_message, tokens_in, tokens_out
+                )
+                return result
 
             except Exception as e:
                 last_exception = e
@@ -318,28 +326,133 @@ class OpenAIService: # Keeping original class name for compatibility
                     logger.error(f"Error in create_chat_completion after {max_retries} retries: {e}")
                     raise Exception(f"Failed to generate chat completion using OpenAI API: {e}") from last_exception
 
-    async def get_embedding(self, text: str, model: str = "text-embedding-ada-002", workflow: str = "embedding", **kwargs) -> Optional[List[float]]:
-        start_time = time.time()
+    @staticmethod
+    def _parse_completion(assistant_message: str, parse_json: bool, json_key: Optional[str]) -> Any:
+        """Returns the message, its parsed JSON, or one key of it; raises ValueError on bad JSON."""
+        if not parse_json:
+            return assistant_message
         try:
-            text = text.replace("\n", " ") # OpenAI recommends replacing newlines
-            response = await asyncio.to_thread(
-                self.client.embeddings.create, input=[text], model=model
-            )
-            embedding = response.data[0].embedding
-            
-            # Estimate tokens for embeddings (input only)
-            # OpenAI's ada-002 counts tokens differently, but this is a rough estimate for logging
-            tokens_in = len(text) // 4 
-            
+            if "```" in assistant_message:
+                assistant_message = assistant_message.split("```")[1]
+                if assistant_message.startswith("json"):
+                    assistant_message = assistant_message[4:]
+
+            result = json.loads(assistant_message.strip())
+            if json_key is not None:
+                if json_key not in result:
+                    raise ValueError(f"Response JSON is missing '{json_key}' field.")
+                return result[json_key]
+            return result
+
+        except json.JSONDecodeError as e:
+            logger.error(f"Error parsing JSON from response: {e}")
+            logger.error(f"Raw response: {assistant_message}")
+            raise ValueError(f"OpenAI response was not valid JSON. Check logs.")
+
+    async def get_embedding(self, text: str, model: str = "text-embedding-ada-002", workflow: str = "embedding", **kwargs) -> Optional[List[float]]:
+        """Embed a single text (see get_embeddings); returns None on failure."""
+        embeddings = await self.get_embeddings([text], model=model, workflow=workflow, **kwargs)
+        return embeddings[0]
+
+    async def get_embeddings(self, texts: List[str], model: str = "text-embedding-ada-002", workflow: str = "embedding",
+                             use_cache: bool = True, **kwargs) -> List[Optional[List[float]]]:
+        """
+        Embed many texts, packing them into as few API requests as the provider limits allow.
+
+        Texts already in the embedding cache for this model are not sent again, and
+        duplicate texts within the call are embedded once.
+
+        Args:
+            texts: Texts to embed
+            model: Embedding model
+            workflow: Name of the workflow, for usage tracking
+            use_cache: Whether to read and write the embedding cache
+
+        Returns:
+            Embeddings in the same order as texts; None for texts that could not be embedded.
+        """
+        inputs = [(text or "").replace("\n", " ") for text in texts] # OpenAI recommends replacing newlines
+        hashes = [hashlib.sha256(text.encode("utf-8")).hexdigest() for text in inputs]
+        results: List[Optional[List[float]]] = [None] * len(inputs)
+        use_cache = use_cache and EMBEDDING_CACHE_ENABLED
+
+        cached: Dict[str, List[float]] = {}
+        if use_cache:
+            try:
+                cached = await embedding_cache_queries.get_cached_embeddings(model, list(set(hashes)))
+            except Exception as e:
+                logger.warning(f"Embedding cache lookup failed, embedding all {len(inputs)} texts: {e}")
+
+        pending: Dict[str, List[int]] = {} # content hash -> positions in texts
+        for position, (text, content_hash) in enumerate(zip(inputs, hashes)):
+            if content_hash in cached:
+                results[position] = cached[content_hash]
+            elif text:
+                pending.setdefault(content_hash, []).append(position)
+
+        if not pending:
+            return results
+
+        new_entries = []
+        for batch in self._pack_embedding_batches([(content_hash, inputs[positions[0]]) for content_hash, positions in pending.items()]):
+            start_time = time.time()
+            try:
+                response = await asyncio.to_thread(
+                    self.client.embeddings.create, input=[text for _, text in batch], model=model
+                )
+            except Exception as e:
+                logger.error(f"Error getting embeddings for a batch of {len(batch)} texts "
+                             f"(first 100 chars of first: '{batch[0][1][:100]}...'): {e}", exc_info=True)
+                continue
+
+            for item in response.data:
+                content_hash = batch[item.index][0]
+                for position in pending[content_hash]:
+                    results[position] = item.embedding
+                new_entries.append((content_hash, item.embedding))
+
+            usage = getattr(response, "usage", None)
+            tokens_in = getattr(usage, "prompt_tokens", None) or sum(len(text) // 4 for _, text in batch)
             await ai_tracker.log_usage(
                 workflow=workflow,
                 model=model,
-                tokens_in=tokens_in, 
+                tokens_in=tokens_in,
                 tokens_out=0, # Embeddings don't have "output tokens" in the same way
                 execution_time=(time.time() - start_time),
                 endpoint="openai.embeddings.create"
             )
-            return embedding
-        except Exception as e:
-            logger.error(f"Error getting embedding for text (first 100 chars): '{text[:100]}...': {e}", exc_info=True)
-            return None
\ No newline at end of file
+
+        if use_cache and new_entries:
+            try:
+                await embedding_cache_queries.store_embeddings(model, new_entries)
+            except Exception as e:
+                logger.warning(f"Could not store {len(new_entries)} embeddings in cache: {e}")
+
+        logger.info(f"Embedded {len(new_entries)} texts for {workflow} "
+                    f"({len(inputs) - len(pending)} cached or empty, {len(inputs)} requested)")
+        return results
+
+    @staticmethod
+    def _pack_embedding_batches(items: List[tuple]) -> List[List[tuple]]:
+        """
+        Greedily group (key, text) pairs into requests under the input-count and
+        estimated-token limits. Texts over the per-input limit get a request of
+        their own so they cannot fail a whole batch.
+        """
+        batches: List[List[tuple]] = []
+        current: List[tuple] = []
+        current_tokens = 0
+        for item in items:
+            tokens = len(item[1]) // 4 + 1
+            if tokens > EMBEDDING_MAX_INPUT_TOKENS:
+                batches.append([item])
+                continue
+            if current and (len(current) >= EMBEDDING_BATCH_MAX_INPUTS or
+                            current_tokens + tokens > EMBEDDING_BATCH_MAX_TOKENS):
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(item)
+            current_tokens += tokens
+        if current:
+            batches.append(current)
+        return batches
\ No newline at end of file
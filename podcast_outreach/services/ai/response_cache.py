@@ -0,0 +1,120 @@
+# podcast_outreach/services/ai/response_cache.py
+
+import asyncio
+import hashlib
+import json
+import time
+import uuid
+from typing import Any, Dict, Optional
+
+from podcast_outreach.config import (
+    LLM_RESPONSE_CACHE_ENABLED,
+    LLM_RESPONSE_CACHE_WORKFLOWS,
+    LLM_RESPONSE_CACHE_MAX_ENTRIES,
+    LLM_RESPONSE_CACHE_PRUNE_INTERVAL_SECONDS
+)
+from podcast_outreach.database.queries import llm_response_cache as cache_queries
+from podcast_outreach.services.ai.tracker import tracker as ai_tracker
+from podcast_outreach.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+def parse_workflow_ttls(spec: str) -> Dict[str, int]:
+    """Parse "workflow:ttl_seconds,..." into a mapping; invalid entries are skipped."""
+    ttls: Dict[str, int] = {}
+    for item in spec.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        workflow, _, ttl = item.partition(":")
+        try:
+            ttls[workflow.strip()] = int(ttl)
+        except ValueError:
+            logger.warning(f"Ignoring invalid LLM response cache entry '{item}'")
+    return ttls
+
+def response_cache_key(model: str, prompt: Any, generation_config: Dict[str, Any]) -> str:
+    """SHA-256 over the model, prompt (str or list of messages) and generation config."""
+    payload = json.dumps({"model": model, "prompt": prompt, "config": generation_config}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+class LLMResponseCache:
+    """
+    Postgres-backed cache of LLM responses for deterministic workflows.
+
+    Only workflows listed in LLM_RESPONSE_CACHE_WORKFLOWS are cached, each with
+    its own TTL. Lookups and hits are reported to the AI usage tracker. Expired
+    and least recently used entries beyond LLM_RESPONSE_CACHE_MAX_ENTRIES are
+    pruned in the background at most once per prune interval. Cache failures
+    never fail the LLM call; they only cost the saving.
+    """
+
+    def __init__(self, workflow_ttls: Optional[Dict[str, int]] = None,
+                 enabled: bool = LLM_RESPONSE_CACHE_ENABLED,
+                 max_entries: int = LLM_RESPONSE_CACHE_MAX_ENTRIES,
+                 prune_interval_seconds: int = LLM_RESPONSE_CACHE_PRUNE_INTERVAL_SECONDS):
+        self.workflow_ttls = parse_workflow_ttls(LLM_RESPONSE_CACHE_WORKFLOWS) if workflow_ttls is None else workflow_ttls
+        self.enabled = enabled
+        self.max_entries = max_entries
+        self.prune_interval_seconds = prune_interval_seconds
+        self._last_prune = 0.0
+        self._prune_task: Optional[asyncio.Task] = None
+
+    def enabled_for(self, workflow: str) -> bool:
+        return self.enabled and workflow in self.workflow_ttls
+
+    async def get(self, workflow: str, model: str, prompt: Any, generation_config: Dict[str, Any],
+                  related_pitch_gen_id: Optional[int] = None,
+                  related_campaign_id: Optional[uuid.UUID] = None,
+                  related_media_id: Optional[int] = None) -> Optional[str]:
+        """Cached response for this call, or None on a miss or for uncached workflows."""
+        if not self.enabled_for(workflow):
+            return None
+        try:
+            row = await cache_queries.get_cached_response(response_cache_key(model, prompt, generation_config))
+        except Exception as e:
+            logger.warning(f"LLM response cache lookup failed for {workflow}: {e}")
+            return None
+        await ai_tracker.log_cache_lookup(
+            workflow=workflow,
+            model=model,
+            hit=row is not None,
+            tokens_saved_in=row['tokens_in'] if row else 0,
+            tokens_saved_out=row['tokens_out'] if row else 0,
+            related_pitch_gen_id=related_pitch_gen_id,
+            related_campaign_id=related_campaign_id,
+            related_media_id=related_media_id
+        )
+        return row['response'] if row else None
+
+    async def put(self, workflow: str, model: str, prompt: Any, generation_config: Dict[str, Any],
+                  response: str, tokens_in: int = 0, tokens_out: int = 0) -> None:
+        """Store a response for the workflow's TTL (no-op for uncached workflows)."""
+        if not self.enabled_for(workflow) or not response:
+            return
+        try:
+            await cache_queries.store_response(
+                response_cache_key(model, prompt, generation_config), workflow, model, response,
+                self.workflow_ttls[workflow], tokens_in, tokens_out
+            )
+        except Exception as e:
+            logger.warning(f"Could not store LLM response for {workflow}: {e}")
+            return
+        self._maybe_prune()
+
+    def _maybe_prune(self) -> None:
+        now = time.monotonic()
+        if now - self._last_prune < self.prune_interval_seconds:
+            return
+        if self._prune_task is not None and not self._prune_task.done():
+            return
+        self._last_prune = now
+        self._prune_task = asyncio.create_task(self._prune())
+
+    async def _prune(self) -> None:
+        try:
+            await cache_queries.prune_llm_response_cache(self.max_entries)
+        except Exception as e:
+            logger.warning(f"LLM response cache pruning failed: {e}")
+
+response_cache = LLMResponseCache()
@@ -0,0 +1,190 @@
+# podcast_outreach/services/ai/template_registry.py
+
+import logging
+import os
+import re
+import string
+import threading
+import time
+from typing import Any, Callable, Dict, FrozenSet, Hashable, Optional
+
+from cachetools import LRUCache
+
+from podcast_outreach.config import PROMPT_TEMPLATE_HOT_RELOAD, PITCH_TEMPLATE_RECHECK_SECONDS
+from podcast_outreach.database.queries import pitch_templates as pitch_template_queries
+
+logger = logging.getLogger(__name__)
+
+# Base directory for all AI prompts
+PROMPTS_BASE_DIR = os.path.join(os.path.dirname(__file__), 'prompts')
+
+_DOUBLE_BRACE_VARIABLE = re.compile(r'\{\{(\w+)\}\}')
+
+def parse_variables(text: str) -> FrozenSet[str]:
+    """Names of the {placeholders} in a str.format style template (empty if it does not parse)."""
+    try:
+        return frozenset(
+            field_name.split('.')[0].split('[')[0]
+            for _, field_name, _, _ in string.Formatter().parse(text)
+            if field_name
+        )
+    except ValueError:
+        return frozenset()
+
+class CompiledTemplate:
+    """
+    A template parsed once: its text, the variables it uses, and any objects
+    built from it (e.g. LangChain prompts), memoized by the caller's key.
+    """
+
+    def __init__(self, name: str, text: str, version: Any = None):
+        self.name = name
+        self.text = text
+        self.version = version
+        self.variables = parse_variables(text)
+        self._memo: Dict[Hashable, Any] = {}
+        self._lock = threading.Lock()
+
+    def render(self, **values: Any) -> str:
+        """Fill the template; variables without a value render as empty strings."""
+        if not self.variables:
+            return self.text
+        return self.text.format_map({name: values.get(name, '') for name in self.variables})
+
+    def memo(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """Return the object built by factory for key, building it only once per template version."""
+        try:
+            return self._memo[key]
+        except KeyError:
+            pass
+        with self._lock:
+            if key not in self._memo:
+                self._memo[key] = factory()
+            return self._memo[key]
+
+class PromptTemplateRegistry:
+    """
+    Prompt templates, loaded and parsed once.
+
+    File prompts under services/ai/prompts are compiled at startup (load_all) or
+    on first use. With hot reload on, a file whose mtime changed is recompiled
+    on its next use. Pitch templates from the pitch_templates table are cached
+    per template_id and revalidated against their version column at most every
+    PITCH_TEMPLATE_RECHECK_SECONDS; edits made through the API invalidate the
+    local copy immediately.
+    """
+
+    def __init__(self, base_dir: str = PROMPTS_BASE_DIR, hot_reload: bool = PROMPT_TEMPLATE_HOT_RELOAD,
+                 recheck_seconds: int = PITCH_TEMPLATE_RECHECK_SECONDS):
+        self.base_dir = base_dir
+        self.hot_reload = hot_reload
+        self.recheck_seconds = recheck_seconds
+        self._files: Dict[str, CompiledTemplate] = {}
+        self._pitch_rows: Dict[str, Dict[str, Any]] = {}  # template_id -> {"row", "checked_at"}
+        # Pitch template bodies compiled to LangChain's single-brace format
+        self._pitch_compiled: LRUCache = LRUCache(maxsize=256)
+
+    # --- File prompts ---
+
+    def load_all(self) -> int:
+        """Compile every .txt prompt under the base directory; returns how many were loaded."""
+        loaded = 0
+        for root, _, files in os.walk(self.base_dir):
+            for file_name in files:
+                if not file_name.endswith('.txt'):
+                    continue
+                relative = os.path.relpath(os.path.join(root, file_name), self.base_dir)
+                name = relative[:-len('.txt')].replace(os.sep, '/')
+                if self._load_file(name) is not None:
+                    loaded += 1
+        logger.info(f"Loaded {loaded} prompt templates from {self.base_dir}")
+        return loaded
+
+    def _load_file(self, name: str) -> Optional[CompiledTemplate]:
+        file_path = os.path.join(self.base_dir, f'{name}.txt')
+        try:
+            mtime = os.stat(file_path).st_mtime_ns
+            with open(file_path, 'r', encoding='utf-8') as f:
+                compiled = CompiledTemplate(name, f.read(), version=mtime)
+        except FileNotFoundError:
+            logger.warning(f"Prompt template file not found: {file_path}")
+            self._files.pop(name, None)
+            return None
+        except Exception as e:
+            logger.error(f"Error reading prompt template file {file_path}: {e}", exc_info=True)
+            return None
+        self._files[name] = compiled
+        return compiled
+
+    def get(self, name: str) -> Optional[CompiledTemplate]:
+        """
+        Compiled file prompt by path relative to the prompts directory, without
+        '.txt' (e.g. 'media_kit/parse_bio_prompt'). None if the file does not exist.
+        """
+        compiled = self._files.get(name)
+        if compiled is None:
+            return self._load_file(name)
+        if self.hot_reload:
+            try:
+                mtime = os.stat(os.path.join(self.base_dir, f'{name}.txt')).st_mtime_ns
+            except FileNotFoundError:
+                mtime = None
+            if mtime != compiled.version:
+                logger.info(f"Prompt template '{name}' changed on disk, reloading")
+                return self._load_file(name)
+        return compiled
+
+    def get_text(self, name: str) -> Optional[str]:
+        compiled = self.get(name)
+        return compiled.text if compiled else None
+
+    # --- DB pitch templates ---
+
+    async def get_pitch_template(self, template_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Pitch template row by template_id, as get_template_by_id returns it.
+        The cached row is reused until its version changes in the database.
+        """
+        now = time.monotonic()
+        entry = self._pitch_rows.get(template_id)
+        if entry is not None:
+            if now - entry['checked_at'] < self.recheck_seconds:
+                return entry['row']
+            version = await pitch_template_queries.get_template_version(template_id)
+            if version is not None and version == entry['row'].get('version'):
+                entry['checked_at'] = now
+                return entry['row']
+
+        row = await pitch_template_queries.get_template_by_id(template_id)
+        if row is None:
+            # Not cached: a missing template may be created at any moment
+            self._pitch_rows.pop(template_id, None)
+            return None
+        self._pitch_rows[template_id] = {'row': row, 'checked_at': now}
+        return row
+
+    def invalidate_pitch_template(self, template_id: Optional[str] = None) -> None:
+        """Drop the cached copy of a pitch template (all of them when template_id is None)."""
+        if template_id is None:
+            self._pitch_rows.clear()
+        else:
+            self._pitch_rows.pop(template_id, None)
+
+    def compile_pitch_template(self, template: Dict[str, Any]) -> CompiledTemplate:
+        """
+        Compiled form of a pitch template row, with {{var}} placeholders converted
+        to {var} for LangChain. Keyed by the body text, so an edited template
+        compiles afresh whichever path the row came from.
+        """
+        body = template['prompt_body']
+        compiled = self._pitch_compiled.get(body)
+        if compiled is None:
+            compiled = CompiledTemplate(
+                template.get('template_id') or 'pitch_template',
+                _DOUBLE_BRACE_VARIABLE.sub(r'{\1}', body),
+                version=template.get('version')
+            )
+            self._pitch_compiled[body] = compiled
+        return compiled
+
+template_registry = PromptTemplateRegistry()
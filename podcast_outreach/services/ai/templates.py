@@ -2,10 +2,9 @@ import os
 import logging
 from typing import Optional
 
-logger = logging.getLogger(__name__)
+from podcast_outreach.services.ai.template_registry import PROMPTS_BASE_DIR, template_registry
 
-# Base directory for all AI prompts
-PROMPTS_BASE_DIR = os.path.join(os.path.dirname(__file__), 'prompts')
+logger = logging.getLogger(__name__)
 
 def load_pitch_template(template_name: str) -> Optional[str]:
     """
@@ -18,20 +17,7 @@ def load_pitch_template(template_name: str) -> Optional[str]:
     Returns:
         The content of the template file as a string, or None if not found.
     """
-    file_path = os.path.join(PROMPTS_BASE_DIR, 'pitch', f'{template_name}.txt')
-    
-    if not os.path.exists(file_path):
-        logger.warning(f"Pitch template file not found: {file_path}")
-        return None
-    
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        logger.debug(f"Successfully loaded pitch template: {template_name}")
-        return content
-    except Exception as e:
-        logger.error(f"Error reading pitch template file {file_path}: {e}", exc_info=True)
-        return None
+    return template_registry.get_text(f'pitch/{template_name}')
 
 def load_prompt_template(template_path_and_name: str) -> Optional[str]:
     """
@@ -45,22 +31,8 @@ def load_prompt_template(template_path_and_name: str) -> Optional[str]:
     Returns:
         The content of the template file as a string, or None if not found.
     """
-    # Construct the full file path
     # template_path_and_name could be "subdir/filename" or just "filename"
-    file_path = os.path.join(PROMPTS_BASE_DIR, f'{template_path_and_name}.txt')
-    
-    if not os.path.exists(file_path):
-        logger.warning(f"Prompt template file not found: {file_path}")
-        return None
-    
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        logger.debug(f"Successfully loaded prompt template: {template_path_and_name}")
-        return content
-    except Exception as e:
-        logger.error(f"Error reading prompt template file {file_path}: {e}", exc_info=True)
-        return None
+    return template_registry.get_text(template_path_and_name)
 
 # Example usage (for testing this module directly)
 if __name__ == "__main__":
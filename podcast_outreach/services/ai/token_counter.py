@@ -0,0 +1,143 @@
+# podcast_outreach/services/ai/token_counter.py
+
+import hashlib
+import logging
+import threading
+from typing import Dict, Iterable, Optional
+
+from cachetools import LRUCache
+
+from podcast_outreach.config import TOKEN_COUNT_CACHE_SIZE
+
+try:
+    import tiktoken
+except ImportError:  # Counting still works from the calibrated estimate
+    tiktoken = None
+
+logger = logging.getLogger(__name__)
+
+# Local BPE used per model family. Claude and Gemini tokenizers are not available
+# offline, so they are counted with cl100k_base and scaled by FAMILY_SCALE.
+FAMILY_ENCODINGS = {
+    "openai": "cl100k_base",
+    "openai-o200k": "o200k_base",
+    "claude": "cl100k_base",
+    "gemini": "cl100k_base",
+}
+FAMILY_SCALE = {
+    "claude": 1.1,  # Claude 3.x tokenizes English ~10% finer than cl100k
+    "gemini": 0.95,
+}
+# Characters per token used until real counts have calibrated a family
+DEFAULT_CHARS_PER_TOKEN = {
+    "openai": 4.0,
+    "openai-o200k": 4.2,
+    "claude": 3.6,
+    "gemini": 4.2,
+}
+# Tokenizer-counted characters needed before the observed ratio replaces the default
+CALIBRATION_MIN_CHARS = 20000
+
+def model_family(model: Optional[str]) -> str:
+    """Map a model name to a tokenizer family."""
+    name = (model or "").lower()
+    if "claude" in name:
+        return "claude"
+    if "gemini" in name:
+        return "gemini"
+    if name.startswith(("gpt-4o", "gpt-4.1", "o1", "o3", "o4")):
+        return "openai-o200k"
+    return "openai"
+
+class TokenCounter:
+    """
+    Counts tokens locally, without API round-trips.
+
+    Texts are counted with a local tokenizer for the model family and the
+    result is kept in an LRU keyed by a hash of the text. Tokenizers load in a
+    background thread (tiktoken may download its BPE file on first use); until
+    one is ready, counts come from a chars-per-token estimate that is
+    calibrated against real counts as they are made. Estimates are not cached.
+    """
+
+    def __init__(self, cache_size: int = TOKEN_COUNT_CACHE_SIZE):
+        self._cache: LRUCache = LRUCache(maxsize=cache_size)
+        self._lock = threading.Lock()
+        self._encodings: Dict[str, object] = {}
+        self._loading: set = set()
+        self._failed: set = set()
+        self._calibration: Dict[str, list] = {}  # family -> [chars, tokens]
+        self.hits = 0
+        self.misses = 0
+
+    def _get_encoding(self, encoding_name: str):
+        """Return a loaded encoding, or None while it loads (or if it cannot be loaded)."""
+        encoding = self._encodings.get(encoding_name)
+        if encoding is not None or tiktoken is None:
+            return encoding
+        with self._lock:
+            if encoding_name in self._loading or encoding_name in self._failed:
+                return None
+            self._loading.add(encoding_name)
+        threading.Thread(target=self._load_encoding, args=(encoding_name,), daemon=True).start()
+        return None
+
+    def _load_encoding(self, encoding_name: str) -> None:
+        try:
+            self._encodings[encoding_name] = tiktoken.get_encoding(encoding_name)
+            logger.info(f"Loaded tokenizer {encoding_name}")
+        except Exception as e:
+            logger.warning(f"Could not load tokenizer {encoding_name}, using estimates: {e}")
+            with self._lock:
+                self._failed.add(encoding_name)
+        finally:
+            with self._lock:
+                self._loading.discard(encoding_name)
+
+    def warm_up(self, models: Iterable[Optional[str]] = ("gpt-4", "claude")) -> None:
+        """Start loading the tokenizers for these models so the first counts are exact."""
+        for model in models:
+            self._get_encoding(FAMILY_ENCODINGS[model_family(model)])
+
+    def estimate(self, text: str, model: Optional[str] = None) -> int:
+        """Chars-per-token estimate, calibrated from tokenizer counts for the family."""
+        if not text:
+            return 0
+        family = model_family(model)
+        chars_per_token = DEFAULT_CHARS_PER_TOKEN[family]
+        observed = self._calibration.get(family)
+        if observed and observed[0] >= CALIBRATION_MIN_CHARS and observed[1]:
+            chars_per_token = observed[0] / observed[1]
+        return max(1, round(len(text) / chars_per_token))
+
+    def count(self, text: str, model: Optional[str] = None) -> int:
+        """Token count for text under the given model (cached, never blocks on I/O)."""
+        if not text:
+            return 0
+        family = model_family(model)
+        key = (family, hashlib.blake2b(text.encode("utf-8", "ignore"), digest_size=16).digest())
+        with self._lock:
+            cached = self._cache.get(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        encoding = self._get_encoding(FAMILY_ENCODINGS[family])
+        if encoding is None:
+            return self.estimate(text, model)
+
+        tokens = len(encoding.encode(text, disallowed_special=()))
+        tokens = max(1, round(tokens * FAMILY_SCALE.get(family, 1.0)))
+        with self._lock:
+            self._cache[key] = tokens
+            observed = self._calibration.setdefault(family, [0, 0])
+            observed[0] += len(text)
+            observed[1] += tokens
+        return tokens
+
+    def count_many(self, texts: Iterable[str], model: Optional[str] = None) -> int:
+        """Sum of token counts for several texts (e.g. the messages of a prompt)."""
+        return sum(self.count(text, model) for text in texts)
+
+token_counter = TokenCounter()
@@ -65,6 +65,9 @@ COST_RATES = {
     }
 }
 
+# Endpoint recorded for calls served from the LLM response cache
+CACHE_HIT_ENDPOINT = "llm_response_cache"
+
 
 class AIUsageTracker:
     """
@@ -82,6 +85,8 @@ class AIUsageTracker:
         # No longer managing local CSV directly for primary logging, but keeping for compatibility/fallback
         self.log_file = 'ai_usage_logs_local_backup.csv' # This will be a local backup/debug file
         self.backup_file = 'ai_usage_logs_local_backup_archive.csv'
+        # Response cache lookups per workflow since process start
+        self.cache_stats: Dict[str, Dict[str, int]] = {}
         self._init_google_drive()
         logger.info("AIUsageTracker initialized. Logging to PostgreSQL.")
 
@@ -266,6 +271,50 @@ class AIUsageTracker:
             logger.error(f"Error logging AI usage to CSV: {e}", exc_info=True)
             # Don't raise - allow the calling process to continue even if logging fails
     
+    async def log_cache_lookup(self,
+                               workflow: str,
+                               model: str,
+                               hit: bool,
+                               tokens_saved_in: int = 0,
+                               tokens_saved_out: int = 0,
+                               related_pitch_gen_id: Optional[int] = None,
+                               related_campaign_id: Optional[uuid.UUID] = None,
+                               related_media_id: Optional[int] = None):
+        """
+        Record an LLM response cache lookup.
+        Hits are also logged as zero-token usage under CACHE_HIT_ENDPOINT so hit
+        rates can be reported from the database.
+        """
+        stats = self.cache_stats.setdefault(workflow, {'hits': 0, 'misses': 0, 'tokens_saved': 0})
+        if not hit:
+            stats['misses'] += 1
+            return
+        stats['hits'] += 1
+        stats['tokens_saved'] += tokens_saved_in + tokens_saved_out
+        logger.info(
+            f"LLM cache hit: {workflow} | {model} | Saved tokens: {tokens_saved_in}+{tokens_saved_out} | "
+            f"Saved cost: ${self.calculate_cost(model, tokens_saved_in, tokens_saved_out):.6f}"
+        )
+        await self.log_usage(
+            workflow=workflow,
+            model=model,
+            tokens_in=0,
+            tokens_out=0,
+            execution_time=0.0,
+            endpoint=CACHE_HIT_ENDPOINT,
+            related_pitch_gen_id=related_pitch_gen_id,
+            related_campaign_id=related_campaign_id,
+            related_media_id=related_media_id
+        )
+
+    def get_cache_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Response cache hits, misses and hit rate per workflow for this process."""
+        return {
+            workflow: {**stats, 'hit_rate': stats['hits'] / (stats['hits'] + stats['misses'])}
+            for workflow, stats in self.cache_stats.items()
+            if stats['hits'] + stats['misses']
+        }
+
     async def generate_report(self, 
                               start_date: Optional[str] = None, 
                               end_date: Optional[str] = None,
@@ -280,13 +329,15 @@ class AIUsageTracker:
         grouped_data = await ai_usage_queries.get_ai_usage_logs(
             start_date=start_dt,
             end_date=end_dt,
-            group_by_column=group_by
+            group_by_column=group_by,
+            cache_endpoint=CACHE_HIT_ENDPOINT
         )
 
         # Fetch total data
         total_data = await ai_usage_queries.get_total_ai_usage(
             start_date=start_dt,
-            end_date=end_dt
+            end_date=end_dt,
+            cache_endpoint=CACHE_HIT_ENDPOINT
         )
         
         # Format grouped data for report
@@ -295,6 +346,7 @@ class AIUsageTracker:
             group_key = str(row[group_by]) if row[group_by] is not None else "N/A"
             groups[group_key] = {
                 'calls': row['calls'],
+                'cache_hits': row['cache_hits'],
                 'tokens_in': row['tokens_in'],
                 'tokens_out': row['tokens_out'],
                 'total_tokens': row['total_tokens'],
@@ -302,14 +354,31 @@ class AIUsageTracker:
                 'avg_time': float(row['avg_execution_time_sec']) if row['avg_execution_time_sec'] is not None else 0.0
             }
         
+        # Hit rates of workflows served from the LLM response cache in this range
+        cache_rows = await ai_usage_queries.get_cache_hit_rates(
+            cache_endpoint=CACHE_HIT_ENDPOINT,
+            start_date=start_dt,
+            end_date=end_dt
+        )
+        response_cache = {
+            row['workflow']: {
+                'hits': row['hits'],
+                'api_calls': row['api_calls'],
+                'hit_rate': row['hits'] / (row['hits'] + row['api_calls'])
+            }
+            for row in cache_rows
+        }
+
         report = {
             "start_date": start_date,
             "end_date": end_date,
             "total_entries": total_data['total_calls'],
+            "total_cache_hits": total_data['total_cache_hits'],
             "total_tokens": total_data['total_tokens'],
             "total_cost": float(total_data['total_cost']),
             "grouped_by": group_by,
-            "groups": groups
+            "groups": groups,
+            "response_cache": response_cache
         }
         
         return report
@@ -335,7 +404,9 @@ class AIUsageTracker:
         total_tokens_in = sum(entry['tokens_in'] for entry in related_logs)
         total_tokens_out = sum(entry['tokens_out'] for entry in related_logs)
         total_tokens = sum(entry['total_tokens'] for entry in related_logs)
-        total_calls = len(related_logs)
+        # Responses served from the LLM response cache are not API calls
+        total_cache_hits = sum(1 for entry in related_logs if entry['endpoint'] == CACHE_HIT_ENDPOINT)
+        total_calls = len(related_logs) - total_cache_hits
         
         # Group by workflow stage
         stages = {}
@@ -344,13 +415,17 @@ class AIUsageTracker:
             if workflow not in stages:
                 stages[workflow] = {
                     'calls': 0,
+                    'cache_hits': 0,
                     'tokens_in': 0,
                     'tokens_out': 0,
                     'total_tokens': 0,
                     'cost': 0.0
                 }
             
-            stages[workflow]['calls'] += 1
+            if entry['endpoint'] == CACHE_HIT_ENDPOINT:
+                stages[workflow]['cache_hits'] += 1
+            else:
+                stages[workflow]['calls'] += 1
             stages[workflow]['tokens_in'] += entry['tokens_in']
             stages[workflow]['tokens_out'] += entry['tokens_out']
             stages[workflow]['total_tokens'] += entry['total_tokens']
@@ -376,6 +451,7 @@ class AIUsageTracker:
             "total_tokens_out": total_tokens_out,
             "total_tokens": total_tokens,
             "total_calls": total_calls,
+            "total_cache_hits": total_cache_hits,
             "workflow_stages": stages,
             "timeline": timeline
         }
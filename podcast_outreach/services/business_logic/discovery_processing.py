@@ -11,9 +11,11 @@ from podcast_outreach.database.queries import campaign_media_discoveries as cmd_
 from podcast_outreach.database.queries import media as media_queries
 from podcast_outreach.database.queries import episodes as episode_queries
 from podcast_outreach.database.queries import campaigns as campaign_queries
+from podcast_outreach.database.queries import projections
 from podcast_outreach.database.queries import match_suggestions as match_queries
 from podcast_outreach.database.queries import review_tasks as review_task_queries
 from podcast_outreach.database.connection import get_db_pool
+from podcast_outreach.database.loaders import get_loaders, run_in_loader_scope
 from podcast_outreach.services.matches.enhanced_vetting_agent import EnhancedVettingAgent
 from podcast_outreach.services.enrichment.enrichment_orchestrator import EnrichmentOrchestrator
 from podcast_outreach.services.events.event_bus import get_event_bus, Event, EventType
@@ -153,7 +155,7 @@ async def _run_vetting_for_discovery(discovery: Dict[str, Any]) -> Dict[str, Any
     """Run vetting for a specific discovery."""
     try:
         # Get campaign and media data
-        campaign_data = await campaign_queries.get_campaign_by_id(discovery["campaign_id"])
+        campaign_data = await get_loaders().campaigns().load(discovery["campaign_id"])
         if not campaign_data:
             return {"success": False, "error": "Campaign not found"}
         
@@ -179,7 +181,7 @@ async def _run_vetting_for_discovery(discovery: Dict[str, Any]) -> Dict[str, Any
             # Emit vetting completed event for notifications
             try:
                 event_bus = get_event_bus()
-                media_data = await media_queries.get_media_by_id_from_db(discovery["media_id"])
+                media_data = await get_loaders().media().load(discovery["media_id"])
                 
                 vetting_event = Event(
                     event_type=EventType.VETTING_COMPLETED,
@@ -313,6 +315,7 @@ async def _create_match_and_review_task(discovery: Dict[str, Any]) -> Dict[str,
         logger.error(f"Error creating match and review task for discovery {discovery['id']}: {e}")
         return {"success": False, "error": str(e)}
 
+@run_in_loader_scope
 async def run_enrichment_pipeline() -> bool:
     """Process discoveries that need enrichment."""
     try:
@@ -333,6 +336,9 @@ async def run_enrichment_pipeline() -> bool:
         
         enrichment_orchestrator = EnrichmentOrchestrator(enrichment_agent, quality_service, social_discovery_service)
         
+        # Load every discovery's media in one query; enrich_media reads it from the loader
+        await get_loaders().media().load_many({d["media_id"] for d in discoveries})
+        
         for discovery in discoveries:
             try:
                 await cmd_queries.update_enrichment_status(discovery["id"], "in_progress")
@@ -360,6 +366,7 @@ async def run_enrichment_pipeline() -> bool:
         logger.error(f"Error in enrichment pipeline: {e}")
         return False
 
+@run_in_loader_scope
 async def run_vetting_pipeline() -> bool:
     """Process discoveries ready for vetting."""
     try:
@@ -371,6 +378,10 @@ async def run_vetting_pipeline() -> bool:
         
         logger.info(f"Processing vetting for {len(discoveries)} discoveries")
         
+        loaders = get_loaders()
+        await loaders.campaigns().load_many({d["campaign_id"] for d in discoveries})
+        await loaders.media().load_many({d["media_id"] for d in discoveries})
+        
         for discovery in discoveries:
             try:
                 await cmd_queries.update_enrichment_status(discovery["id"], "in_progress")
@@ -457,7 +468,7 @@ async def _find_best_matching_episode(
     """Find the best matching episode for a campaign and media pair."""
     try:
         # Get campaign embedding
-        campaign = await campaign_queries.get_campaign_by_id(campaign_id)
+        campaign = await campaign_queries.get_campaign_by_id(campaign_id, profile=projections.WITH_EMBEDDING)
         if not campaign or not campaign.get('embedding'):
             logger.warning(f"Campaign {campaign_id} has no embedding")
             return None
@@ -496,4 +507,228 @@ async def _find_best_matching_episode(
         
     except Exception as e:
         logger.error(f"Error finding best episode: {e}", exc_info=True)
-        return None
\ No newline at end of file
+        return None
+
+async def run_campaign_discovery_pipeline(campaign_id: uuid.UUID, max_matches: int):
+    """
+    Runs the full automated pipeline:
+    Discovery → Enrichment → Vetting → Match Creation → Review Tasks
+    
+    Sends real-time notifications for progress tracking. Runs as a
+    TaskManager task (run_campaign_discovery); returns False if it failed.
+    """
+    from podcast_outreach.services.events.notification_service import get_notification_service
+    from podcast_outreach.services.business_logic.enhanced_discovery_workflow import EnhancedDiscoveryWorkflow
+    from podcast_outreach.services.enrichment.discovery import DiscoveryService
+    from podcast_outreach.services.tasks.context import report_progress, stop_requested
+    
+    notification_service = get_notification_service()
+    campaign_id_str = str(campaign_id)
+    
+    try:
+        logger.info(f"Starting enhanced discovery pipeline for campaign {campaign_id}")
+        
+        # Send pipeline started notification
+        await notification_service.send_discovery_started(campaign_id_str, estimated_completion=5)
+        
+        # Step 1: Run traditional discovery to find podcasts
+        service = DiscoveryService()
+        discovery_results = await service.discover_for_campaign(str(campaign_id), max_matches)
+        
+        logger.info(f"Discovery completed for campaign {campaign_id}: {len(discovery_results)} new media IDs found")
+        report_progress(total=len(discovery_results), message="Processing discovered podcasts")
+        
+        # Initialize enhanced workflow
+        enhanced_workflow = EnhancedDiscoveryWorkflow()
+        
+        # Step 2: Process each discovered podcast through enhanced automated pipeline
+        processed_count = 0
+        reviews_ready = 0
+        
+        # Track each discovered media through campaign_media_discoveries
+        for media_id, discovery_keyword in discovery_results:
+            if stop_requested():
+                logger.info(f"Enhanced discovery pipeline for campaign {campaign_id} stopped after {processed_count} podcasts")
+                break
+            try:
+                if media_id:
+                    # Send progress notification
+                    await notification_service.send_pipeline_progress(
+                        campaign_id_str, 
+                        completed=processed_count, 
+                        total=len(discovery_results), 
+                        in_progress=1
+                    )
+                    
+                    # Run the enhanced automated pipeline for this discovery
+                    pipeline_result = await enhanced_workflow.process_discovery(
+                        campaign_id=campaign_id,
+                        media_id=media_id,
+                        discovery_keyword=discovery_keyword
+                    )
+                    
+                    processed_count += 1
+                    
+                    # Check if this resulted in a review task
+                    if pipeline_result.get('review_task_id'):
+                        reviews_ready += 1
+                    
+                    logger.info(f"Pipeline result for media {media_id}: {pipeline_result['status']}, steps: {pipeline_result.get('steps_completed', [])}")
+                    
+            except Exception as media_error:
+                logger.error(f"Error processing media {media_id} in pipeline: {media_error}")
+                processed_count += 1
+                continue
+            finally:
+                report_progress(done=processed_count)
+        
+        # Send completion notification
+        await notification_service.send_discovery_completed(
+            campaign_id_str, 
+            total_discovered=len(discovery_results), 
+            reviews_ready=reviews_ready
+        )
+        
+        logger.info(f"Enhanced discovery pipeline completed for campaign {campaign_id}")
+        
+    except Exception as e:
+        logger.error(f"Error in enhanced discovery pipeline for campaign {campaign_id}: {e}")
+        return False
+
+async def run_client_discovery_pipeline(
+    campaign_id: uuid.UUID,
+    person_id: int,
+    max_matches: int,
+    max_discoveries: int
+):
+    """
+    Client version of the enhanced discovery pipeline.
+    Includes match limit checking and client-specific notifications.
+    Runs as a TaskManager task (run_client_campaign_discovery); returns False if it failed.
+    """
+    from podcast_outreach.services.events.notification_service import get_notification_service
+    from podcast_outreach.services.business_logic.enhanced_discovery_workflow import EnhancedDiscoveryWorkflow
+    from podcast_outreach.services.enrichment.discovery import DiscoveryService
+    from podcast_outreach.services.tasks.context import report_progress, stop_requested
+    
+    notification_service = get_notification_service()
+    campaign_id_str = str(campaign_id)
+    
+    try:
+        logger.info(f"Starting client discovery pipeline for campaign {campaign_id} (person_id: {person_id})")
+        
+        # Send pipeline started notification
+        await notification_service.send_client_event(
+            person_id,
+            "client.discovery.started",
+            {
+                "campaign_id": campaign_id_str,
+                "max_matches": max_matches,
+                "estimated_completion": 5
+            }
+        )
+        
+        # Step 1: Run discovery to find podcasts (unlimited discoveries)
+        service = DiscoveryService()
+        discovery_results = await service.discover_for_campaign(
+            str(campaign_id), 
+            max_matches=max_discoveries,  # Discover more than we might match
+            is_client=True,
+            person_id=person_id
+        )
+        
+        logger.info(f"Discovery completed for campaign {campaign_id}: {len(discovery_results)} new media found")
+        report_progress(total=len(discovery_results), message="Processing discovered podcasts")
+        
+        # Initialize enhanced workflow
+        enhanced_workflow = EnhancedDiscoveryWorkflow()
+        
+        # Step 2: Process discoveries through enrichment and vetting
+        processed_count = 0
+        matches_created = 0
+        limit_reached = False
+        
+        for media_id, discovery_keyword in discovery_results:
+            if stop_requested():
+                logger.info(f"Client discovery pipeline for campaign {campaign_id} stopped after {processed_count} podcasts")
+                break
+            try:
+                if media_id:
+                    # Send progress notification
+                    await notification_service.send_client_event(
+                        person_id,
+                        "client.enrichment.progress",
+                        {
+                            "campaign_id": campaign_id_str,
+                            "completed": processed_count,
+                            "total": len(discovery_results),
+                            "matches_created": matches_created,
+                            "in_progress": 1
+                        }
+                    )
+                    
+                    # Run the enhanced pipeline with client tracking
+                    pipeline_result = await enhanced_workflow.process_discovery(
+                        campaign_id=campaign_id,
+                        media_id=media_id,
+                        discovery_keyword=discovery_keyword,
+                        is_client=True,
+                        person_id=person_id
+                    )
+                    
+                    processed_count += 1
+                    
+                    # Check if a match was created
+                    if pipeline_result.get('match_id'):
+                        matches_created += 1
+                    
+                    # Check if limit was reached
+                    if pipeline_result.get('match_limit_reached'):
+                        limit_reached = True
+                        logger.info(f"Match limit reached for person_id {person_id}")
+                        break
+                    
+                    logger.info(f"Client pipeline result for media {media_id}: {pipeline_result['status']}")
+                    
+            except Exception as media_error:
+                logger.error(f"Error processing media {media_id} in client pipeline: {media_error}")
+                processed_count += 1
+                continue
+            finally:
+                report_progress(done=processed_count)
+        
+        # Send completion notification
+        completion_data = {
+            "campaign_id": campaign_id_str,
+            "total_discovered": len(discovery_results),
+            "total_processed": processed_count,
+            "matches_created": matches_created,
+            "limit_reached": limit_reached
+        }
+        
+        if limit_reached:
+            await notification_service.send_client_event(
+                person_id,
+                "client.limit.reached",
+                completion_data
+            )
+        
+        await notification_service.send_client_event(
+            person_id,
+            "client.matches.ready",
+            completion_data
+        )
+        
+        logger.info(f"Client discovery pipeline completed for campaign {campaign_id}: {matches_created} matches created")
+        
+    except Exception as e:
+        logger.error(f"Error in client discovery pipeline for campaign {campaign_id}: {e}")
+        await notification_service.send_client_event(
+            person_id,
+            "client.discovery.failed",
+            {
+                "campaign_id": campaign_id_str,
+                "error": str(e)
+            }
+        )
+        return False
@@ -17,6 +17,7 @@ import json
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timezone
 
+from podcast_outreach.config import HOST_VERIFICATION_BATCH_SIZE
 from podcast_outreach.database.queries import campaign_media_discoveries as cmd_queries
 from podcast_outreach.database.queries import media as media_queries
 from podcast_outreach.database.queries import episodes as episode_queries
@@ -34,6 +35,7 @@ from podcast_outreach.services.enrichment.social_scraper import SocialDiscoveryS
 from podcast_outreach.services.enrichment.enrichment_agent import EnrichmentAgent
 from podcast_outreach.services.media.analyzer import MediaAnalyzerService
 from podcast_outreach.services.events.event_bus import get_event_bus, Event, EventType
+from podcast_outreach.config import PIPELINE_JOB_QUEUE_ENABLED
 
 logger = logging.getLogger(__name__)
 
@@ -127,6 +129,7 @@ class EnhancedDiscoveryWorkflow:
                         result["vetting_score"] = vetting_result.get("vetting_score", 0)
                 else:
                     result["steps_completed"].append("waiting_for_ai_description")
+                    await self._queue_pipeline_stage("ai_description", discovery["id"])
             
             # Step 5: Create match if vetting score is high enough
             if discovery["vetting_status"] == "completed" and discovery["vetting_score"] >= 50:
@@ -208,7 +211,7 @@ class EnhancedDiscoveryWorkflow:
             # Filter episodes needing transcription and check URL status
             episodes_to_transcribe = []
             for ep in episodes:
-                if not ep.get('transcript') and ep.get('direct_audio_url'):
+                if not ep.get('has_transcript') and ep.get('direct_audio_url'):
                     # Check if URL has failed before
                     url_status = ep.get('audio_url_status', 'available')
                     if url_status not in ['failed_404', 'failed_temp']:
@@ -285,6 +288,20 @@ class EnhancedDiscoveryWorkflow:
         
         return result
     
+    async def _queue_pipeline_stage(self, stage: str, discovery_id: int) -> None:
+        """
+        Hand a discovery to the pipeline job queue so the stage runs as soon as a
+        worker is free, instead of on the next polling cycle.
+        """
+        if not PIPELINE_JOB_QUEUE_ENABLED:
+            return
+        try:
+            from podcast_outreach.services.tasks.pipeline_worker import pipeline_worker
+            await pipeline_worker.enqueue(stage, [discovery_id])
+        except Exception as e:
+            # The periodic backfill picks the discovery up instead
+            logger.warning(f"Could not queue {stage} for discovery {discovery_id}: {e}")
+    
     async def _verify_host_names(self, media_id: int) -> Optional[Dict[str, Any]]:
         """
         Verify host names and return verification results.
@@ -553,7 +570,7 @@ class EnhancedDiscoveryWorkflow:
         logger.info("Starting periodic host name verifications")
         
         try:
-            results = await self.host_verifier.run_verification_batch(batch_size=50)
+            results = await self.host_verifier.run_verification_batch(batch_size=HOST_VERIFICATION_BATCH_SIZE)
             
             # Log summary
             successful = sum(1 for r in results if r["status"] == "success")
@@ -2,6 +2,7 @@
 
 import logging
 from podcast_outreach.services.database_service import DatabaseService
+from podcast_outreach.database.connection import workload_scope, WORKLOAD_BACKGROUND
 from podcast_outreach.services.enrichment.enrichment_orchestrator import EnrichmentOrchestrator
 from podcast_outreach.services.matches.enhanced_vetting_orchestrator import EnhancedVettingOrchestrator
 from podcast_outreach.services.ai.gemini_client import GeminiService
@@ -18,35 +19,29 @@ async def run_enrichment_pipeline(db_service: DatabaseService, media_id: int = N
     Assumes database resources are available via db_service.
     Can run for all media or a specific media_id.
     """
-    # Temporarily set the global pool for this event loop
-    from podcast_outreach.database import connection
-    original_pool = connection.DB_POOL
-    connection.DB_POOL = db_service.pool
-    
-    try:
-        if media_id:
-            logger.info(f"Running enrichment pipeline for media_id: {media_id}")
-            return await run_single_media_enrichment(db_service, media_id)
-        else:
-            logger.info("Running full enrichment pipeline")
+    # Route query helpers to the task's pool for this context only
+    with workload_scope(WORKLOAD_BACKGROUND, pool=db_service.pool):
+        try:
+            if media_id:
+                logger.info(f"Running enrichment pipeline for media_id: {media_id}")
+                return await run_single_media_enrichment(db_service, media_id)
+            else:
+                logger.info("Running full enrichment pipeline")
             
-            # Initialize services (these should eventually use dependency injection)
-            gemini_service = GeminiService()
-            social_discovery_service = SocialDiscoveryService()
-            data_merger = DataMergerService()
-            enrichment_agent = EnrichmentAgent(gemini_service, social_discovery_service, data_merger)
-            quality_service = QualityService()
-            orchestrator = EnrichmentOrchestrator(enrichment_agent, quality_service, social_discovery_service)
+                # Initialize services (these should eventually use dependency injection)
+                gemini_service = GeminiService()
+                social_discovery_service = SocialDiscoveryService()
+                data_merger = DataMergerService()
+                enrichment_agent = EnrichmentAgent(gemini_service, social_discovery_service, data_merger)
+                quality_service = QualityService()
+                orchestrator = EnrichmentOrchestrator(enrichment_agent, quality_service, social_discovery_service)
             
-            await orchestrator.run_pipeline_once()
-            logger.info("Full enrichment pipeline completed")
-            return True
-    except Exception as e:
-        logger.error(f"Error during enrichment pipeline: {e}", exc_info=True)
-        return False
-    finally:
-        # Restore original pool
-        connection.DB_POOL = original_pool
+                await orchestrator.run_pipeline_once()
+                logger.info("Full enrichment pipeline completed")
+                return True
+        except Exception as e:
+            logger.error(f"Error during enrichment pipeline: {e}", exc_info=True)
+            return False
 
 async def run_single_media_enrichment(db_service: DatabaseService, media_id: int) -> bool:
     """
@@ -168,25 +163,23 @@ async def trigger_vetting_for_media(db_service: DatabaseService, media_id: int)
         logger.error(f"Error triggering vetting for media_id {media_id}: {e}", exc_info=True)
         return False
 
-async def run_vetting_pipeline(db_service: DatabaseService) -> bool:
+async def run_vetting_pipeline(db_service: DatabaseService, batch_size: int = None) -> bool:
     """
     Pure business logic function for vetting pipeline.
     Assumes database resources are available via db_service.
+    batch_size caps the discoveries vetted (default 10).
     """
-    # Temporarily set the global pool for this event loop
-    from podcast_outreach.database import connection
-    original_pool = connection.DB_POOL
-    connection.DB_POOL = db_service.pool
-    
-    try:
-        logger.info("Running Enhanced Vetting Orchestrator pipeline")
-        orchestrator = EnhancedVettingOrchestrator()
-        await orchestrator.run_vetting_pipeline()
-        logger.info("Enhanced Vetting Orchestrator pipeline completed")
-        return True
-    except Exception as e:
-        logger.error(f"Error during vetting pipeline: {e}", exc_info=True)
-        return False
-    finally:
-        # Restore original pool
-        connection.DB_POOL = original_pool
\ No newline at end of file
+    # Route query helpers to the task's pool for this context only
+    with workload_scope(WORKLOAD_BACKGROUND, pool=db_service.pool):
+        try:
+            logger.info("Running Enhanced Vetting Orchestrator pipeline")
+            orchestrator = EnhancedVettingOrchestrator()
+            if batch_size:
+                await orchestrator.run_vetting_pipeline(batch_size=batch_size)
+            else:
+                await orchestrator.run_vetting_pipeline()
+            logger.info("Enhanced Vetting Orchestrator pipeline completed")
+            return True
+        except Exception as e:
+            logger.error(f"Error during vetting pipeline: {e}", exc_info=True)
+            return False
\ No newline at end of file
@@ -4,6 +4,7 @@ import uuid
 import logging
 from typing import Optional
 from podcast_outreach.services.database_service import DatabaseService
+from podcast_outreach.database.connection import workload_scope, WORKLOAD_BACKGROUND
 from podcast_outreach.services.matches.scorer import DetermineFitProcessor
 from podcast_outreach.services.matches.match_creation import MatchCreationService
 from podcast_outreach.database.queries import review_tasks as rt_queries
@@ -17,125 +18,113 @@ async def run_qualitative_match_assessment(db_service: DatabaseService) -> bool:
     Pure business logic function for qualitative match assessment.
     Assumes database resources are available via db_service.
     """
-    # Temporarily set the global pool for this event loop
-    from podcast_outreach.database import connection
-    original_pool = connection.DB_POOL
-    connection.DB_POOL = db_service.pool
-    
-    try:
-        processor = DetermineFitProcessor()
+    # Route query helpers to the task's pool for this context only
+    with workload_scope(WORKLOAD_BACKGROUND, pool=db_service.pool):
+        try:
+            processor = DetermineFitProcessor()
         
-        logger.info("Running Qualitative Match Assessment for pending review tasks")
-        pending_qual_reviews, total_pending = await rt_queries.get_all_review_tasks_paginated(
-            task_type='match_suggestion_qualitative_review',
-            status='pending',
-            size=50
-        )
+            logger.info("Running Qualitative Match Assessment for pending review tasks")
+            pending_qual_reviews, total_pending = await rt_queries.get_all_review_tasks_paginated(
+                task_type='match_suggestion_qualitative_review',
+                status='pending',
+                size=50
+            )
         
-        if not pending_qual_reviews:
-            logger.info("No pending qualitative review tasks found")
-            return True
+            if not pending_qual_reviews:
+                logger.info("No pending qualitative review tasks found")
+                return True
 
-        logger.info(f"Found {len(pending_qual_reviews)} tasks for qualitative assessment")
+            logger.info(f"Found {len(pending_qual_reviews)} tasks for qualitative assessment")
         
-        for review_task_record in pending_qual_reviews:
-            logger.info(f"Processing qualitative review for task_id: {review_task_record.get('review_task_id')}, match_suggestion_id: {review_task_record.get('related_id')}")
-            await processor.process_single_record(review_task_record)
+            for review_task_record in pending_qual_reviews:
+                logger.info(f"Processing qualitative review for task_id: {review_task_record.get('review_task_id')}, match_suggestion_id: {review_task_record.get('related_id')}")
+                await processor.process_single_record(review_task_record)
         
-        logger.info("Qualitative Match Assessment cycle completed")
-        return True
-    except Exception as e:
-        logger.error(f"Error during qualitative match assessment: {e}", exc_info=True)
-        return False
-    finally:
-        # Restore original pool
-        connection.DB_POOL = original_pool
+            logger.info("Qualitative Match Assessment cycle completed")
+            return True
+        except Exception as e:
+            logger.error(f"Error during qualitative match assessment: {e}", exc_info=True)
+            return False
 
 async def create_matches_for_enriched_media(db_service: DatabaseService) -> bool:
     """
     Create match suggestions for media that have completed enrichment and episode analysis.
     This runs as part of the new workflow: Discovery → Enrichment → Match Creation → Vetting
     """
-    # Temporarily set the global pool for this event loop
-    from podcast_outreach.database import connection
-    original_pool = connection.DB_POOL
-    connection.DB_POOL = db_service.pool
-    
-    try:
-        # Get media that are ready for match creation
-        ready_media = await media_queries.get_enriched_media_for_campaigns()
+    # Route query helpers to the task's pool for this context only
+    with workload_scope(WORKLOAD_BACKGROUND, pool=db_service.pool):
+        try:
+            # Get media that are ready for match creation
+            ready_media = await media_queries.get_enriched_media_for_campaigns()
         
-        if not ready_media:
-            logger.info("No enriched media ready for match creation")
-            return True
+            if not ready_media:
+                logger.info("No enriched media ready for match creation")
+                return True
         
-        logger.info(f"Found {len(ready_media)} enriched media ready for match creation")
+            logger.info(f"Found {len(ready_media)} enriched media ready for match creation")
         
-        match_creator = MatchCreationService()
-        created_count = 0
+            match_creator = MatchCreationService()
+            created_count = 0
         
-        for item in ready_media:
-            campaign_id = item['campaign_id']
-            media_id = item['media_id']
-            keyword = item['discovery_keyword']
-            media_name = item['media_name']
+            for item in ready_media:
+                campaign_id = item['campaign_id']
+                media_id = item['media_id']
+                keyword = item['discovery_keyword']
+                media_name = item['media_name']
             
-            try:
-                logger.info(f"Creating match suggestion for media '{media_name}' (ID: {media_id}) and campaign {campaign_id}")
+                try:
+                    logger.info(f"Creating match suggestion for media '{media_name}' (ID: {media_id}) and campaign {campaign_id}")
                 
-                # NEW WORKFLOW: Vet first, then create match suggestion if approved
-                from podcast_outreach.services.matches.enhanced_vetting_agent import EnhancedVettingAgent
-                from podcast_outreach.database.queries import campaigns as campaign_queries
+                    # NEW WORKFLOW: Vet first, then create match suggestion if approved
+                    from podcast_outreach.services.matches.enhanced_vetting_agent import EnhancedVettingAgent
+                    from podcast_outreach.database.queries import campaigns as campaign_queries
                 
-                # Get campaign details for vetting
-                campaign_data = await campaign_queries.get_campaign_by_id(campaign_id)
-                if not campaign_data:
-                    logger.error(f"Campaign {campaign_id} not found for vetting")
-                    continue
+                    # Get campaign details for vetting
+                    campaign_data = await campaign_queries.get_campaign_by_id(campaign_id)
+                    if not campaign_data:
+                        logger.error(f"Campaign {campaign_id} not found for vetting")
+                        continue
                 
-                # Run AI vetting before creating match
-                vetting_agent = EnhancedVettingAgent()
-                vetting_result = await vetting_agent.vet_media_for_campaign(media_id, campaign_data)
+                    # Run AI vetting before creating match
+                    vetting_agent = EnhancedVettingAgent()
+                    vetting_result = await vetting_agent.vet_media_for_campaign(media_id, campaign_data)
                 
-                if vetting_result.get('status') == 'success':
-                    vetting_score = vetting_result.get('vetting_score', 0)
-                    min_vetting_score = 60  # Only create matches for well-vetted podcasts
+                    if vetting_result.get('status') == 'success':
+                        vetting_score = vetting_result.get('vetting_score', 0)
+                        min_vetting_score = 60  # Only create matches for well-vetted podcasts
                     
-                    if vetting_score >= min_vetting_score:
-                        # Create match suggestion only if vetting passes
-                        from podcast_outreach.services.media.podcast_fetcher import MediaFetcher
-                        fetcher = MediaFetcher()
-                        success = await fetcher.create_match_suggestions(media_id, campaign_id, keyword)
+                        if vetting_score >= min_vetting_score:
+                            # Create match suggestion only if vetting passes
+                            from podcast_outreach.services.media.podcast_fetcher import MediaFetcher
+                            fetcher = MediaFetcher()
+                            success = await fetcher.create_match_suggestions(media_id, campaign_id, keyword)
                         
-                        if success:
-                            logger.info(f"Created match suggestion for well-vetted media {media_id} (score: {vetting_score}) and campaign {campaign_id}")
+                            if success:
+                                logger.info(f"Created match suggestion for well-vetted media {media_id} (score: {vetting_score}) and campaign {campaign_id}")
+                            else:
+                                logger.warning(f"Failed to create match suggestion despite good vetting score for media {media_id}")
                         else:
-                            logger.warning(f"Failed to create match suggestion despite good vetting score for media {media_id}")
+                            logger.info(f"Media {media_id} did not pass vetting for campaign {campaign_id} (score: {vetting_score} < {min_vetting_score})")
+                            success = False
                     else:
-                        logger.info(f"Media {media_id} did not pass vetting for campaign {campaign_id} (score: {vetting_score} < {min_vetting_score})")
+                        logger.warning(f"Vetting failed for media {media_id} and campaign {campaign_id}: {vetting_result.get('message')}")
                         success = False
-                else:
-                    logger.warning(f"Vetting failed for media {media_id} and campaign {campaign_id}: {vetting_result.get('message')}")
-                    success = False
                 
-                if success:
-                    created_count += 1
-                    logger.info(f"Successfully created match suggestion for media {media_id} and campaign {campaign_id}")
-                else:
-                    logger.warning(f"Failed to create match suggestion for media {media_id} and campaign {campaign_id}")
+                    if success:
+                        created_count += 1
+                        logger.info(f"Successfully created match suggestion for media {media_id} and campaign {campaign_id}")
+                    else:
+                        logger.warning(f"Failed to create match suggestion for media {media_id} and campaign {campaign_id}")
                     
-            except Exception as e:
-                logger.error(f"Error creating match for media {media_id} and campaign {campaign_id}: {e}", exc_info=True)
+                except Exception as e:
+                    logger.error(f"Error creating match for media {media_id} and campaign {campaign_id}: {e}", exc_info=True)
         
-        logger.info(f"Match creation completed. Created {created_count} new match suggestions from {len(ready_media)} ready media")
-        return True
+            logger.info(f"Match creation completed. Created {created_count} new match suggestions from {len(ready_media)} ready media")
+            return True
         
-    except Exception as e:
-        logger.error(f"Error during enriched media match creation: {e}", exc_info=True)
-        return False
-    finally:
-        # Restore original pool
-        connection.DB_POOL = original_pool
+        except Exception as e:
+            logger.error(f"Error during enriched media match creation: {e}", exc_info=True)
+            return False
 
 async def score_potential_matches(
     db_service: DatabaseService,
@@ -2,7 +2,8 @@
 
 import logging
 from podcast_outreach.services.database_service import DatabaseService
-from podcast_outreach.services.pitches.generator import PitchGeneratorService
+from podcast_outreach.database.connection import workload_scope, WORKLOAD_BACKGROUND
+from podcast_outreach.services.pitches.batch_generator import BatchPitchGenerator
 from podcast_outreach.services.pitches.sender import PitchSenderService
 
 logger = logging.getLogger(__name__)
@@ -12,17 +13,18 @@ async def generate_pitches(db_service: DatabaseService) -> bool:
     Pure business logic function for pitch generation.
     Assumes database resources are available via db_service.
     """
-    generator = PitchGeneratorService()
-    
-    try:
-        logger.info("Running pitch writer (generating pitches for pending matches)")
-        # TODO: Implement actual pitch generation logic
-        logger.warning("Pitch writer business logic is a placeholder. Needs implementation.")
-        logger.info("Pitch writer completed (placeholder)")
-        return True
-    except Exception as e:
-        logger.error(f"Error during pitch writer: {e}", exc_info=True)
-        return False
+    with workload_scope(WORKLOAD_BACKGROUND, pool=db_service.pool):
+        try:
+            logger.info("Running pitch writer (generating pitches for approved matches without pitches)")
+            summary = await BatchPitchGenerator().run(pool=db_service.pool)
+            logger.info(
+                f"Pitch writer completed: {summary['written']} of {summary['matches']} matches pitched, "
+                f"{len(summary['failed'])} failed"
+            )
+            return True
+        except Exception as e:
+            logger.error(f"Error during pitch writer: {e}", exc_info=True)
+            return False
 
 async def send_pitches(db_service: DatabaseService) -> bool:
     """
@@ -431,11 +431,10 @@ Make it conversational and engaging."""
                 if ideal_podcast_description and existing_campaign.get('auto_discovery_enabled', True):
                     try:
                         from podcast_outreach.services.tasks.manager import task_manager
-                        import time
                         
-                        task_id = f"auto_discovery_ready_{campaign_id}_{int(time.time())}"
-                        task_manager.start_task(task_id, "campaign_ready_auto_discovery")
-                        task_manager.run_single_campaign_auto_discovery(task_id, campaign_id)
+                        task_id = task_manager.new_task_id(f"auto_discovery_ready_{campaign_id}")
+                        await task_manager.submit(task_id, "campaign_ready_auto_discovery",
+                                                  "run_single_campaign_auto_discovery", campaign_id=str(campaign_id))
                         
                         logger.info(f"Triggered auto-discovery for campaign {campaign_id} after questionnaire completion")
                     except Exception as e:
@@ -1,12 +1,13 @@
 # podcast_outreach/services/chatbot/agentic/agentic_adapter.py
 
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, AsyncIterator
 from uuid import UUID
 from datetime import datetime
 import json
 import logging
 import os
 
+from podcast_outreach.database.queries import chatbot_conversations as conv_queries
 from .conversation_orchestrator import ConversationOrchestrator
 from .state_converter import StateConverter
 from .fallback_handler import FallbackHandler
@@ -129,49 +130,82 @@ class AgenticChatbotAdapter:
         Returns:
             Response in legacy format
         """
+        legacy_response = None
+        async for event in self.stream_message(conversation_id, message, conversation_data):
+            if event['type'] == 'complete':
+                legacy_response = event['response']
+        return legacy_response
+    
+    async def stream_message(
+        self,
+        conversation_id: str,
+        message: str,
+        conversation_data: Dict[str, Any],
+        defer_enrichment: bool = False
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Process a message using the agentic system, yielding progress events
+        
+        Yields the orchestrator's 'stage' and 'response' events, then
+        {'type': 'complete', 'response': <legacy format response>}. Yields
+        nothing when the conversation is not handled by the agentic system.
+        """
         # Check if this conversation should use agentic
         if not self._should_use_agentic(conversation_data):
-            return None  # Let legacy system handle it
+            return  # Let legacy system handle it
         
+        async def load_agentic_state() -> Dict[str, Any]:
+            # Only needed when the session store has no state for this conversation,
+            # so the full message history is read lazily here
+            legacy_data = dict(conversation_data)
+            legacy_data['messages'] = await conv_queries.get_conversation_messages(UUID(str(conversation_id)))
+            return self.state_converter.legacy_to_agentic(legacy_data)
+        
+        response_sent = False
         try:
-            # Convert legacy state to agentic format
-            agentic_state = self.state_converter.legacy_to_agentic(
-                conversation_data
-            )
-            
             # Process through agentic system
-            response, new_state = await self.orchestrator.process_message(
+            async for event in self.orchestrator.stream_message(
                 message=message,
                 person_id=conversation_data['person_id'],
                 company_id=conversation_data['campaign_id'],
                 session_id=str(conversation_id),
-                existing_state=agentic_state
-            )
-            
-            # Convert back to legacy format
-            legacy_response = self.state_converter.agentic_to_legacy_response(
-                response=response,
-                new_state=new_state,
-                old_conversation_data=conversation_data
-            )
-            
-            # Debug logging
-            logger.info(f"Agentic adapter - bot_message has {legacy_response['bot_message'].count(chr(10))} newlines")
-            logger.info(f"Agentic adapter - first 200 chars: {repr(legacy_response['bot_message'][:200])}")
-            
-            return legacy_response
+                existing_state_loader=load_agentic_state,
+                defer_enrichment=defer_enrichment
+            ):
+                if event['type'] != 'complete':
+                    response_sent = response_sent or event['type'] == 'response'
+                    yield event
+                    continue
+                
+                # Convert back to legacy format
+                legacy_response = self.state_converter.agentic_to_legacy_response(
+                    response=event['response'],
+                    new_state=event['state'],
+                    old_conversation_data=conversation_data
+                )
+                
+                # Debug logging
+                logger.info(f"Agentic adapter - bot_message has {legacy_response['bot_message'].count(chr(10))} newlines")
+                logger.info(f"Agentic adapter - first 200 chars: {repr(legacy_response['bot_message'][:200])}")
+                
+                yield {'type': 'complete', 'response': legacy_response}
             
         except Exception as e:
             logger.error(f"Error in agentic message processing: {e}")
             
             if self.fallback_enabled:
                 # Try to recover with fallback
-                return await self.fallback_handler.handle_error(
+                fallback_response = await self.fallback_handler.handle_error(
                     error=e,
                     conversation_id=conversation_id,
                     message=message,
                     conversation_data=conversation_data
                 )
+                if fallback_response:
+                    if not response_sent:
+                        yield {'type': 'response', 'text': fallback_response['bot_message']}
+                    yield {'type': 'complete', 'response': fallback_response}
+                return
             raise
     
     async def complete_conversation(
@@ -5,6 +5,7 @@ from datetime import datetime, timedelta
 from dataclasses import dataclass
 import re
 
+from podcast_outreach.services.ai.token_counter import token_counter
 from .state_manager import Message, StateManager
 from .bucket_definitions import INFORMATION_BUCKETS
 
@@ -28,8 +29,9 @@ class ContextCompressionManager:
     - Remove redundant information
     """
     
-    def __init__(self, max_context_messages: int = 10):
+    def __init__(self, max_context_messages: int = 10, model: Optional[str] = None):
         self.max_context_messages = max_context_messages
+        self.model = model  # Tokenizer family for estimate_tokens; None counts with cl100k
         self.always_preserve_messages = 4  # Always keep last N messages
         
     def compress_conversation_history(
@@ -265,14 +267,8 @@ class ContextCompressionManager:
         return relevant_messages
     
     def estimate_tokens(self, text: str) -> int:
-        """
-        Rough estimate of token count
-        
-        Note: This is a very rough estimate. In production,
-        use the actual tokenizer for the model being used.
-        """
-        # Rough estimate: ~4 characters per token
-        return len(text) // 4
+        """Token count from the shared local tokenizer (cached per text)"""
+        return token_counter.count(text, self.model)
     
     def should_compress(
         self,
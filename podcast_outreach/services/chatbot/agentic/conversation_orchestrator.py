@@ -1,13 +1,20 @@
 # podcast_outreach/services/chatbot/agentic/conversation_orchestrator.py
 
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, Optional, Tuple, Callable, Awaitable, AsyncIterator
 from datetime import datetime
 import json
 import logging
 
 from .graph_builder import compile_conversation_graph
 from .graph_state import GraphState, create_initial_graph_state
+from .graph_nodes import apply_linkedin_analysis, response_generation_node
 from .state_manager import StateManager, ChatbotState
+from .session_store import (
+    SessionStateStore,
+    SerializedSessionState,
+    StaleSessionStateError,
+    create_session_store
+)
 
 logger = logging.getLogger(__name__)
 
@@ -22,10 +29,15 @@ class ConversationOrchestrator:
     - Tracks analytics and performance
     """
     
-    def __init__(self):
-        """Initialize the conversation orchestrator"""
+    def __init__(self, session_store: Optional[SessionStateStore] = None):
+        """
+        Initialize the conversation orchestrator
+        
+        Args:
+            session_store: Where GraphState is kept between turns (defaults to the configured store)
+        """
         self.graph = compile_conversation_graph()
-        self._active_sessions: Dict[str, GraphState] = {}
+        self.session_store = session_store or create_session_store()
     
     async def process_message(
         self,
@@ -33,7 +45,8 @@ class ConversationOrchestrator:
         person_id: int,
         company_id: str,
         session_id: Optional[str] = None,
-        existing_state: Optional[Dict[str, Any]] = None
+        existing_state: Optional[Dict[str, Any]] = None,
+        existing_state_loader: Optional[Callable[[], Awaitable[Dict[str, Any]]]] = None
     ) -> Tuple[str, Dict[str, Any]]:
         """
         Process a user message through the conversation graph
@@ -44,57 +57,63 @@ class ConversationOrchestrator:
             company_id: The company ID
             session_id: Optional session ID for conversation continuity
             existing_state: Optional existing conversation state to restore
+            existing_state_loader: Optional coroutine factory building existing_state,
+                only awaited when the session store has no state for session_id
             
         Returns:
             Tuple of (response_message, updated_state_dict)
         """
+        final_event = None
+        async for event in self.stream_message(
+            message, person_id, company_id,
+            session_id=session_id,
+            existing_state=existing_state,
+            existing_state_loader=existing_state_loader
+        ):
+            if event['type'] == 'complete':
+                final_event = event
+        return final_event['response'], final_event['state']
+    
+    async def stream_message(
+        self,
+        message: str,
+        person_id: int,
+        company_id: str,
+        session_id: Optional[str] = None,
+        existing_state: Optional[Dict[str, Any]] = None,
+        existing_state_loader: Optional[Callable[[], Awaitable[Dict[str, Any]]]] = None,
+        defer_enrichment: bool = False
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Process a user message, yielding events as the turn progresses
+        
+        Events, in order:
+            {'type': 'stage', 'node': <graph node name>} after each graph node
+            {'type': 'response', 'text': <bot reply>} as soon as the graph finishes
+            {'type': 'response', 'text': <bot reply>, 'revised': True} if deferred
+                enrichment pre-filled buckets; replaces the first reply
+            {'type': 'complete', 'response': <bot reply>, 'state': <updated state dict>}
+        
+        Deferred enrichment and saving the session happen between the first
+        response and the complete event.
+        
+        Args:
+            defer_enrichment: Run slow enrichment (LinkedIn analysis) after the
+                reply instead of inside the graph
+            Other arguments are as for process_message.
+        """
+        response_sent = False
         try:
-            # Get or create session
-            if session_id and session_id in self._active_sessions:
-                graph_state = self._active_sessions[session_id]
-                logger.info(f"Resuming session {session_id}")
-            else:
-                # Create new or restore from existing state
-                if existing_state:
-                    # Restore from saved state
-                    logger.info(f"Existing state keys: {list(existing_state.keys())}")
-                    if 'buckets' in existing_state:
-                        bucket_count = len(existing_state.get('buckets', {}))
-                        logger.info(f"Existing state has {bucket_count} buckets: {list(existing_state['buckets'].keys())[:5]}...")
-                    
-                    # Ensure all buckets are present
-                    from .bucket_definitions import INFORMATION_BUCKETS
-                    if 'buckets' not in existing_state:
-                        existing_state['buckets'] = {}
-                    
-                    # Initialize missing buckets
-                    for bucket_id in INFORMATION_BUCKETS:
-                        if bucket_id not in existing_state['buckets']:
-                            existing_state['buckets'][bucket_id] = []
-                    
-                    logger.info(f"After initialization, state has {len(existing_state['buckets'])} buckets")
-                    
-                    chatbot_state = ChatbotState(**existing_state)
-                    graph_state = create_initial_graph_state(
-                        person_id, company_id, chatbot_state
-                    )
-                    # Preserve db_extracted_data if available
-                    if 'db_extracted_data' in existing_state:
-                        graph_state['db_extracted_data'] = existing_state['db_extracted_data']
-                    logger.info(f"Restored state for person {person_id}")
-                else:
-                    # Brand new conversation
-                    graph_state = create_initial_graph_state(person_id, company_id)
-                    logger.info(f"Started new conversation for person {person_id}")
-                
-                # Cache the session
-                if session_id:
-                    self._active_sessions[session_id] = graph_state
+            graph_state, state_version = await self._load_graph_state(
+                person_id, company_id, session_id, existing_state, existing_state_loader
+            )
             
             # Update current message
             graph_state['current_message'] = message
             graph_state['current_message_timestamp'] = datetime.utcnow()
             graph_state['total_messages'] += 1
+            graph_state['defer_enrichment'] = defer_enrichment
+            graph_state['pending_enrichment'] = None
             
             # Add message to conversation history
             state_manager = StateManager(
@@ -106,12 +125,41 @@ class ConversationOrchestrator:
             state_manager.add_message("user", message)
             graph_state['chatbot_state'] = state_manager.state
             
-            # Process through graph
+            # Process through graph; every node returns the full state, so
+            # applying the updates in order yields the final state
             logger.info(f"Processing message through graph: '{message[:50]}...'")
-            result = await self.graph.ainvoke(graph_state)
+            result = dict(graph_state)
+            async for update in self.graph.astream(graph_state, stream_mode="updates"):
+                for node_name, node_state in update.items():
+                    if node_state:
+                        result.update(node_state)
+                    yield {'type': 'stage', 'node': node_name}
             
             # Extract response
             response = result.get('generated_response', "I'm sorry, I couldn't process that message. Could you please try again?")
+            yield {'type': 'response', 'text': response}
+            response_sent = True
+            
+            pending = result.get('pending_enrichment')
+            if pending and pending.get('linkedin_url'):
+                enrichment_manager = StateManager(
+                    conversation_id=session_id or result['chatbot_state']['session_id'],
+                    campaign_id=company_id,
+                    person_id=person_id
+                )
+                enrichment_manager.state = result['chatbot_state']
+                previous_analysis = enrichment_manager.state.get('linkedin_analysis')
+                result = await apply_linkedin_analysis(result, enrichment_manager, pending['linkedin_url'])
+                if result['chatbot_state'].get('linkedin_analysis') is not previous_analysis:
+                    # The reply was built before the profile was analyzed; rebuild it
+                    # so it acknowledges the profile and skips questions it answered
+                    revised = await response_generation_node(dict(result))
+                    if revised.get('next_action') != 'error' and revised.get('generated_response'):
+                        result = revised
+                        response = revised['generated_response']
+                        yield {'type': 'response', 'text': response, 'revised': True}
+            result['pending_enrichment'] = None
+            result['defer_enrichment'] = False
             
             # Add assistant message to history
             state_manager.state = result['chatbot_state']
@@ -121,9 +169,13 @@ class ConversationOrchestrator:
             # Update momentum
             result['conversation_momentum'] = self._calculate_momentum(result)
             
-            # Cache updated state
+            # Save updated state so any worker can pick up the next turn
             if session_id:
-                self._active_sessions[session_id] = result
+                try:
+                    await self.session_store.put(session_id, result, state_version)
+                except StaleSessionStateError as conflict:
+                    # A concurrent turn on another worker won; its state is reloaded next time
+                    logger.warning(f"{conflict}; discarding this worker's copy")
             
             # Prepare state for serialization
             serializable_state = self._prepare_state_for_storage(result['chatbot_state'])
@@ -131,7 +183,7 @@ class ConversationOrchestrator:
             # Log analytics
             self._log_analytics(result)
             
-            return response, serializable_state
+            yield {'type': 'complete', 'response': response, 'state': serializable_state}
             
         except Exception as e:
             logger.error(f"Error processing message: {e}", exc_info=True)
@@ -141,10 +193,17 @@ class ConversationOrchestrator:
                 "I apologize, but I encountered an error processing your message. "
                 "Your information has been saved, and you can continue where you left off."
             )
+            if not response_sent:
+                yield {'type': 'response', 'text': error_response}
             
             # Return existing state if available
+            if existing_state is None and existing_state_loader is not None:
+                try:
+                    existing_state = await existing_state_loader()
+                except Exception as load_error:
+                    logger.error(f"Could not load existing state after error: {load_error}")
             if existing_state:
-                return error_response, existing_state
+                yield {'type': 'complete', 'response': error_response, 'state': existing_state}
             else:
                 # Create minimal state
                 minimal_state = {
@@ -154,7 +213,44 @@ class ConversationOrchestrator:
                     'messages': [],
                     'last_updated': datetime.utcnow().isoformat()
                 }
-                return error_response, minimal_state
+                yield {'type': 'complete', 'response': error_response, 'state': minimal_state}
+    
+    async def _load_graph_state(
+        self,
+        person_id: int,
+        company_id: str,
+        session_id: Optional[str],
+        existing_state: Optional[Dict[str, Any]],
+        existing_state_loader: Optional[Callable[[], Awaitable[Dict[str, Any]]]]
+    ) -> Tuple[GraphState, int]:
+        """Get the session's GraphState and stored version, or build a new one"""
+        if session_id:
+            stored = await self.session_store.get(session_id)
+            if stored:
+                stored_state, state_version = stored
+                if isinstance(stored_state, SerializedSessionState):
+                    graph_state = self._restore_graph_state(
+                        stored_state.chatbot_state, person_id, company_id
+                    )
+                    for field, value in stored_state.graph.items():
+                        if value is not None:
+                            graph_state[field] = value
+                    logger.info(f"Restored session {session_id} v{state_version} from session store")
+                else:
+                    graph_state = stored_state
+                    logger.info(f"Resuming session {session_id}")
+                return graph_state, state_version
+        
+        # Create new or restore from existing state
+        if existing_state is None and existing_state_loader is not None:
+            existing_state = await existing_state_loader()
+        
+        if existing_state:
+            return self._restore_graph_state(existing_state, person_id, company_id), 0
+        
+        # Brand new conversation
+        logger.info(f"Started new conversation for person {person_id}")
+        return create_initial_graph_state(person_id, company_id), 0
     
     async def get_conversation_summary(
         self,
@@ -226,30 +322,63 @@ class ConversationOrchestrator:
                 'company_id': company_id
             }
     
-    def clear_session(self, session_id: str) -> None:
-        """Clear a cached session"""
-        if session_id in self._active_sessions:
-            del self._active_sessions[session_id]
-            logger.info(f"Cleared session {session_id}")
+    async def clear_session(self, session_id: str) -> None:
+        """Clear a stored session"""
+        await self.session_store.delete(session_id)
+        logger.info(f"Cleared session {session_id}")
     
-    def clear_old_sessions(self, hours: int = 24) -> int:
-        """Clear sessions older than specified hours"""
-        cutoff = datetime.utcnow().timestamp() - (hours * 3600)
-        cleared = 0
-        
-        for session_id in list(self._active_sessions.keys()):
-            state = self._active_sessions[session_id]
-            last_update = state.get('current_message_timestamp', datetime.utcnow())
-            
-            if last_update.timestamp() < cutoff:
-                del self._active_sessions[session_id]
-                cleared += 1
+    async def clear_old_sessions(self, hours: int = 24) -> int:
+        """
+        Clear durable sessions not updated within the specified hours.
+        In-process copies expire on their own through the cache TTL.
+        """
+        from podcast_outreach.database.queries import chatbot_session_states as session_queries
+        try:
+            cleared = await session_queries.delete_stale_session_states(hours)
+        except Exception as e:
+            logger.warning(f"Could not prune stored sessions: {e}")
+            cleared = 0
         
         logger.info(f"Cleared {cleared} old sessions")
         return cleared
     
     # Private helper methods
     
+    def _restore_graph_state(
+        self,
+        existing_state: Dict[str, Any],
+        person_id: int,
+        company_id: str
+    ) -> GraphState:
+        """Build a GraphState from a serialized chatbot state"""
+        # Restore from saved state
+        logger.info(f"Existing state keys: {list(existing_state.keys())}")
+        if 'buckets' in existing_state:
+            bucket_count = len(existing_state.get('buckets', {}))
+            logger.info(f"Existing state has {bucket_count} buckets: {list(existing_state['buckets'].keys())[:5]}...")
+        
+        # Ensure all buckets are present
+        from .bucket_definitions import INFORMATION_BUCKETS
+        if 'buckets' not in existing_state:
+            existing_state['buckets'] = {}
+        
+        # Initialize missing buckets
+        for bucket_id in INFORMATION_BUCKETS:
+            if bucket_id not in existing_state['buckets']:
+                existing_state['buckets'][bucket_id] = []
+        
+        logger.info(f"After initialization, state has {len(existing_state['buckets'])} buckets")
+        
+        chatbot_state = ChatbotState(**existing_state)
+        graph_state = create_initial_graph_state(
+            person_id, company_id, chatbot_state
+        )
+        # Preserve db_extracted_data if available
+        if 'db_extracted_data' in existing_state:
+            graph_state['db_extracted_data'] = existing_state['db_extracted_data']
+        logger.info(f"Restored state for person {person_id}")
+        return graph_state
+    
     def _calculate_momentum(self, state: GraphState) -> str:
         """Calculate conversation momentum"""
         from .graph_state import GraphStateManager
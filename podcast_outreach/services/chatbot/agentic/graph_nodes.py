@@ -167,69 +167,12 @@ async def bucket_update_node(state: GraphState) -> GraphState:
         if 'linkedin_url' in update_result.updated_buckets:
             linkedin_url = state_manager.get_bucket_value('linkedin_url')
             if linkedin_url:
-                logger.info(f"LinkedIn URL provided: {linkedin_url}. Analyzing profile...")
-                
-                # Import LinkedIn analyzer
-                from podcast_outreach.services.chatbot.linkedin_analyzer import LinkedInAnalyzer
-                analyzer = LinkedInAnalyzer()
-                
-                try:
-                    # Analyze the LinkedIn profile
-                    analysis_results = await analyzer.analyze_profile(linkedin_url)
-                    
-                    if analysis_results:
-                        logger.info(f"LinkedIn analysis successful. Extracted data: {list(analysis_results.keys())}")
-                        
-                        # Pre-fill buckets with LinkedIn data
-                        linkedin_updates = {}
-                        
-                        # Map LinkedIn data to buckets
-                        if analysis_results.get('professional_bio'):
-                            linkedin_updates['professional_bio'] = analysis_results['professional_bio']
-                        
-                        if analysis_results.get('expertise_keywords'):
-                            linkedin_updates['expertise_keywords'] = analysis_results['expertise_keywords']
-                        
-                        if analysis_results.get('years_experience'):
-                            linkedin_updates['years_experience'] = analysis_results['years_experience']
-                        
-                        if analysis_results.get('success_stories'):
-                            linkedin_updates['success_stories'] = analysis_results['success_stories']
-                        
-                        if analysis_results.get('podcast_topics'):
-                            linkedin_updates['podcast_topics'] = analysis_results['podcast_topics']
-                        
-                        if analysis_results.get('unique_perspective'):
-                            linkedin_updates['unique_perspective'] = analysis_results['unique_perspective']
-                        
-                        if analysis_results.get('target_audience'):
-                            linkedin_updates['target_audience'] = analysis_results['target_audience']
-                        
-                        if analysis_results.get('key_achievements'):
-                            linkedin_updates['achievements'] = analysis_results['key_achievements']
-                        
-                        # Update buckets with LinkedIn data
-                        for bucket_id, value in linkedin_updates.items():
-                            if bucket_id in INFORMATION_BUCKETS and not state_manager.get_bucket_value(bucket_id):
-                                # Only update if bucket is empty
-                                state_manager.update_bucket(bucket_id, value, confidence=0.8)
-                                logger.info(f"Pre-filled {bucket_id} from LinkedIn analysis")
-                        
-                        # Store analysis results in chatbot state metadata for response generation
-                        state_manager.state['linkedin_analysis'] = analysis_results
-                        state_manager.state['linkedin_prefilled_buckets'] = list(linkedin_updates.keys())
-                        
-                        # Update chatbot state
-                        state['chatbot_state'] = state_manager.state
-                        
-                        # Update successful extractions count
-                        state['successful_extractions'] += len(linkedin_updates)
-                    else:
-                        logger.warning("LinkedIn analysis returned no results")
-                        
-                except Exception as e:
-                    logger.error(f"Error analyzing LinkedIn profile: {e}")
-                    # Continue without LinkedIn data
+                if state.get('defer_enrichment'):
+                    # Streaming turn: reply first, the orchestrator analyzes the profile afterwards
+                    logger.info(f"LinkedIn URL provided: {linkedin_url}. Deferring profile analysis")
+                    state['pending_enrichment'] = {'linkedin_url': linkedin_url}
+                else:
+                    state = await apply_linkedin_analysis(state, state_manager, linkedin_url)
         
         return state
         
@@ -242,6 +185,84 @@ async def bucket_update_node(state: GraphState) -> GraphState:
         return state
 
 
+async def apply_linkedin_analysis(
+    state: GraphState,
+    state_manager: StateManager,
+    linkedin_url: str
+) -> GraphState:
+    """
+    Analyze a LinkedIn profile and pre-fill empty buckets from it
+
+    Runs inline from bucket_update_node, or after the reply has been sent
+    when the turn is streamed (see ConversationOrchestrator.stream_message).
+    """
+    logger.info(f"LinkedIn URL provided: {linkedin_url}. Analyzing profile...")
+    
+    # Import LinkedIn analyzer
+    from podcast_outreach.services.chatbot.linkedin_analyzer import LinkedInAnalyzer
+    analyzer = LinkedInAnalyzer()
+    
+    try:
+        # Analyze the LinkedIn profile
+        analysis_results = await analyzer.analyze_profile(linkedin_url)
+    
+        if analysis_results:
+            logger.info(f"LinkedIn analysis successful. Extracted data: {list(analysis_results.keys())}")
+    
+            # Pre-fill buckets with LinkedIn data
+            linkedin_updates = {}
+    
+            # Map LinkedIn data to buckets
+            if analysis_results.get('professional_bio'):
+                linkedin_updates['professional_bio'] = analysis_results['professional_bio']
+    
+            if analysis_results.get('expertise_keywords'):
+                linkedin_updates['expertise_keywords'] = analysis_results['expertise_keywords']
+    
+            if analysis_results.get('years_experience'):
+                linkedin_updates['years_experience'] = analysis_results['years_experience']
+    
+            if analysis_results.get('success_stories'):
+                linkedin_updates['success_stories'] = analysis_results['success_stories']
+    
+            if analysis_results.get('podcast_topics'):
+                linkedin_updates['podcast_topics'] = analysis_results['podcast_topics']
+    
+            if analysis_results.get('unique_perspective'):
+                linkedin_updates['unique_perspective'] = analysis_results['unique_perspective']
+    
+            if analysis_results.get('target_audience'):
+                linkedin_updates['target_audience'] = analysis_results['target_audience']
+    
+            if analysis_results.get('key_achievements'):
+                linkedin_updates['achievements'] = analysis_results['key_achievements']
+    
+            # Update buckets with LinkedIn data
+            for bucket_id, value in linkedin_updates.items():
+                if bucket_id in INFORMATION_BUCKETS and not state_manager.get_bucket_value(bucket_id):
+                    # Only update if bucket is empty
+                    state_manager.update_bucket(bucket_id, value, confidence=0.8)
+                    logger.info(f"Pre-filled {bucket_id} from LinkedIn analysis")
+    
+            # Store analysis results in chatbot state metadata for response generation
+            state_manager.state['linkedin_analysis'] = analysis_results
+            state_manager.state['linkedin_prefilled_buckets'] = list(linkedin_updates.keys())
+    
+            # Update chatbot state
+            state['chatbot_state'] = state_manager.state
+    
+            # Update successful extractions count
+            state['successful_extractions'] += len(linkedin_updates)
+        else:
+            logger.warning("LinkedIn analysis returned no results")
+    
+    except Exception as e:
+        logger.error(f"Error analyzing LinkedIn profile: {e}")
+        # Continue without LinkedIn data
+    
+    return state
+
+
 async def response_generation_node(state: GraphState) -> GraphState:
     """
     Generate an appropriate response based on current state
@@ -59,6 +59,10 @@ class GraphState(TypedDict):
     
     # Database data (for complete summaries)
     db_extracted_data: Optional[Dict[str, Any]]
+    
+    # Streaming turns: slow enrichment (LinkedIn analysis) runs after the reply is sent
+    defer_enrichment: bool
+    pending_enrichment: Optional[Dict[str, Any]]
 
 
 def create_initial_graph_state(
@@ -117,7 +121,9 @@ def create_initial_graph_state(
         successful_extractions=0,
         corrections_made=0,
         clarifications_needed=0,
-        db_extracted_data=None
+        db_extracted_data=None,
+        defer_enrichment=False,
+        pending_enrichment=None
     )
 
 
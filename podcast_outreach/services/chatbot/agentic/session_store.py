@@ -0,0 +1,191 @@
+# podcast_outreach/services/chatbot/agentic/session_store.py
+
+import abc
+from typing import Dict, Any, Optional, Tuple
+from dataclasses import dataclass, is_dataclass, asdict
+from datetime import datetime
+import json
+import logging
+
+from cachetools import TTLCache
+
+from podcast_outreach.config import (
+    CHATBOT_SESSION_STORE,
+    CHATBOT_SESSION_CACHE_SIZE,
+    CHATBOT_SESSION_CACHE_TTL_SECONDS
+)
+from podcast_outreach.database.queries import chatbot_session_states as session_queries
+from .graph_state import GraphState
+
+logger = logging.getLogger(__name__)
+
+# GraphState fields carried between turns; per-turn fields (classification, generated response, ...) are rebuilt
+PERSISTED_GRAPH_FIELDS = [
+    'total_messages',
+    'successful_extractions',
+    'corrections_made',
+    'clarifications_needed',
+    'error_count',
+    'frustration_indicators',
+    'conversation_momentum',
+    'db_extracted_data',
+]
+
+class StaleSessionStateError(Exception):
+    """Raised when another worker saved a newer version of a session first"""
+    pass
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if is_dataclass(value):
+        return asdict(value)
+    if hasattr(value, '__dict__'):
+        return value.__dict__
+    return str(value)
+
+def serialize_graph_state(graph_state: GraphState) -> str:
+    """Serialize the durable part of a GraphState to JSON"""
+    payload = {
+        'chatbot_state': graph_state['chatbot_state'],
+        'graph': {field: graph_state.get(field) for field in PERSISTED_GRAPH_FIELDS}
+    }
+    return json.dumps(payload, default=_json_default)
+
+@dataclass
+class SerializedSessionState:
+    """Session state loaded from the durable store, not yet rebuilt into a GraphState"""
+    chatbot_state: Dict[str, Any]  # Same shape as an existing_state dict
+    graph: Dict[str, Any]  # Values for PERSISTED_GRAPH_FIELDS
+
+def deserialize_graph_state(state_json: str) -> SerializedSessionState:
+    """Parse a stored state back into its parts"""
+    payload = json.loads(state_json)
+    return SerializedSessionState(
+        chatbot_state=payload.get('chatbot_state', {}),
+        graph=payload.get('graph', {})
+    )
+
+class SessionStateStore(abc.ABC):
+    """
+    Interface for agentic session state storage.
+
+    get() returns (state, version); put() takes the version that was read and
+    returns the new one, raising StaleSessionStateError on a lost update.
+    """
+
+    @abc.abstractmethod
+    async def get(self, session_id: str) -> Optional[Tuple[Any, int]]:
+        """Returns (GraphState or SerializedSessionState, version), or None if unknown"""
+        pass
+
+    @abc.abstractmethod
+    async def put(self, session_id: str, graph_state: GraphState, expected_version: int) -> int:
+        """Saves the state if the stored version is still expected_version; returns the new version"""
+        pass
+
+    @abc.abstractmethod
+    async def delete(self, session_id: str) -> None:
+        """Forgets the session"""
+        pass
+
+    def evict_local(self, session_id: Optional[str] = None) -> int:
+        """Drop in-process copies (all when session_id is None); returns how many were dropped"""
+        return 0
+
+class InMemorySessionStore(SessionStateStore):
+    """Bounded in-process LRU cache with per-entry TTL"""
+
+    def __init__(self, max_size: int = CHATBOT_SESSION_CACHE_SIZE, ttl_seconds: int = CHATBOT_SESSION_CACHE_TTL_SECONDS):
+        self._cache: TTLCache = TTLCache(maxsize=max_size, ttl=ttl_seconds)
+
+    async def get(self, session_id: str) -> Optional[Tuple[GraphState, int]]:
+        return self._cache.get(session_id)
+
+    async def put(self, session_id: str, graph_state: GraphState, expected_version: int) -> int:
+        new_version = expected_version + 1
+        self._cache[session_id] = (graph_state, new_version)
+        return new_version
+
+    async def delete(self, session_id: str) -> None:
+        self._cache.pop(session_id, None)
+
+    def evict_local(self, session_id: Optional[str] = None) -> int:
+        if session_id is None:
+            count = len(self._cache)
+            self._cache.clear()
+            return count
+        return 1 if self._cache.pop(session_id, None) is not None else 0
+
+    def set_local(self, session_id: str, graph_state: Any, version: int) -> None:
+        self._cache[session_id] = (graph_state, version)
+
+class TieredSessionStore(SessionStateStore):
+    """
+    In-process LRU in front of Postgres.
+
+    A local hit is only trusted after a primary-key version lookup confirms no
+    other worker has written the session since; otherwise the serialized state
+    is loaded from Postgres. If the table is unavailable the store degrades to
+    local-only caching.
+    """
+
+    def __init__(self, local: Optional[InMemorySessionStore] = None):
+        self.local = local or InMemorySessionStore()
+
+    async def get(self, session_id: str) -> Optional[Tuple[Any, int]]:
+        cached = await self.local.get(session_id)
+        try:
+            remote_version = await session_queries.get_session_state_version(session_id)
+        except Exception as e:
+            logger.warning(f"Session store unavailable, using local cache for {session_id}: {e}")
+            return cached
+
+        if remote_version is None:
+            # Never persisted (or pruned): a local copy must be re-inserted from scratch
+            return (cached[0], 0) if cached else None
+
+        if cached and cached[1] == remote_version:
+            return cached
+
+        row = await session_queries.get_session_state(session_id)
+        if not row:
+            return None
+        logger.info(f"Loaded session {session_id} v{row['version']} from durable store")
+        # The orchestrator rebuilds a GraphState from this and re-caches it on put()
+        return deserialize_graph_state(row['state']), row['version']
+
+    async def put(self, session_id: str, graph_state: GraphState, expected_version: int) -> int:
+        try:
+            new_version = await session_queries.save_session_state(
+                session_id, serialize_graph_state(graph_state), expected_version
+            )
+        except Exception as e:
+            logger.warning(f"Could not persist session {session_id}, keeping it in local cache only: {e}")
+            self.local.set_local(session_id, graph_state, expected_version)
+            return expected_version
+
+        if new_version is None:
+            self.local.evict_local(session_id)
+            raise StaleSessionStateError(f"Session {session_id} was updated by another worker")
+
+        self.local.set_local(session_id, graph_state, new_version)
+        return new_version
+
+    async def delete(self, session_id: str) -> None:
+        self.local.evict_local(session_id)
+        try:
+            await session_queries.delete_session_state(session_id)
+        except Exception as e:
+            logger.warning(f"Could not delete stored session {session_id}: {e}")
+
+    def evict_local(self, session_id: Optional[str] = None) -> int:
+        return self.local.evict_local(session_id)
+
+def create_session_store() -> SessionStateStore:
+    """Build the session store configured by CHATBOT_SESSION_STORE"""
+    if CHATBOT_SESSION_STORE == "memory":
+        logger.info("Using in-process chatbot session store")
+        return InMemorySessionStore()
+    logger.info("Using tiered (LRU + Postgres) chatbot session store")
+    return TieredSessionStore()
@@ -4,7 +4,7 @@ import asyncio
 import json
 import os
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any, AsyncIterator
 from uuid import UUID
 
 from podcast_outreach.logging_config import get_logger
@@ -90,13 +90,10 @@ class ConversationEngine:
                         "use_agentic": agentic_result.get('use_agentic', True)
                     }
                     
-                    await conv_queries.update_conversation(
+                    await conv_queries.append_messages(
                         conversation['conversation_id'],
                         messages,
-                        {},  # extracted_data
-                        metadata,
-                        'introduction',
-                        0  # progress
+                        metadata_patch=metadata
                     )
                     
                     return {
@@ -130,13 +127,10 @@ class ConversationEngine:
                 "phase": "introduction"
             }]
             
-            await conv_queries.update_conversation(
+            await conv_queries.append_messages(
                 conversation['conversation_id'],
                 messages,
-                {},  # extracted_data
-                {"start_time": datetime.utcnow().isoformat()},  # metadata
-                'introduction',
-                0  # progress
+                metadata_patch={"start_time": datetime.utcnow().isoformat()}
             )
             
             return {
@@ -151,6 +145,20 @@ class ConversationEngine:
     
     async def process_message(self, conversation_id: str, message: str) -> Dict:
         """Process a user message and generate response"""
+        response = None
+        async for event in self.process_message_stream(conversation_id, message):
+            if event['type'] == 'complete':
+                response = event['response']
+        return response
+    
+    async def process_message_stream(self, conversation_id: str, message: str,
+                                     defer_enrichment: bool = False) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Process a user message, yielding 'stage' and 'response' events while the
+        turn runs and a final 'complete' event (with the full response) once it
+        has been saved. With defer_enrichment, slow enrichment such as LinkedIn
+        analysis runs after the 'response' event instead of before it.
+        """
         try:
             # Load conversation with campaign data
             conv = await conv_queries.get_conversation_with_campaign_data(UUID(conversation_id))
@@ -159,52 +167,22 @@ class ConversationEngine:
             
             # Try agentic system first
             if self.agentic_adapter:
-                agentic_response = await self.agentic_adapter.process_message(
+                agentic_response = None
+                async for event in self.agentic_adapter.stream_message(
                     conversation_id=conversation_id,
                     message=message,
-                    conversation_data=conv
-                )
+                    conversation_data=conv,
+                    defer_enrichment=defer_enrichment
+                ):
+                    if event['type'] == 'complete':
+                        agentic_response = event['response']
+                    else:
+                        yield event
                 
                 if agentic_response:
-                    # Update conversation with agentic response
-                    messages = json.loads(conv['messages'])
-                    messages.extend([
-                        {
-                            "type": "user",
-                            "content": message,
-                            "timestamp": datetime.utcnow().isoformat()
-                        },
-                        {
-                            "type": "bot",
-                            "content": agentic_response['bot_message'],
-                            "timestamp": datetime.utcnow().isoformat()
-                        }
-                    ])
-                    
-                    # Update metadata with state flags from agentic response
-                    metadata = json.loads(conv.get('conversation_metadata', '{}'))
-                    
-                    # Get metadata from agentic response
-                    response_metadata = agentic_response.get('metadata', {})
-                    
-                    # Simple update - merge response metadata into existing metadata
-                    # This preserves existing fields and adds/updates from response
-                    metadata.update(response_metadata)
-                    
-                    # Also check top-level fields for backward compatibility
-                    if 'awaiting_confirmation' in agentic_response:
-                        metadata['awaiting_confirmation'] = agentic_response['awaiting_confirmation']
-                    
-                    await conv_queries.update_conversation(
-                        UUID(conversation_id),
-                        messages,
-                        agentic_response.get('extracted_data', {}),
-                        metadata,
-                        agentic_response.get('phase', 'processing'),
-                        agentic_response.get('progress', 0)
-                    )
-                    
-                    return agentic_response
+                    await self._save_agentic_turn(conversation_id, conv, message, agentic_response)
+                    yield {'type': 'complete', 'response': agentic_response}
+                    return
             
             # Agentic system is required
             raise ValueError("Agentic adapter not available")
@@ -213,6 +191,50 @@ class ConversationEngine:
             logger.exception(f"Error processing message: {e}")
             raise
     
+    async def _save_agentic_turn(self, conversation_id: str, conv: Dict[str, Any],
+                                 message: str, agentic_response: Dict[str, Any]) -> None:
+        """Append this turn's messages and write only the changed conversation fields"""
+        # Append only this turn; earlier messages are never rewritten
+        new_messages = [
+            {
+                "type": "user",
+                "content": message,
+                "timestamp": datetime.utcnow().isoformat()
+            },
+            {
+                "type": "bot",
+                "content": agentic_response['bot_message'],
+                "timestamp": datetime.utcnow().isoformat()
+            }
+        ]
+        
+        # Merge response metadata into existing metadata; only changed keys are written
+        metadata = json.loads(conv.get('conversation_metadata') or '{}')
+        metadata_patch = self._changed_keys(metadata, {
+            **metadata, **agentic_response.get('metadata', {})
+        })
+        
+        # Also check top-level fields for backward compatibility
+        if 'awaiting_confirmation' in agentic_response:
+            if metadata.get('awaiting_confirmation') != agentic_response['awaiting_confirmation']:
+                metadata_patch['awaiting_confirmation'] = agentic_response['awaiting_confirmation']
+        
+        # Extracted data is replaced wholesale by the agentic response; send only the diff
+        old_extracted = json.loads(conv.get('extracted_data') or '{}')
+        new_extracted = agentic_response.get('extracted_data', {})
+        extracted_patch = self._changed_keys(old_extracted, new_extracted)
+        removed_keys = [key for key in old_extracted if key not in new_extracted]
+        
+        await conv_queries.append_messages(
+            UUID(conversation_id),
+            new_messages,
+            extracted_data_patch=extracted_patch,
+            removed_extracted_keys=removed_keys,
+            metadata_patch=metadata_patch,
+            conversation_phase=agentic_response.get('phase', 'processing'),
+            progress=agentic_response.get('progress', 0)
+        )
+    
     async def complete_conversation(self, conversation_id: str) -> Dict:
         """Complete the conversation and process final data"""
         try:
@@ -233,7 +255,7 @@ class ConversationEngine:
                     "next_steps": ["view_media_kit"]
                 }
             
-            messages = json.loads(conv['messages'])
+            messages = await conv_queries.get_conversation_messages(UUID(conversation_id))
             extracted_data = json.loads(conv['extracted_data'])
             
             # Generate mock interview transcript
@@ -296,6 +318,11 @@ class ConversationEngine:
             logger.exception(f"Error completing conversation: {e}")
             raise
     
+    @staticmethod
+    def _changed_keys(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+        """Top-level keys of `new` whose values differ from `old` (a JSONB || patch)"""
+        return {key: value for key, value in new.items() if key not in old or old[key] != value}
+    
     def _generate_initial_message(self, name: str, campaign_name: str) -> str:
         """Generate personalized initial message"""
         return f"""Hi {name}! I'm excited to help you create an amazing media kit and find perfect podcast opportunities for {campaign_name}. 
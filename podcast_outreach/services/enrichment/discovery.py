@@ -61,11 +61,10 @@ class DiscoveryService:
                 logger.info(f"Creating non-blocking asyncio task '{task_name}'...")
                 # Use TaskManager for enrichment instead of direct asyncio task
                 from podcast_outreach.services.tasks.manager import task_manager
-                import time
                 
-                task_id = f"enrichment_{media_id}_{int(time.time())}"
-                task_manager.start_task(task_id, f"enrichment_media_{media_id}")
-                task_manager.run_enrichment_pipeline(task_id, media_id=media_id)
+                task_id = task_manager.new_task_id(f"enrichment_{media_id}")
+                await task_manager.submit(task_id, f"enrichment_media_{media_id}",
+                                          "run_enrichment_pipeline", media_id=media_id)
 
         # Phase 3: Retrieve all pending match suggestions for this campaign to refresh their episodes.
         from podcast_outreach.database.queries import match_suggestions as match_queries
@@ -16,6 +16,7 @@ from podcast_outreach.services.enrichment.data_merger import DataMergerService
 # Model imports
 from podcast_outreach.database.models.media_models import EnrichedPodcastProfile
 from podcast_outreach.database.models.llm_outputs import GeminiPodcastEnrichment
+from podcast_outreach.config import HOST_NAME_TRIGRAM_THRESHOLD
 
 # DB Queries
 from podcast_outreach.database.queries import people as people_queries
@@ -264,37 +265,23 @@ class EnrichmentAgent:
         return structured_output
 
     async def _create_or_link_hosts(self, media_id: int, host_names: List[str]):
-        """Creates or links hosts in the people and media_people tables."""
+        """
+        Creates or links hosts in the people and media_people tables: all names
+        are resolved (by normalized name) and missing people created in one
+        transaction, then linked with one insert.
+        """
         if not host_names:
             return
 
-        for host_name in host_names:
-            if not host_name or not isinstance(host_name, str):
-                continue
-            
-            # Check if a person with this name already exists
-            existing_person = await people_queries.get_person_by_full_name(host_name)
-            
-            person_id = None
-            if existing_person:
-                person_id = existing_person['person_id']
-                logger.info(f"Found existing person record for host '{host_name}' (ID: {person_id}).")
-            else:
-                # Create a new person record for the host
-                logger.info(f"Host '{host_name}' not found. Creating a new person record without an email.")
-                new_person_data = {
-                    "full_name": host_name,
-                    "role": "host",
-                    "email": None # Explicitly set to None
-                }
-                created_person = await people_queries.create_person_in_db(new_person_data)
-                if created_person:
-                    person_id = created_person['person_id']
-                    logger.info(f"Created new person record for host '{host_name}' (ID: {person_id}).")
-            
-            if person_id:
-                # Create the link in the media_people table
-                await media_queries.link_person_to_media(media_id, person_id, 'host')
+        person_ids = await people_queries.resolve_people_by_names(
+            host_names, role="host", trigram_threshold=HOST_NAME_TRIGRAM_THRESHOLD or None
+        )
+        if not person_ids:
+            return
+        linked = await media_queries.link_people_to_media(
+            [(media_id, person_id) for person_id in person_ids.values()], 'host'
+        )
+        logger.info(f"Resolved {len(person_ids)} hosts for media_id {media_id} ({linked} new links).")
 
     async def enrich_podcast_profile(
         self, 
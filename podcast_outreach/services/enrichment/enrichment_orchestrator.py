@@ -13,7 +13,7 @@ from typing import Dict, Any, Optional, List
 # Import specific query functions from the modular queries packages
 from podcast_outreach.database.queries import media as media_queries
 from podcast_outreach.database.queries.episodes import flag_specific_episodes_for_transcription
-from podcast_outreach.database.models.media_models import EnrichedPodcastProfile
+from podcast_outreach.database.loaders import get_loaders
 
 # Import services
 from .enrichment_agent import EnrichmentAgent
@@ -22,7 +22,7 @@ from .social_scraper import SocialDiscoveryService
 
 # Import modular DB connection for main execution block
 from podcast_outreach.database.connection import init_db_pool, close_db_pool 
-from podcast_outreach.config import ORCHESTRATOR_CONFIG
+from podcast_outreach.config import ORCHESTRATOR_CONFIG, QUALITY_SCORE_BATCH_SIZE, QUALITY_SCORE_RECOMPUTE_PAGE_SIZE
 
 logger = logging.getLogger(__name__)
 
@@ -38,28 +38,6 @@ class EnrichmentOrchestrator:
         self.social_discovery_service = social_discovery_service
         logger.info("EnrichmentOrchestrator initialized with EnrichmentAgent, QualityService, and SocialDiscoveryService.")
 
-    def _clean_media_data_for_validation(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Clean media data to fix common validation issues (same logic as data_merger)."""
-        cleaned_data = data.copy()
-        
-        # Fix emails being stored in URL fields
-        url_fields = [
-            'podcast_twitter_url', 'podcast_linkedin_url', 'podcast_instagram_url',
-            'podcast_facebook_url', 'podcast_youtube_url', 'podcast_tiktok_url',
-            'podcast_other_social_url', 'website', 'image_url', 'rss_feed_url'
-        ]
-        
-        for field in url_fields:
-            if field in cleaned_data and cleaned_data[field]:
-                value = str(cleaned_data[field]).strip()
-                # Check if it's an email (contains @ but not a valid URL)
-                if '@' in value and not value.startswith(('http://', 'https://')):
-                    logger.warning(f"Found email '{value}' in URL field '{field}' during quality scoring, cleaning...")
-                    # Clear the URL field (don't move to email since we don't want to overwrite)
-                    cleaned_data[field] = None
-        
-        return cleaned_data
-
     async def run_social_stats_refresh(self, batch_size: int = 20):
         """Refreshes only social media follower counts for stale records."""
         logger.info("Starting social stats refresh batch...")
@@ -174,40 +152,51 @@ class EnrichmentOrchestrator:
             await asyncio.sleep(0.5)
         logger.info("Core details enrichment batch finished.")
 
-    async def run_quality_score_updates(self, batch_size: int = 20):
+    async def update_quality_scores(self, inputs: Dict[str, List[Any]], compile_episode_summaries: bool = True) -> int:
+        """Scores media from columnar inputs (see media_queries.get_quality_score_inputs) and writes them back in one statement."""
+        if not inputs:
+            return 0
+        scores = self.quality_service.score_batch(inputs)
+        return await media_queries.bulk_update_media_quality_scores(scores, compile_episode_summaries)
+
+    async def run_quality_score_updates(self, batch_size: int = QUALITY_SCORE_BATCH_SIZE):
         """Refreshes quality scores for records where the score is stale."""
         logger.info("Starting quality score update batch...")
         update_interval = ORCHESTRATOR_CONFIG["quality_score_update_interval_hours"]
-        media_to_score = await media_queries.get_media_for_quality_score_update(batch_size, update_interval)
-        
-        if not media_to_score:
+        inputs = await media_queries.get_stale_quality_score_inputs(batch_size, update_interval)
+
+        if not inputs:
             logger.info("No media items found for quality score update in this batch.")
             return
 
-        for media_data in media_to_score:
-            media_id = media_data['media_id']
-            try:
-                # Clean the data before validation (same logic as in data_merger)
-                cleaned_media_data = self._clean_media_data_for_validation(media_data)
-                profile = EnrichedPodcastProfile(**cleaned_media_data)
-                
-                quality_score_val, score_components = self.quality_service.calculate_podcast_quality_score(profile)
-                
-                if quality_score_val is not None:
-                    # Use update_media_quality_score which also compiles episode summaries
-                    success = await media_queries.update_media_quality_score(media_id, quality_score_val)
-                    if success:
-                        logger.info(f"Updated quality score and compiled episode summaries for media_id: {media_id}")
-                    else:
-                        logger.error(f"Failed to update quality score for media_id: {media_id}")
-                else:
-                    logger.warning(f"Quality score calculation returned None for media_id: {media_id}")
-
-            except Exception as e:
-                logger.error(f"Error updating quality score for media_id {media_id}: {e}", exc_info=True)
-            await asyncio.sleep(0.2)
+        try:
+            updated = await self.update_quality_scores(inputs)
+            logger.info(f"Updated quality scores and compiled episode summaries for {updated} media.")
+        except Exception as e:
+            logger.error(f"Error updating quality scores for {len(inputs['media_id'])} media: {e}", exc_info=True)
         logger.info("Quality score update batch finished.")
 
+    async def recompute_all_quality_scores(self, page_size: int = QUALITY_SCORE_RECOMPUTE_PAGE_SIZE) -> int:
+        """
+        Re-scores every enriched media item, e.g. after QUALITY_CONFIG weights change.
+        Walks the catalogue in media_id order; episode summaries are left as they are.
+
+        Returns:
+            Number of media rows updated.
+        """
+        logger.info("Starting full quality score recompute...")
+        start_time = datetime.now(timezone.utc)
+        after_media_id, updated = 0, 0
+        while True:
+            inputs = await media_queries.get_quality_score_inputs_page(after_media_id, page_size)
+            if not inputs:
+                break
+            updated += await self.update_quality_scores(inputs, compile_episode_summaries=False)
+            after_media_id = inputs['media_id'][-1]
+            logger.info(f"Quality score recompute: {updated} media updated (through media_id {after_media_id})")
+        logger.info(f"Full quality score recompute finished: {updated} media in {datetime.now(timezone.utc) - start_time}")
+        return updated
+
     async def _manage_transcription_flags(self):
         """Identifies media that might need new episodes flagged for transcription."""
         logger.info("Checking for media items to flag new episodes for transcription...")
@@ -251,25 +240,12 @@ class EnrichmentOrchestrator:
             transcribed_count = await media_queries.count_transcribed_episodes_for_media(media_id)
             
             if transcribed_count >= ORCHESTRATOR_CONFIG["quality_score_min_transcribed_episodes"]:
-                try:
-                    # Clean the data before validation (same as in data_merger)
-                    cleaned_media_data = self._clean_media_data_for_validation(media_data_dict)
-                    profile_for_scoring = EnrichedPodcastProfile(**cleaned_media_data)
-                except Exception as val_err:
-                    logger.error(f"Could not construct EnrichedPodcastProfile for media_id {media_id} from DB data for quality scoring: {val_err}")
-                    return
-
-                quality_score_val, score_components = self.quality_service.calculate_podcast_quality_score(profile_for_scoring)
-                
-                if quality_score_val is not None:
-                    # Use update_media_quality_score which also compiles episode summaries
-                    success = await media_queries.update_media_quality_score(media_id, quality_score_val)
-                    if success:
-                        logger.info(f"Successfully updated quality score and compiled episode summaries for media_id: {media_id} to {quality_score_val}")
-                    else:
-                        logger.error(f"Failed to update quality score in DB for media_id: {media_id}")
+                # Scored from the stored row, so fields changed since media_data_dict was read count too
+                inputs = await media_queries.get_quality_score_inputs([media_id])
+                if await self.update_quality_scores(inputs):
+                    logger.info(f"Successfully updated quality score and compiled episode summaries for media_id: {media_id}")
                 else:
-                    logger.warning(f"Quality score calculation returned None for media_id: {media_id}")
+                    logger.error(f"Failed to update quality score in DB for media_id: {media_id}")
             else:
                 logger.info(f"Skipping quality score for media_id: {media_id}, transcribed episodes: {transcribed_count} (need {ORCHESTRATOR_CONFIG['quality_score_min_transcribed_episodes']}).")
         except Exception as e:
@@ -311,8 +287,10 @@ class EnrichmentOrchestrator:
         try:
             logger.info(f"Starting enrichment for media_id: {media_id}")
             
-            # Get current media data
-            media_data = await media_queries.get_media_by_id_from_db(media_id)
+            # Get current media data (batched with the other media of the run when in a loader scope)
+            media_loader = get_loaders().media()
+            media_data = await media_loader.load(media_id)
+            media_loader.clear(media_id)  # the row is rewritten below
             if not media_data:
                 logger.error(f"Media {media_id} not found")
                 return False
@@ -361,23 +339,7 @@ class EnrichmentOrchestrator:
                         logger.info(f"AI description generated for media_id: {media_id}")
             
             # 3. Update quality score and compile episode summaries
-            # Refetch media data to get latest updates
-            media_data = await media_queries.get_media_by_id_from_db(media_id)
-            transcribed_count = await media_queries.count_transcribed_episodes_for_media(media_id)
-            
-            if transcribed_count >= ORCHESTRATOR_CONFIG.get("quality_score_min_transcribed_episodes", 3):
-                try:
-                    # Clean data and calculate quality score
-                    cleaned_media_data = self._clean_media_data_for_validation(media_data)
-                    profile = EnrichedPodcastProfile(**cleaned_media_data)
-                    quality_score_val, _ = self.quality_service.calculate_podcast_quality_score(profile)
-                    
-                    if quality_score_val is not None:
-                        # Use update_media_quality_score which also compiles episode summaries
-                        await media_queries.update_media_quality_score(media_id, quality_score_val)
-                        logger.info(f"Quality score updated and episode summaries compiled for media_id: {media_id}")
-                except Exception as e:
-                    logger.error(f"Error updating quality score for media {media_id}: {e}")
+            await self._update_quality_score_for_media({"media_id": media_id})
             
             logger.info(f"Enrichment completed successfully for media_id: {media_id}")
             return True
@@ -439,7 +401,10 @@ if __name__ == '__main__':
             
             orchestrator = EnrichmentOrchestrator(enrichment_agent, quality_service, social_discovery_service)
             
-            await orchestrator.run_pipeline_once()
+            if "--recompute-quality-scores" in sys.argv:
+                await orchestrator.recompute_all_quality_scores()
+            else:
+                await orchestrator.run_pipeline_once()
             
         except ValueError as e:
             logger.error(f"Failed to initialize services for orchestrator: {e}", exc_info=True)
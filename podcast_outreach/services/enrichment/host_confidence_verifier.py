@@ -9,18 +9,47 @@ This service provides functionality to:
 """
 
 import logging
-import asyncio
+import json
+from functools import lru_cache
 from typing import Dict, List, Optional, Set, Tuple, Any
 from datetime import datetime, timezone, timedelta
 import re
 from difflib import SequenceMatcher
 
+from podcast_outreach.config import (
+    HOST_VERIFICATION_CHUNK_SIZE,
+    HOST_VERIFICATION_EPISODES_PER_MEDIA,
+    HOST_NAME_SIMILARITY_CACHE_SIZE
+)
 from podcast_outreach.database.queries import media as media_queries
-from podcast_outreach.database.queries import episodes as episode_queries
 from podcast_outreach.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+_TITLE_PATTERN = re.compile(r'^(dr\.?|mr\.?|mrs\.?|ms\.?|prof\.?|professor)\s+', re.IGNORECASE)
+
+@lru_cache(maxsize=HOST_NAME_SIMILARITY_CACHE_SIZE)
+def _name_similarity(name1: str, name2: str) -> float:
+    # Normalize names
+    name1 = name1.lower().strip()
+    name2 = name2.lower().strip()
+    
+    # Handle common variations
+    # Remove titles (Dr., Mr., Ms., etc.)
+    name1 = _TITLE_PATTERN.sub('', name1)
+    name2 = _TITLE_PATTERN.sub('', name2)
+    
+    # Check exact match after normalization
+    if name1 == name2:
+        return 1.0
+    
+    # Check if one name contains the other (e.g., "John Smith" vs "John")
+    if name1 in name2 or name2 in name1:
+        return 0.9
+    
+    # Use sequence matcher for fuzzy matching
+    return SequenceMatcher(None, name1, name2).ratio()
+
 class HostConfidenceVerifier:
     """
     Service for verifying and scoring confidence in discovered host names.
@@ -48,28 +77,10 @@ class HostConfidenceVerifier:
     def calculate_name_similarity(self, name1: str, name2: str) -> float:
         """
         Calculate similarity between two names using fuzzy matching.
-        Returns a score between 0.0 and 1.0.
+        Returns a score between 0.0 and 1.0. Results are cached, since the
+        same host names recur across a podcast's episodes and batches.
         """
-        # Normalize names
-        name1 = name1.lower().strip()
-        name2 = name2.lower().strip()
-        
-        # Handle common variations
-        # Remove titles (Dr., Mr., Ms., etc.)
-        title_pattern = r'^(dr\.?|mr\.?|mrs\.?|ms\.?|prof\.?|professor)\s+'
-        name1 = re.sub(title_pattern, '', name1, flags=re.IGNORECASE)
-        name2 = re.sub(title_pattern, '', name2, flags=re.IGNORECASE)
-        
-        # Check exact match after normalization
-        if name1 == name2:
-            return 1.0
-        
-        # Check if one name contains the other (e.g., "John Smith" vs "John")
-        if name1 in name2 or name2 in name1:
-            return 0.9
-        
-        # Use sequence matcher for fuzzy matching
-        return SequenceMatcher(None, name1, name2).ratio()
+        return _name_similarity(name1, name2)
     
     async def verify_host_names(self, media_id: int) -> Dict[str, Any]:
         """
@@ -85,134 +96,172 @@ class HostConfidenceVerifier:
         logger.info(f"Starting host name verification for media_id: {media_id}")
         
         try:
-            # Get current media data
-            media_data = await media_queries.get_media_by_id_from_db(media_id)
+            # Get current media data and its latest episodes' host names
+            inputs = await media_queries.get_host_verification_inputs(
+                [media_id], HOST_VERIFICATION_EPISODES_PER_MEDIA
+            )
+            media_data = inputs.get(media_id)
             if not media_data:
                 logger.error(f"Media {media_id} not found")
                 return {}
             
-            # Initialize tracking data
-            host_sources: Dict[str, Set[str]] = {}  # host_name -> set of sources
-            all_discovered_hosts: Set[str] = set()
-            discovery_sources: Set[str] = set()
+            result = self._compute_verification(media_data)
             
-            # 1. Check existing host_names field
-            current_hosts = media_data.get('host_names', [])
-            if current_hosts and isinstance(current_hosts, list):
-                for host in current_hosts:
+            # Update database with verification results
+            await self._update_host_verification_data(
+                media_id,
+                result["verified_hosts"],
+                result["discovery_sources"],
+                result["confidence_scores"]
+            )
+            
+            logger.info(f"Host verification completed for media {media_id}: {result['total_hosts_found']} hosts found")
+            return result
+            
+        except Exception as e:
+            logger.error(f"Error verifying host names for media {media_id}: {e}", exc_info=True)
+            return {}
+    
+    async def verify_host_names_batch(self, media_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """
+        Verify host names for many media at once: one load of their host
+        columns and latest episodes, confidences computed in memory, and one
+        bulk write of the results.
+        
+        Returns:
+            Dict mapping media_id to the same result verify_host_names returns.
+            Media that no longer exist are absent.
+        """
+        inputs = await media_queries.get_host_verification_inputs(
+            media_ids, HOST_VERIFICATION_EPISODES_PER_MEDIA
+        )
+        results = {media_id: self._compute_verification(media_data) for media_id, media_data in inputs.items()}
+        await media_queries.bulk_update_host_verification([
+            {
+                "media_id": media_id,
+                "host_names": [host['name'] for host in result["verified_hosts"]],
+                "discovery_sources": result["discovery_sources"],
+                "confidence_scores": result["confidence_scores"],
+            }
+            for media_id, result in results.items()
+        ])
+        return results
+    
+    def _compute_verification(self, media_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Cross-reference the host sources of one media row (with its 'episodes'
+        as loaded by get_host_verification_inputs) and score each host.
+        """
+        # Initialize tracking data
+        host_sources: Dict[str, Set[str]] = {}  # host_name -> set of sources
+        all_discovered_hosts: Set[str] = set()
+        discovery_sources: Set[str] = set()
+        
+        # 1. Check existing host_names field
+        existing_confidence = media_data.get('host_names_discovery_confidence') or {}
+        if isinstance(existing_confidence, str):
+            try:
+                existing_confidence = json.loads(existing_confidence)
+            except ValueError:
+                existing_confidence = {}
+        current_hosts = media_data.get('host_names', [])
+        if current_hosts and isinstance(current_hosts, list):
+            for host in current_hosts:
+                if host and isinstance(host, str):
+                    normalized_host = host.strip()
+                    all_discovered_hosts.add(normalized_host)
+                    if normalized_host not in host_sources:
+                        host_sources[normalized_host] = set()
+                    # Determine source based on existing confidence data
+                    if (existing_confidence.get(normalized_host) or 0) >= 0.9:
+                        host_sources[normalized_host].add("manual_entry")
+                    else:
+                        host_sources[normalized_host].add("llm_extraction")
+        
+        # 2. Check RSS owner name
+        rss_owner = media_data.get('rss_owner_name')
+        if rss_owner and isinstance(rss_owner, str):
+            normalized_owner = rss_owner.strip()
+            all_discovered_hosts.add(normalized_owner)
+            if normalized_owner not in host_sources:
+                host_sources[normalized_owner] = set()
+            host_sources[normalized_owner].add("rss_owner")
+            discovery_sources.add("rss_owner")
+        
+        # 3. Check episode transcripts and AI analysis
+        for episode in media_data.get('episodes', []):
+            # Check AI-analyzed host names
+            episode_hosts = episode.get('host_names', [])
+            if episode_hosts and isinstance(episode_hosts, list):
+                for host in episode_hosts:
                     if host and isinstance(host, str):
                         normalized_host = host.strip()
                         all_discovered_hosts.add(normalized_host)
                         if normalized_host not in host_sources:
                             host_sources[normalized_host] = set()
-                        # Determine source based on existing confidence data
-                        existing_confidence = media_data.get('host_names_discovery_confidence', {})
-                        if normalized_host in existing_confidence and existing_confidence[normalized_host] >= 0.9:
-                            host_sources[normalized_host].add("manual_entry")
+                        
+                        # Determine if from transcript or AI analysis
+                        if episode.get('has_transcript'):
+                            host_sources[normalized_host].add("episode_transcript")
+                            discovery_sources.add("episode_transcript")
                         else:
-                            host_sources[normalized_host].add("llm_extraction")
-            
-            # 2. Check RSS owner name
-            rss_owner = media_data.get('rss_owner_name')
-            if rss_owner and isinstance(rss_owner, str):
-                normalized_owner = rss_owner.strip()
-                all_discovered_hosts.add(normalized_owner)
-                if normalized_owner not in host_sources:
-                    host_sources[normalized_owner] = set()
-                host_sources[normalized_owner].add("rss_owner")
-                discovery_sources.add("rss_owner")
-            
-            # 3. Check episode transcripts and AI analysis
-            episodes = await episode_queries.get_episodes_for_media_paginated(media_id, offset=0, limit=10)
-            
-            for episode in episodes:
-                # Check AI-analyzed host names
-                episode_hosts = episode.get('host_names', [])
-                if episode_hosts and isinstance(episode_hosts, list):
-                    for host in episode_hosts:
-                        if host and isinstance(host, str):
-                            normalized_host = host.strip()
-                            all_discovered_hosts.add(normalized_host)
-                            if normalized_host not in host_sources:
-                                host_sources[normalized_host] = set()
-                            
-                            # Determine if from transcript or AI analysis
-                            if episode.get('transcript'):
-                                host_sources[normalized_host].add("episode_transcript")
-                                discovery_sources.add("episode_transcript")
-                            else:
-                                host_sources[normalized_host].add("ai_analysis")
-                                discovery_sources.add("ai_analysis")
-            
-            # 4. Extract from podcast description if available
-            description = media_data.get('description', '')
-            if description:
-                hosts_from_desc = self._extract_hosts_from_description(description)
-                for host in hosts_from_desc:
-                    all_discovered_hosts.add(host)
-                    if host not in host_sources:
-                        host_sources[host] = set()
-                    host_sources[host].add("podcast_description")
-                    discovery_sources.add("podcast_description")
-            
-            # 5. Consolidate similar names
-            consolidated_hosts = self._consolidate_similar_names(list(all_discovered_hosts))
-            
-            # 6. Calculate confidence scores
-            confidence_scores = {}
-            for host_group in consolidated_hosts:
-                # Use the most common variant as the canonical name
-                canonical_name = max(host_group, key=lambda x: len(host_sources.get(x, [])))
-                
-                # Combine sources from all variants
-                combined_sources = set()
-                for variant in host_group:
-                    combined_sources.update(host_sources.get(variant, set()))
-                
-                # Calculate weighted confidence score
-                confidence = self._calculate_confidence_score(combined_sources)
-                confidence_scores[canonical_name] = confidence
-            
-            # 7. Prepare results
-            verified_hosts = []
-            low_confidence_hosts = []
-            
-            for host, confidence in confidence_scores.items():
-                host_info = {
-                    "name": host,
-                    "confidence": confidence,
-                    "sources": list(host_sources.get(host, set()))
-                }
-                verified_hosts.append(host_info)
-                
-                if confidence < 0.7:
-                    low_confidence_hosts.append(host_info)
-            
-            # Sort by confidence
-            verified_hosts.sort(key=lambda x: x['confidence'], reverse=True)
+                            host_sources[normalized_host].add("ai_analysis")
+                            discovery_sources.add("ai_analysis")
+        
+        # 4. Extract from podcast description if available
+        description = media_data.get('description', '')
+        if description:
+            hosts_from_desc = self._extract_hosts_from_description(description)
+            for host in hosts_from_desc:
+                all_discovered_hosts.add(host)
+                if host not in host_sources:
+                    host_sources[host] = set()
+                host_sources[host].add("podcast_description")
+                discovery_sources.add("podcast_description")
+        
+        # 5. Consolidate similar names
+        consolidated_hosts = self._consolidate_similar_names(list(all_discovered_hosts))
+        
+        # 6. Calculate confidence scores
+        confidence_scores = {}
+        for host_group in consolidated_hosts:
+            # Use the most common variant as the canonical name
+            canonical_name = max(host_group, key=lambda x: len(host_sources.get(x, [])))
             
-            # 8. Update database with verification results
-            await self._update_host_verification_data(
-                media_id,
-                verified_hosts,
-                list(discovery_sources),
-                confidence_scores
-            )
+            # Combine sources from all variants
+            combined_sources = set()
+            for variant in host_group:
+                combined_sources.update(host_sources.get(variant, set()))
             
-            result = {
-                "verified_hosts": verified_hosts,
-                "discovery_sources": list(discovery_sources),
-                "low_confidence_hosts": low_confidence_hosts,
-                "confidence_scores": confidence_scores,
-                "total_hosts_found": len(verified_hosts)
+            # Calculate weighted confidence score
+            confidence = self._calculate_confidence_score(combined_sources)
+            confidence_scores[canonical_name] = confidence
+        
+        # 7. Prepare results
+        verified_hosts = []
+        low_confidence_hosts = []
+        
+        for host, confidence in confidence_scores.items():
+            host_info = {
+                "name": host,
+                "confidence": confidence,
+                "sources": list(host_sources.get(host, set()))
             }
+            verified_hosts.append(host_info)
             
-            logger.info(f"Host verification completed for media {media_id}: {len(verified_hosts)} hosts found")
-            return result
-            
-        except Exception as e:
-            logger.error(f"Error verifying host names for media {media_id}: {e}", exc_info=True)
-            return {}
+            if confidence < 0.7:
+                low_confidence_hosts.append(host_info)
+        
+        # Sort by confidence
+        verified_hosts.sort(key=lambda x: x['confidence'], reverse=True)
+        
+        return {
+            "verified_hosts": verified_hosts,
+            "discovery_sources": list(discovery_sources),
+            "low_confidence_hosts": low_confidence_hosts,
+            "confidence_scores": confidence_scores,
+            "total_hosts_found": len(verified_hosts)
+        }
     
     def _extract_hosts_from_description(self, description: str) -> List[str]:
         """
@@ -361,7 +410,8 @@ class HostConfidenceVerifier:
     
     async def run_verification_batch(self, batch_size: int = 20):
         """
-        Run host name verification for a batch of media items.
+        Run host name verification for a batch of media items, verifying
+        HOST_VERIFICATION_CHUNK_SIZE media per load/write round trip.
         """
         logger.info(f"Starting host verification batch (size: {batch_size})")
         
@@ -369,31 +419,30 @@ class HostConfidenceVerifier:
         
         if not media_ids:
             logger.info("No media items need host verification")
-            return
+            return []
         
         logger.info(f"Found {len(media_ids)} media items needing verification")
         
         results = []
-        for media_id in media_ids:
+        for start in range(0, len(media_ids), HOST_VERIFICATION_CHUNK_SIZE):
+            chunk = media_ids[start:start + HOST_VERIFICATION_CHUNK_SIZE]
             try:
-                result = await self.verify_host_names(media_id)
+                verified = await self.verify_host_names_batch(chunk)
+            except Exception as e:
+                logger.error(f"Error verifying {len(chunk)} media: {e}", exc_info=True)
+                results.extend({"media_id": media_id, "status": "error", "error": str(e)} for media_id in chunk)
+                continue
+            for media_id in chunk:
+                result = verified.get(media_id)
+                if result is None:
+                    results.append({"media_id": media_id, "status": "error", "error": "Media not found"})
+                    continue
                 results.append({
                     "media_id": media_id,
                     "status": "success",
                     "hosts_found": result.get("total_hosts_found", 0),
                     "low_confidence_count": len(result.get("low_confidence_hosts", []))
                 })
-                
-                # Small delay to avoid overwhelming the system
-                await asyncio.sleep(0.5)
-                
-            except Exception as e:
-                logger.error(f"Error verifying media {media_id}: {e}")
-                results.append({
-                    "media_id": media_id,
-                    "status": "error",
-                    "error": str(e)
-                })
         
         # Log summary
         successful = sum(1 for r in results if r["status"] == "success")
@@ -402,4 +451,4 @@ class HostConfidenceVerifier:
         logger.info(f"Host verification batch completed: {successful}/{len(results)} successful, "
                    f"{total_low_confidence} low-confidence hosts found")
         
-        return results
\ No newline at end of file
+        return results
@@ -2,8 +2,9 @@
 
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, Optional, Sequence, Tuple
 import statistics
+import numpy as np
 from dateutil import parser # For robust date parsing if needed
 
 # Corrected import path for EnrichedPodcastProfile
@@ -254,6 +255,97 @@ class QualityService:
         # The first element of the tuple is still the final score for convenience
         return final_quality_score, detailed_metrics
 
+    def score_batch(self, columns: Dict[str, Sequence[Any]]) -> Dict[str, np.ndarray]:
+        """Calculates quality scores for many podcasts at once with NumPy.
+
+        Applies the same rules as calculate_podcast_quality_score to columnar
+        inputs, as returned by media_queries.get_quality_score_inputs.
+
+        Args:
+            columns: Equal-length sequences (None for missing values) keyed
+                media_id, days_since_last, episode_span_days,
+                publishing_frequency_days, total_episodes, the audience
+                columns (listen_score, audience_size, itunes/spotify
+                rating average and count) and the social follower columns.
+
+        Returns:
+            Arrays keyed media_id, quality_score (0-100) and
+            quality_score_recency/frequency/audience/social (0-1).
+        """
+        def column(name: str) -> np.ndarray:
+            # None becomes NaN, which every rule below treats as missing
+            return np.array(columns[name], dtype=float)
+
+        def normalize(values: np.ndarray, max_value: float) -> np.ndarray:
+            return np.nan_to_num(np.clip(values, 0.0, max_value) / max_value)
+
+        # Recency
+        days = column("days_since_last")
+        ideal, good, stale = (QUALITY_CONFIG["recency_max_days_ideal"], QUALITY_CONFIG["recency_max_days_good"],
+                              QUALITY_CONFIG["recency_max_days_stale"])
+        recency = np.select(
+            [days <= ideal, days <= good, days <= stale],
+            [1.0,
+             np.maximum(0.5, 1.0 - 0.5 * ((days - ideal) / (good - ideal))),
+             np.maximum(0.1, 0.5 - 0.4 * ((days - good) / (stale - good)))],
+            default=0.0
+        )
+
+        # Frequency: the stored value, else the average gap between first and latest episode
+        frequency_days = column("publishing_frequency_days")
+        total_episodes = column("total_episodes")
+        span_days = column("episode_span_days")
+        derivable = (np.isnan(frequency_days) & (total_episodes >= QUALITY_CONFIG["frequency_min_episodes_for_calc"])
+                     & (span_days > 0))
+        frequency_days = np.divide(span_days, total_episodes - 1, out=frequency_days, where=derivable)
+        ideal, good = QUALITY_CONFIG["frequency_ideal_days"], QUALITY_CONFIG["frequency_good_days"]
+        stale = good * 2.5
+        frequency = np.select(
+            [frequency_days <= ideal, frequency_days <= good, frequency_days > good],
+            [1.0,
+             np.maximum(0.5, 1.0 - 0.5 * ((frequency_days - ideal) / (good - ideal))),
+             np.maximum(0.0, 0.5 * (1 - ((frequency_days - good) / (stale - good))))],
+            default=0.0
+        )
+
+        # Audience
+        cfg = QUALITY_CONFIG["audience_metrics"]
+        audience = (
+            normalize(column("listen_score"), cfg["listen_score_norm_max"]) * cfg["listen_score_weight"] +
+            normalize(column("audience_size"), cfg["audience_size_norm_high"]) * cfg["audience_size_weight"]
+        )
+        for platform in ("itunes", "spotify"):
+            rating_avg = column(f"{platform}_rating_average")
+            rating_count = column(f"{platform}_rating_count")
+            rated = ~np.isnan(rating_avg) & ~np.isnan(rating_count)
+            platform_score = (normalize(rating_avg, 5.0) * 0.7 +
+                              normalize(rating_count, cfg["rating_count_norm_high"]) * 0.3)
+            audience += np.where(rated, platform_score, 0.0) * cfg[f"{platform}_rating_weight"]
+        audience = np.clip(audience, 0.0, 1.0)
+
+        # Social
+        cfg = QUALITY_CONFIG["social_metrics"]
+        total_followers = sum(
+            np.nan_to_num(column(name))
+            for name in ("twitter_followers", "instagram_followers", "youtube_subscribers",
+                         "tiktok_followers", "facebook_likes")
+        )
+        social = np.where(total_followers < cfg["min_followers_for_score"], 0.0,
+                          normalize(total_followers, cfg["total_followers_norm_high"]))
+
+        weights = QUALITY_CONFIG["weights"]
+        overall = (recency * weights["recency_score"] + frequency * weights["frequency_score"] +
+                   audience * weights["audience_score"] + social * weights["social_score"])
+
+        return {
+            "media_id": np.array(columns["media_id"], dtype=np.int64),
+            "quality_score": np.clip(overall * 100, 0.0, 100.0),
+            "quality_score_recency": recency,
+            "quality_score_frequency": frequency,
+            "quality_score_audience": audience,
+            "quality_score_social": social,
+        }
+
 # Example Usage (for direct testing of this service module)
 if __name__ == '__main__':
     # Import EnrichedPodcastProfile for testing purposes
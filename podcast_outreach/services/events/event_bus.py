@@ -168,11 +168,10 @@ async def handle_media_created(event: Event):
         
         # Trigger enrichment for new media
         from podcast_outreach.services.tasks.manager import task_manager
-        import time
         
-        task_id = f"event_enrichment_{media_id}_{int(time.time())}"
-        task_manager.start_task(task_id, f"event_driven_enrichment_media_{media_id}")
-        task_manager.run_enrichment_pipeline(task_id, media_id=media_id)
+        task_id = task_manager.new_task_id(f"event_enrichment_{media_id}")
+        await task_manager.submit(task_id, f"event_driven_enrichment_media_{media_id}",
+                                  "run_enrichment_pipeline", media_id=media_id)
         
         logger.info(f"Triggered enrichment for new media_id: {media_id}")
         
@@ -226,11 +225,6 @@ async def handle_episode_transcribed(event: Event):
         
         # Trigger match creation for campaigns
         if media_id:
-            from podcast_outreach.services.tasks.manager import task_manager
-            import time
-            
-            task_id = f"event_match_creation_{media_id}_{int(time.time())}"
-            task_manager.start_task(task_id, f"event_driven_match_creation_media_{media_id}")
             # This would need a new method in TaskManager for media-specific match creation
             logger.info(f"Would trigger match creation for media_id: {media_id} after episode transcription")
         
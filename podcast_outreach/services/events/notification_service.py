@@ -3,6 +3,7 @@
 import asyncio
 import json
 import logging
+from collections import deque
 from typing import Dict, List, Set, Optional, Any
 from datetime import datetime
 from dataclasses import dataclass, asdict
@@ -10,6 +11,7 @@ from fastapi import WebSocket
 import uuid
 
 from .event_bus import Event, EventType, get_event_bus
+from podcast_outreach.config import NOTIFICATION_SEND_QUEUE_SIZE, NOTIFICATION_SEND_TIMEOUT, NOTIFICATION_PG_CHANNEL
 
 logger = logging.getLogger(__name__)
 
@@ -30,30 +32,144 @@ class NotificationData:
         result = asdict(self)
         result['timestamp'] = self.timestamp.isoformat()
         return result
+    
+    @classmethod
+    def from_dict(cls, payload: Dict[str, Any]) -> "NotificationData":
+        """Rebuild a notification serialized with to_dict"""
+        values = dict(payload)
+        values['timestamp'] = datetime.fromisoformat(values['timestamp'])
+        return cls(**values)
+
+# Notification types that only carry "latest state" and can be coalesced/dropped under load
+COALESCIBLE_NOTIFICATION_TYPES = {
+    "discovery_progress",
+    "pipeline_progress",
+    "client.enrichment.progress",
+}
+
+class ConnectionSender:
+    """
+    Owns a single WebSocket and delivers queued messages to it from a dedicated task.
+    
+    Producers never await the socket: they enqueue and return. When the queue is full,
+    pending progress messages are dropped first; otherwise the oldest message is dropped.
+    Progress messages with the same coalesce key replace each other while still pending.
+    """
+    
+    def __init__(self, websocket: WebSocket, user_id: str, max_queue_size: int, send_timeout: float):
+        self.websocket = websocket
+        self.user_id = user_id
+        self.max_queue_size = max_queue_size
+        self.send_timeout = send_timeout
+        # Pending entries: [coalesce_key or None, serialized message]
+        self._pending: deque = deque()
+        self._coalesced: Dict[str, List[Any]] = {}
+        self._wakeup = asyncio.Event()
+        self._closed = False
+        self._task: Optional[asyncio.Task] = None
+        self.dropped_count = 0
+    
+    def start(self, on_failure):
+        """Start the writer task; on_failure is awaited if the socket stops accepting messages"""
+        self._task = asyncio.create_task(self._writer_loop(on_failure))
+    
+    def enqueue(self, message: str, coalesce_key: Optional[str] = None):
+        """Queue a serialized message without blocking"""
+        if self._closed:
+            return
+        
+        if coalesce_key is not None and coalesce_key in self._coalesced:
+            # Replace the pending progress message in place, keeping its queue position
+            self._coalesced[coalesce_key][1] = message
+            return
+        
+        if len(self._pending) >= self.max_queue_size:
+            self._drop_one()
+        
+        entry = [coalesce_key, message]
+        self._pending.append(entry)
+        if coalesce_key is not None:
+            self._coalesced[coalesce_key] = entry
+        self._wakeup.set()
+    
+    def _drop_one(self):
+        """Make room in a full queue, preferring to drop coalescible progress messages"""
+        victim = None
+        for entry in self._pending:
+            if entry[0] is not None:
+                victim = entry
+                break
+        if victim is None:
+            victim = self._pending[0]
+        self._pending.remove(victim)
+        if victim[0] is not None:
+            self._coalesced.pop(victim[0], None)
+        self.dropped_count += 1
+        if self.dropped_count % 50 == 1:
+            logger.warning(f"Send queue full for user {self.user_id}; dropped {self.dropped_count} notifications so far")
+    
+    async def _writer_loop(self, on_failure):
+        try:
+            while not self._closed:
+                if not self._pending:
+                    self._wakeup.clear()
+                    await self._wakeup.wait()
+                    continue
+                
+                coalesce_key, message = self._pending.popleft()
+                if coalesce_key is not None:
+                    self._coalesced.pop(coalesce_key, None)
+                
+                try:
+                    await asyncio.wait_for(self.websocket.send_text(message), timeout=self.send_timeout)
+                except Exception as e:
+                    logger.warning(f"Failed to send notification to user {self.user_id}: {e}")
+                    self._closed = True
+                    await on_failure(self)
+                    return
+        except asyncio.CancelledError:
+            pass
+    
+    async def close(self):
+        """Stop the writer task and discard pending messages"""
+        self._closed = True
+        self._pending.clear()
+        self._coalesced.clear()
+        self._wakeup.set()
+        if self._task and self._task is not asyncio.current_task():
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
 
 class WebSocketManager:
     """Manages WebSocket connections and notification broadcasting"""
     
-    def __init__(self):
-        # Active connections grouped by user/campaign
-        self.connections: Dict[str, Set[WebSocket]] = {}
+    def __init__(self, max_queue_size: int = NOTIFICATION_SEND_QUEUE_SIZE, send_timeout: float = NOTIFICATION_SEND_TIMEOUT):
+        # Active connections grouped by user
+        self.connections: Dict[str, Dict[WebSocket, ConnectionSender]] = {}
         # Campaign subscriptions: user_id -> set of campaign_ids
         self.campaign_subscriptions: Dict[str, Set[str]] = {}
+        # Reverse index: campaign_id -> set of subscribed user_ids
+        self.campaign_subscribers: Dict[str, Set[str]] = {}
+        self.max_queue_size = max_queue_size
+        self.send_timeout = send_timeout
+        # Optional cross-process bridge (see pg_notify_bridge.py)
+        self.bridge = None
         logger.info("WebSocketManager initialized")
     
     async def connect(self, websocket: WebSocket, user_id: str, campaign_id: Optional[str] = None):
         """Connect a WebSocket for a user and optionally subscribe to campaign updates"""
         await websocket.accept()
         
-        if user_id not in self.connections:
-            self.connections[user_id] = set()
-        self.connections[user_id].add(websocket)
+        sender = ConnectionSender(websocket, user_id, self.max_queue_size, self.send_timeout)
+        self.connections.setdefault(user_id, {})[websocket] = sender
+        sender.start(self._handle_send_failure)
         
         # Subscribe to campaign updates if specified
         if campaign_id:
-            if user_id not in self.campaign_subscriptions:
-                self.campaign_subscriptions[user_id] = set()
-            self.campaign_subscriptions[user_id].add(campaign_id)
+            self.subscribe(user_id, campaign_id)
         
         logger.info(f"WebSocket connected for user {user_id}, campaign: {campaign_id}")
         
@@ -67,47 +183,98 @@ class WebSocketManager:
             timestamp=datetime.utcnow()
         ))
     
+    def subscribe(self, user_id: str, campaign_id: str):
+        """Subscribe a connected user to campaign updates"""
+        self.campaign_subscriptions.setdefault(user_id, set()).add(campaign_id)
+        self.campaign_subscribers.setdefault(campaign_id, set()).add(user_id)
+    
+    def _unsubscribe_all(self, user_id: str):
+        """Remove every campaign subscription for a user from both indexes"""
+        for campaign_id in self.campaign_subscriptions.pop(user_id, set()):
+            subscribers = self.campaign_subscribers.get(campaign_id)
+            if subscribers is not None:
+                subscribers.discard(user_id)
+                if not subscribers:
+                    del self.campaign_subscribers[campaign_id]
+    
     async def disconnect(self, websocket: WebSocket, user_id: str):
         """Disconnect a WebSocket"""
-        if user_id in self.connections:
-            self.connections[user_id].discard(websocket)
-            if not self.connections[user_id]:
+        user_connections = self.connections.get(user_id)
+        if user_connections is not None:
+            sender = user_connections.pop(websocket, None)
+            if sender:
+                await sender.close()
+            if not user_connections:
                 del self.connections[user_id]
                 # Clean up campaign subscriptions if no connections
-                if user_id in self.campaign_subscriptions:
-                    del self.campaign_subscriptions[user_id]
+                self._unsubscribe_all(user_id)
         
         logger.info(f"WebSocket disconnected for user {user_id}")
     
+    async def _handle_send_failure(self, sender: ConnectionSender):
+        """Called from a writer task when its socket fails or times out"""
+        await self.disconnect(sender.websocket, sender.user_id)
+    
+    async def send_to_socket(self, websocket: WebSocket, user_id: str, payload: Dict[str, Any]):
+        """Queue a protocol message (pong, confirmations) for one specific socket"""
+        sender = self.connections.get(user_id, {}).get(websocket)
+        if sender:
+            sender.enqueue(json.dumps(payload))
+    
+    @staticmethod
+    def _coalesce_key(notification: NotificationData) -> Optional[str]:
+        if notification.type in COALESCIBLE_NOTIFICATION_TYPES:
+            return f"{notification.type}:{notification.campaign_id}"
+        return None
+    
+    def _enqueue_for_user(self, user_id: str, message: str, coalesce_key: Optional[str]):
+        for sender in list(self.connections.get(user_id, {}).values()):
+            sender.enqueue(message, coalesce_key)
+    
     async def send_to_user(self, user_id: str, notification: NotificationData):
         """Send notification to all connections for a specific user"""
-        if user_id not in self.connections:
+        if self.bridge is not None and self.bridge.active:
+            await self.bridge.publish("user", user_id, notification)
             return
-        
-        message = json.dumps(notification.to_dict())
-        disconnected = set()
-        
-        for websocket in self.connections[user_id]:
-            try:
-                await websocket.send_text(message)
-            except Exception as e:
-                logger.warning(f"Failed to send notification to user {user_id}: {e}")
-                disconnected.add(websocket)
-        
-        # Clean up disconnected sockets
-        for ws in disconnected:
-            self.connections[user_id].discard(ws)
+        self.deliver_to_user(user_id, notification)
     
     async def send_to_campaign_subscribers(self, campaign_id: str, notification: NotificationData):
         """Send notification to all users subscribed to a campaign"""
-        for user_id, subscriptions in self.campaign_subscriptions.items():
-            if campaign_id in subscriptions:
-                await self.send_to_user(user_id, notification)
+        if self.bridge is not None and self.bridge.active:
+            await self.bridge.publish("campaign", campaign_id, notification)
+            return
+        self.deliver_to_campaign(campaign_id, notification)
     
     async def broadcast_to_all(self, notification: NotificationData):
         """Send notification to all connected users"""
-        for user_id in self.connections.keys():
-            await self.send_to_user(user_id, notification)
+        if self.bridge is not None and self.bridge.active:
+            await self.bridge.publish("all", None, notification)
+            return
+        self.deliver_to_all(notification)
+    
+    def deliver_to_user(self, user_id: str, notification: NotificationData):
+        """Queue a notification for a user's sockets held by this process"""
+        if user_id not in self.connections:
+            return
+        self._enqueue_for_user(user_id, json.dumps(notification.to_dict()), self._coalesce_key(notification))
+    
+    def deliver_to_campaign(self, campaign_id: str, notification: NotificationData):
+        """Queue a notification for campaign subscribers connected to this process"""
+        subscribers = self.campaign_subscribers.get(campaign_id)
+        if not subscribers:
+            return
+        # Serialize once for every recipient
+        message = json.dumps(notification.to_dict())
+        coalesce_key = self._coalesce_key(notification)
+        for user_id in list(subscribers):
+            self._enqueue_for_user(user_id, message, coalesce_key)
+    
+    def deliver_to_all(self, notification: NotificationData):
+        """Queue a notification for every socket held by this process"""
+        message = json.dumps(notification.to_dict())
+        coalesce_key = self._coalesce_key(notification)
+        for user_id in list(self.connections.keys()):
+            self._enqueue_for_user(user_id, message, coalesce_key)
 
 class NotificationService:
     """Service for creating and sending notifications based on system events"""
@@ -118,6 +285,18 @@ class NotificationService:
         self._setup_event_handlers()
         logger.info("NotificationService initialized")
     
+    async def start_bridge(self, listen: bool = True):
+        """Route notifications through Postgres LISTEN/NOTIFY so any process can reach any socket"""
+        from .pg_notify_bridge import PgNotifyBridge
+        if self.websocket_manager.bridge is None:
+            self.websocket_manager.bridge = PgNotifyBridge(self.websocket_manager, NOTIFICATION_PG_CHANNEL)
+        await self.websocket_manager.bridge.start(listen=listen)
+    
+    async def stop_bridge(self):
+        """Stop cross-process delivery and fall back to in-process sockets only"""
+        if self.websocket_manager.bridge is not None:
+            await self.websocket_manager.bridge.stop()
+    
     def _setup_event_handlers(self):
         """Subscribe to relevant events from the event bus"""
         # Discovery and pipeline events
@@ -0,0 +1,140 @@
+# podcast_outreach/services/events/pg_notify_bridge.py
+
+import asyncio
+import json
+import logging
+from typing import Any, Dict, Optional
+
+import asyncpg
+
+from podcast_outreach.database.connection import get_db_pool, create_dedicated_connection
+
+logger = logging.getLogger(__name__)
+
+# Postgres rejects NOTIFY payloads of 8000 bytes or more
+MAX_NOTIFY_PAYLOAD_BYTES = 7900
+
+class PgNotifyBridge:
+    """
+    Relays notifications between processes through Postgres LISTEN/NOTIFY.
+
+    Every process that holds WebSockets listens on the channel and delivers
+    incoming notifications to its local sockets. Any process (web or background
+    worker) can publish; the publishing process receives its own NOTIFY too, so
+    delivery happens exactly once per listening process.
+    """
+
+    def __init__(self, websocket_manager, channel: str, reconnect_delay: float = 5.0):
+        self.websocket_manager = websocket_manager
+        self.channel = channel
+        self.reconnect_delay = reconnect_delay
+        self.active = False
+        self._listen_conn: Optional[asyncpg.Connection] = None
+        self._supervisor_task: Optional[asyncio.Task] = None
+        self._stopping = False
+
+    async def start(self, listen: bool = True):
+        """
+        Enable cross-process delivery.
+
+        Args:
+            listen: Whether this process holds sockets and should consume notifications.
+                    Background-only processes publish without listening.
+        """
+        self._stopping = False
+        if listen:
+            try:
+                await self._connect_listener()
+            except Exception as e:
+                logger.error(f"Could not start notification listener on '{self.channel}', using local delivery: {e}")
+                return
+            self._supervisor_task = asyncio.create_task(self._supervise())
+        self.active = True
+        logger.info(f"Postgres notification bridge active on channel '{self.channel}' (listen={listen})")
+
+    async def stop(self):
+        """Stop listening and fall back to in-process delivery"""
+        self._stopping = True
+        self.active = False
+        if self._supervisor_task:
+            self._supervisor_task.cancel()
+            try:
+                await self._supervisor_task
+            except asyncio.CancelledError:
+                pass
+            self._supervisor_task = None
+        await self._close_listener()
+        logger.info("Postgres notification bridge stopped")
+
+    async def publish(self, scope: str, target: Optional[str], notification) -> None:
+        """
+        Publish a notification to every listening process.
+
+        Args:
+            scope: "user", "campaign" or "all"
+            target: user_id or campaign_id for the given scope
+            notification: NotificationData to deliver
+        """
+        payload = json.dumps({
+            "scope": scope,
+            "target": target,
+            "notification": notification.to_dict()
+        })
+
+        if len(payload.encode("utf-8")) > MAX_NOTIFY_PAYLOAD_BYTES:
+            logger.warning(f"Notification {notification.id} exceeds NOTIFY payload limit, delivering locally only")
+            self._deliver_locally(scope, target, notification)
+            return
+
+        try:
+            pool = await get_db_pool()
+            async with pool.acquire() as conn:
+                await conn.execute("SELECT pg_notify($1, $2)", self.channel, payload)
+        except Exception as e:
+            logger.error(f"Failed to publish notification {notification.id} via NOTIFY, delivering locally: {e}")
+            self._deliver_locally(scope, target, notification)
+
+    def _deliver_locally(self, scope: str, target: Optional[str], notification) -> None:
+        if scope == "user":
+            self.websocket_manager.deliver_to_user(target, notification)
+        elif scope == "campaign":
+            self.websocket_manager.deliver_to_campaign(target, notification)
+        else:
+            self.websocket_manager.deliver_to_all(notification)
+
+    def _on_notify(self, connection, pid: int, channel: str, payload: str) -> None:
+        """asyncpg listener callback, runs on the event loop"""
+        from .notification_service import NotificationData
+        try:
+            message: Dict[str, Any] = json.loads(payload)
+            notification = NotificationData.from_dict(message["notification"])
+            self._deliver_locally(message.get("scope"), message.get("target"), notification)
+        except Exception as e:
+            logger.error(f"Discarding malformed notification payload on '{channel}': {e}")
+
+    async def _connect_listener(self):
+        self._listen_conn = await create_dedicated_connection()
+        await self._listen_conn.add_listener(self.channel, self._on_notify)
+
+    async def _close_listener(self):
+        if self._listen_conn is not None and not self._listen_conn.is_closed():
+            try:
+                await self._listen_conn.remove_listener(self.channel, self._on_notify)
+                await self._listen_conn.close()
+            except Exception as e:
+                logger.warning(f"Error closing notification listener connection: {e}")
+        self._listen_conn = None
+
+    async def _supervise(self):
+        """Reconnect the listener if its connection drops"""
+        while not self._stopping:
+            await asyncio.sleep(self.reconnect_delay)
+            if self._listen_conn is not None and not self._listen_conn.is_closed():
+                continue
+            logger.warning(f"Notification listener connection lost, reconnecting to '{self.channel}'")
+            try:
+                await self._close_listener()
+                await self._connect_listener()
+                logger.info("Notification listener reconnected")
+            except Exception as e:
+                logger.error(f"Notification listener reconnect failed: {e}")
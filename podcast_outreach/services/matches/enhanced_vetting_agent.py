@@ -7,8 +7,8 @@ from datetime import datetime, timezone
 from pydantic import BaseModel, Field
 
 from podcast_outreach.services.ai.gemini_client import GeminiService
-from podcast_outreach.database.queries import media as media_queries
 from podcast_outreach.database.queries import episodes as episode_queries
+from podcast_outreach.database.loaders import get_loaders
 
 logger = logging.getLogger(__name__)
 
@@ -189,7 +189,7 @@ class EnhancedVettingAgent:
 
     async def _gather_enhanced_podcast_evidence(self, media_id: int) -> str:
         """Gather comprehensive podcast data including episode themes and guest patterns."""
-        media_record = await media_queries.get_media_by_id_from_db(media_id)
+        media_record = await get_loaders().media().load(media_id)
         if not media_record:
             return "No media data available."
 
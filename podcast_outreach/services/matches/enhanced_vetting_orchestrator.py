@@ -2,14 +2,14 @@
 
 import logging
 import asyncio
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from datetime import datetime, timezone
 
 from podcast_outreach.database.queries import campaign_media_discoveries as cmd_queries
-from podcast_outreach.database.queries import campaigns as campaign_queries
 from podcast_outreach.database.queries import media as media_queries
 from podcast_outreach.database.queries import match_suggestions as match_queries
 from podcast_outreach.database.queries import review_tasks as review_task_queries
+from podcast_outreach.database.loaders import get_loaders, run_in_loader_scope
 from .enhanced_vetting_agent import EnhancedVettingAgent
 from .episode_matcher import EpisodeMatcher
 
@@ -22,11 +22,15 @@ class EnhancedVettingOrchestrator:
     are ready for vetting (enrichment completed).
     """
 
+    # Vetting score from which a match suggestion is created
+    MATCH_SCORE_THRESHOLD = 50
+
     def __init__(self):
         self.vetting_agent = EnhancedVettingAgent()
         self.episode_matcher = EpisodeMatcher()
         logger.info("EnhancedVettingOrchestrator initialized.")
 
+    @run_in_loader_scope
     async def run_vetting_pipeline(self, batch_size: int = 10):
         """
         Process discoveries that are ready for vetting.
@@ -53,6 +57,11 @@ class EnhancedVettingOrchestrator:
         
         logger.info(f"Found {len(discoveries_to_vet)} discoveries to vet.")
         
+        # One query each for the campaigns and media of the whole batch
+        loaders = get_loaders()
+        await loaders.campaigns().load_many({d['campaign_id'] for d in discoveries_to_vet})
+        await loaders.media().load_many({d['media_id'] for d in discoveries_to_vet})
+        
         processed = 0
         successful = 0
         
@@ -64,92 +73,18 @@ class EnhancedVettingOrchestrator:
             logger.info(f"Vetting discovery_id: {discovery_id} (campaign: {campaign_id}, media: {media_id})")
             
             try:
-                # Update vetting status to in_progress (not enrichment!)
-                # This was a bug - we were updating enrichment_status instead of vetting_status
-                await cmd_queries.update_vetting_status(discovery_id, "in_progress")
-                
-                # Get full campaign data including questionnaire responses
-                campaign_data = await campaign_queries.get_campaign_by_id(campaign_id)
-                if not campaign_data:
-                    logger.error(f"Could not find campaign {campaign_id}. Skipping.")
-                    await self._mark_vetting_failed(
-                        discovery_id, 
-                        "Campaign data not found"
-                    )
-                    continue
-                
-                # Ensure we have ideal_podcast_description
-                if not campaign_data.get('ideal_podcast_description'):
-                    logger.error(f"Campaign {campaign_id} missing ideal_podcast_description. Skipping.")
-                    await self._mark_vetting_failed(
-                        discovery_id,
-                        "Campaign missing ideal_podcast_description"
-                    )
-                    continue
-                
-                # Run the vetting agent
-                vetting_results = await self.vetting_agent.vet_match(campaign_data, media_id)
-                
+                vetting_results = await self.vet_discovery(discovery)
                 if vetting_results:
-                    # Update discovery with vetting results
-                    # Store ALL vetting data in vetting_criteria_met for backward compatibility
-                    vetting_criteria_met = {
-                        'vetting_checklist': vetting_results.get('vetting_checklist', {}),
-                        'topic_match_analysis': vetting_results.get('topic_match_analysis', ''),
-                        'vetting_criteria_scores': vetting_results.get('vetting_criteria_scores', []),
-                        'client_expertise_matched': vetting_results.get('client_expertise_matched', [])
-                    }
-                    
-                    # Check if we have the enhanced columns available
-                    try:
-                        # Try to use the enhanced function first
-                        await cmd_queries.update_vetting_results_enhanced(
-                            discovery_id,
-                            vetting_results['vetting_score'],
-                            vetting_results.get('vetting_reasoning', ''),
-                            vetting_criteria_met,
-                            vetting_results.get('topic_match_analysis', ''),
-                            vetting_results.get('vetting_criteria_scores', []),
-                            vetting_results.get('client_expertise_matched', []),
-                            'completed'
-                        )
-                    except Exception as e:
-                        # Fall back to regular function if enhanced columns don't exist
-                        logger.warning(f"Enhanced vetting update failed, falling back to regular update: {e}")
-                        await cmd_queries.update_vetting_results(
-                            discovery_id,
-                            vetting_results['vetting_score'],
-                            vetting_results.get('vetting_reasoning', ''),
-                            vetting_criteria_met,
-                            'completed'
-                        )
-                    
-                    logger.info(
-                        f"Successfully vetted discovery {discovery_id}. "
-                        f"Score: {vetting_results['vetting_score']}"
-                    )
-                    
                     successful += 1
                     
                     # If score is high enough, automatically create match suggestion
-                    if vetting_results['vetting_score'] >= 50:
+                    if vetting_results['vetting_score'] >= self.MATCH_SCORE_THRESHOLD:
                         match_created = await self._create_match_suggestion(
                             discovery, 
                             vetting_results
                         )
                         if match_created:
                             logger.info(f"Match suggestion created for discovery {discovery_id}")
-                        
-                    # Publish vetting completed event
-                    await self._publish_vetting_event(discovery, vetting_results)
-                    
-                else:
-                    # Vetting failed to produce results
-                    await self._mark_vetting_failed(
-                        discovery_id,
-                        "Vetting agent failed to produce results"
-                    )
-                    logger.error(f"Vetting failed for discovery {discovery_id}")
                 
             except Exception as e:
                 logger.error(f"Error vetting discovery {discovery_id}: {e}", exc_info=True)
@@ -169,6 +104,93 @@ class EnhancedVettingOrchestrator:
             f"Processed: {processed}, Successful: {successful}"
         )
     
+    async def vet_discovery(self, discovery: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Vet one discovery and store the results on it. Match creation is left to
+        the caller. Returns the vetting results, or None if vetting could not
+        run or produced nothing (the discovery is marked failed then).
+        """
+        discovery_id = discovery['id']
+        campaign_id = discovery['campaign_id']
+        media_id = discovery['media_id']
+        
+        # Update vetting status to in_progress (not enrichment!)
+        # This was a bug - we were updating enrichment_status instead of vetting_status
+        await cmd_queries.update_vetting_status(discovery_id, "in_progress")
+        
+        # Get full campaign data including questionnaire responses
+        campaign_data = await get_loaders().campaigns().load(campaign_id)
+        if not campaign_data:
+            logger.error(f"Could not find campaign {campaign_id}. Skipping.")
+            await self._mark_vetting_failed(
+                discovery_id, 
+                "Campaign data not found"
+            )
+            return None
+        
+        # Ensure we have ideal_podcast_description
+        if not campaign_data.get('ideal_podcast_description'):
+            logger.error(f"Campaign {campaign_id} missing ideal_podcast_description. Skipping.")
+            await self._mark_vetting_failed(
+                discovery_id,
+                "Campaign missing ideal_podcast_description"
+            )
+            return None
+        
+        # Run the vetting agent
+        vetting_results = await self.vetting_agent.vet_match(campaign_data, media_id)
+        
+        if not vetting_results:
+            # Vetting failed to produce results
+            await self._mark_vetting_failed(
+                discovery_id,
+                "Vetting agent failed to produce results"
+            )
+            logger.error(f"Vetting failed for discovery {discovery_id}")
+            return None
+        
+        # Update discovery with vetting results
+        # Store ALL vetting data in vetting_criteria_met for backward compatibility
+        vetting_criteria_met = {
+            'vetting_checklist': vetting_results.get('vetting_checklist', {}),
+            'topic_match_analysis': vetting_results.get('topic_match_analysis', ''),
+            'vetting_criteria_scores': vetting_results.get('vetting_criteria_scores', []),
+            'client_expertise_matched': vetting_results.get('client_expertise_matched', [])
+        }
+        
+        # Check if we have the enhanced columns available
+        try:
+            # Try to use the enhanced function first
+            await cmd_queries.update_vetting_results_enhanced(
+                discovery_id,
+                vetting_results['vetting_score'],
+                vetting_results.get('vetting_reasoning', ''),
+                vetting_criteria_met,
+                vetting_results.get('topic_match_analysis', ''),
+                vetting_results.get('vetting_criteria_scores', []),
+                vetting_results.get('client_expertise_matched', []),
+                'completed'
+            )
+        except Exception as e:
+            # Fall back to regular function if enhanced columns don't exist
+            logger.warning(f"Enhanced vetting update failed, falling back to regular update: {e}")
+            await cmd_queries.update_vetting_results(
+                discovery_id,
+                vetting_results['vetting_score'],
+                vetting_results.get('vetting_reasoning', ''),
+                vetting_criteria_met,
+                'completed'
+            )
+        
+        logger.info(
+            f"Successfully vetted discovery {discovery_id}. "
+            f"Score: {vetting_results['vetting_score']}"
+        )
+        
+        # Publish vetting completed event
+        await self._publish_vetting_event(discovery, vetting_results)
+        return vetting_results
+    
     async def _mark_vetting_failed(self, discovery_id: int, error_message: str):
         """Mark a discovery as having failed vetting."""
         await cmd_queries.update_vetting_results(
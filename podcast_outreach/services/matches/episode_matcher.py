@@ -6,6 +6,7 @@ import numpy as np
 
 from podcast_outreach.database.queries import episodes as episode_queries
 from podcast_outreach.database.queries import campaigns as campaign_queries
+from podcast_outreach.database.queries import projections
 
 logger = logging.getLogger(__name__)
 
@@ -26,7 +27,7 @@ class EpisodeMatcher:
         """
         try:
             # Get campaign embedding
-            campaign = await campaign_queries.get_campaign_by_id(campaign_id)
+            campaign = await campaign_queries.get_campaign_by_id(campaign_id, profile=projections.WITH_EMBEDDING)
             if not campaign:
                 logger.warning(f"Campaign {campaign_id} not found")
                 return None
@@ -2,8 +2,6 @@
 import asyncio
 import logging
 import uuid
-import json
-import re
 from typing import Dict, Any, Optional, List, Tuple
 import numpy as np
 from datetime import timezone, datetime
@@ -12,8 +10,11 @@ from datetime import timezone, datetime
 from podcast_outreach.database.queries import campaigns as campaign_queries
 from podcast_outreach.database.queries import media as media_queries
 from podcast_outreach.database.queries import episodes as episode_queries
+from podcast_outreach.database.queries import projections
 from podcast_outreach.database.queries import match_suggestions as match_queries
 from podcast_outreach.database.queries import review_tasks as review_task_queries
+from podcast_outreach.services.tasks.process_pool import process_pool
+from podcast_outreach.utils.cpu_tasks import convert_embedding_to_list
 
 logger = logging.getLogger(__name__)
 
@@ -22,55 +23,6 @@ WEIGHT_EMBEDDING = 0.7
 WEIGHT_KEYWORD = 0.3
 MIN_SCORE_FOR_VETTING = 50 # Threshold to create a review task (on 0-100 scale)
 
-def convert_embedding_to_list(embedding) -> Optional[List[float]]:
-    """Convert various embedding formats to a list of floats."""
-    if embedding is None:
-        return None
-        
-    # If it's already a list of numbers, return as is
-    if isinstance(embedding, list) and all(isinstance(x, (int, float)) for x in embedding):
-        return [float(x) for x in embedding]
-    
-    # If it's a numpy array, convert to list
-    if isinstance(embedding, np.ndarray):
-        return embedding.tolist()
-    
-    # If it's a string representation from PostgreSQL
-    if isinstance(embedding, str):
-        # Handle numpy string representation like np.str_('[-0.009, 0.015, ...]')
-        if embedding.startswith("np.str_('") and embedding.endswith("')"):
-            clean_embedding = embedding[9:-2]  # Remove np.str_(' and ')
-            try:
-                # Parse as JSON array
-                return json.loads(clean_embedding)
-            except json.JSONDecodeError:
-                # Fall back to regex parsing
-                numbers = re.findall(r'-?\d+\.?\d*(?:[eE][+-]?\d+)?', clean_embedding)
-                return [float(x) for x in numbers] if numbers else None
-        
-        # Handle direct JSON array string
-        if embedding.startswith('[') and embedding.endswith(']'):
-            try:
-                return json.loads(embedding)
-            except json.JSONDecodeError:
-                # Fall back to regex parsing
-                numbers = re.findall(r'-?\d+\.?\d*(?:[eE][+-]?\d+)?', embedding)
-                return [float(x) for x in numbers] if numbers else None
-        
-        # Handle comma-separated values
-        if ',' in embedding:
-            try:
-                return [float(x.strip()) for x in embedding.split(',')]
-            except ValueError:
-                return None
-    
-    # If all else fails, try to extract numbers with regex
-    if isinstance(embedding, str):
-        numbers = re.findall(r'-?\d+\.?\d*(?:[eE][+-]?\d+)?', str(embedding))
-        return [float(x) for x in numbers] if numbers else None
-    
-    return None
-
 def cosine_similarity(vec1, vec2) -> float:
     """Computes cosine similarity between two vectors."""
     # Convert embeddings to lists if needed
@@ -119,7 +71,7 @@ class MatchCreationService:
         Processes one campaign against multiple media records to create/update match suggestions.
         """
         processed_matches = []
-        campaign = await campaign_queries.get_campaign_by_id(campaign_id)
+        campaign = await campaign_queries.get_campaign_by_id(campaign_id, profile=projections.WITH_EMBEDDING)
         if not campaign or not campaign.get("embedding") or not campaign.get("campaign_keywords"):
             logger.warning(f"Campaign {campaign_id} has no embedding or keywords. Skipping match creation.")
             return []
@@ -186,18 +138,17 @@ class MatchCreationService:
         if not episodes_to_score:
             return None
 
-        best_embedding_score = -1.0
         best_matching_episode_id = None
         best_episode_keywords = []
         
-        for episode in episodes_to_score:
-            episode_embedding = episode.get("embedding")
-            if episode_embedding:
-                sim = cosine_similarity(campaign_embedding, episode_embedding)
-                if sim > best_embedding_score:
-                    best_embedding_score = sim
-                    best_matching_episode_id = episode.get("episode_id")
-                    best_episode_keywords = episode.get("episode_keywords", [])
+        # Parsing text embeddings is CPU-heavy; all episodes are compared in one pool task
+        scored_episodes = [episode for episode in episodes_to_score if episode.get("embedding")]
+        best_index, best_embedding_score = await process_pool.best_cosine_match(
+            campaign_embedding, [episode["embedding"] for episode in scored_episodes]
+        )
+        if best_index is not None:
+            best_matching_episode_id = scored_episodes[best_index].get("episode_id")
+            best_episode_keywords = scored_episodes[best_index].get("episode_keywords", [])
 
         keyword_score = 0.0
         overlapping_keywords = []
@@ -27,6 +27,7 @@ from pydantic import BaseModel, Field, ValidationError
 from podcast_outreach.database.queries import campaigns as campaign_queries
 from podcast_outreach.database.queries import media as media_queries
 from podcast_outreach.database.queries import episodes as episode_queries
+from podcast_outreach.database.queries import projections
 from podcast_outreach.database.queries import match_suggestions as match_queries
 from podcast_outreach.database.queries import review_tasks as review_task_queries
 
@@ -348,7 +349,7 @@ class DetermineFitProcessor:
 
             episode_content_snippet = "No specific episode content available for this match."
             if best_episode_id:
-                best_episode_record = await episode_queries.get_episode_by_id(best_episode_id)
+                best_episode_record = await episode_queries.get_episode_by_id(best_episode_id, profile=projections.WITH_TRANSCRIPT)
                 if best_episode_record:
                     ep_summary = best_episode_record.get('ai_episode_summary') or best_episode_record.get('episode_summary')
                     ep_transcript_sample = (best_episode_record.get('transcript') or "")[:1000]
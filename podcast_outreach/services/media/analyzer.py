@@ -12,10 +12,99 @@ from podcast_outreach.logging_config import get_logger
 from podcast_outreach.services.ai.gemini_client import GeminiService, GeminiSafetyBlockError
 from podcast_outreach.services.ai.tracker import tracker as ai_tracker
 from podcast_outreach.database.queries import episodes as episode_queries
-from podcast_outreach.database.models.llm_outputs import EpisodeAnalysisOutput
+from podcast_outreach.database.queries import projections
+from podcast_outreach.services.ai.token_counter import token_counter
+from podcast_outreach.services.media.transcript_reducer import reduce_episode_transcripts
+from podcast_outreach.database.models.llm_outputs import EpisodeAnalysisOutput, BatchedEpisodeAnalysisOutput
+from podcast_outreach.config import (
+    EPISODE_ANALYSIS_BATCH_TOKEN_BUDGET,
+    EPISODE_ANALYSIS_BATCH_MAX_EPISODES,
+    EPISODE_ANALYSIS_SOLO_TOKENS
+)
 
 logger = get_logger(__name__)
 
+# Gemini 1.5 Flash has a 1M token context window, so 100k characters is very safe.
+MAX_CONTENT_LENGTH = 100000
+
+ANALYSIS_MODEL = "gemini-2.0-flash"
+
+EPISODE_ANALYSIS_PROMPT = """
+            You are an expert podcast content analyst. Your task is to extract structured information
+            from the provided podcast episode content.
+
+            {user_query}
+
+            Based *only* on the provided content, identify the following:
+            1.  **Host Names**: List the full names of any hosts explicitly mentioned or clearly identifiable as hosts.
+            2.  **Guest Names**: List the full names of any guests explicitly mentioned or clearly identifiable as guests.
+            3.  **Episode Themes**: List 3-5 overarching themes or main topics discussed in the episode.
+            4.  **Episode Keywords**: List 5-10 specific keywords or key phrases relevant to the episode's content.
+            5.  **AI Analysis Summary**: Provide a very brief (1-2 sentences) summary of your overall findings or the episode's main focus.
+
+            If a piece of information is not explicitly present or clearly inferable from the provided text, output `null` or an empty list for that field.
+            Do not invent information.
+
+            {format_instructions}
+            """
+
+BATCHED_EPISODE_ANALYSIS_PROMPT = """
+            You are an expert podcast content analyst. Your task is to extract structured information
+            from several independent podcast episodes. Each episode is marked [EPISODE n].
+
+            {user_query}
+
+            Analyze each episode *separately*, based only on that episode's own content, and identify:
+            1.  **Host Names**: List the full names of any hosts explicitly mentioned or clearly identifiable as hosts.
+            2.  **Guest Names**: List the full names of any guests explicitly mentioned or clearly identifiable as guests.
+            3.  **Episode Themes**: List 3-5 overarching themes or main topics discussed in the episode.
+            4.  **Episode Keywords**: List 5-10 specific keywords or key phrases relevant to the episode's content.
+            5.  **AI Analysis Summary**: Provide a very brief (1-2 sentences) summary of your overall findings or the episode's main focus.
+
+            Return exactly one entry per episode with episode_ref set to its number n. Never carry names,
+            themes or keywords over from one episode to another.
+            If a piece of information is not explicitly present or clearly inferable from the episode's text, output `null` or an empty list for that field.
+            Do not invent information.
+
+            {format_instructions}
+            """
+
+def episode_analysis_content(episode: Dict[str, Any], reduced_transcript: Optional[str] = None) -> Optional[str]:
+    """
+    Content to analyze: the reduced transcript if given, else the transcript, then AI summary,
+    then original summary (truncated to MAX_CONTENT_LENGTH).
+    """
+    content = reduced_transcript or episode.get('transcript') or episode.get('ai_episode_summary') or episode.get('episode_summary')
+    if content and len(content) > MAX_CONTENT_LENGTH:
+        logger.warning(f"Episode {episode.get('episode_id')} content length ({len(content)}) exceeds {MAX_CONTENT_LENGTH}. Truncating for analysis.")
+        content = content[:MAX_CONTENT_LENGTH]
+    return content
+
+def pack_episodes(episodes: List[Dict[str, Any]], token_budget: int, max_episodes: int) -> List[List[Dict[str, Any]]]:
+    """Greedily pack episodes (each with a 'tokens' count) into groups within the token budget."""
+    groups: List[List[Dict[str, Any]]] = []
+    current: List[Dict[str, Any]] = []
+    current_tokens = 0
+    for episode in sorted(episodes, key=lambda ep: ep['tokens'], reverse=True):
+        if current and (current_tokens + episode['tokens'] > token_budget or len(current) >= max_episodes):
+            groups.append(current)
+            current, current_tokens = [], 0
+        current.append(episode)
+        current_tokens += episode['tokens']
+    if current:
+        groups.append(current)
+    return groups
+
+def _analysis_update(episode_id: int, analysis: EpisodeAnalysisOutput) -> Dict[str, Any]:
+    return {
+        "episode_id": episode_id,
+        "host_names": analysis.host_names_identified,
+        "guest_names": analysis.guest_names_identified,
+        "episode_themes": analysis.episode_themes,
+        "episode_keywords": analysis.episode_keywords,
+        "ai_analysis_done": True
+    }
+
 class MediaAnalyzerService:
     """
     Analyzes podcast episode content (transcripts, summaries) using AI
@@ -45,16 +134,15 @@ class MediaAnalyzerService:
         }
 
         try:
-            episode_data = await episode_queries.get_episode_by_id(episode_id)
+            episode_data = await episode_queries.get_episode_by_id(episode_id, profile=projections.WITH_TRANSCRIPT)
             if not episode_data:
                 result["message"] = f"Episode {episode_id} not found."
                 logger.warning(result["message"])
                 return result
 
-            # Prioritize transcript, then AI summary, then original summary
-            content_for_analysis = episode_data.get('transcript') or \
-                                   episode_data.get('ai_episode_summary') or \
-                                   episode_data.get('episode_summary')
+            # Prioritize transcript (reduced to its informative spans), then AI summary, then original summary
+            reduced = await reduce_episode_transcripts([episode_data])
+            content_for_analysis = episode_analysis_content(episode_data, reduced.get(episode_id))
 
             if not content_for_analysis:
                 result["message"] = f"No sufficient content (transcript or summary) found for episode {episode_id} for analysis."
@@ -64,56 +152,11 @@ class MediaAnalyzerService:
                 result["status"] = "skipped_no_content"
                 return result
 
-            # Truncate content if it's excessively long to fit within typical LLM context windows
-            # Gemini 1.5 Flash has a 1M token context window, so 100k characters is very safe.
-            MAX_CONTENT_LENGTH = 100000 
-            if len(content_for_analysis) > MAX_CONTENT_LENGTH:
-                logger.warning(f"Episode {episode_id} content length ({len(content_for_analysis)}) exceeds {MAX_CONTENT_LENGTH}. Truncating for analysis.")
-                content_for_analysis = content_for_analysis[:MAX_CONTENT_LENGTH]
-
             episode_title = episode_data.get('title', 'Untitled Episode')
             media_id = episode_data.get('media_id')
 
-            # Create template and user query for structured data extraction
-            prompt_template = """
-            You are an expert podcast content analyst. Your task is to extract structured information
-            from the provided podcast episode content.
-
-            {user_query}
-
-            Based *only* on the provided content, identify the following:
-            1.  **Host Names**: List the full names of any hosts explicitly mentioned or clearly identifiable as hosts.
-            2.  **Guest Names**: List the full names of any guests explicitly mentioned or clearly identifiable as guests.
-            3.  **Episode Themes**: List 3-5 overarching themes or main topics discussed in the episode.
-            4.  **Episode Keywords**: List 5-10 specific keywords or key phrases relevant to the episode's content.
-            5.  **AI Analysis Summary**: Provide a very brief (1-2 sentences) summary of your overall findings or the episode's main focus.
-
-            If a piece of information is not explicitly present or clearly inferable from the provided text, output `null` or an empty list for that field.
-            Do not invent information.
-
-            {format_instructions}
-            """
-
-            user_query = f"""
-            Episode Title: {episode_title}
-
-            Episode Content (Summary or Transcript):
-            ---
-            {content_for_analysis}
-            ---
-            """
-
             logger.info(f"Sending episode {episode_id} content to Gemini for structured analysis.")
-            
-            # Use GeminiService's structured data extraction
-            structured_analysis_output: Optional[EpisodeAnalysisOutput] = await self.gemini_service.get_structured_data(
-                prompt_template_str=prompt_template,
-                user_query=user_query,
-                output_model=EpisodeAnalysisOutput,
-                workflow="episode_analysis",
-                related_media_id=media_id,
-                # No related_pitch_gen_id or related_campaign_id for general episode analysis
-            )
+            structured_analysis_output = await self._analyze_content(episode_title, content_for_analysis, media_id)
 
             if not structured_analysis_output:
                 result["message"] = f"Gemini returned no structured analysis for episode {episode_id}."
@@ -159,6 +202,147 @@ class MediaAnalyzerService:
 
         return result
 
+    async def _analyze_content(self, episode_title: str, content: str, media_id: Optional[int]) -> Optional[EpisodeAnalysisOutput]:
+        """One structured analysis call for a single episode's content."""
+        user_query = f"""
+            Episode Title: {episode_title}
+
+            Episode Content (Summary or Transcript):
+            ---
+            {content}
+            ---
+            """
+        return await self.gemini_service.get_structured_data(
+            prompt_template_str=EPISODE_ANALYSIS_PROMPT,
+            user_query=user_query,
+            output_model=EpisodeAnalysisOutput,
+            workflow="episode_analysis",
+            related_media_id=media_id,
+            # No related_pitch_gen_id or related_campaign_id for general episode analysis
+        )
+
+    async def _analyze_solo(self, episode: Dict[str, Any]) -> Any:
+        """Analyze one prepared episode; returns the analysis, None, or the exception raised."""
+        try:
+            return await self._analyze_content(episode.get('title') or 'Untitled Episode', episode['content'], episode.get('media_id'))
+        except Exception as e:
+            logger.warning(f"Analysis failed for episode {episode['episode_id']}: {e}")
+            return e
+
+    async def _analyze_group(self, group: List[Dict[str, Any]]) -> Dict[int, EpisodeAnalysisOutput]:
+        """
+        Analyze several short episodes in one structured call.
+        Returns analyses by episode_id; episodes missing from the response are left out.
+        """
+        sections = []
+        for ref, episode in enumerate(group, start=1):
+            sections.append(
+                f"[EPISODE {ref}]\n"
+                f"Episode Title: {episode.get('title') or 'Untitled Episode'}\n"
+                f"Episode Content (Summary or Transcript):\n---\n{episode['content']}\n---"
+            )
+        media_ids = {episode.get('media_id') for episode in group}
+        try:
+            output = await self.gemini_service.get_structured_data(
+                prompt_template_str=BATCHED_EPISODE_ANALYSIS_PROMPT,
+                user_query="\n\n".join(sections),
+                output_model=BatchedEpisodeAnalysisOutput,
+                workflow="episode_analysis_batch",
+                related_media_id=media_ids.pop() if len(media_ids) == 1 else None
+            )
+        except Exception as e:
+            # Includes safety blocks: one flagged episode should not cost the others their analysis
+            logger.warning(f"Batched analysis of {len(group)} episodes failed, falling back to single calls: {e}")
+            return {}
+
+        analyses: Dict[int, EpisodeAnalysisOutput] = {}
+        for item in (output.episodes if output else []):
+            if 1 <= item.episode_ref <= len(group):
+                episode_id = group[item.episode_ref - 1]['episode_id']
+                analyses.setdefault(episode_id, EpisodeAnalysisOutput(**item.model_dump(exclude={'episode_ref'})))
+        return analyses
+
+    async def analyze_episodes_batch(self, episodes: List[Dict[str, Any]], pool: Optional[Any] = None) -> Dict[str, Any]:
+        """
+        Analyzes many episodes with as few LLM calls as possible.
+
+        Short episodes (typically summaries) are packed into shared structured calls
+        within EPISODE_ANALYSIS_BATCH_TOKEN_BUDGET; long content is analyzed alone.
+        Episodes a batched call misses or fails on are retried alone. All results
+        are written with one bulk update, and every episode is marked analyzed,
+        as analyze_episode does, so failures are not retried forever.
+
+        Args:
+            episodes: Rows from fetch_episodes_for_analysis.
+
+        Returns:
+            Dict with per-episode "results" (episode_id, media_id, status, message) and "llm_calls".
+        """
+        start_time = time.time()
+        results: Dict[int, Dict[str, Any]] = {}
+        updates: Dict[int, Dict[str, Any]] = {}
+        long_episodes: List[Dict[str, Any]] = []
+        short_episodes: List[Dict[str, Any]] = []
+        reduced_transcripts = await reduce_episode_transcripts(episodes, pool=pool)
+
+        for episode in episodes:
+            episode_id = episode['episode_id']
+            results[episode_id] = {"episode_id": episode_id, "media_id": episode.get('media_id'), "status": "failed",
+                                   "message": "Analysis failed due to an unexpected error."}
+            content = episode_analysis_content(episode, reduced_transcripts.get(episode_id))
+            if not content:
+                results[episode_id].update(status="skipped_no_content", message=f"No sufficient content found for episode {episode_id} for analysis.")
+                updates[episode_id] = {"episode_id": episode_id, "ai_analysis_done": True}
+                continue
+            prepared = dict(episode, content=content, tokens=token_counter.count(content, ANALYSIS_MODEL))
+            (long_episodes if prepared['tokens'] > EPISODE_ANALYSIS_SOLO_TOKENS else short_episodes).append(prepared)
+
+        groups = pack_episodes(short_episodes, EPISODE_ANALYSIS_BATCH_TOKEN_BUDGET, EPISODE_ANALYSIS_BATCH_MAX_EPISODES)
+        solo = long_episodes + [group[0] for group in groups if len(group) == 1]
+        groups = [group for group in groups if len(group) > 1]
+
+        # Batched and solo calls run together; the Gemini client's limiter bounds concurrency
+        outcomes = await asyncio.gather(
+            asyncio.gather(*(self._analyze_group(group) for group in groups)),
+            asyncio.gather(*(self._analyze_solo(episode) for episode in solo))
+        )
+        analyses: Dict[int, Any] = {}
+        for episode, outcome in zip(solo, outcomes[1]):
+            analyses[episode['episode_id']] = outcome
+        retry = []
+        for group, group_analyses in zip(groups, outcomes[0]):
+            analyses.update(group_analyses)
+            retry.extend(episode for episode in group if episode['episode_id'] not in group_analyses)
+        if retry:
+            logger.info(f"Retrying {len(retry)} episodes from batched calls individually")
+            for episode, outcome in zip(retry, await asyncio.gather(*(self._analyze_solo(e) for e in retry))):
+                analyses[episode['episode_id']] = outcome
+        llm_calls = len(groups) + len(solo) + len(retry)
+
+        for episode_id, outcome in analyses.items():
+            if isinstance(outcome, EpisodeAnalysisOutput):
+                updates[episode_id] = _analysis_update(episode_id, outcome)
+                results[episode_id].update(status="success", message=f"Successfully analyzed and updated episode {episode_id}.")
+            else:
+                # Mark as analyzed to prevent re-attempting if AI consistently fails for this episode
+                updates[episode_id] = {"episode_id": episode_id, "ai_analysis_done": True}
+                results[episode_id]["message"] = (
+                    f"An error occurred during episode analysis for {episode_id}: {outcome}" if outcome
+                    else f"Gemini returned no structured analysis for episode {episode_id}."
+                )
+
+        try:
+            await episode_queries.bulk_update_episode_analysis_data(list(updates.values()), pool=pool)
+        except Exception as e:
+            logger.error(f"Failed to write analysis results for {len(updates)} episodes: {e}")
+            for result in results.values():
+                if result["status"] == "success":
+                    result.update(status="failed", message=f"Analysis successful for episode {result['episode_id']}, but failed to update DB record.")
+
+        succeeded = sum(1 for r in results.values() if r["status"] == "success")
+        logger.info(f"Analyzed {succeeded}/{len(episodes)} episodes with {llm_calls} LLM calls in {time.time() - start_time:.1f}s")
+        return {"results": list(results.values()), "llm_calls": llm_calls}
+
     async def analyze_podcast_from_episodes(self, media_id: int) -> Dict[str, Any]:
         """
         Analyzes a podcast as a whole using its episode transcripts and analysis data.
@@ -20,6 +20,7 @@ import requests
 from urllib.parse import urlparse
 
 from podcast_outreach.database.queries import episodes as episode_queries
+from podcast_outreach.database.loaders import get_loaders
 from podcast_outreach.services.media.transcriber import MediaTranscriber, AudioNotFoundError
 from podcast_outreach.logging_config import get_logger
 from podcast_outreach.utils.memory_monitor import get_memory_info
@@ -88,12 +89,9 @@ class BatchTranscriptionService:
         logger.info(f"Creating transcription batch {batch_id} with {len(episode_ids)} episodes")
         
         try:
-            # Get episode details
-            episodes = []
-            for episode_id in episode_ids:
-                episode = await episode_queries.get_episode_by_id(episode_id)
-                if episode:
-                    episodes.append(episode)
+            # Get episode details in one query
+            loaded = await get_loaders().episodes().load_many(episode_ids)
+            episodes = [episode for episode in loaded if episode]
             
             if not episodes:
                 return {
@@ -310,7 +308,7 @@ class BatchTranscriptionService:
         
         try:
             # Check if episode already has transcript
-            if episode.get('transcript'):
+            if episode.get('has_transcript'):
                 logger.info(f"Episode {episode_id} already has transcript, skipping")
                 result['status'] = 'skipped'
                 result['reason'] = 'already_transcribed'
@@ -393,7 +391,7 @@ class BatchTranscriptionService:
                 
                 try:
                     # Get episode details for transcription
-                    episode = await episode_queries.get_episode_by_id(episode_id)
+                    episode = await get_loaders().episodes().load(episode_id)
                     episode_title = episode.get('title') if episode else None
                     
                     # Transcribe - the transcribe_audio method will handle cleanup
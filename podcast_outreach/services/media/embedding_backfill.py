@@ -0,0 +1,146 @@
+# podcast_outreach/services/media/embedding_backfill.py
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+
+from podcast_outreach.database.queries import episodes as episode_queries
+from podcast_outreach.services.ai.openai_client import OpenAIService
+from podcast_outreach.config import EMBEDDING_BACKFILL_BATCH_SIZE, EMBEDDING_BACKFILL_SUMMARY_CONCURRENCY
+
+logger = logging.getLogger(__name__)
+
+class EmbeddingBackfillService:
+    """
+    Drains episodes that have content but no embedding.
+
+    Each round fetches a large batch, embeds all texts through the batched
+    (and cached) embeddings API and writes the results with one UPDATE.
+    Episodes with only a transcript are summarized first, as the per-episode
+    path did, at most summary_concurrency at a time, and the generated summary
+    is stored alongside the embedding.
+    """
+
+    def __init__(self, openai_service: Optional[OpenAIService] = None,
+                 summary_concurrency: int = EMBEDDING_BACKFILL_SUMMARY_CONCURRENCY):
+        self.openai_service = openai_service or OpenAIService()
+        self.summary_concurrency = max(1, summary_concurrency)
+        self._transcriber = None
+
+    def _get_transcriber(self):
+        if self._transcriber is None:
+            from podcast_outreach.services.media.transcriber import MediaTranscriber
+            self._transcriber = MediaTranscriber()
+        return self._transcriber
+
+    async def _build_embedding_input(self, episode: Dict[str, Any],
+                                     summary_slots: asyncio.Semaphore) -> Optional[Dict[str, Any]]:
+        """Return the text to embed and any summary generated for it, or None if there is no content."""
+        title = episode.get("title") or ""
+        summary = episode.get("ai_episode_summary") or episode.get("episode_summary") or ""
+        if summary:
+            # Use only title + AI summary for embeddings (semantic-focused)
+            return {"text": f"Title: {title}\nSummary: {summary}", "generated_summary": None}
+
+        transcript = episode.get("transcript") or ""
+        if not transcript:
+            return None
+        logger.info(f"No summary available for episode {episode['episode_id']}, creating one from transcript")
+        async with summary_slots:
+            generated = await self._get_transcriber().summarize_transcript(
+                transcript=transcript,
+                episode_title=title,
+                podcast_name="",
+                episode_summary=""
+            )
+        return {"text": f"Title: {title}\nSummary: {generated}", "generated_summary": generated}
+
+    async def run_batch(self, batch_size: int = EMBEDDING_BACKFILL_BATCH_SIZE,
+                        exclude_episode_ids: Optional[List[int]] = None,
+                        pool: Optional[Any] = None) -> Dict[str, Any]:
+        """
+        Embed one batch of episodes.
+
+        Returns:
+            Dict with fetched/embedded counts and the ids that failed.
+        """
+        episodes = await episode_queries.fetch_episodes_for_embedding_generation(
+            batch_size, pool, exclude_episode_ids=exclude_episode_ids
+        )
+        if not episodes:
+            return {"fetched": 0, "embedded": 0, "failed_ids": []}
+
+        summary_slots = asyncio.Semaphore(self.summary_concurrency)
+        inputs = await asyncio.gather(
+            *(self._build_embedding_input(episode, summary_slots) for episode in episodes),
+            return_exceptions=True
+        )
+
+        failed_ids: List[int] = []
+        prepared = []
+        for episode, embedding_input in zip(episodes, inputs):
+            if isinstance(embedding_input, Exception) or embedding_input is None:
+                if isinstance(embedding_input, Exception):
+                    logger.error(f"Could not prepare embedding input for episode {episode['episode_id']}: {embedding_input}")
+                else:
+                    logger.warning(f"Episode {episode['episode_id']} has no content for embedding generation")
+                failed_ids.append(episode["episode_id"])
+                continue
+            prepared.append((episode["episode_id"], embedding_input))
+
+        embeddings = await self.openai_service.get_embeddings(
+            [embedding_input["text"] for _, embedding_input in prepared],
+            workflow="episode_embedding"
+        )
+
+        updates = []
+        for (episode_id, embedding_input), embedding in zip(prepared, embeddings):
+            if embedding is None:
+                failed_ids.append(episode_id)
+                continue
+            updates.append({
+                "episode_id": episode_id,
+                "embedding": embedding,
+                "ai_episode_summary": embedding_input["generated_summary"]
+            })
+
+        embedded = await episode_queries.bulk_update_episode_embeddings(updates, pool)
+        logger.info(f"Embedding backfill batch: {embedded}/{len(episodes)} episodes embedded, {len(failed_ids)} failed")
+        return {"fetched": len(episodes), "embedded": embedded, "failed_ids": failed_ids}
+
+    async def run(self, batch_size: int = EMBEDDING_BACKFILL_BATCH_SIZE,
+                  max_batches: Optional[int] = None,
+                  pool: Optional[Any] = None) -> Dict[str, int]:
+        """
+        Drain the backlog in batches until it is empty or max_batches is reached.
+        Episodes that fail are skipped for the rest of the run.
+        """
+        total_embedded = 0
+        failed_ids: List[int] = []
+        batches = 0
+        while max_batches is None or batches < max_batches:
+            result = await self.run_batch(batch_size, exclude_episode_ids=failed_ids, pool=pool)
+            batches += 1
+            total_embedded += result["embedded"]
+            failed_ids.extend(result["failed_ids"])
+            if result["fetched"] < batch_size:
+                break
+            if result["embedded"] == 0:
+                # Nothing in a full batch succeeded (e.g. API outage); retry on the next run
+                break
+        logger.info(f"Embedding backfill finished: {total_embedded} embedded, {len(failed_ids)} failed, {batches} batches")
+        return {"embedded": total_embedded, "failed": len(failed_ids), "batches": batches}
+
+
+async def main():
+    """Drain the whole episode embedding backlog."""
+    from podcast_outreach.database.connection import init_db_pool, close_db_pool
+    await init_db_pool()
+    try:
+        await EmbeddingBackfillService().run()
+    finally:
+        await close_db_pool()
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+    asyncio.run(main())
@@ -148,7 +148,7 @@ class EpisodeHandlerService:
                 
                 if existing_episode:
                     # If transcript was missing and now we have it (from Podscan), update it.
-                    if not existing_episode.get('transcript') and standardized_episode.get('transcript'):
+                    if not existing_episode.get('has_transcript') and standardized_episode.get('transcript'):
                         await episode_queries.update_episode_transcription(
                             episode_id=existing_episode['episode_id'],
                             transcript=standardized_episode['transcript']
@@ -212,7 +212,7 @@ class EpisodeHandlerService:
             return
 
         # Count how many of the recent episodes already have a transcript
-        transcribed_count = sum(1 for ep in recent_episodes if ep.get('transcript'))
+        transcribed_count = sum(1 for ep in recent_episodes if ep.get('has_transcript'))
         
         episodes_to_flag_ids = []
         if transcribed_count < goal_count:
@@ -220,7 +220,7 @@ class EpisodeHandlerService:
             logger.info(f"Media {media_id} has {transcribed_count} transcribed episodes. Need to flag {needed} more.")
             
             # Find the most recent episodes that do NOT have a transcript yet
-            untranscribed_recent_episodes = [ep for ep in recent_episodes if not ep.get('transcript')]
+            untranscribed_recent_episodes = [ep for ep in recent_episodes if not ep.get('has_transcript')]
             
             # Select the top `needed` episodes from this list to flag
             episodes_to_flag = untranscribed_recent_episodes[:needed]
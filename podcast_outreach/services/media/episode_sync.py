@@ -7,7 +7,6 @@ from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Any, Optional, Set
 
 import aiohttp # For asynchronous HTTP requests
-from bs4 import BeautifulSoup # For parsing RSS
 from email.utils import parsedate_to_datetime # For parsing RSS dates
 
 # Project-specific services and modules (UPDATED IMPORTS)
@@ -18,6 +17,8 @@ from podcast_outreach.integrations.podscan import PodscanAPIClient # Use new int
 from podcast_outreach.utils.exceptions import APIClientError # Use new utils path
 from podcast_outreach.utils.data_processor import parse_date as fallback_parse_date # Use new utils path
 from podcast_outreach.services.media.episode_handler import EpisodeHandlerService
+from podcast_outreach.services.tasks.process_pool import process_pool
+from podcast_outreach.services.tasks.context import report_progress, stop_requested
 
 # --- Configuration ---
 logging.basicConfig(level=logging.INFO,
@@ -89,53 +90,32 @@ async def fetch_episodes_from_rss_async(
             response.raise_for_status()
             content = await response.text()
 
-        # BeautifulSoup parsing can be blocking; run in executor if feeds are very large/complex
-        # For typical feeds, direct call is often acceptable in async if not too frequent.
-        # For true non-blocking, would need an async XML parser or careful executor use.
-        loop = asyncio.get_running_loop()
-        soup = await loop.run_in_executor(None, BeautifulSoup, content, 'xml')
+        # Parsing large feeds holds the GIL for a long time; it runs in the process pool
+        item_count, items = await process_pool.parse_rss_items(
+            content, max_episodes_to_parse * 2 # Parse more to allow for date issues or future-dated items
+        )
+        logger.debug(f"Found {item_count} items in RSS feed: {rss_url}")
 
-        items = soup.find_all('item')
-        logger.debug(f"Found {len(items)} items in RSS feed: {rss_url}")
-
-        for item in items[:max_episodes_to_parse * 2]: # Parse more to allow for date issues or future-dated items
-            pub_date = robust_parse_rss_date(item.findtext('pubDate'))
+        for item in items:
+            pub_date = robust_parse_rss_date(item['pub_date'])
             if not pub_date:
-                logger.warning(f"Skipping episode in {rss_url} due to unparsable pubDate: {item.findtext('pubDate')}")
+                logger.warning(f"Skipping episode in {rss_url} due to unparsable pubDate: {item['pub_date']}")
                 continue
 
-            audio_url = None
-            enclosure = item.find('enclosure')
-            if enclosure and enclosure.get('url'):
-                audio_url = enclosure['url']
-            # Basic check if guid might be an audio url
-            elif item.find('guid') and item.findtext('guid', '').startswith(('http://', 'https://')):
-                    guid_text = item.findtext('guid')
-                    if any(guid_text.lower().endswith(ext) for ext in ['.mp3', '.m4a', '.ogg', '.wav', '.aac']):
-                        audio_url = guid_text
-            
-            api_episode_id_from_rss = item.findtext('guid') # Store GUID as potential API ID
-
+            audio_url = item['audio_url']
             if not audio_url: # Skip if no audio URL, as it's key for uniqueness & playback
-                logger.debug(f"Skipping episode '{item.findtext('title')}' from {rss_url} due to missing audio URL.")
+                logger.debug(f"Skipping episode '{item['title']}' from {rss_url} due to missing audio URL.")
                 continue
 
-            description_text = item.findtext('description') or item.findtext('content:encoded') or item.findtext('itunes:summary')
-            # Strip HTML from description if necessary (using a simple approach or a library)
-            if description_text:
-                    desc_soup = BeautifulSoup(description_text, 'html.parser')
-                    description_text = desc_soup.get_text(separator='\n', strip=True)
-
-
             raw_episodes.append({
-                "title": item.findtext('title') or 'No Title',
+                "title": item['title'] or 'No Title',
                 "publish_date": pub_date, # datetime object
                 "episode_url": audio_url, # This is the audio file URL
-                "episode_summary": description_text,
+                "episode_summary": item['summary'], # HTML already stripped
                 "transcript": None, # RSS feeds typically don't have transcripts
                 "downloaded": False,
                 # Podscan specific fields will be None or derived if possible
-                "api_episode_id": api_episode_id_from_rss, 
+                "api_episode_id": item['guid'], # Store GUID as potential API ID
                 "duration_sec": None, # Try to parse from itunes:duration if available
                 "guest_names": None, # Not typically in basic RSS
             })
@@ -164,6 +144,8 @@ class MediaFetcher: # Renamed from original fetch_episodes_to_pg.py's implicit s
     ):
         """Processes a single media item to sync its episodes."""
         async with sync_semaphore: # Control concurrency for processing each podcast
+            if stop_requested(): # Task stopped while this podcast was waiting its turn
+                return
             media_id = media_item['media_id']
             media_name = media_item.get('name', f'Media ID {media_id}')
             rss_url = media_item.get('rss_url')
@@ -307,11 +289,15 @@ async def main_episode_sync_orchestrator():
             logger.info("No media items found requiring an episode sync at this time.")
         else:
             logger.info(f"Found {len(media_to_sync)} media items to process for episode sync.")
+            report_progress(total=len(media_to_sync), message="Syncing podcast episodes")
+            
+            async def sync_media(media_item):
+                try:
+                    return await media_fetcher_instance.sync_episodes_for_media(media_item, http_session, sync_semaphore)
+                finally:
+                    report_progress(advance=1)
             
-            tasks = [
-                media_fetcher_instance.sync_episodes_for_media(media_item, http_session, sync_semaphore)
-                for media_item in media_to_sync
-            ]
+            tasks = [sync_media(media_item) for media_item in media_to_sync]
             
             results = await asyncio.gather(*tasks, return_exceptions=True)
             
@@ -12,9 +12,9 @@ import yt_dlp  # For downloading audio from various platforms
 # from podcast_outreach.services.ai.gemini_client import GeminiService 
 import google.generativeai as genai
 from pathlib import Path
-import base64
 from google.api_core.exceptions import ResourceExhausted, ServiceUnavailable
 from podcast_outreach.logging_config import get_logger
+from podcast_outreach.services.tasks.process_pool import process_pool
 import shutil  # For cleaning up temp directories
 
 logger = get_logger(__name__)
@@ -47,7 +47,7 @@ class PodcastTranscriberService:
     async def _prepare_audio_for_gemini(self, file_path: str) -> Optional[Dict[str, Any]]:
         """
         Reads an audio file and prepares its content for the Gemini API.
-        Synchronous file I/O is run in a thread.
+        Reading and base64-encoding run in the process pool.
         """
         try:
             p = Path(file_path)
@@ -80,17 +80,7 @@ class PodcastTranscriberService:
                 return None
 
 
-            def read_and_encode():
-                with open(file_path, 'rb') as f:
-                    audio_data = f.read()
-                return base64.b64encode(audio_data).decode('utf-8')
-
-            encoded_data = await asyncio.to_thread(read_and_encode)
-            
-            return {
-                "mime_type": mime_type,
-                "data": encoded_data
-            }
+            return await process_pool.encode_audio_file(file_path, mime_type)
         except Exception as e:
             logger.error(f"Error preparing audio file {file_path} for Gemini: {e}")
             return None
@@ -5,9 +5,9 @@ import requests
 import logging
 import os
 import tempfile
+import shutil
 from typing import Optional, List, Tuple, Dict, Any
 import asyncio
-import base64
 from pathlib import Path
 import pydub
 from pydub import AudioSegment
@@ -28,11 +28,13 @@ class AudioNotFoundError(Exception):
 # Project-specific imports
 from podcast_outreach.database.queries import episodes as episode_queries, media as media_queries, campaigns as campaign_queries
 from podcast_outreach.services.ai.openai_client import OpenAIService
+from podcast_outreach.services.media.transcript_reducer import reduce_text
 from podcast_outreach.services.matches.match_creation import MatchCreationService
 from podcast_outreach.services.enrichment.quality_score import QualityService
 from podcast_outreach.database.models.media_models import EnrichedPodcastProfile
 from podcast_outreach.config import ORCHESTRATOR_CONFIG, FFMPEG_PATH, FFPROBE_PATH
 from podcast_outreach.utils.memory_monitor import check_memory_usage, memory_guard, cleanup_memory
+from podcast_outreach.services.tasks.process_pool import process_pool
 
 logger = logging.getLogger(__name__)
 
@@ -88,7 +90,7 @@ class MediaTranscriber:
         if not self._api_key:
             raise ValueError("GEMINI_API_KEY is required.")
         
-        self._openai_service = OpenAIService()
+        self.openai_service = OpenAIService()
         self._gemini_api_semaphore = asyncio.Semaphore(int(os.getenv("GEMINI_API_CONCURRENCY", "3")))  # Reduced from 10 to 3
         self._setup_gemini_api()
         logger.info("MediaTranscriber initialized.")
@@ -265,9 +267,6 @@ class MediaTranscriber:
             return None
 
     async def _process_audio_file_for_gemini(self, file_path: str) -> dict:
-        return await asyncio.to_thread(self.__sync_process_audio_file_for_gemini, file_path)
-
-    def __sync_process_audio_file_for_gemini(self, file_path: str) -> dict:
         path = Path(file_path)
         if not path.exists():
             raise FileNotFoundError(f"Audio file not found: {file_path}")
@@ -279,21 +278,7 @@ class MediaTranscriber:
         if extension == '.mp4':
             logger.info(f"Converting MP4 to MP3 for Gemini compatibility: {file_path}")
             try:
-                # Load the MP4 file using pydub
-                audio = AudioSegment.from_file(file_path, format="mp4")
-                
-                # Create a temporary MP3 file
-                with temp_audio_file(suffix=".mp3") as temp_mp3_path:
-                    # Export as MP3
-                    audio.export(temp_mp3_path, format="mp3")
-                    logger.info(f"Successfully converted MP4 to MP3: {temp_mp3_path}")
-                    
-                    # Process the converted MP3 file
-                    with open(temp_mp3_path, 'rb') as f:
-                        audio_data = f.read()
-                    
-                    return {"mime_type": "audio/mp3", "data": base64.b64encode(audio_data).decode('utf-8')}
-                    
+                return await process_pool.encode_audio_file(file_path, "audio/mp3", convert_to_mp3=True)
             except Exception as e:
                 logger.error(f"Failed to convert MP4 to MP3: {e}")
                 raise ValueError(f"Failed to process MP4 file: {e}")
@@ -303,10 +288,7 @@ class MediaTranscriber:
         if not mime_type:
             raise ValueError(f"Unsupported audio format: {extension}")
         
-        with open(file_path, 'rb') as f:
-            audio_data = f.read()
-        
-        return {"mime_type": mime_type, "data": base64.b64encode(audio_data).decode('utf-8')}
+        return await process_pool.encode_audio_file(file_path, mime_type)
 
     async def _transcribe_gemini_api_call(self, audio_content: dict, episode_name: Optional[str] = None, chunk_id: Optional[int] = None) -> str:
         if not self._model:
@@ -369,18 +351,12 @@ class MediaTranscriber:
                 logger.error(f"An unexpected error occurred during Gemini API call{chunk_info}: {e}")
                 raise
 
-    async def _process_audio_chunk(self, chunk_index: int, audio_segment: AudioSegment, total_chunks: int, chunk_length_ms: int, overlap_ms: int, file_suffix: str, episode_name: Optional[str]) -> tuple[int, str]:
+    async def _process_audio_chunk(self, chunk_index: int, chunk_path: str, total_chunks: int, episode_name: Optional[str]) -> tuple[int, str]:
         try:
             logger.info(f"Processing chunk {chunk_index+1} of {total_chunks}")
-            start_ms = max(chunk_index * chunk_length_ms - overlap_ms, 0) if chunk_index > 0 else 0
-            end_ms = min((chunk_index + 1) * chunk_length_ms, len(audio_segment))
-            chunk = audio_segment[start_ms:end_ms]
-            
-            with temp_audio_file(suffix=file_suffix) as temp_path:
-                await asyncio.to_thread(chunk.export, temp_path, format="mp3")
-                audio_content = await self._process_audio_file_for_gemini(temp_path)
-                chunk_transcript = await self._transcribe_gemini_api_call(audio_content, f"{episode_name} - Part {chunk_index+1}" if episode_name else f"Chunk {chunk_index+1}", chunk_id=chunk_index+1)
-                return chunk_index, chunk_transcript
+            audio_content = await self._process_audio_file_for_gemini(chunk_path)
+            chunk_transcript = await self._transcribe_gemini_api_call(audio_content, f"{episode_name} - Part {chunk_index+1}" if episode_name else f"Chunk {chunk_index+1}", chunk_id=chunk_index+1)
+            return chunk_index, chunk_transcript
         except Exception as e:
             logger.error(f"Error processing chunk {chunk_index+1}: {e}", exc_info=True)
             return chunk_index, f"ERROR in chunk {chunk_index+1}: {str(e)}"
@@ -393,22 +369,26 @@ class MediaTranscriber:
         if not check_memory_usage():
             raise MemoryError("Memory usage too high to process long audio file")
         
-        audio = await asyncio.to_thread(AudioSegment.from_file, file_path)
         chunk_length_ms = self.DEFAULT_CHUNK_MINUTES * 60 * 1000
         overlap_ms = self.DEFAULT_OVERLAP_SECONDS * 1000
-        total_chunks = -(-len(audio) // chunk_length_ms) # Ceiling division
-        
-        tasks = [
-            self._process_audio_chunk(i, audio, total_chunks, chunk_length_ms, overlap_ms, Path(file_path).suffix, episode_name)
-            for i in range(total_chunks)
-        ]
-        
-        results = await asyncio.gather(*tasks)
+        chunk_dir = tempfile.mkdtemp(prefix="transcribe_chunks_")
+        try:
+            # The file is decoded and split into mp3 chunks in a pool worker, so the
+            # decoded audio never lives in this process
+            chunk_paths = await process_pool.split_audio(file_path, chunk_length_ms, overlap_ms, chunk_dir)
+            total_chunks = len(chunk_paths)
+            
+            tasks = [
+                self._process_audio_chunk(i, chunk_path, total_chunks, episode_name)
+                for i, chunk_path in enumerate(chunk_paths)
+            ]
+            
+            results = await asyncio.gather(*tasks)
+        finally:
+            shutil.rmtree(chunk_dir, ignore_errors=True)
         results.sort(key=lambda x: x[0])
         transcripts = [transcript for _, transcript in results]
         
-        # Free memory after processing chunks
-        del audio
         cleanup_memory()
         
         return "\n\n".join(transcripts)
@@ -416,6 +396,8 @@ class MediaTranscriber:
     async def summarize_transcript(self, transcript: str, episode_title: str = "", podcast_name: str = "", episode_summary: str = "") -> str:
         """Generate a comprehensive AI summary optimized for semantic matching and embeddings."""
         logger.info("Generating comprehensive episode summary (%d chars transcript)", len(transcript))
+        # Ads, intros and repeated banter add tokens but nothing to the summary
+        reduced_transcript = await reduce_text(transcript)
         
         # Enhanced prompt for better semantic understanding
         prompt = f"""You are an expert podcast content analyst. Create a comprehensive summary that will be used for guest matching and semantic search.
@@ -426,7 +408,7 @@ Episode: {episode_title if episode_title else "Untitled Episode"}
 {f"Original Summary: {episode_summary}" if episode_summary else ""}
 
 TRANSCRIPT:
-{transcript}
+{reduced_transcript}
 
 Create a structured summary optimized for semantic matching:
 
@@ -484,8 +466,7 @@ Provide a comprehensive but concise summary (400-600 words) that captures the ep
                     should_cleanup = True
                     logger.debug(f"Audio file {audio_path} is in temp directory, will clean up after processing")
             
-                audio = await asyncio.to_thread(AudioSegment.from_file, audio_path)
-                duration_minutes = len(audio) / (60 * 1000)
+                duration_minutes = await process_pool.audio_duration_ms(audio_path) / (60 * 1000)
                 
                 if duration_minutes > self.MAX_SINGLE_CHUNK_DURATION_MINUTES:
                     transcript = await self._process_long_audio(audio_path, episode_name=episode_title)
@@ -503,7 +484,7 @@ Provide a comprehensive but concise summary (400-600 words) that captures the ep
                     )
                     # Use only title + AI summary for embeddings (no transcript truncation)
                     embedding_text = f"Title: {episode_title or 'Untitled Episode'}\nSummary: {summary}"
-                    embedding = await self._openai_service.get_embedding(text=embedding_text, workflow="episode_embedding", related_ids={"episode_id": episode_id})
+                    embedding = await self.openai_service.get_embedding(text=embedding_text, workflow="episode_embedding", related_ids={"episode_id": episode_id})
             except Exception as e:
                 logger.error(f"Error during transcription process for {audio_path}: {e}", exc_info=True)
                 raise
@@ -0,0 +1,181 @@
+# podcast_outreach/services/media/transcript_reducer.py
+
+import asyncio
+import hashlib
+import logging
+import math
+import re
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+from podcast_outreach.config import TRANSCRIPT_REDUCTION_TOKEN_BUDGET, TRANSCRIPT_REDUCTION_SEGMENT_CHARS
+from podcast_outreach.database.queries import episodes as episode_queries
+from podcast_outreach.services.ai.token_counter import token_counter
+
+logger = logging.getLogger(__name__)
+
+# Bump when the selection logic changes so cached reductions are recomputed
+REDUCTION_VERSION = 1
+REDUCTION_MODEL = "gemini-2.0-flash"
+
+GAP_MARKER = "\n[...]\n"
+# Ad reads, calls to action and housekeeping that rarely describe the episode
+AD_PATTERN = re.compile(
+    r"\b(sponsored by|brought to you by|our sponsors?|promo code|use (the )?code|discount code|free trial|"
+    r"sign up at|go to \w+\.com|rate (and|&) review|leave (us )?a review|subscribe (to|on)|"
+    r"follow us on|patreon|hit the like button|smash that)\b",
+    re.IGNORECASE
+)
+# Segments this similar to an already selected one add nothing new
+REDUNDANCY_THRESHOLD = 0.8
+
+_SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+|\n+")
+_WORD = re.compile(r"[a-z0-9']+")
+STOPWORDS = frozenset("""
+a about after all also am an and any are as at be because been but by can could did do does doing don't
+for from get go going got had has have he her here him his how i i'm if in into is it it's just know
+like me more my no not now of oh okay on one or our out really right say so some that that's the their
+them then there they think this to up us very was we we're well what when where which who will with
+would yeah yes you you're your
+""".split())
+
+def reduction_key(transcript: str, token_budget: int = TRANSCRIPT_REDUCTION_TOKEN_BUDGET) -> str:
+    """Cache key for a reduction: changes when the transcript, budget or selection logic does."""
+    digest = hashlib.sha256(f"{REDUCTION_VERSION}:{token_budget}:".encode("utf-8"))
+    digest.update(transcript.encode("utf-8", "ignore"))
+    return digest.hexdigest()
+
+def segment_transcript(transcript: str, segment_chars: int = TRANSCRIPT_REDUCTION_SEGMENT_CHARS,
+                       drop_ads: bool = True) -> List[str]:
+    """Split a transcript into spans of whole sentences of roughly segment_chars each, optionally without ad sentences."""
+    segments: List[str] = []
+    current: List[str] = []
+    length = 0
+    for sentence in _SENTENCE_SPLIT.split(transcript):
+        sentence = sentence.strip()
+        if not sentence or (drop_ads and AD_PATTERN.search(sentence)):
+            continue
+        current.append(sentence)
+        length += len(sentence) + 1
+        if length >= segment_chars:
+            segments.append(" ".join(current))
+            current, length = [], 0
+    if current:
+        segments.append(" ".join(current))
+    return segments
+
+def _terms(segment: str) -> List[str]:
+    return [word for word in _WORD.findall(segment.lower()) if len(word) > 2 and word not in STOPWORDS]
+
+def _cosine(a: Dict[str, float], b: Dict[str, float]) -> float:
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(weight * b.get(term, 0.0) for term, weight in a.items())
+
+def reduce_transcript(transcript: str,
+                      token_budget: int = TRANSCRIPT_REDUCTION_TOKEN_BUDGET,
+                      model: str = REDUCTION_MODEL,
+                      segment_chars: int = TRANSCRIPT_REDUCTION_SEGMENT_CHARS) -> str:
+    """
+    Extractive reduction of a transcript to about token_budget tokens.
+
+    Ad reads and calls to action are dropped sentence by sentence, the rest is
+    cut into sentence-aligned segments, verbatim repeats (recurring intros,
+    catchphrases) are dropped, and segments are ranked by TF-IDF similarity to
+    the whole episode, skipping near-duplicates of spans already chosen. The
+    opening segment is always kept since it usually names the host and guest.
+    Selected spans keep their original order, with GAP_MARKER where text was
+    left out. Transcripts already within budget are returned unchanged.
+    """
+    if not transcript or token_counter.estimate(transcript, model) <= token_budget:
+        return transcript
+
+    candidates = []  # (position, text, terms)
+    seen = set()
+    for position, segment in enumerate(segment_transcript(transcript, segment_chars)):
+        normalized = " ".join(_WORD.findall(segment.lower()))
+        if not normalized or normalized in seen:
+            continue
+        seen.add(normalized)
+        candidates.append((position, segment, _terms(segment)))
+    if not candidates:
+        return transcript
+
+    document_frequency = Counter()
+    for _, _, terms in candidates:
+        document_frequency.update(set(terms))
+    idf = {term: math.log((1 + len(candidates)) / (1 + count)) + 1 for term, count in document_frequency.items()}
+
+    vectors: List[Dict[str, float]] = []
+    centroid: Counter = Counter()
+    for _, _, terms in candidates:
+        weights = {term: count * idf[term] for term, count in Counter(terms).items()}
+        norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+        vector = {term: w / norm for term, w in weights.items()}
+        vectors.append(vector)
+        centroid.update(vector)
+
+    scores = [_cosine(vector, centroid) for vector in vectors]
+    order = sorted(range(1, len(candidates)), key=lambda i: scores[i], reverse=True)
+    order.insert(0, 0)
+
+    selected: List[int] = []
+    used_tokens = 0
+    for i in order:
+        tokens = token_counter.estimate(candidates[i][1], model)
+        if used_tokens + tokens > token_budget:
+            continue
+        if any(_cosine(vectors[i], vectors[j]) >= REDUNDANCY_THRESHOLD for j in selected):
+            continue
+        selected.append(i)
+        used_tokens += tokens
+
+    parts: List[str] = []
+    previous_position = None
+    for i in sorted(selected, key=lambda i: candidates[i][0]):
+        position, segment, _ = candidates[i]
+        if parts:
+            parts.append(" " if position == previous_position + 1 else GAP_MARKER)
+        elif position > 0:
+            parts.append(GAP_MARKER.lstrip("\n"))
+        parts.append(segment)
+        previous_position = position
+    return "".join(parts)
+
+async def reduce_text(transcript: str, token_budget: int = TRANSCRIPT_REDUCTION_TOKEN_BUDGET) -> str:
+    """reduce_transcript off the event loop (long transcripts take tens of milliseconds)."""
+    if not transcript:
+        return transcript
+    return await asyncio.to_thread(reduce_transcript, transcript, token_budget)
+
+async def reduce_episode_transcripts(episodes: List[Dict[str, Any]],
+                                     token_budget: int = TRANSCRIPT_REDUCTION_TOKEN_BUDGET,
+                                     pool: Optional[Any] = None) -> Dict[int, str]:
+    """
+    Reduced transcripts by episode_id for the episodes that have a transcript.
+
+    Rows carrying a reduced_transcript whose reduced_transcript_key matches the
+    current transcript are served from that cached copy; the rest are reduced
+    and written back in one statement. A failed write only costs the cache.
+    """
+    reduced: Dict[int, str] = {}
+    to_save: List[Dict[str, Any]] = []
+    for episode in episodes:
+        transcript = episode.get("transcript")
+        if not transcript:
+            continue
+        key = reduction_key(transcript, token_budget)
+        if episode.get("reduced_transcript") and episode.get("reduced_transcript_key") == key:
+            reduced[episode["episode_id"]] = episode["reduced_transcript"]
+            continue
+        text = await reduce_text(transcript, token_budget)
+        reduced[episode["episode_id"]] = text
+        to_save.append({"episode_id": episode["episode_id"], "reduced_transcript": text, "reduced_transcript_key": key})
+
+    if to_save:
+        try:
+            await episode_queries.bulk_save_reduced_transcripts(to_save, pool=pool)
+        except Exception as e:
+            logger.warning(f"Could not cache {len(to_save)} reduced transcripts: {e}")
+        logger.info(f"Reduced {len(to_save)} transcripts ({len(reduced) - len(to_save)} served from cache)")
+    return reduced
@@ -0,0 +1,234 @@
+# podcast_outreach/services/pitches/batch_generator.py
+
+import asyncio
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from podcast_outreach.config import (
+    PITCH_BATCH_MAX_MATCHES,
+    PITCH_BATCH_CONCURRENCY,
+    PITCH_BATCH_PER_CAMPAIGN_CONCURRENCY,
+    PITCH_BATCH_WRITE_SIZE,
+    PITCH_BATCH_EPISODES_PER_MEDIA,
+    PITCH_BATCH_RETRY_BACKOFF_MINUTES,
+    PITCH_BATCH_RETRY_MAX_HOURS
+)
+from podcast_outreach.database.queries import campaigns as campaign_queries
+from podcast_outreach.database.queries import media as media_queries
+from podcast_outreach.database.queries import episodes as episode_queries
+from podcast_outreach.database.queries import match_suggestions as match_queries
+from podcast_outreach.database.queries import pitch_generations as pitch_gen_queries
+from podcast_outreach.database.queries import projections
+from podcast_outreach.services.ai.template_registry import template_registry
+from podcast_outreach.services.pitches.enhanced_generator import EnhancedPitchGeneratorService
+
+logger = logging.getLogger(__name__)
+
+SUBJECT_TEMPLATE_ID = "subject_line_v1"
+
+def interleave_by_campaign(matches: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Round-robin matches across campaigns so a large campaign does not delay the others."""
+    queues: "OrderedDict[Any, List[Dict[str, Any]]]" = OrderedDict()
+    for match in matches:
+        queues.setdefault(match['campaign_id'], []).append(match)
+    ordered = []
+    while queues:
+        for campaign_id in list(queues):
+            ordered.append(queues[campaign_id].pop(0))
+            if not queues[campaign_id]:
+                del queues[campaign_id]
+    return ordered
+
+class BatchPitchGenerator:
+    """
+    Generates pitches for every approved match that does not have one yet.
+
+    Campaign, media and candidate-episode rows are loaded with one query each,
+    Google Doc content and templates once per run, and the best episode is
+    picked in-process. LLM calls run with bounded concurrency, capped per
+    campaign, and finished drafts are written in bulk together with their
+    pitch records and review tasks.
+    """
+
+    def __init__(self, generator: Optional[EnhancedPitchGeneratorService] = None,
+                 concurrency: int = PITCH_BATCH_CONCURRENCY,
+                 per_campaign_concurrency: int = PITCH_BATCH_PER_CAMPAIGN_CONCURRENCY,
+                 write_size: int = PITCH_BATCH_WRITE_SIZE):
+        self.generator = generator or EnhancedPitchGeneratorService()
+        self.concurrency = max(1, concurrency)
+        self.per_campaign_concurrency = max(1, per_campaign_concurrency)
+        self.write_size = max(1, write_size)
+
+    async def _fetch_doc(self, url: Optional[str], allow_text: bool = True) -> Optional[str]:
+        """Returns Google Doc text for a docs URL, the value itself for plain text (if allowed), None on failure."""
+        if not url or not isinstance(url, str):
+            return None
+        if not url.startswith('https://docs.google.com'):
+            return url if allow_text else None
+        doc_id = self.generator._extract_google_doc_id(url)
+        if not doc_id:
+            logger.warning(f"Could not extract doc ID from URL: {url}")
+            return None
+        try:
+            return await asyncio.to_thread(self.generator.google_docs_service.get_document_content, doc_id)
+        except Exception as e:
+            logger.warning(f"Failed to fetch Google Doc {doc_id}: {e}")
+            return None
+
+    async def _resolve_campaign_content(self, campaign: Dict[str, Any]) -> Tuple[Dict[str, Any], Optional[str]]:
+        """
+        Fetches a campaign's angles, bio and media kit docs once for all of its matches.
+        Returns a copy of the campaign with angles/bio as text, and the media kit text.
+        """
+        angles, bio, media_kit = await asyncio.gather(
+            self._fetch_doc(campaign.get('campaign_angles')),
+            self._fetch_doc(campaign.get('campaign_bio')),
+            self._fetch_doc(campaign.get('media_kit_url'), allow_text=False)
+        )
+        resolved = dict(campaign)
+        resolved['campaign_angles'] = angles or ''
+        resolved['campaign_bio'] = bio or ''
+        return resolved, media_kit
+
+    async def _prefetch(self, matches: List[Dict[str, Any]], pitch_template_id: str, pool: Optional[Any]) -> Dict[str, Any]:
+        campaign_ids = list({m['campaign_id'] for m in matches})
+        media_ids = list({m['media_id'] for m in matches})
+        campaigns, media, episodes, pitch_template, subject_template = await asyncio.gather(
+            campaign_queries.get_campaigns_by_ids(campaign_ids, pool=pool, profile=projections.WITH_EMBEDDING),
+            media_queries.get_media_by_ids(media_ids, pool=pool),
+            episode_queries.get_episodes_with_content_for_media_ids(media_ids, PITCH_BATCH_EPISODES_PER_MEDIA, pool=pool),
+            template_registry.get_pitch_template(pitch_template_id),
+            template_registry.get_pitch_template(SUBJECT_TEMPLATE_ID)
+        )
+        resolved = await asyncio.gather(*(self._resolve_campaign_content(c) for c in campaigns.values()))
+        return {
+            "campaigns": {cid: content for cid, content in zip(campaigns.keys(), resolved)},
+            "media": media,
+            "episodes": episodes,
+            "templates": {tid: t for tid, t in ((pitch_template_id, pitch_template), (SUBJECT_TEMPLATE_ID, subject_template)) if t}
+        }
+
+    async def _generate_one(self, match: Dict[str, Any], context: Dict[str, Any], pitch_template_id: str,
+                            global_slots: asyncio.Semaphore, campaign_slots: asyncio.Semaphore) -> Tuple[Dict[str, Any], Any]:
+        """Generates one pitch; returns (match, draft dict) or (match, the exception that stopped it)."""
+        try:
+            return match, await self._build_draft(match, context, pitch_template_id, global_slots, campaign_slots)
+        except Exception as e:
+            logger.warning(f"Pitch generation failed for match {match['match_id']}: {e}")
+            return match, e
+
+    async def _build_draft(self, match: Dict[str, Any], context: Dict[str, Any], pitch_template_id: str,
+                           global_slots: asyncio.Semaphore, campaign_slots: asyncio.Semaphore) -> Dict[str, Any]:
+        campaign_entry = context["campaigns"].get(match['campaign_id'])
+        media = context["media"].get(match['media_id'])
+        if not campaign_entry or not media:
+            raise LookupError("Campaign or Media data not found for the match.")
+        campaign, media_kit_content = campaign_entry
+
+        episode, match_score = self.generator.rank_episodes(campaign, context["episodes"].get(match['media_id'], []))
+        if not episode:
+            raise LookupError("Could not select a best episode for pitching.")
+
+        # Take the campaign slot first so queued work from a busy campaign does not hold global slots
+        async with campaign_slots:
+            async with global_slots:
+                email_body, subject_line, _, _ = await self.generator.generate_pitch_from_template(
+                    campaign, media, episode, pitch_template_id, media_kit_content,
+                    templates=context["templates"]
+                )
+
+        if not email_body or not subject_line or email_body.startswith("ERROR:"):
+            raise RuntimeError(email_body or "AI failed to generate complete pitch email or subject line.")
+
+        return {
+            "match_id": match['match_id'],
+            "campaign_id": match['campaign_id'],
+            "media_id": match['media_id'],
+            "template_id": pitch_template_id,
+            "draft_text": email_body,
+            "subject_line": subject_line,
+            "ai_model_used": self.generator.model_name,
+            "pitch_topic": episode.get('title'),
+            "temperature": 0.4,
+            "match_score": match_score,
+            "matched_keywords": match.get('matched_keywords'),
+            "review_notes": f"Review generated pitch for campaign '{campaign.get('campaign_name')}' and podcast '{media.get('name')}'."
+        }
+
+    async def _flush(self, drafts: List[Dict[str, Any]], summary: Dict[str, Any], pool: Optional[Any]) -> None:
+        if not drafts:
+            return
+        try:
+            written = await pitch_gen_queries.bulk_create_pitch_drafts(drafts, pool=pool)
+            summary["written"] += len(written)
+            summary["skipped"] += len(drafts) - len(written)
+        except Exception as e:
+            logger.error(f"Failed to write {len(drafts)} pitch drafts: {e}", exc_info=True)
+            summary["failed"].extend({"match_id": d["match_id"], "error": f"Write failed: {e}"} for d in drafts)
+        drafts.clear()
+
+    async def run(self, limit: int = PITCH_BATCH_MAX_MATCHES, campaign_id: Optional[uuid.UUID] = None,
+                  pitch_template_id: str = "generic_pitch_v1", pool: Optional[Any] = None) -> Dict[str, Any]:
+        """
+        Generate pitches for up to `limit` approved matches without pitches.
+
+        Returns:
+            Summary with counts of matches, written and skipped drafts, and per-match failures.
+        """
+        start_time = time.time()
+        summary: Dict[str, Any] = {"matches": 0, "written": 0, "skipped": 0, "failed": []}
+
+        matches = await match_queries.get_approved_matches_without_pitches(
+            limit, campaign_id, pool=pool,
+            retry_backoff_minutes=PITCH_BATCH_RETRY_BACKOFF_MINUTES,
+            retry_max_hours=PITCH_BATCH_RETRY_MAX_HOURS
+        )
+        # A (campaign, media) pair only ever gets one pitch
+        unique: Dict[Tuple[Any, int], Dict[str, Any]] = {}
+        for match in matches:
+            unique.setdefault((match['campaign_id'], match['media_id']), match)
+        matches = interleave_by_campaign(list(unique.values()))
+        summary["matches"] = len(matches)
+        if not matches:
+            logger.info("No approved matches waiting for pitches")
+            return summary
+
+        context = await self._prefetch(matches, pitch_template_id, pool)
+        if pitch_template_id not in context["templates"]:
+            logger.error(f"Pitch template '{pitch_template_id}' not found; skipping {len(matches)} matches")
+            summary["failed"] = [{"match_id": m['match_id'], "error": "Pitch template not found"} for m in matches]
+            return summary
+
+        global_slots = asyncio.Semaphore(self.concurrency)
+        campaign_slots = {cid: asyncio.Semaphore(self.per_campaign_concurrency) for cid in {m['campaign_id'] for m in matches}}
+        tasks = [
+            asyncio.create_task(self._generate_one(m, context, pitch_template_id, global_slots, campaign_slots[m['campaign_id']]))
+            for m in matches
+        ]
+
+        # Write drafts as they finish so a late failure does not throw away earlier LLM work
+        pending_drafts: List[Dict[str, Any]] = []
+        for next_done in asyncio.as_completed(tasks):
+            match, outcome = await next_done
+            if isinstance(outcome, Exception):
+                summary["failed"].append({"match_id": match['match_id'], "error": str(outcome)})
+                continue
+            pending_drafts.append(outcome)
+            if len(pending_drafts) >= self.write_size:
+                await self._flush(pending_drafts, summary, pool)
+        await self._flush(pending_drafts, summary, pool)
+
+        # Failed matches back off instead of heading the next batch again
+        try:
+            await match_queries.record_pitch_failures(summary["failed"], pool=pool)
+        except Exception as e:
+            logger.error(f"Failed to record {len(summary['failed'])} pitch failures: {e}")
+
+        logger.info(
+            f"Batch pitch generation: {summary['written']} written, {summary['skipped']} skipped, "
+            f"{len(summary['failed'])} failed out of {summary['matches']} matches in {time.time() - start_time:.1f}s"
+        )
+        return summary
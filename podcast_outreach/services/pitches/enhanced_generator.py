@@ -19,22 +19,21 @@ from langchain_core.prompts import ChatPromptTemplate, HumanMessagePromptTemplat
 from langchain_core.messages import SystemMessage
 from langchain_core.exceptions import OutputParserException
 
-# Anthropic for tokenizer
-import anthropic
-
 # Project imports
 from podcast_outreach.config import ANTHROPIC_API_KEY, GEMINI_API_KEY
 from podcast_outreach.logging_config import get_logger
 from podcast_outreach.database.queries import campaigns as campaign_queries
 from podcast_outreach.database.queries import media as media_queries
 from podcast_outreach.database.queries import episodes as episode_queries
+from podcast_outreach.database.queries import projections
 from podcast_outreach.database.queries import match_suggestions as match_queries
 from podcast_outreach.database.queries import pitch_generations as pitch_gen_queries
 from podcast_outreach.database.queries import pitches as pitch_queries
 from podcast_outreach.database.queries import review_tasks as review_task_queries
-from podcast_outreach.database.queries import pitch_templates as pitch_template_queries
 from podcast_outreach.integrations import google_docs as google_docs_integration
 from podcast_outreach.services.ai.tracker import tracker as ai_tracker
+from podcast_outreach.services.ai.token_counter import token_counter
+from podcast_outreach.services.ai.template_registry import template_registry, CompiledTemplate
 
 logger = get_logger(__name__)
 
@@ -51,10 +50,6 @@ class EnhancedPitchGeneratorService:
         self.model_name = "claude-3-5-sonnet-20241022"
         self.llm = self._get_llm_client(self.model_name)
         
-        self.anthropic_client = None
-        if "claude" in self.model_name.lower() and ANTHROPIC_API_KEY:
-            self.anthropic_client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY)
-        
         logger.info(f"EnhancedPitchGeneratorService initialized with LLM: {self.model_name}")
 
     def _get_llm_client(self, model_name: str):
@@ -90,19 +85,8 @@ class EnhancedPitchGeneratorService:
         return None
 
     def _count_tokens(self, text: str) -> int:
-        """Count tokens accurately using the appropriate tokenizer for the LLM."""
-        if "claude" in self.model_name.lower() and self.anthropic_client:
-            try:
-                count_result = self.anthropic_client.beta.messages.count_tokens(
-                    model=self.model_name,
-                    messages=[{"role": "user", "content": text}]
-                )
-                return count_result.input_tokens
-            except Exception as e:
-                logger.warning(f"Error counting Claude tokens: {str(e)}. Falling back to estimation.")
-                return len(text) // 4
-        else:
-            return len(text) // 4
+        """Count tokens locally with the tokenizer for this service's model family."""
+        return token_counter.count(text, self.model_name)
 
     def _extract_talking_points_from_angles(self, angles_text: str) -> List[str]:
         """Extract key talking points from campaign angles text."""
@@ -194,9 +178,15 @@ class EnhancedPitchGeneratorService:
         
         return "sharing valuable insights with your audience"
 
-    def _convert_template_format(self, template_content: str) -> str:
-        """Convert double brace {{var}} to single brace {var} for LangChain compatibility."""
-        return re.sub(r'\{\{(\w+)\}\}', r'{\1}', template_content)
+    async def _get_template(self, template_id: str, templates: Optional[Dict[str, Dict[str, Any]]] = None) -> Optional[Dict[str, Any]]:
+        """Returns a prefetched template when available, otherwise the registry's cached copy."""
+        if templates and template_id in templates:
+            return templates[template_id]
+        return await template_registry.get_pitch_template(template_id)
+
+    def _convert_template_format(self, template: Dict[str, Any]) -> CompiledTemplate:
+        """Compiled template with double brace {{var}} converted to single brace {var} for LangChain compatibility."""
+        return template_registry.compile_pitch_template(template)
 
     async def select_best_episode(self, campaign_id: uuid.UUID, media_id: int) -> Tuple[Optional[Dict[str, Any]], Optional[float]]:
         """
@@ -204,19 +194,26 @@ class EnhancedPitchGeneratorService:
         """
         logger.info(f"Selecting best episode for campaign {campaign_id} and media {media_id}")
 
-        campaign = await campaign_queries.get_campaign_by_id(campaign_id)
+        campaign = await campaign_queries.get_campaign_by_id(campaign_id, profile=projections.WITH_EMBEDDING)
         if not campaign:
             logger.error(f"Campaign {campaign_id} not found for episode selection.")
             return None, None
 
-        campaign_embedding = campaign.get('embedding')
-        campaign_keywords = campaign.get('campaign_keywords', [])
-
         episodes = await episode_queries.get_episodes_for_media_with_content(media_id)
         if not episodes:
             logger.warning(f"No episodes with content found for media {media_id}.")
             return None, None
 
+        return self.rank_episodes(campaign, episodes)
+
+    def rank_episodes(self, campaign: Dict[str, Any], episodes: List[Dict[str, Any]]) -> Tuple[Optional[Dict[str, Any]], Optional[float]]:
+        """
+        Picks the best episode from already-loaded candidates: embedding similarity,
+        then keyword overlap, then recency. Shared by select_best_episode and batch generation.
+        """
+        campaign_embedding = campaign.get('embedding')
+        campaign_keywords = campaign.get('campaign_keywords') or []
+
         best_episode = None
         highest_score = -1.0
 
@@ -243,10 +240,10 @@ class EnhancedPitchGeneratorService:
         if campaign_keywords:
             for episode in episodes:
                 episode_content = " ".join([
-                    episode.get('ai_episode_summary', ''),
-                    episode.get('episode_summary', ''),
-                    episode.get('transcript', ''),
-                    episode.get('title', '')
+                    (episode.get('ai_episode_summary') or ''),
+                    (episode.get('episode_summary') or ''),
+                    (episode.get('transcript') or ''),
+                    (episode.get('title') or '')
                 ]).lower()
                 
                 if episode_content:
@@ -275,7 +272,7 @@ class EnhancedPitchGeneratorService:
             logger.info(f"Best episode selected by recency: {best_episode.get('title')} (Score: {highest_score})")
             return best_episode, highest_score
 
-        logger.warning(f"Could not select a best episode for campaign {campaign_id} and media {media_id}.")
+        logger.warning(f"Could not select a best episode for campaign {campaign.get('campaign_id')}.")
         return None, None
 
     async def generate_pitch_from_template(
@@ -284,22 +281,24 @@ class EnhancedPitchGeneratorService:
         media_data: Dict[str, Any],
         episode_data: Dict[str, Any],
         pitch_template_id_str: str,
-        media_kit_content: Optional[str] = None
+        media_kit_content: Optional[str] = None,
+        templates: Optional[Dict[str, Dict[str, Any]]] = None
     ) -> Tuple[Optional[str], Optional[str], Dict[str, int], float]:
         """
         Generates a pitch email and subject line using an LLM and a specified template.
+        Templates found in `templates` (keyed by template_id) are used instead of a DB lookup.
         """
         start_time = time.time()
         total_token_usage = {"input_tokens": 0, "output_tokens": 0}
         
         # Fetch template from DB
-        db_template = await pitch_template_queries.get_template_by_id(pitch_template_id_str)
+        db_template = await self._get_template(pitch_template_id_str, templates)
         if not db_template or not db_template.get('prompt_body'):
             logger.error(f"Pitch template with ID '{pitch_template_id_str}' not found in DB or has no prompt_body.")
             return None, None, total_token_usage, 0.0
         
-        # Convert template format
-        pitch_template_content = self._convert_template_format(db_template['prompt_body'])
+        # Convert template format (compiled once per template body)
+        pitch_template = self._convert_template_format(db_template)
         
         # Extract host names from media data
         host_names_list = media_data.get('host_names', [])
@@ -401,13 +400,13 @@ class EnhancedPitchGeneratorService:
         
         IMPORTANT: Return ONLY the email body text, without any JSON formatting, field names, or metadata. The email should be ready to send as-is."""
         
-        human_message_template = pitch_template_content + "\n\nGenerate the pitch email based on the above template and the provided information."
+        human_message_template = pitch_template.text + "\n\nGenerate the pitch email based on the above template and the provided information."
         
-        # Use ChatPromptTemplate for better structure
-        prompt = ChatPromptTemplate.from_messages([
+        # Use ChatPromptTemplate for better structure; parsed once and reused for every pitch with this template
+        prompt = pitch_template.memo("pitch_body_prompt", lambda: ChatPromptTemplate.from_messages([
             SystemMessage(content=system_message),
             HumanMessagePromptTemplate.from_template(human_message_template)
-        ])
+        ]))
         
         generated_email_body = None
         generated_subject_line = None
@@ -443,10 +442,10 @@ class EnhancedPitchGeneratorService:
 
         # Subject line generation
         subject_template_id = "subject_line_v1"
-        db_subject_template = await pitch_template_queries.get_template_by_id(subject_template_id)
+        db_subject_template = await self._get_template(subject_template_id, templates)
 
         if db_subject_template and db_subject_template.get('prompt_body'):
-            subject_template_content = self._convert_template_format(db_subject_template['prompt_body'])
+            subject_template = self._convert_template_format(db_subject_template)
             
             subject_inputs = {
                 "podcast_name": media_data.get('name', 'your podcast'),
@@ -460,10 +459,10 @@ class EnhancedPitchGeneratorService:
             }
             
             subject_system_message = "Generate a clear, engaging email subject line based on the template. Return ONLY the subject line text, nothing else."
-            subject_prompt = ChatPromptTemplate.from_messages([
+            subject_prompt = subject_template.memo("subject_prompt", lambda: ChatPromptTemplate.from_messages([
                 SystemMessage(content=subject_system_message),
-                HumanMessagePromptTemplate.from_template(subject_template_content)
-            ])
+                HumanMessagePromptTemplate.from_template(subject_template.text)
+            ]))
             
             try:
                 subject_messages = subject_prompt.format_messages(**subject_inputs)
@@ -17,22 +17,21 @@ from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.prompts import PromptTemplate
 from langchain_core.exceptions import OutputParserException
  
-# Anthropic for tokenizer (for accurate token counting)
-import anthropic
- 
 # Project imports
 from podcast_outreach.config import ANTHROPIC_API_KEY, GEMINI_API_KEY
 from podcast_outreach.logging_config import get_logger
 from podcast_outreach.database.queries import campaigns as campaign_queries
 from podcast_outreach.database.queries import media as media_queries
 from podcast_outreach.database.queries import episodes as episode_queries
+from podcast_outreach.database.queries import projections
 from podcast_outreach.database.queries import match_suggestions as match_queries
 from podcast_outreach.database.queries import pitch_generations as pitch_gen_queries
 from podcast_outreach.database.queries import pitches as pitch_queries
 from podcast_outreach.database.queries import review_tasks as review_task_queries
-from podcast_outreach.database.queries import pitch_templates as pitch_template_queries
 from podcast_outreach.integrations import google_docs as google_docs_integration
 from podcast_outreach.services.ai.tracker import tracker as ai_tracker
+from podcast_outreach.services.ai.token_counter import token_counter
+from podcast_outreach.services.ai.template_registry import template_registry
 from podcast_outreach.api.schemas.pitch_schemas import PitchEmail, SubjectLine
  
 logger = get_logger(__name__)
@@ -50,12 +49,6 @@ class PitchGeneratorService:
  
         self.model_name = "claude-3-5-sonnet-20241022" # Default model
         self.llm = self._get_llm_client(self.model_name)
- 
-        self.anthropic_client = None
-        if "claude" in self.model_name.lower() and ANTHROPIC_API_KEY:
-            self.anthropic_client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY)
-        elif "gemini" in self.model_name.lower() and GEMINI_API_KEY:
-            pass
         
         logger.info(f"PitchGeneratorService initialized with LLM: {self.model_name}")
  
@@ -92,23 +85,8 @@ class PitchGeneratorService:
         return None
  
     def _count_tokens(self, text: str) -> int:
-        """
-        Count tokens accurately using the appropriate tokenizer for the LLM.
-        """
-        if "claude" in self.model_name.lower() and self.anthropic_client:
-            try:
-                count_result = self.anthropic_client.beta.messages.count_tokens(
-                    model=self.model_name,
-                    messages=[{"role": "user", "content": text}]
-                )
-                return count_result.input_tokens
-            except Exception as e:
-                logger.warning(f"Error counting Claude tokens: {str(e)}. Falling back to estimation.")
-                return len(text) // 4
-        elif "gemini" in self.model_name.lower():
-            return len(text) // 4
-        else:
-            return len(text) // 4
+        """Count tokens locally with the tokenizer for this service's model family."""
+        return token_counter.count(text, self.model_name)
  
     async def select_best_episode(self, campaign_id: uuid.UUID, media_id: int) -> Tuple[Optional[Dict[str, Any]], Optional[float]]:
         """
@@ -118,7 +96,7 @@ class PitchGeneratorService:
         """
         logger.info(f"Selecting best episode for campaign {campaign_id} and media {media_id}")
  
-        campaign = await campaign_queries.get_campaign_by_id(campaign_id)
+        campaign = await campaign_queries.get_campaign_by_id(campaign_id, profile=projections.WITH_EMBEDDING)
         if not campaign:
             logger.error(f"Campaign {campaign_id} not found for episode selection.")
             return None, None
@@ -190,7 +168,7 @@ class PitchGeneratorService:
         total_token_usage = {"input_tokens": 0, "output_tokens": 0}
         
         # Fetch template from DB
-        db_template = await pitch_template_queries.get_template_by_id(pitch_template_id_str)
+        db_template = await template_registry.get_pitch_template(pitch_template_id_str)
         if not db_template or not db_template.get('prompt_body'):
             logger.error(f"Pitch template with ID '{pitch_template_id_str}' not found in DB or has no prompt_body.")
             return None, None, total_token_usage, 0.0
@@ -275,7 +253,7 @@ class PitchGeneratorService:
  
         # Subject line generation - use our subject_line_v1 template
         subject_template_id_for_db = "subject_line_v1"
-        db_subject_template = await pitch_template_queries.get_template_by_id(subject_template_id_for_db)
+        db_subject_template = await template_registry.get_pitch_template(subject_template_id_for_db)
 
         if db_subject_template and db_subject_template.get('prompt_body'):
             subject_line_template_content = db_subject_template['prompt_body']
@@ -2,36 +2,128 @@
 
 import asyncio
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, Callable, Optional, Any
+import os
+import random
+import socket
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Callable, Optional, Any, List, Awaitable, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
+import asyncpg
+
 from podcast_outreach.services.tasks.manager import TaskManager
 from podcast_outreach.services.database_service import DatabaseService
+from podcast_outreach.database.connection import workload_context, WORKLOAD_BACKGROUND, create_dedicated_connection
+from podcast_outreach.database.queries import scheduled_tasks as scheduled_task_queries
+from podcast_outreach.database.queries import background_tasks as background_task_queries
+from podcast_outreach.database.queries import episodes as episode_queries
+from podcast_outreach.database.queries import campaign_media_discoveries as cmd_queries
+from podcast_outreach.database.queries import chatbot_session_states as session_state_queries
+from podcast_outreach.services.events.event_bus import get_event_bus, Event, EventType
+from podcast_outreach.config import (
+    PIPELINE_JOB_QUEUE_ENABLED,
+    PIPELINE_BACKFILL_INTERVAL_SECONDS,
+    SCHEDULER_TICK_SECONDS,
+    SCHEDULER_JITTER_SECONDS,
+    SCHEDULER_RUN_HISTORY_DAYS,
+    TASK_HISTORY_DAYS,
+    CHATBOT_SESSION_RETENTION_HOURS,
+    PIPELINE_LLM_CALLS_PER_HOUR,
+    SCHEDULER_WAKE_DEBOUNCE_SECONDS,
+    TRANSCRIPTION_MIN_BATCH_SIZE,
+    TRANSCRIPTION_MAX_BATCH_SIZE,
+    TRANSCRIPTION_MIN_INTERVAL_SECONDS,
+    TRANSCRIPTION_MAX_INTERVAL_SECONDS,
+    VETTING_MIN_BATCH_SIZE,
+    VETTING_MAX_BATCH_SIZE,
+    VETTING_MIN_INTERVAL_SECONDS,
+    VETTING_MAX_INTERVAL_SECONDS,
+    AI_DESCRIPTION_MIN_BATCH_SIZE,
+    AI_DESCRIPTION_MAX_BATCH_SIZE,
+    AI_DESCRIPTION_MIN_INTERVAL_SECONDS,
+    AI_DESCRIPTION_MAX_INTERVAL_SECONDS
+)
 
 logger = logging.getLogger(__name__)
 
+# Session advisory lock held by the scheduler that runs tasks for the whole fleet
+SCHEDULER_LOCK_NAME = "podcast_outreach:task_scheduler"
+# NOTIFY channel on which woken tasks are announced to the leader
+SCHEDULER_WAKE_CHANNEL = "scheduler_wake"
+
 class ScheduleType(Enum):
     INTERVAL = "interval"
     DAILY = "daily"
     WEEKLY = "weekly"
 
+@dataclass
+class AdaptivePolicy:
+    """
+    Scales a task's batch size and run frequency with its backlog.
+
+    An empty backlog runs min_batch every max_interval_seconds; a backlog of
+    max_batch or more runs max_batch every min_interval_seconds, with the
+    interval interpolated in between. wake_events bring the next run forward
+    (to no sooner than min_interval_seconds after the last one).
+    """
+    backlog_fn: Callable[[], Awaitable[int]]
+    min_batch: int
+    max_batch: int
+    min_interval_seconds: int
+    max_interval_seconds: int
+    llm_calls_per_item: float = 0  # Estimate charged against PIPELINE_LLM_CALLS_PER_HOUR
+    wake_events: Tuple[EventType, ...] = ()
+
+    def plan(self, backlog: int) -> Tuple[int, int]:
+        """Batch size and seconds until the following run, for a measured backlog"""
+        if backlog <= 0:
+            return self.min_batch, self.max_interval_seconds
+        batch_size = max(self.min_batch, min(backlog, self.max_batch))
+        fill = min(1.0, backlog / self.max_batch)
+        interval = self.max_interval_seconds - (self.max_interval_seconds - self.min_interval_seconds) * fill
+        return batch_size, int(interval)
+
 @dataclass
 class ScheduledTask:
     name: str
     task_function: Callable
     schedule_type: ScheduleType
     interval_seconds: Optional[int] = None
-    time_of_day: Optional[str] = None  # Format: "HH:MM"
+    time_of_day: Optional[str] = None  # Format: "HH:MM", UTC
     day_of_week: Optional[int] = None  # 0=Monday, 6=Sunday
     last_run: Optional[datetime] = None
     enabled: bool = True
+    # Mirrored from scheduled_task_state
+    next_run: Optional[datetime] = None
+    last_status: Optional[str] = None
+    last_duration_ms: Optional[int] = None
+    # Adaptive tasks take a batch_size argument; interval_seconds is their fallback
+    adaptive: Optional[AdaptivePolicy] = None
+    last_backlog: Optional[int] = None
+    last_batch_size: Optional[int] = None
 
 class TaskScheduler:
     """
     Centralized scheduler for background tasks with different scheduling patterns.
     Provides automated execution of periodic processes without manual triggers.
+
+    Every instance runs the scheduler loop, but only the one holding the
+    scheduler advisory lock (on a dedicated connection, so the lock is released
+    if the process dies) starts runs; the others stand by and take over within
+    a tick. Next run times, enabled flags and run history live in
+    scheduled_task_state / scheduled_task_runs, so restarts do not re-trigger
+    tasks and any instance can report status. A run is claimed by moving the
+    task's next_run_at forward in the statement that checks it is due, so it
+    happens once even if two schedulers briefly both think they lead.
+
+    Adaptive tasks measure their backlog when due and size the run and the
+    gap to the next one from it, within the bounds of their AdaptivePolicy
+    and the shared hourly LLM budget. Events that signal new work wake them
+    early: any instance moves the task's next run forward and NOTIFYs the
+    leader, which listens on its lock connection and dispatches at once.
     """
     
     def __init__(self, task_manager: TaskManager):
@@ -39,6 +131,13 @@ class TaskScheduler:
         self.scheduled_tasks: Dict[str, ScheduledTask] = {}
         self.running = False
         self.scheduler_task: Optional[asyncio.Task] = None
+        self.instance_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self.is_leader = False
+        self._leader_conn: Optional[asyncpg.Connection] = None
+        self._states_synced = False
+        self._last_prune: Optional[datetime] = None
+        self._wakeup = asyncio.Event()
+        self._last_wake: Dict[str, float] = {}
         
         # Track running tasks to prevent concurrent execution
         self.running_tasks: Dict[str, asyncio.Task] = {}
@@ -51,34 +150,75 @@ class TaskScheduler:
             'transcription_pipeline': asyncio.Semaphore(2),     # Max 2 concurrent
             'episode_sync': asyncio.Semaphore(1),               # Only 1 concurrent
             'qualitative_assessment': asyncio.Semaphore(1),     # Only 1 concurrent
-            'workflow_health_check': asyncio.Semaphore(1)       # Only 1 concurrent
+            'workflow_health_check': asyncio.Semaphore(1),      # Only 1 concurrent
+            'pipeline_backfill': asyncio.Semaphore(1)           # Only 1 concurrent
         }
         
-        logger.info("TaskScheduler initialized with concurrency controls")
+        logger.info(f"TaskScheduler {self.instance_id} initialized with concurrency controls")
     
     def register_task(self, scheduled_task: ScheduledTask):
         """Register a task for automated scheduling"""
+        if scheduled_task.schedule_type == ScheduleType.INTERVAL and not scheduled_task.interval_seconds:
+            raise ValueError(f"Interval task {scheduled_task.name} needs interval_seconds")
+        policy = scheduled_task.adaptive
+        if policy and (scheduled_task.schedule_type != ScheduleType.INTERVAL
+                       or not 0 < policy.min_batch <= policy.max_batch
+                       or not 0 < policy.min_interval_seconds <= policy.max_interval_seconds):
+            raise ValueError(f"Adaptive task {scheduled_task.name} needs an interval schedule "
+                             f"and 0 < min <= max batch sizes and intervals")
+        if scheduled_task.schedule_type != ScheduleType.INTERVAL and not scheduled_task.time_of_day:
+            raise ValueError(f"{scheduled_task.schedule_type.value} task {scheduled_task.name} needs time_of_day")
+        if scheduled_task.schedule_type == ScheduleType.WEEKLY and scheduled_task.day_of_week is None:
+            raise ValueError(f"Weekly task {scheduled_task.name} needs day_of_week")
         self.scheduled_tasks[scheduled_task.name] = scheduled_task
         logger.info(f"Registered scheduled task: {scheduled_task.name}")
     
     def register_default_tasks(self):
         """Register the default set of automated background tasks"""
         
-        # Transcription pipeline - every 30 minutes
+        # Transcription pipeline - every 5 to 60 minutes depending on the backlog
         self.register_task(ScheduledTask(
             name="transcription_pipeline",
             task_function=self._run_transcription_pipeline,
             schedule_type=ScheduleType.INTERVAL,
-            interval_seconds=30 * 60  # 30 minutes
+            interval_seconds=TRANSCRIPTION_MAX_INTERVAL_SECONDS,
+            adaptive=AdaptivePolicy(
+                backlog_fn=episode_queries.count_episodes_for_transcription,
+                min_batch=TRANSCRIPTION_MIN_BATCH_SIZE,
+                max_batch=TRANSCRIPTION_MAX_BATCH_SIZE,
+                min_interval_seconds=TRANSCRIPTION_MIN_INTERVAL_SECONDS,
+                max_interval_seconds=TRANSCRIPTION_MAX_INTERVAL_SECONDS,
+                llm_calls_per_item=2,  # Transcription and episode analysis
+                wake_events=(EventType.EPISODES_FETCHED,)
+            )
         ))
         
-        # Vetting pipeline - every 15 minutes  
-        self.register_task(ScheduledTask(
-            name="vetting_pipeline",
-            task_function=self._run_vetting_pipeline,
-            schedule_type=ScheduleType.INTERVAL,
-            interval_seconds=15 * 60  # 15 minutes
-        ))
+        if PIPELINE_JOB_QUEUE_ENABLED:
+            # Vetting and AI descriptions run from the pipeline job queue; this
+            # only queues discoveries that are waiting without a job
+            self.register_task(ScheduledTask(
+                name="pipeline_backfill",
+                task_function=self._run_pipeline_backfill,
+                schedule_type=ScheduleType.INTERVAL,
+                interval_seconds=PIPELINE_BACKFILL_INTERVAL_SECONDS
+            ))
+        else:
+            # Vetting pipeline - every 2 to 30 minutes depending on the backlog
+            self.register_task(ScheduledTask(
+                name="vetting_pipeline",
+                task_function=self._run_vetting_pipeline,
+                schedule_type=ScheduleType.INTERVAL,
+                interval_seconds=VETTING_MAX_INTERVAL_SECONDS,
+                adaptive=AdaptivePolicy(
+                    backlog_fn=cmd_queries.count_discoveries_ready_for_vetting,
+                    min_batch=VETTING_MIN_BATCH_SIZE,
+                    max_batch=VETTING_MAX_BATCH_SIZE,
+                    min_interval_seconds=VETTING_MIN_INTERVAL_SECONDS,
+                    max_interval_seconds=VETTING_MAX_INTERVAL_SECONDS,
+                    llm_calls_per_item=1,
+                    wake_events=(EventType.ENRICHMENT_COMPLETED,)
+                )
+            ))
         
         # Episode sync - daily at 02:00
         self.register_task(ScheduledTask(
@@ -104,13 +244,23 @@ class TaskScheduler:
             interval_seconds=2 * 60 * 60  # 2 hours
         ))
         
-        # AI description completion - every 10 minutes
-        self.register_task(ScheduledTask(
-            name="ai_description_completion",
-            task_function=self._run_ai_description_completion,
-            schedule_type=ScheduleType.INTERVAL,
-            interval_seconds=10 * 60  # 10 minutes
-        ))
+        # AI description completion - every 2 to 30 minutes depending on the backlog
+        if not PIPELINE_JOB_QUEUE_ENABLED:
+            self.register_task(ScheduledTask(
+                name="ai_description_completion",
+                task_function=self._run_ai_description_completion,
+                schedule_type=ScheduleType.INTERVAL,
+                interval_seconds=AI_DESCRIPTION_MAX_INTERVAL_SECONDS,
+                adaptive=AdaptivePolicy(
+                    backlog_fn=cmd_queries.count_discoveries_needing_ai_description,
+                    min_batch=AI_DESCRIPTION_MIN_BATCH_SIZE,
+                    max_batch=AI_DESCRIPTION_MAX_BATCH_SIZE,
+                    min_interval_seconds=AI_DESCRIPTION_MIN_INTERVAL_SECONDS,
+                    max_interval_seconds=AI_DESCRIPTION_MAX_INTERVAL_SECONDS,
+                    llm_calls_per_item=1,
+                    wake_events=(EventType.ENRICHMENT_COMPLETED,)
+                )
+            ))
         
         # Workflow health check - every 30 minutes
         self.register_task(ScheduledTask(
@@ -147,6 +297,44 @@ class TaskScheduler:
         
         logger.info(f"Registered {len(self.scheduled_tasks)} default background tasks")
     
+    def subscribe_wake_events(self):
+        """Wake adaptive tasks when the event bus reports new work for them"""
+        event_bus = get_event_bus()
+        for task_name, scheduled_task in self.scheduled_tasks.items():
+            if not scheduled_task.adaptive:
+                continue
+            
+            async def wake_handler(event: Event, task_name: str = task_name):
+                await self.wake(task_name)
+            
+            for event_type in scheduled_task.adaptive.wake_events:
+                event_bus.subscribe(event_type, wake_handler)
+    
+    async def wake(self, task_name: str) -> bool:
+        """
+        Bring an adaptive task's next run forward on whichever instance leads.
+        Calls within SCHEDULER_WAKE_DEBOUNCE_SECONDS of the last one are
+        dropped, so a burst of events costs one query.
+        """
+        scheduled_task = self.scheduled_tasks.get(task_name)
+        if not scheduled_task or not scheduled_task.adaptive or not scheduled_task.enabled:
+            return False
+        now = time.monotonic()
+        last_wake = self._last_wake.get(task_name)
+        if last_wake is not None and now - last_wake < SCHEDULER_WAKE_DEBOUNCE_SECONDS:
+            return False
+        self._last_wake[task_name] = now
+        try:
+            woken = await scheduled_task_queries.wake_task(
+                task_name, scheduled_task.adaptive.min_interval_seconds, SCHEDULER_WAKE_CHANNEL
+            )
+        except Exception as e:
+            logger.warning(f"Could not wake scheduled task {task_name}: {e}")
+            return False
+        if woken:
+            logger.info(f"Woke scheduled task {task_name}")
+        return woken
+    
     async def start(self):
         """Start the scheduler"""
         if self.running:
@@ -156,7 +344,10 @@ class TaskScheduler:
         self.running = True
         try:
             loop = asyncio.get_running_loop()
-            self.scheduler_task = loop.create_task(self._scheduler_loop())
+            # Scheduled jobs (and tasks they spawn) use the background pool
+            self.scheduler_task = loop.create_task(
+                self._scheduler_loop(), context=workload_context(WORKLOAD_BACKGROUND)
+            )
         except RuntimeError:
             logger.error("No running event loop to start scheduler")
             self.running = False
@@ -164,7 +355,7 @@ class TaskScheduler:
         logger.info("TaskScheduler started")
     
     async def stop(self):
-        """Stop the scheduler"""
+        """Stop the scheduler and hand leadership to another instance. Runs in progress finish on their own."""
         self.running = False
         if self.scheduler_task:
             self.scheduler_task.cancel()
@@ -172,204 +363,372 @@ class TaskScheduler:
                 await self.scheduler_task
             except asyncio.CancelledError:
                 pass
+        await self._release_leadership()
         logger.info("TaskScheduler stopped")
     
     async def _scheduler_loop(self):
-        """Main scheduler loop with concurrency controls"""
+        """Main scheduler loop: keep or take leadership, then (as leader) start the runs that are due"""
         while self.running:
             try:
-                current_time = datetime.now()
-                
-                for task_name, scheduled_task in self.scheduled_tasks.items():
-                    if not scheduled_task.enabled:
-                        continue
-                    
-                    if self._should_run_task(scheduled_task, current_time):
-                        # Check if task is already running
-                        if task_name in self.running_tasks and not self.running_tasks[task_name].done():
-                            logger.info(f"Task {task_name} is already running, skipping this cycle")
-                            continue
-                        
-                        # Check semaphore availability
-                        semaphore = self.task_semaphores.get(task_name)
-                        if semaphore and semaphore.locked():
-                            logger.info(f"Max concurrent {task_name} tasks reached, skipping")
-                            continue
-                        
-                        logger.info(f"Triggering scheduled task: {task_name}")
-                        
-                        # Create task with semaphore protection
-                        if semaphore:
-                            self.running_tasks[task_name] = asyncio.create_task(
-                                self._run_task_with_semaphore(scheduled_task, semaphore, current_time)
-                            )
-                        else:
-                            self.running_tasks[task_name] = asyncio.create_task(
-                                self._run_task(scheduled_task, current_time)
-                            )
-                
-                # Sleep for 60 seconds before next check
-                await asyncio.sleep(60)
-                
+                if await self._ensure_leadership():
+                    await self._dispatch_due_tasks()
+                else:
+                    # Standby instances keep their view current for status requests
+                    self._apply_states(await scheduled_task_queries.get_task_states())
             except Exception as e:
                 logger.error(f"Error in scheduler loop: {e}", exc_info=True)
-                await asyncio.sleep(60)
-    
-    async def _run_task_with_semaphore(self, scheduled_task: ScheduledTask, semaphore: asyncio.Semaphore, current_time: datetime):
-        """Run a task with semaphore protection"""
-        async with semaphore:
-            await self._run_task(scheduled_task, current_time)
+            # Sleep until the next tick, or until a woken task is announced
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=SCHEDULER_TICK_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
     
-    async def _run_task(self, scheduled_task: ScheduledTask, current_time: datetime):
-        """Run a scheduled task"""
+    async def _ensure_leadership(self) -> bool:
+        """Hold or try to take the scheduler advisory lock. Returns whether this instance leads."""
+        if self.is_leader:
+            try:
+                await self._leader_conn.fetchval("SELECT 1")
+                return True
+            except Exception as e:
+                # The session lock is gone with the connection; another instance may take over
+                logger.error(f"Scheduler {self.instance_id} lost its leader connection, stepping down: {e}")
+                await self._release_leadership()
+                return False
+        
         try:
-            await scheduled_task.task_function()
-            scheduled_task.last_run = current_time
+            if self._leader_conn is None or self._leader_conn.is_closed():
+                self._leader_conn = await create_dedicated_connection()
+            acquired = await self._leader_conn.fetchval(
+                "SELECT pg_try_advisory_lock(hashtext($1))", SCHEDULER_LOCK_NAME
+            )
         except Exception as e:
-            logger.error(f"Error running scheduled task {scheduled_task.name}: {e}", exc_info=True)
+            logger.warning(f"Scheduler {self.instance_id} could not check leadership: {e}")
+            await self._release_leadership()
+            return False
+        
+        if acquired:
+            self.is_leader = True
+            self._states_synced = False
+            try:
+                await self._leader_conn.add_listener(SCHEDULER_WAKE_CHANNEL, self._on_wake_notification)
+            except Exception as e:
+                logger.warning(f"Scheduler {self.instance_id} could not listen for wake-ups, relying on ticks: {e}")
+            logger.info(f"Scheduler {self.instance_id} is now the leader")
+        return self.is_leader
     
-    def _should_run_task(self, task: ScheduledTask, current_time: datetime) -> bool:
-        """Determine if a task should run based on its schedule"""
-        if task.schedule_type == ScheduleType.INTERVAL:
-            if task.last_run is None:
-                return True
-            
-            elapsed = (current_time - task.last_run).total_seconds()
-            return elapsed >= task.interval_seconds
+    def _on_wake_notification(self, connection, pid, channel, payload):
+        """asyncpg listener: a task was woken, so dispatch without waiting for the tick"""
+        logger.debug(f"Scheduler wake-up for {payload}")
+        self._wakeup.set()
+    
+    async def _release_leadership(self):
+        """Close the leader connection, which releases the advisory lock"""
+        was_leader, self.is_leader = self.is_leader, False
+        conn, self._leader_conn = self._leader_conn, None
+        if conn is not None and not conn.is_closed():
+            try:
+                await conn.close()
+            except Exception as e:
+                logger.warning(f"Error closing scheduler leader connection: {e}")
+        if was_leader:
+            logger.info(f"Scheduler {self.instance_id} released leadership")
+    
+    async def _dispatch_due_tasks(self):
+        """Claim and start every due task that is not already running here"""
+        now = datetime.now(timezone.utc)
+        if not self._states_synced:
+            states = await scheduled_task_queries.sync_task_states(
+                {name: self._first_run(task, now) for name, task in self.scheduled_tasks.items()},
+                {name: self._compute_next_run(task, now) for name, task in self.scheduled_tasks.items()}
+            )
+            abandoned = await scheduled_task_queries.abandon_task_runs(self.instance_id)
+            if abandoned:
+                logger.warning(f"Marked {abandoned} runs of a previous scheduler leader as abandoned")
+            self._states_synced = True
+        else:
+            states = await scheduled_task_queries.get_task_states()
+        self._apply_states(states)
+        
+        if self._last_prune is None or now - self._last_prune >= timedelta(hours=1):
+            self._last_prune = now
+            await scheduled_task_queries.prune_task_runs(SCHEDULER_RUN_HISTORY_DAYS)
+            await background_task_queries.prune_tasks(TASK_HISTORY_DAYS)
+            await session_state_queries.delete_stale_session_states(CHATBOT_SESSION_RETENTION_HOURS)
         
-        elif task.schedule_type == ScheduleType.DAILY:
-            if task.last_run is None:
-                return self._is_time_to_run_daily(task, current_time)
+        for task_name, scheduled_task in self.scheduled_tasks.items():
+            if not scheduled_task.enabled or scheduled_task.next_run is None or scheduled_task.next_run > now:
+                continue
             
-            # Check if it's a new day and the right time
-            if current_time.date() > task.last_run.date():
-                return self._is_time_to_run_daily(task, current_time)
+            # Check if task is already running
+            if task_name in self.running_tasks and not self.running_tasks[task_name].done():
+                logger.info(f"Task {task_name} is already running, skipping this cycle")
+                continue
             
-            return False
-        
-        elif task.schedule_type == ScheduleType.WEEKLY:
-            if task.last_run is None:
-                return self._is_time_to_run_weekly(task, current_time)
+            # Check semaphore availability
+            semaphore = self.task_semaphores.get(task_name)
+            if semaphore and semaphore.locked():
+                logger.info(f"Max concurrent {task_name} tasks reached, skipping")
+                continue
             
-            # Check if it's the right day and time, and hasn't run this week
-            days_since_last = (current_time - task.last_run).days
-            if days_since_last >= 7:
-                return self._is_time_to_run_weekly(task, current_time)
+            next_run = self._compute_next_run(scheduled_task, now)
+            batch_size = backlog = None
+            if scheduled_task.adaptive:
+                plan = await self._plan_adaptive_run(scheduled_task, now)
+                if plan is None:
+                    continue
+                batch_size, backlog, next_run = plan
             
-            return False
-        
-        return False
-    
-    def _is_time_to_run_daily(self, task: ScheduledTask, current_time: datetime) -> bool:
-        """Check if it's the right time of day to run a daily task"""
-        if not task.time_of_day:
-            return False
-        
-        target_hour, target_minute = map(int, task.time_of_day.split(':'))
-        return (current_time.hour == target_hour and 
-                current_time.minute == target_minute)
+            claim = await scheduled_task_queries.claim_task_run(
+                task_name, next_run, self.instance_id, batch_size, backlog
+            )
+            if not claim:
+                continue
+            
+            batch_note = f", batch {batch_size} of backlog {backlog}" if batch_size is not None else ""
+            logger.info(f"Triggering scheduled task: {task_name} (run {claim['run_id']}{batch_note})")
+            scheduled_task.last_run = now
+            scheduled_task.last_status = "running"
+            scheduled_task.next_run = next_run
+            if batch_size is not None:
+                scheduled_task.last_backlog, scheduled_task.last_batch_size = backlog, batch_size
+            
+            # Create task with semaphore protection
+            if semaphore:
+                self.running_tasks[task_name] = asyncio.create_task(
+                    self._run_task_with_semaphore(scheduled_task, semaphore, claim['run_id'], batch_size)
+                )
+            else:
+                self.running_tasks[task_name] = asyncio.create_task(
+                    self._run_task(scheduled_task, claim['run_id'], batch_size)
+                )
     
-    def _is_time_to_run_weekly(self, task: ScheduledTask, current_time: datetime) -> bool:
-        """Check if it's the right day and time to run a weekly task"""
-        if task.day_of_week is None or not task.time_of_day:
-            return False
+    async def _plan_adaptive_run(self, scheduled_task: ScheduledTask,
+                                 now: datetime) -> Optional[Tuple[Optional[int], Optional[int], datetime]]:
+        """
+        Batch size, measured backlog and next run time for a due adaptive task,
+        or None if the LLM budget is spent (the run is deferred instead). If the
+        backlog cannot be measured the task runs with its default batch on its
+        fallback interval.
+        """
+        policy = scheduled_task.adaptive
+        try:
+            backlog = await policy.backlog_fn()
+        except Exception as e:
+            logger.warning(f"Could not measure backlog of {scheduled_task.name}, using its fixed schedule: {e}")
+            return None, None, self._compute_next_run(scheduled_task, now)
         
-        # Check day of week (0=Monday, 6=Sunday)
-        if current_time.weekday() != task.day_of_week:
-            return False
+        batch_size, interval_seconds = policy.plan(backlog)
+        budget = await self._llm_budget_items(scheduled_task)
+        if budget is not None and budget < batch_size:
+            if budget <= 0:
+                defer_until = now + timedelta(seconds=policy.min_interval_seconds)
+                logger.info(f"LLM budget spent, deferring {scheduled_task.name} "
+                            f"(backlog {backlog}) to {defer_until.isoformat()}")
+                await scheduled_task_queries.defer_task(scheduled_task.name, defer_until)
+                scheduled_task.next_run = defer_until
+                return None
+            logger.info(f"LLM budget limits {scheduled_task.name} to {budget} of {batch_size} items")
+            batch_size = budget
         
-        return self._is_time_to_run_daily(task, current_time)
+        jitter = min(SCHEDULER_JITTER_SECONDS, interval_seconds * 0.1)
+        next_run = now + timedelta(seconds=interval_seconds + random.uniform(0, jitter))
+        return batch_size, backlog, next_run
+    
+    async def _llm_budget_items(self, scheduled_task: ScheduledTask) -> Optional[int]:
+        """Items the task may still start this hour under PIPELINE_LLM_CALLS_PER_HOUR, or None if unlimited"""
+        calls_per_item = scheduled_task.adaptive.llm_calls_per_item
+        if PIPELINE_LLM_CALLS_PER_HOUR <= 0 or calls_per_item <= 0:
+            return None
+        # Runs of every instance count, as they are recorded with their batch size
+        recent = await scheduled_task_queries.get_recent_batch_totals(3600)
+        used = sum(
+            items * self.scheduled_tasks[name].adaptive.llm_calls_per_item
+            for name, items in recent.items()
+            if name in self.scheduled_tasks and self.scheduled_tasks[name].adaptive
+        )
+        return int((PIPELINE_LLM_CALLS_PER_HOUR - used) // calls_per_item)
+    
+    async def refresh_states(self):
+        """Load persisted state, for status reads in a process whose scheduler loop is not running"""
+        self._apply_states(await scheduled_task_queries.get_task_states())
+    
+    def _apply_states(self, states: Dict[str, Dict[str, Any]]):
+        """Mirror persisted state onto the registered tasks"""
+        for task_name, state in states.items():
+            scheduled_task = self.scheduled_tasks.get(task_name)
+            if scheduled_task is None:
+                continue
+            scheduled_task.enabled = state['enabled']
+            scheduled_task.next_run = state['next_run_at']
+            scheduled_task.last_run = state['last_run_at']
+            scheduled_task.last_status = state['last_status']
+            scheduled_task.last_duration_ms = state['last_duration_ms']
+    
+    async def _run_task_with_semaphore(self, scheduled_task: ScheduledTask, semaphore: asyncio.Semaphore,
+                                       run_id: int, batch_size: Optional[int] = None):
+        """Run a task with semaphore protection"""
+        async with semaphore:
+            await self._run_task(scheduled_task, run_id, batch_size)
+    
+    async def _run_task(self, scheduled_task: ScheduledTask, run_id: int, batch_size: Optional[int] = None):
+        """Run a claimed task and record its duration and outcome"""
+        status, error = "succeeded", None
+        try:
+            if batch_size is not None:
+                result = await scheduled_task.task_function(batch_size=batch_size)
+            else:
+                result = await scheduled_task.task_function()
+            if result is False:
+                status, error = "failed", "Task reported failure"
+        except asyncio.CancelledError:
+            status, error = "cancelled", None
+            raise
+        except Exception as e:
+            status, error = "failed", str(e)
+            logger.error(f"Error running scheduled task {scheduled_task.name}: {e}", exc_info=True)
+        finally:
+            scheduled_task.last_status = status
+            try:
+                await scheduled_task_queries.finish_task_run(run_id, status, error)
+            except Exception as e:
+                logger.error(f"Could not record run {run_id} of {scheduled_task.name}: {e}")
+    
+    def _first_run(self, task: ScheduledTask, now: datetime) -> datetime:
+        """First run time of a task that has never been scheduled"""
+        if task.schedule_type == ScheduleType.INTERVAL:
+            return now + timedelta(seconds=random.uniform(0, min(SCHEDULER_JITTER_SECONDS, task.interval_seconds)))
+        return self._compute_next_run(task, now)
+    
+    def _compute_next_run(self, task: ScheduledTask, after: datetime) -> datetime:
+        """Next run time after `after` (UTC), plus random jitter so tasks do not all fire on the same tick"""
+        if task.schedule_type == ScheduleType.INTERVAL:
+            next_run = after + timedelta(seconds=task.interval_seconds)
+            jitter = min(SCHEDULER_JITTER_SECONDS, task.interval_seconds * 0.1)
+        else:
+            target_hour, target_minute = map(int, task.time_of_day.split(':'))
+            next_run = after.replace(hour=target_hour, minute=target_minute, second=0, microsecond=0)
+            period = timedelta(days=1)
+            if task.schedule_type == ScheduleType.WEEKLY:
+                next_run += timedelta(days=(task.day_of_week - next_run.weekday()) % 7)
+                period = timedelta(days=7)
+            if next_run <= after:
+                next_run += period
+            jitter = SCHEDULER_JITTER_SECONDS
+        return next_run + timedelta(seconds=random.uniform(0, jitter))
+    
+    async def _execute(self, prefix: str, action: str, method: str, **params) -> Any:
+        """Run a TaskManager task here and wait for it; it is recorded in background_tasks like any other task"""
+        task_id = self.task_manager.new_task_id(prefix)
+        return await self.task_manager.execute(task_id, action, method, params)
     
     # Task execution methods that interface with TaskManager
     
-    async def _run_transcription_pipeline(self):
+    async def _run_transcription_pipeline(self, batch_size: Optional[int] = None):
         """Run transcription pipeline"""
-        task_id = f"scheduled_transcription_{int(datetime.now().timestamp())}"
-        self.task_manager.start_task(task_id, "scheduled_transcription_pipeline")
-        self.task_manager.run_transcription(task_id)
+        return await self._execute("scheduled_transcription", "scheduled_transcription_pipeline",
+                                   "run_transcription", batch_size=batch_size)
     
-    async def _run_vetting_pipeline(self):
+    async def _run_vetting_pipeline(self, batch_size: Optional[int] = None):
         """Run vetting pipeline"""
-        task_id = f"scheduled_vetting_{int(datetime.now().timestamp())}"
-        self.task_manager.start_task(task_id, "scheduled_vetting_pipeline")
-        self.task_manager.run_vetting_pipeline(task_id)
+        return await self._execute("scheduled_vetting", "scheduled_vetting_pipeline",
+                                   "run_vetting_pipeline", batch_size=batch_size)
     
     async def _run_episode_sync(self):
         """Run episode sync"""
-        task_id = f"scheduled_episode_sync_{int(datetime.now().timestamp())}"
-        self.task_manager.start_task(task_id, "scheduled_episode_sync")
-        self.task_manager.run_episode_sync(task_id)
+        return await self._execute("scheduled_episode_sync", "scheduled_episode_sync", "run_episode_sync")
     
     async def _run_enrichment_pipeline(self):
         """Run enrichment pipeline"""
-        task_id = f"scheduled_enrichment_{int(datetime.now().timestamp())}"
-        self.task_manager.start_task(task_id, "scheduled_enrichment_pipeline")
-        self.task_manager.run_enrichment_pipeline(task_id)
+        return await self._execute("scheduled_enrichment", "scheduled_enrichment_pipeline", "run_enrichment_pipeline")
     
     async def _run_qualitative_assessment(self):
         """Run qualitative match assessment"""
-        task_id = f"scheduled_qualitative_{int(datetime.now().timestamp())}"
-        self.task_manager.start_task(task_id, "scheduled_qualitative_assessment")
-        self.task_manager.run_qualitative_match_assessment(task_id)
+        return await self._execute("scheduled_qualitative", "scheduled_qualitative_assessment",
+                                   "run_qualitative_match_assessment")
     
-    async def _run_ai_description_completion(self):
+    async def _run_ai_description_completion(self, batch_size: Optional[int] = None):
         """Complete AI descriptions for enriched media."""
-        task_id = f"scheduled_ai_description_{int(datetime.now().timestamp())}"
-        self.task_manager.start_task(task_id, "scheduled_ai_description_completion")
-        self.task_manager.run_ai_description_completion(task_id)
+        return await self._execute("scheduled_ai_description", "scheduled_ai_description_completion",
+                                   "run_ai_description_completion", batch_size=batch_size)
+    
+    async def _run_pipeline_backfill(self):
+        """Queue discoveries waiting on a pipeline stage without a job."""
+        from podcast_outreach.services.tasks.pipeline_worker import pipeline_worker
+        await pipeline_worker.backfill()
     
     async def _run_workflow_health_check(self):
         """Run workflow health check to detect and fix common issues."""
-        task_id = f"scheduled_health_check_{int(datetime.now().timestamp())}"
-        self.task_manager.start_task(task_id, "scheduled_workflow_health_check")
-        self.task_manager.run_workflow_health_check(task_id)
+        return await self._execute("scheduled_health_check", "scheduled_workflow_health_check",
+                                   "run_workflow_health_check")
     
     async def _run_automated_discovery(self):
         """Run automated campaign discovery check"""
-        task_id = f"scheduled_auto_discovery_{int(datetime.now().timestamp())}"
-        self.task_manager.start_task(task_id, "scheduled_automated_discovery")
-        self.task_manager.run_automated_discovery(task_id)
+        return await self._execute("scheduled_auto_discovery", "scheduled_automated_discovery",
+                                   "run_automated_discovery")
     
     async def _reset_all_weekly_counts(self):
         """Reset weekly counts for ALL users (free and paid)"""
-        task_id = f"scheduled_weekly_reset_{int(datetime.now().timestamp())}"
-        self.task_manager.start_task(task_id, "scheduled_weekly_reset")
-        self.task_manager.reset_all_weekly_counts(task_id)
+        return await self._execute("scheduled_weekly_reset", "scheduled_weekly_reset", "reset_all_weekly_counts")
     
     async def _check_weekly_reset_health(self):
         """Check health of weekly reset system"""
-        task_id = f"scheduled_reset_health_{int(datetime.now().timestamp())}"
-        self.task_manager.start_task(task_id, "scheduled_reset_health_check")
-        self.task_manager.check_weekly_reset_health(task_id)
+        return await self._execute("scheduled_reset_health", "scheduled_reset_health_check",
+                                   "check_weekly_reset_health")
     
     def get_task_status(self) -> Dict[str, Any]:
         """Get status of all scheduled tasks"""
         return {
             "scheduler_running": self.running,
+            "instance_id": self.instance_id,
+            "is_leader": self.is_leader,
             "tasks": {
                 name: {
                     "enabled": task.enabled,
                     "schedule_type": task.schedule_type.value,
                     "last_run": task.last_run.isoformat() if task.last_run else None,
+                    "next_run": task.next_run.isoformat() if task.next_run else None,
+                    "last_status": task.last_status,
+                    "last_duration_ms": task.last_duration_ms,
                     "interval_seconds": task.interval_seconds,
                     "time_of_day": task.time_of_day,
-                    "day_of_week": task.day_of_week
+                    "day_of_week": task.day_of_week,
+                    "adaptive": {
+                        "min_batch": task.adaptive.min_batch,
+                        "max_batch": task.adaptive.max_batch,
+                        "min_interval_seconds": task.adaptive.min_interval_seconds,
+                        "max_interval_seconds": task.adaptive.max_interval_seconds,
+                        "last_backlog": task.last_backlog,
+                        "last_batch_size": task.last_batch_size
+                    } if task.adaptive else None
                 }
                 for name, task in self.scheduled_tasks.items()
             }
         }
     
-    def enable_task(self, task_name: str):
-        """Enable a specific scheduled task"""
-        if task_name in self.scheduled_tasks:
-            self.scheduled_tasks[task_name].enabled = True
-            logger.info(f"Enabled scheduled task: {task_name}")
-    
-    def disable_task(self, task_name: str):
-        """Disable a specific scheduled task"""
-        if task_name in self.scheduled_tasks:
-            self.scheduled_tasks[task_name].enabled = False
-            logger.info(f"Disabled scheduled task: {task_name}")
+    async def get_run_history(self, task_name: Optional[str] = None, limit: int = 50,
+                              before_run_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Recorded runs across all instances, newest first"""
+        return await scheduled_task_queries.get_task_runs(task_name, limit, before_run_id)
+    
+    async def _set_task_enabled(self, task_name: str, enabled: bool) -> bool:
+        task = self.scheduled_tasks.get(task_name)
+        if task is None:
+            return False
+        await scheduled_task_queries.set_task_enabled(
+            task_name, enabled, self._first_run(task, datetime.now(timezone.utc))
+        )
+        task.enabled = enabled
+        logger.info(f"{'Enabled' if enabled else 'Disabled'} scheduled task: {task_name}")
+        return True
+    
+    async def enable_task(self, task_name: str) -> bool:
+        """Enable a specific scheduled task on every instance. Returns False for an unknown task."""
+        return await self._set_task_enabled(task_name, True)
+    
+    async def disable_task(self, task_name: str) -> bool:
+        """Disable a specific scheduled task on every instance. Returns False for an unknown task."""
+        return await self._set_task_enabled(task_name, False)
 
 # Global scheduler instance
 scheduler: Optional[TaskScheduler] = None
@@ -384,4 +743,5 @@ def initialize_scheduler(task_manager: TaskManager) -> TaskScheduler:
     scheduler = TaskScheduler(task_manager)
     # Register default tasks including AI description completion
     scheduler.register_default_tasks()
-    return scheduler
\ No newline at end of file
+    scheduler.subscribe_wake_events()
+    return scheduler
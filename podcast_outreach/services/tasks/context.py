@@ -0,0 +1,72 @@
+# podcast_outreach/services/tasks/context.py
+
+"""
+The task the current coroutine runs as, for progress reports and cooperative
+cancellation.
+
+TaskManager runs every task with its TaskHandle set in a context variable, so
+long-running business logic can report progress and honour stop requests
+without the task id being passed down to it:
+
+    report_progress(total=len(episodes))
+    for episode in episodes:
+        if stop_requested():
+            break
+        ...
+        report_progress(advance=1)
+
+Both are no-ops outside a task. Progress is saved to background_tasks with
+the task's heartbeat, and stop requests made from any instance arrive the
+same way, so neither costs a query per call.
+"""
+
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Optional
+
+@dataclass
+class TaskHandle:
+    """A task running in this process. Updated from the task's thread, read by the heartbeat."""
+    task_id: str
+    action: str
+    method: Optional[str] = None
+    start_time: float = field(default_factory=time.time)
+    stop_flag: threading.Event = field(default_factory=threading.Event)
+    progress_done: int = 0
+    progress_total: Optional[int] = None
+    progress_message: Optional[str] = None
+
+_current_task: ContextVar[Optional[TaskHandle]] = ContextVar("current_task", default=None)
+
+def current_task() -> Optional[TaskHandle]:
+    """The task the caller runs as, or None outside TaskManager tasks."""
+    return _current_task.get()
+
+def report_progress(done: Optional[int] = None, total: Optional[int] = None,
+                    message: Optional[str] = None, advance: int = 0) -> None:
+    """
+    Record progress of the current task.
+
+    Args:
+        done: Items finished so far.
+        total: Items the task will process, if known.
+        message: Short description of the current step.
+        advance: Add to the items finished (for concurrent workers).
+    """
+    handle = _current_task.get()
+    if handle is None:
+        return
+    if done is not None:
+        handle.progress_done = done
+    handle.progress_done += advance
+    if total is not None:
+        handle.progress_total = total
+    if message is not None:
+        handle.progress_message = message[:500]
+
+def stop_requested() -> bool:
+    """True once the current task was asked to stop; long loops should finish the current item and return."""
+    handle = _current_task.get()
+    return handle is not None and handle.stop_flag.is_set()
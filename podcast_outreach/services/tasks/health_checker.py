@@ -8,6 +8,7 @@ from typing import List, Dict, Any
 from datetime import datetime, timedelta
 
 from podcast_outreach.database.connection import get_db_pool
+from podcast_outreach.config import PIPELINE_JOB_QUEUE_ENABLED
 from podcast_outreach.database.queries import media as media_queries
 from podcast_outreach.database.queries import campaign_media_discoveries as cmd_queries
 from podcast_outreach.services.enrichment.quality_score import QualityService
@@ -332,6 +333,15 @@ class WorkflowHealthChecker:
                     "error": str(e)
                 })
         
+        # Retry the reset discoveries right away rather than waiting for the daily enrichment run
+        reset_ids = [d["discovery_id"] for d in result["details"] if d.get("status") == "reset_for_retry"]
+        if reset_ids and PIPELINE_JOB_QUEUE_ENABLED:
+            from podcast_outreach.services.tasks.pipeline_worker import pipeline_worker, STAGE_ENRICHMENT
+            try:
+                await pipeline_worker.enqueue(STAGE_ENRICHMENT, reset_ids)
+            except Exception as e:
+                logger.warning(f"Could not queue enrichment retries: {e}")
+        
         return result
 
 
@@ -1,17 +1,26 @@
 # podcast_outreach/services/tasks/manager.py
 
+import os
+import socket
 import threading
+import time
 import uuid
 import asyncpg
-from typing import Dict, Optional, Any, List
+from typing import Dict, Optional, Any, List, Coroutine
 import logging
-import time
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
 
 # Database and service imports
-from podcast_outreach.database.connection import get_background_task_pool, close_background_task_pool
+from podcast_outreach.database.connection import (
+    get_background_task_pool,
+    close_background_task_pool,
+    workload_context,
+    WORKLOAD_BACKGROUND
+)
+from podcast_outreach.database.queries import background_tasks as background_task_queries
 from podcast_outreach.services.database_service import DatabaseService
+from podcast_outreach.services.tasks.context import TaskHandle, _current_task
+from podcast_outreach.config import RUNS_BACKGROUND_WORK
 
 # Business logic imports
 from podcast_outreach.services.business_logic.campaign_processing import (
@@ -38,41 +47,64 @@ from podcast_outreach.services.business_logic.pitch_processing import (
 
 logger = logging.getLogger(__name__)
 
-# --- Task Wrapper Functions ---
-
-async def _run_async_background_task(coro):
-    """Runs an async coroutine using the background task connection pool."""
-    try:
-        return await coro
-    except Exception as e:
-        logger.error(f"Error in background task: {e}", exc_info=True)
-        return False
-
-
-
-
+# NOTIFY channel announcing tasks queued for worker processes, and stop requests for running tasks
+TASK_QUEUE_CHANNEL = "background_tasks"
 
+# Statuses of tasks that have not finished
+ACTIVE_TASK_STATUSES = ["queued", "running"]
 
 
+class TaskManager:
+    """
+    Runs background tasks and records them in background_tasks, so their
+    status, progress, timings and errors can be read from any instance.
 
+    Tasks are started with submit() (or queued for a worker process when this
+    process only serves the API) and run with execute(). Each run_* method is
+    the body of one kind of task; the shared runner records its start and
+    outcome. Running tasks report progress and check for stop requests through
+    services.tasks.context; their progress is saved, and stop requests made on
+    other instances are picked up, with each heartbeat.
+    """
 
+    # run_* methods that submit() and execute() accept, and so that a worker process may run for the API
+    QUEUEABLE_METHODS = frozenset({
+        "run_angles_bio_generation",
+        "run_episode_sync",
+        "run_transcription",
+        "run_enrichment_pipeline",
+        "run_vetting_pipeline",
+        "run_pitch_generation",
+        "run_pitch_sending",
+        "run_campaign_content_processing",
+        "run_qualitative_match_assessment",
+        "run_score_potential_matches",
+        "run_create_matches_for_enriched_media",
+        "run_workflow_health_check",
+        "run_ai_description_completion",
+        "run_automated_discovery",
+        "run_single_campaign_auto_discovery",
+        "run_campaign_discovery",
+        "run_client_campaign_discovery",
+        "reset_all_weekly_counts",
+        "check_weekly_reset_health",
+    })
 
-class TaskManager:
     def __init__(self):
-        self.tasks: Dict[str, Dict] = {}
+        self.instance_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self._running: Dict[str, TaskHandle] = {}
         self._lock = threading.Lock()
         self.db_pool: Optional[asyncpg.Pool] = None
         self.db_service: Optional[DatabaseService] = None
-        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="TaskManager")
         logger.info("TaskManager initialized.")
-    
+
     async def initialize(self):
         """Initialize the background task database pool and services"""
         if self.db_pool is None or self.db_pool._closed:
             self.db_pool = await get_background_task_pool()
             self.db_service = DatabaseService(self.db_pool)
             logger.info("TaskManager background task database resources initialized.")
-    
+
     async def cleanup_resources(self):
         """Cleanup database resources"""
         if self.db_pool and not self.db_pool._closed:
@@ -80,509 +112,450 @@ class TaskManager:
             self.db_pool = None
             self.db_service = None
             logger.info("TaskManager background task database resources cleaned up.")
-    
-    async def _run_business_logic_task(self, task_func, *args, **kwargs):
-        """Run a business logic function using the background task connection pool"""
+
+    # --- Running tasks ---
+
+    @staticmethod
+    def new_task_id(prefix: str) -> str:
+        """A task id that is unique even for tasks started in the same second, e.g. enrichment_42_1700000000_1a2b3c"""
+        return f"{prefix}_{int(time.time())}_{uuid.uuid4().hex[:6]}"
+
+    async def submit(self, task_id: str, action: str, method: str, **params) -> Optional[asyncio.Task]:
+        """
+        Start a task with one of the QUEUEABLE_METHODS, or queue it for a worker
+        process when this process only serves the API (PROCESS_ROLE=web).
+
+        Args:
+            action: Label shown in task status.
+            params: Keyword arguments of the method; must be JSON-serializable.
+
+        Returns:
+            The asyncio task running it here, or None if queued.
+
+        Raises:
+            ValueError: For an unknown method, or a task_id already used
+                (see new_task_id).
+        """
+        if method not in self.QUEUEABLE_METHODS:
+            raise ValueError(f"Unknown task method: {method}")
+        if not RUNS_BACKGROUND_WORK:
+            if not await background_task_queries.enqueue_task(task_id, action, method, params, TASK_QUEUE_CHANNEL):
+                raise ValueError(f"Task id {task_id} is already in use")
+            logger.info(f"Task {task_id} for action '{action}' queued for a worker process.")
+            return None
+        work = getattr(self, method)(**params)
+        handle = await self._start(task_id, action, method, params, work)
+        return asyncio.get_running_loop().create_task(
+            self._run(handle, work),
+            context=workload_context(WORKLOAD_BACKGROUND)
+        )
+
+    async def execute(self, task_id: str, action: str, method: str, params: Dict[str, Any]) -> Any:
+        """
+        Run a task in this process and wait for its result: the worker side of
+        submit(), and how the scheduler runs its pipelines.
+
+        Returns:
+            The method's result, or False if it raised.
+        """
+        if method not in self.QUEUEABLE_METHODS:
+            raise ValueError(f"Unknown task method: {method}")
+        work = getattr(self, method)(**params)
+        handle = await self._start(task_id, action, method, params, work)
+        return await asyncio.get_running_loop().create_task(
+            self._run(handle, work),
+            context=workload_context(WORKLOAD_BACKGROUND)
+        )
+
+    async def _start(self, task_id: str, action: str, method: str, params: Dict[str, Any],
+                     work: Coroutine) -> TaskHandle:
+        """Registers and records a task about to run `work`; refuses (and closes `work`) if task_id is in use."""
+        handle = TaskHandle(task_id=task_id, action=action, method=method)
+        with self._lock:
+            in_use = task_id in self._running
+            if not in_use:
+                self._running[task_id] = handle
+        if in_use:
+            work.close()
+            raise ValueError(f"Task {task_id} is already running")
+        try:
+            started = await background_task_queries.start_task(task_id, action, method, params, self.instance_id)
+        except Exception as e:
+            # The task still runs; it is only missing from other instances' listings
+            logger.error(f"Could not record start of task {task_id}: {e}")
+            started = True
+        if not started:
+            with self._lock:
+                self._running.pop(task_id, None)
+            work.close()
+            raise ValueError(f"Task id {task_id} was already used by another task")
+        logger.info(f"Task {task_id} for action '{action}' started.")
+        return handle
+
+    async def _run(self, handle: TaskHandle, work: Coroutine) -> Any:
+        """Run a task's coroutine as `handle` and record how it ended."""
+        _current_task.set(handle)
+        status, error, result = "completed", None, False
         try:
-            # Ensure the background task pool is initialized
-            if self.db_pool is None or self.db_pool._closed:
-                await self.initialize()
-            
-            logger.info(f"Starting background task: {task_func.__name__}")
-            result = await task_func(self.db_service, *args, **kwargs)
-            logger.info(f"Background task completed: {task_func.__name__}")
-            return result
-                
+            result = await work
+            if handle.stop_flag.is_set():
+                status, error = "cancelled", "Stopped on request"
+            elif result is False:
+                status, error = "failed", "Task reported failure"
+        except asyncio.CancelledError:
+            status = "cancelled"
+            raise
         except Exception as e:
-            logger.error(f"Error in business logic task {task_func.__name__}: {e}", exc_info=True)
+            status, error = "failed", str(e)
+            logger.error(f"Error in background task {handle.task_id} ({handle.method}): {e}", exc_info=True)
+        finally:
+            with self._lock:
+                self._running.pop(handle.task_id, None)
+            try:
+                await background_task_queries.finish_task(
+                    handle.task_id, status, error, handle.progress_done, handle.progress_total
+                )
+            except Exception as e:
+                logger.error(f"Could not record outcome of task {handle.task_id}: {e}")
+            logger.info(f"Task {handle.task_id} for action '{handle.action}' {status}.")
+        return result
+
+    async def heartbeat(self, pool: Optional[Any] = None) -> None:
+        """Save progress of the tasks running here, and signal those asked to stop from any instance."""
+        with self._lock:
+            handles = list(self._running.values())
+        if not handles:
+            return
+        stop_ids = await background_task_queries.heartbeat_tasks(
+            self.instance_id,
+            [h.task_id for h in handles],
+            [h.progress_done for h in handles],
+            [h.progress_total for h in handles],
+            [h.progress_message for h in handles],
+            pool=pool
+        )
+        for task_id in stop_ids:
+            self._signal_stop(task_id)
+
+    def _signal_stop(self, task_id: str) -> bool:
+        with self._lock:
+            handle = self._running.get(task_id)
+        if handle is None:
             return False
-    
-    
-    def run_angles_bio_generation(self, task_id: str, campaign_id_str: str):
+        if not handle.stop_flag.is_set():
+            handle.stop_flag.set()
+            logger.info(f"Task {task_id} for action '{handle.action}' signaled to stop.")
+        return True
+
+    async def stop_task(self, task_id: str) -> bool:
+        """
+        Ask a running task to stop, on whichever instance runs it. Stopping is
+        cooperative: the task finishes its current item and is recorded as
+        cancelled. Returns False if the task is not running.
+        """
+        stopping_here = self._signal_stop(task_id)
+        return await background_task_queries.request_stop(task_id, TASK_QUEUE_CHANNEL) or stopping_here
+
+    def get_stop_flag(self, task_id: str) -> Optional[threading.Event]:
+        """Stop flag of a task running in this process"""
+        with self._lock:
+            handle = self._running.get(task_id)
+            return handle.stop_flag if handle else None
+
+    def running_task_ids(self) -> List[str]:
+        """Ids of the tasks running in this process"""
+        with self._lock:
+            return list(self._running)
+
+    # --- Status ---
+
+    @staticmethod
+    def _task_status(task: Dict[str, Any]) -> Dict[str, Any]:
+        """API shape of a background_tasks row"""
+        started_at, finished_at, heartbeat_at = task['started_at'], task['finished_at'], task['heartbeat_at']
+        runtime = None
+        if finished_at and started_at:
+            runtime = (finished_at - started_at).total_seconds()
+        elif started_at and heartbeat_at:
+            runtime = (heartbeat_at - started_at).total_seconds()
+        status = task['status']
+        if status == 'running' and task['stop_requested']:
+            status = 'stopping'
+        return {
+            'task_id': task['task_id'],
+            'action': task['action'],
+            'method': task['method'],
+            'status': status,
+            'runtime': runtime,
+            'progress': {
+                'done': task['progress_done'],
+                'total': task['progress_total'],
+                'message': task['progress_message'],
+            },
+            'worker_id': task['worker_id'],
+            'error': task['error'],
+            'queued_at': task['queued_at'],
+            'started_at': started_at,
+            'finished_at': finished_at,
+            'duration_ms': task['duration_ms'],
+        }
+
+    async def get_task_status(self, task_id: str) -> Optional[dict]:
+        """Status of a task run or queued by any instance, or None"""
+        task = await background_task_queries.get_task(task_id)
+        if not task:
+            return None
+        status = self._task_status(task)
+        with self._lock:
+            handle = self._running.get(task_id)
+            if handle is not None:
+                # Fresher than the last heartbeat
+                status['progress'] = {
+                    'done': handle.progress_done,
+                    'total': handle.progress_total,
+                    'message': handle.progress_message,
+                }
+        return status
+
+    async def list_tasks(self, statuses: Optional[List[str]] = None, action: Optional[str] = None,
+                         limit: int = 50, before_task_id: Optional[str] = None) -> List[dict]:
+        """
+        Tasks of all instances, newest first; by default those queued or running.
+        Pass the last task_id of a page as before_task_id for the next one.
+        """
+        tasks = await background_task_queries.list_tasks(
+            statuses or ACTIVE_TASK_STATUSES, action, limit, before_task_id
+        )
+        return [self._task_status(task) for task in tasks]
+
+    # --- Task bodies ---
+
+    async def _run_business_logic_task(self, task_func, *args, **kwargs):
+        """Run a business logic function using the background task connection pool"""
+        # Ensure the background task pool is initialized
+        if self.db_pool is None or self.db_pool._closed:
+            await self.initialize()
+
+        logger.info(f"Starting background task: {task_func.__name__}")
+        result = await task_func(self.db_service, *args, **kwargs)
+        logger.info(f"Background task completed: {task_func.__name__}")
+        return result
+
+    async def run_angles_bio_generation(self, campaign_id_str: str):
         """Run angles and bio generation task"""
-        async def _cleanup_wrapper():
-            try:
-                await self._run_business_logic_task(generate_angles_and_bio, campaign_id_str)
-            finally:
-                self.cleanup_task(task_id)
-        
-        # Create asyncio task
-        try:
-            loop = asyncio.get_event_loop()
-            task = loop.create_task(_cleanup_wrapper())
-            return task
-        except RuntimeError:
-            logger.warning("No event loop running for angles_bio_generation")
-            return self._executor.submit(asyncio.run, _cleanup_wrapper())
-    
-    def run_episode_sync(self, task_id: str):
+        return await self._run_business_logic_task(generate_angles_and_bio, campaign_id_str)
+
+    async def run_episode_sync(self):
         """Run episode sync task"""
-        async def _cleanup_wrapper():
-            try:
-                await self._run_business_logic_task(sync_episodes_logic)
-            finally:
-                self.cleanup_task(task_id)
-        
-        try:
-            loop = asyncio.get_event_loop()
-            task = loop.create_task(_cleanup_wrapper())
-            return task
-        except RuntimeError:
-            logger.warning("No event loop running for episode_sync")
-            return self._executor.submit(asyncio.run, _cleanup_wrapper())
-    
-    def run_transcription(self, task_id: str):
+        return await self._run_business_logic_task(sync_episodes_logic)
+
+    async def run_transcription(self, batch_size: Optional[int] = None):
         """Run transcription task"""
-        async def _cleanup_wrapper():
-            try:
-                await self._run_business_logic_task(transcribe_episodes_logic)
-            finally:
-                self.cleanup_task(task_id)
-        
-        try:
-            loop = asyncio.get_event_loop()
-            task = loop.create_task(_cleanup_wrapper())
-            return task
-        except RuntimeError:
-            logger.warning("No event loop running for transcription")
-            return self._executor.submit(asyncio.run, _cleanup_wrapper())
-    
-    def run_enrichment_pipeline(self, task_id: str, media_id: int = None):
+        return await self._run_business_logic_task(transcribe_episodes_logic, batch_size=batch_size)
+
+    async def run_enrichment_pipeline(self, media_id: int = None):
         """Run enrichment pipeline task"""
-        async def _cleanup_wrapper():
-            try:
-                await self._run_business_logic_task(run_enrichment_pipeline_logic, media_id=media_id)
-            finally:
-                self.cleanup_task(task_id)
-        
-        try:
-            loop = asyncio.get_event_loop()
-            task = loop.create_task(_cleanup_wrapper())
-            return task
-        except RuntimeError:
-            logger.warning("No event loop running for enrichment_pipeline")
-            return self._executor.submit(asyncio.run, _cleanup_wrapper())
-    
-    def run_vetting_pipeline(self, task_id: str):
+        return await self._run_business_logic_task(run_enrichment_pipeline_logic, media_id=media_id)
+
+    async def run_vetting_pipeline(self, batch_size: Optional[int] = None):
         """Run vetting pipeline task"""
-        async def _cleanup_wrapper():
-            try:
-                await self._run_business_logic_task(run_vetting_pipeline_logic)
-            finally:
-                self.cleanup_task(task_id)
-        
-        try:
-            loop = asyncio.get_event_loop()
-            task = loop.create_task(_cleanup_wrapper())
-            return task
-        except RuntimeError:
-            logger.warning("No event loop running for vetting_pipeline")
-            return self._executor.submit(asyncio.run, _cleanup_wrapper())
-    
-    def run_pitch_generation(self, task_id: str):
+        return await self._run_business_logic_task(run_vetting_pipeline_logic, batch_size=batch_size)
+
+    async def run_pitch_generation(self):
         """Run pitch generation task"""
-        async def _cleanup_wrapper():
-            try:
-                await self._run_business_logic_task(generate_pitches_logic)
-            finally:
-                self.cleanup_task(task_id)
-        
-        try:
-            loop = asyncio.get_event_loop()
-            task = loop.create_task(_cleanup_wrapper())
-            return task
-        except RuntimeError:
-            logger.warning("No event loop running for pitch_generation")
-            return self._executor.submit(asyncio.run, _cleanup_wrapper())
-    
-    def run_pitch_sending(self, task_id: str):
+        return await self._run_business_logic_task(generate_pitches_logic)
+
+    async def run_pitch_sending(self):
         """Run pitch sending task"""
-        async def _cleanup_wrapper():
-            try:
-                await self._run_business_logic_task(send_pitches_logic)
-            finally:
-                self.cleanup_task(task_id)
-        
-        try:
-            loop = asyncio.get_event_loop()
-            task = loop.create_task(_cleanup_wrapper())
-            return task
-        except RuntimeError:
-            logger.warning("No event loop running for pitch_sending")
-            return self._executor.submit(asyncio.run, _cleanup_wrapper())
-    
-    def run_campaign_content_processing(self, task_id: str, campaign_id_str: str):
+        return await self._run_business_logic_task(send_pitches_logic)
+
+    async def run_campaign_content_processing(self, campaign_id_str: str):
         """Run campaign content processing task"""
-        async def _cleanup_wrapper():
-            try:
-                campaign_id = uuid.UUID(campaign_id_str)
-                await self._run_business_logic_task(process_campaign_content, campaign_id)
-            finally:
-                self.cleanup_task(task_id)
-        
-        try:
-            loop = asyncio.get_event_loop()
-            task = loop.create_task(_cleanup_wrapper())
-            return task
-        except RuntimeError:
-            logger.warning("No event loop running for campaign_content_processing")
-            return self._executor.submit(asyncio.run, _cleanup_wrapper())
-    
-    def run_qualitative_match_assessment(self, task_id: str):
+        campaign_id = uuid.UUID(campaign_id_str)
+        return await self._run_business_logic_task(process_campaign_content, campaign_id)
+
+    async def run_qualitative_match_assessment(self):
         """Run qualitative match assessment task"""
-        async def _cleanup_wrapper():
-            try:
-                await self._run_business_logic_task(run_qualitative_match_assessment_logic)
-            finally:
-                self.cleanup_task(task_id)
-        
-        try:
-            loop = asyncio.get_event_loop()
-            task = loop.create_task(_cleanup_wrapper())
-            return task
-        except RuntimeError:
-            logger.warning("No event loop running for qualitative_match_assessment")
-            return self._executor.submit(asyncio.run, _cleanup_wrapper())
-    
-    def run_score_potential_matches(self, task_id: str, campaign_id_str: Optional[str] = None, media_id_int: Optional[int] = None):
+        return await self._run_business_logic_task(run_qualitative_match_assessment_logic)
+
+    async def run_score_potential_matches(self, campaign_id_str: Optional[str] = None, media_id_int: Optional[int] = None):
         """Run score potential matches task"""
-        async def _cleanup_wrapper():
-            try:
-                await self._run_business_logic_task(score_potential_matches_logic, campaign_id_str, media_id_int)
-            finally:
-                self.cleanup_task(task_id)
-        
-        try:
-            loop = asyncio.get_event_loop()
-            task = loop.create_task(_cleanup_wrapper())
-            return task
-        except RuntimeError:
-            logger.warning("No event loop running for score_potential_matches")
-            return self._executor.submit(asyncio.run, _cleanup_wrapper())
-    
-    def run_create_matches_for_enriched_media(self, task_id: str):
+        return await self._run_business_logic_task(score_potential_matches_logic, campaign_id_str, media_id_int)
+
+    async def run_create_matches_for_enriched_media(self):
         """Run create matches for enriched media task"""
-        async def _cleanup_wrapper():
-            try:
-                await self._run_business_logic_task(create_matches_for_enriched_media_logic)
-            finally:
-                self.cleanup_task(task_id)
-        
-        try:
-            loop = asyncio.get_event_loop()
-            task = loop.create_task(_cleanup_wrapper())
-            return task
-        except RuntimeError:
-            logger.warning("No event loop running for create_matches_for_enriched_media")
-            return self._executor.submit(asyncio.run, _cleanup_wrapper())
-    
-    def run_workflow_health_check(self, task_id: str):
+        return await self._run_business_logic_task(create_matches_for_enriched_media_logic)
+
+    async def run_workflow_health_check(self):
         """Run workflow health check to detect and fix common issues"""
-        self.start_task(task_id, "workflow_health_check")
-        
-        async def health_check_logic():
-            from podcast_outreach.services.tasks.health_checker import run_workflow_health_check
-            try:
-                results = await run_workflow_health_check()
-                
-                # Log results
-                logger.info(f"Health check completed: {results['issues_found']} issues found, {results['issues_fixed']} fixed")
-                for detail in results['details']:
-                    if detail.get('found', 0) > 0:
-                        logger.info(f"  - {detail['check']}: {detail['found']} found, {detail['fixed']} fixed")
-                
-                return results
-                
-            except Exception as e:
-                logger.error(f"Error in workflow health check: {e}", exc_info=True)
-                return None
-        
-        async def _cleanup_wrapper():
-            try:
-                await health_check_logic()
-            finally:
-                self.cleanup_task(task_id)
-        
+        from podcast_outreach.services.tasks.health_checker import run_workflow_health_check
         try:
-            loop = asyncio.get_event_loop()
-            task = loop.create_task(_cleanup_wrapper())
-            return task
-        except RuntimeError:
-            logger.warning("No event loop running for workflow_health_check")
-            return self._executor.submit(asyncio.run, _cleanup_wrapper())
-    
-    def run_ai_description_completion(self, task_id: str):
-        """Run AI description completion for discoveries missing AI descriptions"""
-        async def ai_description_completion_logic():
-            """Complete AI descriptions for enriched media with race condition protection."""
-            from podcast_outreach.database.queries import campaign_media_discoveries as cmd_queries
-            from podcast_outreach.database.queries import media as media_queries
-            from podcast_outreach.services.business_logic.enhanced_discovery_workflow import EnhancedDiscoveryWorkflow
-            import asyncio
-            
-            try:
-                # First, clean up any stale locks from previous runs
-                cleaned = await cmd_queries.cleanup_stale_ai_description_locks(stale_minutes=60)
-                if cleaned > 0:
-                    logger.info(f"Cleaned up {cleaned} stale AI description locks")
-                
-                # Atomically acquire a batch of work
-                discoveries = await cmd_queries.acquire_ai_description_work_batch(limit=20)
-                if not discoveries:
-                    logger.info("No discoveries available for AI description completion")
-                    return
-                
-                logger.info(f"Acquired {len(discoveries)} discoveries for AI description generation")
-                
-                # Initialize workflow
-                workflow = EnhancedDiscoveryWorkflow()
-                
-                # Process with controlled concurrency (max 3 concurrent AI calls)
-                semaphore = asyncio.Semaphore(3)
-                
-                async def process_discovery(discovery):
-                    async with semaphore:
-                        discovery_id = discovery['id']
-                        media_id = discovery['media_id']
-                        media_name = discovery.get('media_name', 'Unknown')
-                        
-                        try:
-                            logger.info(f"Generating AI description for media {media_id} ({media_name})")
-                            
-                            # Generate AI description
-                            ai_desc = await workflow._generate_podcast_ai_description(media_id)
-                            
-                            if ai_desc:
-                                # Update media with AI description
-                                await media_queries.update_media_ai_description(media_id, ai_desc)
-                                logger.info(f"Generated AI description for media {media_id}")
-                                
-                                # Release lock with success
-                                await cmd_queries.release_ai_description_lock(discovery_id, success=True)
-                            else:
-                                logger.warning(f"Failed to generate AI description for media {media_id}")
-                                # Release lock with failure
-                                await cmd_queries.release_ai_description_lock(discovery_id, success=False)
-                                
-                        except Exception as e:
-                            logger.error(f"Error generating AI description for discovery {discovery_id}: {e}")
-                            # Always release lock on error
+            results = await run_workflow_health_check()
+
+            # Log results
+            logger.info(f"Health check completed: {results['issues_found']} issues found, {results['issues_fixed']} fixed")
+            for detail in results['details']:
+                if detail.get('found', 0) > 0:
+                    logger.info(f"  - {detail['check']}: {detail['found']} found, {detail['fixed']} fixed")
+
+            return results
+
+        except Exception as e:
+            logger.error(f"Error in workflow health check: {e}", exc_info=True)
+            return False  # Recorded as a failed run
+
+    async def run_ai_description_completion(self, batch_size: Optional[int] = None):
+        """Complete AI descriptions for enriched media with race condition protection."""
+        from podcast_outreach.database.queries import campaign_media_discoveries as cmd_queries
+        from podcast_outreach.database.queries import media as media_queries
+        from podcast_outreach.services.business_logic.enhanced_discovery_workflow import EnhancedDiscoveryWorkflow
+        from podcast_outreach.services.tasks.context import report_progress, stop_requested
+
+        try:
+            # First, clean up any stale locks from previous runs
+            cleaned = await cmd_queries.cleanup_stale_ai_description_locks(stale_minutes=60)
+            if cleaned > 0:
+                logger.info(f"Cleaned up {cleaned} stale AI description locks")
+
+            # Atomically acquire a batch of work
+            discoveries = await cmd_queries.acquire_ai_description_work_batch(limit=batch_size or 20)
+            if not discoveries:
+                logger.info("No discoveries available for AI description completion")
+                return
+
+            logger.info(f"Acquired {len(discoveries)} discoveries for AI description generation")
+            report_progress(total=len(discoveries))
+
+            # Initialize workflow
+            workflow = EnhancedDiscoveryWorkflow()
+
+            # Process with controlled concurrency (max 3 concurrent AI calls)
+            semaphore = asyncio.Semaphore(3)
+
+            async def process_discovery(discovery):
+                async with semaphore:
+                    discovery_id = discovery['id']
+                    media_id = discovery['media_id']
+                    media_name = discovery.get('media_name', 'Unknown')
+
+                    if stop_requested():
+                        # Unlock untouched so the next run picks it up
+                        await cmd_queries.release_ai_description_lock(discovery_id, success=True)
+                        return
+
+                    try:
+                        logger.info(f"Generating AI description for media {media_id} ({media_name})")
+
+                        # Generate AI description
+                        ai_desc = await workflow._generate_podcast_ai_description(media_id)
+
+                        if ai_desc:
+                            # Update media with AI description
+                            await media_queries.update_media_ai_description(media_id, ai_desc)
+                            logger.info(f"Generated AI description for media {media_id}")
+
+                            # Release lock with success
+                            await cmd_queries.release_ai_description_lock(discovery_id, success=True)
+                        else:
+                            logger.warning(f"Failed to generate AI description for media {media_id}")
+                            # Release lock with failure
                             await cmd_queries.release_ai_description_lock(discovery_id, success=False)
-                
-                # Process all discoveries with timeout
-                tasks = [process_discovery(discovery) for discovery in discoveries]
-                
-                # Wait for all with timeout (45 minutes max)
-                try:
-                    await asyncio.wait_for(
-                        asyncio.gather(*tasks, return_exceptions=True),
-                        timeout=45 * 60  # 45 minutes
-                    )
-                except asyncio.TimeoutError:
-                    logger.error("AI description completion timed out after 45 minutes")
-                    # Locks will be cleaned up in next run
-                        
-            except Exception as e:
-                logger.error(f"Error in AI description completion task: {e}", exc_info=True)
-        
-        async def _cleanup_wrapper():
+
+                    except Exception as e:
+                        logger.error(f"Error generating AI description for discovery {discovery_id}: {e}")
+                        # Always release lock on error
+                        await cmd_queries.release_ai_description_lock(discovery_id, success=False)
+                    finally:
+                        report_progress(advance=1)
+
+            # Process all discoveries with timeout
+            tasks = [process_discovery(discovery) for discovery in discoveries]
+
+            # Wait for all with timeout (45 minutes max)
             try:
-                await ai_description_completion_logic()
-            finally:
-                self.cleanup_task(task_id)
-        
-        try:
-            loop = asyncio.get_event_loop()
-            task = loop.create_task(_cleanup_wrapper())
-            return task
-        except RuntimeError:
-            logger.warning("No event loop running for ai_description_completion")
-            return self._executor.submit(asyncio.run, _cleanup_wrapper())
-    
-    def start_task(self, task_id: str, action: str) -> None:
-        with self._lock:
-            self.tasks[task_id] = {
-                'action': action,
-                'start_time': time.time(),
-                'stop_flag': threading.Event(),
-                'status': 'running'
-            }
-            logger.info(f"Task {task_id} for action '{action}' started.")
-    
-    def stop_task(self, task_id: str) -> bool:
-        with self._lock:
-            if task_id not in self.tasks:
+                await asyncio.wait_for(
+                    asyncio.gather(*tasks, return_exceptions=True),
+                    timeout=45 * 60  # 45 minutes
+                )
+            except asyncio.TimeoutError:
+                logger.error("AI description completion timed out after 45 minutes")
+                # Locks will be cleaned up in next run
                 return False
-            self.tasks[task_id]['stop_flag'].set()
-            self.tasks[task_id]['status'] = 'stopping'
-            logger.info(f"Task {task_id} for action '{self.tasks[task_id]['action']}' signaled to stop.")
-            return True
-    
-    def get_stop_flag(self, task_id: str) -> Optional[threading.Event]:
-        with self._lock:
-            if task_id not in self.tasks:
-                return None
-            return self.tasks[task_id]['stop_flag']
-    
-    def cleanup_task(self, task_id: str) -> None:
-        with self._lock:
-            if task_id in self.tasks:
-                action = self.tasks[task_id]['action']
-                del self.tasks[task_id]
-                logger.info(f"Task {task_id} for action '{action}' cleaned up.")
-    
-    def get_task_status(self, task_id: str) -> Optional[dict]:
-        with self._lock:
-            if task_id not in self.tasks:
-                return None
-            task = self.tasks[task_id]
-            return {
-                'task_id': task_id,
-                'action': task['action'],
-                'status': task['status'],
-                'runtime': time.time() - task['start_time']
-            }
-    
-    def list_tasks(self) -> Dict[str, dict]:
-        with self._lock:
-            return {
-                task_id: {
-                    'task_id': task_id,
-                    'action': info['action'],
-                    'status': info['status'],
-                    'runtime': time.time() - info['start_time']
-                }
-                for task_id, info in self.tasks.items()
-            }
-    
-    def run_automated_discovery(self, task_id: str):
+
+        except Exception as e:
+            logger.error(f"Error in AI description completion task: {e}", exc_info=True)
+            return False  # Recorded as a failed run
+
+    async def run_automated_discovery(self):
         """Run automated campaign discovery check"""
-        async def _cleanup_wrapper():
-            try:
-                from podcast_outreach.services.discovery.automated_discovery_service import AutomatedDiscoveryService
-                service = AutomatedDiscoveryService()
-                results = await service.check_and_run_discoveries()
-                logger.info(f"Automated discovery completed: {results}")
-                return results
-            finally:
-                self.cleanup_task(task_id)
-        
-        try:
-            loop = asyncio.get_event_loop()
-            task = loop.create_task(_cleanup_wrapper())
-            return task
-        except RuntimeError:
-            logger.warning("No event loop running for automated_discovery")
-            return self._executor.submit(asyncio.run, _cleanup_wrapper())
-    
-    def reset_auto_discovery_counts(self, task_id: str):
+        from podcast_outreach.services.discovery.automated_discovery_service import AutomatedDiscoveryService
+        service = AutomatedDiscoveryService()
+        results = await service.check_and_run_discoveries()
+        logger.info(f"Automated discovery completed: {results}")
+        return results
+
+    async def reset_auto_discovery_counts(self):
         """DEPRECATED: Reset weekly auto-discovery counts for paid users only. Use reset_all_weekly_counts instead."""
         logger.warning("reset_auto_discovery_counts is deprecated. Use reset_all_weekly_counts instead.")
-        async def _cleanup_wrapper():
-            try:
-                from podcast_outreach.services.discovery.automated_discovery_service import AutomatedDiscoveryService
-                service = AutomatedDiscoveryService()
-                count = await service.reset_weekly_auto_discovery_counts()
-                logger.info(f"Reset auto-discovery counts for {count} users")
-                return count
-            finally:
-                self.cleanup_task(task_id)
-        
-        try:
-            loop = asyncio.get_event_loop()
-            task = loop.create_task(_cleanup_wrapper())
-            return task
-        except RuntimeError:
-            logger.warning("No event loop running for reset_auto_discovery_counts")
-            return self._executor.submit(asyncio.run, _cleanup_wrapper())
-    
-    def reset_all_weekly_counts(self, task_id: str):
+        from podcast_outreach.services.discovery.automated_discovery_service import AutomatedDiscoveryService
+        service = AutomatedDiscoveryService()
+        count = await service.reset_weekly_auto_discovery_counts()
+        logger.info(f"Reset auto-discovery counts for {count} users")
+        return count
+
+    async def reset_all_weekly_counts(self):
         """Reset weekly counts for ALL users (free and paid)"""
-        async def _cleanup_wrapper():
-            try:
-                from podcast_outreach.services.discovery.automated_discovery_service import AutomatedDiscoveryService
-                service = AutomatedDiscoveryService()
-                results = await service.reset_all_weekly_counts()
-                logger.info(f"Weekly reset completed: {results['total_reset']} users "
-                           f"({results['free_users']} free, {results['paid_users']} paid)")
-                return results
-            finally:
-                self.cleanup_task(task_id)
-        
-        try:
-            loop = asyncio.get_event_loop()
-            task = loop.create_task(_cleanup_wrapper())
-            return task
-        except RuntimeError:
-            logger.warning("No event loop running for reset_all_weekly_counts")
-            return self._executor.submit(asyncio.run, _cleanup_wrapper())
-    
-    def check_weekly_reset_health(self, task_id: str):
+        from podcast_outreach.services.discovery.automated_discovery_service import AutomatedDiscoveryService
+        service = AutomatedDiscoveryService()
+        results = await service.reset_all_weekly_counts()
+        logger.info(f"Weekly reset completed: {results['total_reset']} users "
+                   f"({results['free_users']} free, {results['paid_users']} paid)")
+        return results
+
+    async def check_weekly_reset_health(self):
         """Check health of weekly reset system"""
-        async def _cleanup_wrapper():
-            try:
-                from podcast_outreach.services.discovery.automated_discovery_service import AutomatedDiscoveryService
-                service = AutomatedDiscoveryService()
-                health_status = await service.check_weekly_reset_health()
-                
-                if health_status['healthy']:
-                    logger.info("Weekly reset health check passed")
-                else:
-                    logger.error(f"Weekly reset health check FAILED: {health_status}")
-                
-                return health_status
-            finally:
-                self.cleanup_task(task_id)
-        
-        try:
-            loop = asyncio.get_event_loop()
-            task = loop.create_task(_cleanup_wrapper())
-            return task
-        except RuntimeError:
-            logger.warning("No event loop running for check_weekly_reset_health")
-            return self._executor.submit(asyncio.run, _cleanup_wrapper())
-    
-    def run_single_campaign_auto_discovery(self, task_id: str, campaign_id: str):
+        from podcast_outreach.services.discovery.automated_discovery_service import AutomatedDiscoveryService
+        service = AutomatedDiscoveryService()
+        health_status = await service.check_weekly_reset_health()
+
+        if health_status['healthy']:
+            logger.info("Weekly reset health check passed")
+        else:
+            logger.error(f"Weekly reset health check FAILED: {health_status}")
+
+        return health_status
+
+    async def run_single_campaign_auto_discovery(self, campaign_id: str):
         """Run auto-discovery for a single campaign immediately"""
-        async def _cleanup_wrapper():
-            try:
-                from podcast_outreach.services.discovery.automated_discovery_service import AutomatedDiscoveryService
-                import uuid
-                service = AutomatedDiscoveryService()
-                campaign_uuid = uuid.UUID(campaign_id)
-                results = await service.process_single_campaign(campaign_uuid)
-                logger.info(f"Single campaign auto-discovery completed for {campaign_id}: {results}")
-                return results
-            finally:
-                self.cleanup_task(task_id)
-        
-        try:
-            loop = asyncio.get_event_loop()
-            task = loop.create_task(_cleanup_wrapper())
-            return task
-        except RuntimeError:
-            logger.warning("No event loop running for single_campaign_auto_discovery")
-            return self._executor.submit(asyncio.run, _cleanup_wrapper())
-    
+        from podcast_outreach.services.discovery.automated_discovery_service import AutomatedDiscoveryService
+        service = AutomatedDiscoveryService()
+        campaign_uuid = uuid.UUID(campaign_id)
+        results = await service.process_single_campaign(campaign_uuid)
+        logger.info(f"Single campaign auto-discovery completed for {campaign_id}: {results}")
+        return results
+
+    async def run_campaign_discovery(self, campaign_id: str, max_matches: int):
+        """Run discovery → enrichment → vetting → matches for a campaign (admin discover endpoint)"""
+        from podcast_outreach.services.business_logic.discovery_processing import run_campaign_discovery_pipeline
+        return await run_campaign_discovery_pipeline(uuid.UUID(campaign_id), max_matches)
+
+    async def run_client_campaign_discovery(self, campaign_id: str, person_id: int,
+                                            max_matches: int, max_discoveries: int):
+        """Run the client discovery pipeline for a campaign, within the client's match limits"""
+        from podcast_outreach.services.business_logic.discovery_processing import run_client_discovery_pipeline
+        return await run_client_discovery_pipeline(uuid.UUID(campaign_id), person_id, max_matches, max_discoveries)
+
     async def cleanup(self) -> None:
         logger.info("Cleaning up all tasks during application shutdown.")
         with self._lock:
-            task_ids = list(self.tasks.keys())
-            for task_id in task_ids:
-                try:
-                    self.tasks[task_id]['stop_flag'].set()
-                    self.tasks[task_id]['status'] = 'stopped'
-                    logger.info(f"Signaled task {task_id} to stop during shutdown.")
-                except Exception as e:
-                    logger.error(f"Error signaling task {task_id} to stop during shutdown: {e}")
-            self.tasks.clear()
-            logger.info(f"All {len(task_ids)} tasks cleared from manager.")
-        
-        # Shutdown executor
-        self._executor.shutdown(wait=True)
-        
+            handles = list(self._running.values())
+        for handle in handles:
+            handle.stop_flag.set()
+            logger.info(f"Signaled task {handle.task_id} to stop during shutdown.")
+        logger.info(f"All {len(handles)} running tasks signaled to stop.")
+
         # Cleanup database resources
         await self.cleanup_resources()
 
 # Global task manager instance
-task_manager = TaskManager()
\ No newline at end of file
+task_manager = TaskManager()
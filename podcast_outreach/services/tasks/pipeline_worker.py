@@ -0,0 +1,232 @@
+# podcast_outreach/services/tasks/pipeline_worker.py
+
+import asyncio
+import logging
+import os
+import socket
+import uuid
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from podcast_outreach.config import (
+    PIPELINE_ENRICHMENT_WORKERS,
+    PIPELINE_AI_DESCRIPTION_WORKERS,
+    PIPELINE_VETTING_WORKERS,
+    PIPELINE_MATCH_CREATION_WORKERS,
+    PIPELINE_ENRICHMENT_VISIBILITY_SECONDS,
+    PIPELINE_VISIBILITY_SECONDS,
+    PIPELINE_JOB_MAX_ATTEMPTS,
+    PIPELINE_RETRY_DELAY_SECONDS,
+    PIPELINE_POLL_INTERVAL_SECONDS
+)
+from podcast_outreach.database.connection import get_background_task_pool, workload_context, WORKLOAD_BACKGROUND
+from podcast_outreach.database.loaders import loader_scope
+from podcast_outreach.database.queries import pipeline_jobs as job_queries
+from podcast_outreach.database.queries import media as media_queries
+
+logger = logging.getLogger(__name__)
+
+STAGE_ENRICHMENT = "enrichment"
+STAGE_AI_DESCRIPTION = "ai_description"
+STAGE_VETTING = "vetting"
+STAGE_MATCH_CREATION = "match_creation"
+STAGES = (STAGE_ENRICHMENT, STAGE_AI_DESCRIPTION, STAGE_VETTING, STAGE_MATCH_CREATION)
+
+class PipelineWorker:
+    """
+    Moves discoveries through enrichment, AI description, vetting and match
+    creation using the pipeline_jobs queue.
+
+    Each stage has its own pool of worker loops that claim one job at a time
+    with FOR UPDATE SKIP LOCKED, so any number of processes can share the
+    queue. A finished stage queues the next one in the same transaction and
+    wakes this process's workers for it, so a discovery moves on within
+    seconds instead of waiting for the next polling cycle. Jobs from other
+    processes are picked up within PIPELINE_POLL_INTERVAL_SECONDS. A job whose
+    worker dies becomes visible again after its stage's visibility timeout;
+    failed jobs are retried with exponential backoff up to
+    PIPELINE_JOB_MAX_ATTEMPTS.
+    """
+
+    def __init__(self, concurrency: Optional[Dict[str, int]] = None,
+                 poll_interval: float = PIPELINE_POLL_INTERVAL_SECONDS):
+        self.concurrency = concurrency or {
+            STAGE_ENRICHMENT: PIPELINE_ENRICHMENT_WORKERS,
+            STAGE_AI_DESCRIPTION: PIPELINE_AI_DESCRIPTION_WORKERS,
+            STAGE_VETTING: PIPELINE_VETTING_WORKERS,
+            STAGE_MATCH_CREATION: PIPELINE_MATCH_CREATION_WORKERS,
+        }
+        self.visibility_timeouts = {stage: PIPELINE_VISIBILITY_SECONDS for stage in STAGES}
+        self.visibility_timeouts[STAGE_ENRICHMENT] = PIPELINE_ENRICHMENT_VISIBILITY_SECONDS
+        self.poll_interval = poll_interval
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self.running = False
+        self._tasks: List[asyncio.Task] = []
+        self._wakeups: Dict[str, asyncio.Event] = {}
+        self._handlers: Dict[str, Callable[[Dict[str, Any]], Awaitable[Optional[str]]]] = {
+            STAGE_ENRICHMENT: self._run_enrichment,
+            STAGE_AI_DESCRIPTION: self._run_ai_description,
+            STAGE_VETTING: self._run_vetting,
+            STAGE_MATCH_CREATION: self._run_match_creation,
+        }
+        self._workflow = None
+        self._vetting_orchestrator = None
+
+    # --- Lifecycle ---
+
+    async def start(self):
+        """Start the worker loops of every stage on the running event loop."""
+        if self.running:
+            logger.warning("PipelineWorker is already running")
+            return
+        self.running = True
+        loop = asyncio.get_running_loop()
+        for stage in STAGES:
+            self._wakeups[stage] = asyncio.Event()
+            for slot in range(max(0, self.concurrency.get(stage, 0))):
+                self._tasks.append(loop.create_task(
+                    self._stage_loop(stage, slot), context=workload_context(WORKLOAD_BACKGROUND)
+                ))
+        logger.info(f"PipelineWorker {self.worker_id} started with {self.concurrency}")
+
+    async def stop(self):
+        """Stop the worker loops. Jobs cut short become visible again after their timeout."""
+        self.running = False
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        logger.info("PipelineWorker stopped")
+
+    def notify(self, stage: str) -> None:
+        """Wake this process's idle workers of a stage (after queueing work for it)."""
+        wakeup = self._wakeups.get(stage)
+        if wakeup is not None:
+            wakeup.set()
+
+    async def enqueue(self, stage: str, discovery_ids: List[int], pool: Optional[Any] = None) -> int:
+        """Queue a stage for discoveries and wake the local workers for it."""
+        pool = pool or await get_background_task_pool()
+        created = await job_queries.enqueue_jobs(stage, discovery_ids, PIPELINE_JOB_MAX_ATTEMPTS, pool=pool)
+        if created:
+            self.notify(stage)
+        return created
+
+    async def backfill(self, pool: Optional[Any] = None) -> Dict[str, int]:
+        """Queue discoveries waiting on a stage without a job (e.g. rows from before the queue existed)."""
+        pool = pool or await get_background_task_pool()
+        created = await job_queries.enqueue_ready_discoveries(PIPELINE_JOB_MAX_ATTEMPTS, pool=pool)
+        for stage, count in created.items():
+            if count:
+                self.notify(stage)
+        if any(created.values()):
+            logger.info(f"Pipeline backfill queued {created}")
+        return created
+
+    # --- Worker loop ---
+
+    async def _stage_loop(self, stage: str, slot: int):
+        wakeup = self._wakeups[stage]
+        while self.running:
+            try:
+                pool = await get_background_task_pool()
+                jobs = await job_queries.claim_jobs(
+                    stage, 1, self.visibility_timeouts[stage], self.worker_id, pool=pool
+                )
+                if not jobs:
+                    wakeup.clear()
+                    try:
+                        await asyncio.wait_for(wakeup.wait(), timeout=self.poll_interval)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+                for job in jobs:
+                    await self._run_job(job, pool)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error in {stage} worker {slot}: {e}", exc_info=True)
+                await asyncio.sleep(self.poll_interval)
+
+    async def _run_job(self, job: Dict[str, Any], pool: Any):
+        stage = job['stage']
+        job_id = job['job_id']
+        try:
+            with loader_scope():
+                next_stage = await self._handlers[stage](job)
+        except Exception as e:
+            logger.warning(f"{stage} job {job_id} for discovery {job['id']} failed "
+                           f"(attempt {job['attempts']}/{job['max_attempts']}): {e}")
+            status = await job_queries.fail_job(job_id, self.worker_id, str(e), PIPELINE_RETRY_DELAY_SECONDS, pool=pool)
+            if status == 'failed':
+                logger.error(f"{stage} job {job_id} for discovery {job['id']} gave up after {job['attempts']} attempts")
+            return
+
+        completed = await job_queries.complete_job(
+            job_id, self.worker_id, next_stage, PIPELINE_JOB_MAX_ATTEMPTS, pool=pool
+        )
+        if not completed:
+            logger.warning(f"{stage} job {job_id} finished after its visibility timeout; it was claimed again")
+        elif next_stage:
+            self.notify(next_stage)
+
+    # --- Stages ---
+
+    def _get_workflow(self):
+        if self._workflow is None:
+            from podcast_outreach.services.business_logic.enhanced_discovery_workflow import EnhancedDiscoveryWorkflow
+            self._workflow = EnhancedDiscoveryWorkflow()
+        return self._workflow
+
+    def _get_vetting_orchestrator(self):
+        if self._vetting_orchestrator is None:
+            from podcast_outreach.services.matches.enhanced_vetting_orchestrator import EnhancedVettingOrchestrator
+            self._vetting_orchestrator = EnhancedVettingOrchestrator()
+        return self._vetting_orchestrator
+
+    async def _run_enrichment(self, discovery: Dict[str, Any]) -> Optional[str]:
+        workflow = self._get_workflow()
+        if discovery['enrichment_status'] != 'completed':
+            result = await workflow._run_enhanced_enrichment_step(discovery)
+            if result["status"] == "error":
+                raise RuntimeError("; ".join(result["errors"]) or "Enrichment failed")
+            await workflow._verify_host_names(discovery['media_id'])
+        media = await media_queries.get_media_by_id_from_db(discovery['media_id'])
+        return STAGE_VETTING if media and media.get('ai_description') else STAGE_AI_DESCRIPTION
+
+    async def _run_ai_description(self, discovery: Dict[str, Any]) -> Optional[str]:
+        if discovery.get('ai_description'):
+            return STAGE_VETTING
+        media_id = discovery['media_id']
+        ai_description = await self._get_workflow()._generate_podcast_ai_description(media_id)
+        if not ai_description:
+            raise RuntimeError(f"No AI description generated for media {media_id}")
+        await media_queries.update_media_ai_description(media_id, ai_description)
+        logger.info(f"Generated AI description for media {media_id}")
+        return STAGE_VETTING
+
+    async def _run_vetting(self, discovery: Dict[str, Any]) -> Optional[str]:
+        orchestrator = self._get_vetting_orchestrator()
+        if discovery['vetting_status'] == 'completed':
+            vetting_score = discovery.get('vetting_score') or 0
+        else:
+            if not discovery.get('ai_description'):
+                return STAGE_AI_DESCRIPTION
+            vetting_results = await orchestrator.vet_discovery(discovery)
+            if not vetting_results:
+                raise RuntimeError("Vetting produced no results")
+            vetting_score = vetting_results['vetting_score']
+        if vetting_score >= orchestrator.MATCH_SCORE_THRESHOLD and not discovery.get('match_created'):
+            return STAGE_MATCH_CREATION
+        return None
+
+    async def _run_match_creation(self, discovery: Dict[str, Any]) -> Optional[str]:
+        if discovery.get('match_created'):
+            return None
+        # The discovery row carries the stored vetting_score / vetting_reasoning
+        created = await self._get_vetting_orchestrator()._create_match_suggestion(discovery, discovery)
+        if not created:
+            raise RuntimeError("Match suggestion was not created")
+        logger.info(f"Match suggestion created for discovery {discovery['id']}")
+        return None
+
+pipeline_worker = PipelineWorker()
@@ -0,0 +1,149 @@
+# podcast_outreach/services/tasks/process_pool.py
+
+import asyncio
+import logging
+import multiprocessing
+import threading
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from podcast_outreach.config import (
+    FFMPEG_PATH,
+    FFPROBE_PATH,
+    PROCESS_POOL_WORKERS,
+    PROCESS_POOL_AUDIO_LIMIT,
+    PROCESS_POOL_PARSE_LIMIT
+)
+from podcast_outreach.utils import cpu_tasks
+
+logger = logging.getLogger(__name__)
+
+# Task types, each with its own limit on how many run in the pool at once
+TASK_AUDIO = "audio"  # decoding, splitting and encoding audio files
+TASK_PARSE = "parse"  # RSS/HTML parsing and embedding comparison
+
+class ProcessPoolService:
+    """
+    Shared, bounded process pool for CPU-bound work that would otherwise hold
+    the GIL on the event loop or in its default thread pool: RSS and HTML
+    parsing, audio decoding and encoding, and embedding comparison.
+
+    The pool starts `max_workers` spawned processes on first use, or up front
+    with warm_up(), and each imports bs4/pydub once in its initializer. Work is
+    submitted through the typed helpers below; each task type has its own
+    limit so, e.g., long audio decodes cannot take every worker while RSS
+    feeds are waiting. Limits are enforced per event loop, as tasks run by
+    TaskManager in threads have loops of their own. With max_workers=0 the
+    same work runs in threads instead.
+    """
+
+    def __init__(self, max_workers: int = PROCESS_POOL_WORKERS,
+                 limits: Optional[Dict[str, int]] = None):
+        self.max_workers = max_workers
+        self.limits = limits or {TASK_AUDIO: PROCESS_POOL_AUDIO_LIMIT, TASK_PARSE: PROCESS_POOL_PARSE_LIMIT}
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=cpu_tasks.warm_worker,
+                    initargs=(FFMPEG_PATH, FFPROBE_PATH),
+                )
+                logger.info(f"Process pool created with {self.max_workers} workers")
+            return self._executor
+
+    def _reset_executor(self, broken: ProcessPoolExecutor):
+        with self._lock:
+            if self._executor is broken:
+                self._executor = None
+        broken.shutdown(wait=False, cancel_futures=True)
+
+    def _semaphore(self, task_type: str) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            semaphores = self._semaphores.setdefault(loop, {})
+            if task_type not in semaphores:
+                limit = self.limits.get(task_type) or self.max_workers or 1
+                semaphores[task_type] = asyncio.Semaphore(limit)
+            return semaphores[task_type]
+
+    async def warm_up(self):
+        """Start every pool worker now, so the first tasks do not wait for processes to spawn."""
+        if self.max_workers <= 0:
+            return
+        executor = self._get_executor()
+        loop = asyncio.get_running_loop()
+        pids = await asyncio.gather(
+            *(loop.run_in_executor(executor, cpu_tasks.ping) for _ in range(self.max_workers)),
+            return_exceptions=True
+        )
+        failed = [p for p in pids if isinstance(p, BaseException)]
+        if failed:
+            logger.error(f"Process pool warm-up failed: {failed[0]}")
+        else:
+            logger.info(f"Process pool warmed up ({len(set(pids))} workers started)")
+
+    async def run(self, task_type: str, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        Runs fn(*args) in the pool, once a slot for task_type is free.
+        fn must be a top-level function and args and result picklable.
+        If a worker dies (e.g. killed for memory), the pool is replaced and
+        BrokenProcessPool is raised for the tasks it was running.
+        """
+        async with self._semaphore(task_type):
+            if self.max_workers <= 0:
+                return await asyncio.to_thread(fn, *args)
+            executor = self._get_executor()
+            try:
+                return await asyncio.get_running_loop().run_in_executor(executor, fn, *args)
+            except BrokenProcessPool:
+                logger.error(f"Process pool broke while running {fn.__name__}; starting a new one")
+                self._reset_executor(executor)
+                raise
+
+    def shutdown(self, wait: bool = True):
+        """Stop the pool workers; the pool is recreated if used again."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+            logger.info("Process pool shut down")
+
+    # --- Typed helpers ---
+
+    async def parse_rss_items(self, content: str, max_items: int) -> Tuple[int, List[Dict[str, Any]]]:
+        """See cpu_tasks.parse_rss_items."""
+        return await self.run(TASK_PARSE, cpu_tasks.parse_rss_items, content, max_items)
+
+    async def strip_html(self, text: Optional[str]) -> Optional[str]:
+        """Plain text of an HTML fragment."""
+        if not text:
+            return text
+        return await self.run(TASK_PARSE, cpu_tasks.strip_html, text)
+
+    async def best_cosine_match(self, target: Any, candidates: List[Any]) -> Tuple[Optional[int], float]:
+        """See cpu_tasks.best_cosine_match."""
+        return await self.run(TASK_PARSE, cpu_tasks.best_cosine_match, target, candidates)
+
+    async def audio_duration_ms(self, file_path: str) -> int:
+        """Duration of an audio file in milliseconds."""
+        return await self.run(TASK_AUDIO, cpu_tasks.audio_duration_ms, file_path)
+
+    async def split_audio(self, file_path: str, chunk_length_ms: int, overlap_ms: int, out_dir: str) -> List[str]:
+        """See cpu_tasks.split_audio."""
+        return await self.run(TASK_AUDIO, cpu_tasks.split_audio, file_path, chunk_length_ms, overlap_ms, out_dir)
+
+    async def encode_audio_file(self, file_path: str, mime_type: str, convert_to_mp3: bool = False) -> Dict[str, str]:
+        """See cpu_tasks.encode_audio_file."""
+        return await self.run(TASK_AUDIO, cpu_tasks.encode_audio_file, file_path, mime_type, convert_to_mp3)
+
+process_pool = ProcessPoolService()
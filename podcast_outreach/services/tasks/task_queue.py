@@ -0,0 +1,141 @@
+# podcast_outreach/services/tasks/task_queue.py
+
+import asyncio
+import logging
+from typing import Any, Dict, Optional
+
+import asyncpg
+
+from podcast_outreach.config import (
+    TASK_QUEUE_CONCURRENCY,
+    TASK_QUEUE_POLL_INTERVAL_SECONDS,
+    TASK_QUEUE_STALE_SECONDS
+)
+from podcast_outreach.database.connection import (
+    get_background_task_pool,
+    create_dedicated_connection,
+    workload_context,
+    WORKLOAD_BACKGROUND
+)
+from podcast_outreach.database.queries import background_tasks as background_task_queries
+from podcast_outreach.services.tasks.manager import TaskManager, task_manager, TASK_QUEUE_CHANNEL
+
+logger = logging.getLogger(__name__)
+
+class TaskQueueWorker:
+    """
+    Runs the tasks that API-only processes (PROCESS_ROLE=web) queue in
+    background_tasks.
+
+    Up to `concurrency` tasks run at once, claimed with FOR UPDATE SKIP LOCKED
+    so any number of worker processes can share the queue. A queued task is
+    announced with NOTIFY and starts at once; the queue is also polled every
+    poll_interval in case a notification was missed. On every poll the
+    TaskManager's running tasks (queued or started here) send a heartbeat with
+    their progress and pick up stop requests, which are also announced on the
+    channel. Tasks whose worker stopped sending heartbeats are marked failed
+    rather than run again, as they may have had side effects.
+    """
+
+    def __init__(self, task_manager: TaskManager, concurrency: int = TASK_QUEUE_CONCURRENCY,
+                 poll_interval: float = TASK_QUEUE_POLL_INTERVAL_SECONDS):
+        self.task_manager = task_manager
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.worker_id = task_manager.instance_id
+        self.running = False
+        self._loop_task: Optional[asyncio.Task] = None
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._wakeup = asyncio.Event()
+        self._listen_conn: Optional[asyncpg.Connection] = None
+
+    async def start(self):
+        """Start claiming queued tasks on the running event loop."""
+        if self.running:
+            logger.warning("TaskQueueWorker is already running")
+            return
+        self.running = True
+        try:
+            self._listen_conn = await create_dedicated_connection()
+            await self._listen_conn.add_listener(TASK_QUEUE_CHANNEL, self._on_notification)
+        except Exception as e:
+            logger.warning(f"TaskQueueWorker could not listen for queued tasks, polling only: {e}")
+        self._loop_task = asyncio.get_running_loop().create_task(
+            self._claim_loop(), context=workload_context(WORKLOAD_BACKGROUND)
+        )
+        logger.info(f"TaskQueueWorker {self.worker_id} started with concurrency {self.concurrency}")
+
+    async def stop(self):
+        """Stop claiming tasks and cancel the ones running here; they are recorded as cancelled."""
+        self.running = False
+        if self._loop_task:
+            self._loop_task.cancel()
+            await asyncio.gather(self._loop_task, return_exceptions=True)
+            self._loop_task = None
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        conn, self._listen_conn = self._listen_conn, None
+        if conn is not None and not conn.is_closed():
+            try:
+                await conn.close()
+            except Exception as e:
+                logger.warning(f"Error closing task queue listener connection: {e}")
+        logger.info("TaskQueueWorker stopped")
+
+    def _on_notification(self, connection, pid, channel, payload):
+        """asyncpg listener: a task was queued, or a running task was asked to stop"""
+        self._wakeup.set()
+
+    async def _claim_loop(self):
+        while self.running:
+            self._wakeup.clear()
+            try:
+                pool = await get_background_task_pool()
+                await self.task_manager.heartbeat(pool=pool)
+                stale = await background_task_queries.fail_stale_tasks(TASK_QUEUE_STALE_SECONDS, pool=pool)
+                if stale:
+                    logger.warning(f"Marked {stale} background tasks of unresponsive workers as failed")
+                free = self.concurrency - len(self._tasks)
+                if free > 0:
+                    for task in await background_task_queries.claim_tasks(self.worker_id, free, pool=pool):
+                        self._start(task)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error in task queue worker: {e}", exc_info=True)
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def _start(self, task: Dict[str, Any]):
+        task_id = task['task_id']
+        runner = asyncio.create_task(self._run(task))
+        self._tasks[task_id] = runner
+
+        def _done(_):
+            self._tasks.pop(task_id, None)
+            # A slot is free; claim the next queued task without waiting for the poll
+            self._wakeup.set()
+
+        runner.add_done_callback(_done)
+
+    async def _run(self, task: Dict[str, Any]):
+        task_id = task['task_id']
+        logger.info(f"Running queued task {task_id} ({task['method']}) for action '{task['action']}'")
+        try:
+            # TaskManager records the outcome of the tasks it runs
+            await self.task_manager.execute(task_id, task['action'], task['method'], task['params'])
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # It could not start (e.g. unknown method or parameters)
+            logger.error(f"Queued task {task_id} could not be started: {e}", exc_info=True)
+            try:
+                await background_task_queries.finish_task(task_id, "failed", str(e))
+            except Exception as e:
+                logger.error(f"Could not record outcome of queued task {task_id}: {e}")
+
+task_queue_worker = TaskQueueWorker(task_manager)
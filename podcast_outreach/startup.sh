@@ -19,10 +19,17 @@ export FFPROBE_CUSTOM_PATH="${FFPROBE_CUSTOM_PATH:-}"
 echo "Configuration:"
 echo "- PORT: ${PORT:-8000}"
 echo "- IS_PRODUCTION: ${IS_PRODUCTION:-false}"
+echo "- PROCESS_ROLE: ${PROCESS_ROLE:-all}"
 echo "- FRONTEND_ORIGIN: ${FRONTEND_ORIGIN}"
 echo "- Google credentials: $([ -f /tmp/service-account-key.json ] && echo 'Configured' || echo 'Not configured')"
 echo "- Database: $([ ! -z "$DATABASE_URL" ] && echo 'Configured' || echo 'Not configured')"
 
+# Worker replicas run the scheduler, pipelines and queued tasks without serving HTTP
+if [ "${PROCESS_ROLE:-all}" = "worker" ]; then
+    echo "Starting background worker..."
+    exec python -m podcast_outreach.worker
+fi
+
 # Start the application
 echo "Starting Uvicorn..."
 exec uvicorn podcast_outreach.main:app \
@@ -13,6 +13,7 @@ from podcast_outreach.database.connection import get_db_pool
 from podcast_outreach.database.queries import match_suggestions as match_queries
 from podcast_outreach.database.queries import campaigns as campaign_queries
 from podcast_outreach.database.queries import episodes as episode_queries
+from podcast_outreach.database.queries import projections
 
 # Set up logging
 logging.basicConfig(
@@ -42,7 +43,7 @@ async def find_best_episode_for_match(campaign_id: str, media_id: int) -> tuple[
     """Find the best matching episode for a campaign and media pair."""
     try:
         # Get campaign embedding
-        campaign = await campaign_queries.get_campaign_by_id(campaign_id)
+        campaign = await campaign_queries.get_campaign_by_id(campaign_id, profile=projections.WITH_EMBEDDING)
         if not campaign or not campaign.get('embedding'):
             logger.warning(f"Campaign {campaign_id} has no embedding")
             return None, 0.0
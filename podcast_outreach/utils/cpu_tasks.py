@@ -0,0 +1,225 @@
+# podcast_outreach/utils/cpu_tasks.py
+
+"""
+CPU-bound work run in the process pool (services/tasks/process_pool.py).
+
+Everything here runs in a pool worker process: functions are top-level so
+they pickle, take and return plain data (paths, strings, lists, dicts), and
+import bs4/pydub when called, so importing this module stays cheap for API
+processes. Call them through process_pool rather than directly.
+"""
+
+import base64
+import json
+import os
+import re
+import tempfile
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+_NUMBER_RE = re.compile(r'-?\d+\.?\d*(?:[eE][+-]?\d+)?')
+
+
+def warm_worker(ffmpeg_path: Optional[str] = None, ffprobe_path: Optional[str] = None) -> None:
+    """Pool worker initializer: imports the parsers and points pydub at the configured ffmpeg/ffprobe."""
+    import bs4  # noqa: F401
+    import pydub
+    import pydub.utils
+
+    if ffmpeg_path and os.path.exists(ffmpeg_path):
+        pydub.AudioSegment.converter = ffmpeg_path
+    if ffprobe_path and os.path.exists(ffprobe_path):
+        pydub.utils.get_prober_name = lambda: ffprobe_path
+
+
+def ping() -> int:
+    """No-op used to start pool workers ahead of the first real task."""
+    return os.getpid()
+
+
+# --- RSS / HTML ---
+
+def strip_html(text: Optional[str]) -> Optional[str]:
+    """Plain text of an HTML fragment, one block per line."""
+    if not text:
+        return text
+    from bs4 import BeautifulSoup
+    return BeautifulSoup(text, 'html.parser').get_text(separator='\n', strip=True)
+
+
+def parse_rss_items(content: str, max_items: int) -> Tuple[int, List[Dict[str, Any]]]:
+    """
+    Parses the first max_items <item>s of an RSS document.
+
+    Returns:
+        (number of items in the feed, items). Each item has title, pub_date
+        (the raw pubDate string; dates are parsed by the caller), audio_url
+        (enclosure url, or a guid that is an audio url), guid and summary
+        (description with HTML stripped).
+    """
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(content, 'xml')
+    items = soup.find_all('item')
+    parsed = []
+    for item in items[:max_items]:
+        audio_url = None
+        enclosure = item.find('enclosure')
+        guid = item.findtext('guid')
+        if enclosure and enclosure.get('url'):
+            audio_url = enclosure['url']
+        elif guid and guid.startswith(('http://', 'https://')):
+            if any(guid.lower().endswith(ext) for ext in ['.mp3', '.m4a', '.ogg', '.wav', '.aac']):
+                audio_url = guid
+
+        description = item.findtext('description') or item.findtext('content:encoded') or item.findtext('itunes:summary')
+        parsed.append({
+            "title": item.findtext('title'),
+            "pub_date": item.findtext('pubDate'),
+            "audio_url": audio_url,
+            "guid": guid,
+            "summary": strip_html(description),
+        })
+    return len(items), parsed
+
+
+# --- Audio ---
+
+def audio_duration_ms(file_path: str) -> int:
+    """Duration of an audio file, from ffprobe metadata; decodes the file only if that has none."""
+    from pydub import AudioSegment
+    from pydub.utils import mediainfo
+
+    try:
+        duration = float(mediainfo(file_path).get('duration') or 0)
+    except Exception:
+        duration = 0
+    if duration > 0:
+        return int(duration * 1000)
+    return len(AudioSegment.from_file(file_path))
+
+
+def split_audio(file_path: str, chunk_length_ms: int, overlap_ms: int, out_dir: str) -> List[str]:
+    """
+    Decodes an audio file once and exports it as mp3 chunks of chunk_length_ms,
+    each starting overlap_ms before the previous one ends.
+
+    Returns:
+        Paths of the chunks in out_dir, in order.
+    """
+    from pydub import AudioSegment
+
+    audio = AudioSegment.from_file(file_path)
+    total_chunks = -(-len(audio) // chunk_length_ms)  # Ceiling division
+    paths = []
+    for i in range(total_chunks):
+        start_ms = max(i * chunk_length_ms - overlap_ms, 0)
+        end_ms = min((i + 1) * chunk_length_ms, len(audio))
+        path = os.path.join(out_dir, f"chunk_{i:03d}.mp3")
+        audio[start_ms:end_ms].export(path, format="mp3")
+        paths.append(path)
+    return paths
+
+
+def encode_audio_file(file_path: str, mime_type: str, convert_to_mp3: bool = False) -> Dict[str, str]:
+    """
+    Base64-encodes an audio file as a Gemini inline data part. With
+    convert_to_mp3 the file is re-encoded to mp3 first (e.g. mp4 containers).
+    """
+    if not convert_to_mp3:
+        with open(file_path, 'rb') as f:
+            return {"mime_type": mime_type, "data": base64.b64encode(f.read()).decode('utf-8')}
+
+    from pydub import AudioSegment
+
+    fd, mp3_path = tempfile.mkstemp(suffix=".mp3")
+    os.close(fd)
+    try:
+        AudioSegment.from_file(file_path).export(mp3_path, format="mp3")
+        with open(mp3_path, 'rb') as f:
+            return {"mime_type": "audio/mp3", "data": base64.b64encode(f.read()).decode('utf-8')}
+    finally:
+        os.remove(mp3_path)
+
+
+# --- Embeddings ---
+
+def convert_embedding_to_list(embedding) -> Optional[List[float]]:
+    """Convert various embedding formats to a list of floats."""
+    if embedding is None:
+        return None
+
+    # If it's already a list of numbers, return as is
+    if isinstance(embedding, list) and all(isinstance(x, (int, float)) for x in embedding):
+        return [float(x) for x in embedding]
+
+    # If it's a numpy array, convert to list
+    if isinstance(embedding, np.ndarray):
+        return embedding.tolist()
+
+    # If it's a string representation from PostgreSQL
+    if isinstance(embedding, str):
+        # Handle numpy string representation like np.str_('[-0.009, 0.015, ...]')
+        if embedding.startswith("np.str_('") and embedding.endswith("')"):
+            clean_embedding = embedding[9:-2]  # Remove np.str_(' and ')
+            try:
+                # Parse as JSON array
+                return json.loads(clean_embedding)
+            except json.JSONDecodeError:
+                # Fall back to regex parsing
+                numbers = _NUMBER_RE.findall(clean_embedding)
+                return [float(x) for x in numbers] if numbers else None
+
+        # Handle direct JSON array string
+        if embedding.startswith('[') and embedding.endswith(']'):
+            try:
+                return json.loads(embedding)
+            except json.JSONDecodeError:
+                # Fall back to regex parsing
+                numbers = _NUMBER_RE.findall(embedding)
+                return [float(x) for x in numbers] if numbers else None
+
+        # Handle comma-separated values
+        if ',' in embedding:
+            try:
+                return [float(x.strip()) for x in embedding.split(',')]
+            except ValueError:
+                return None
+
+        # If all else fails, try to extract numbers with regex
+        numbers = _NUMBER_RE.findall(embedding)
+        return [float(x) for x in numbers] if numbers else None
+
+    return None
+
+
+def best_cosine_match(target: Any, candidates: List[Any]) -> Tuple[Optional[int], float]:
+    """
+    Index and cosine similarity of the candidate embedding closest to target.
+    Embeddings may be in any format convert_embedding_to_list accepts. A
+    candidate that cannot be compared (unparsable, all zeros, or of another
+    length than target) scores 0.0, as does every candidate when target cannot
+    be; ties go to the earliest candidate.
+
+    Returns:
+        (index, similarity), or (None, -1.0) if there are no candidates.
+    """
+    target_list = convert_embedding_to_list(target)
+    target_vec = np.asarray(target_list, dtype=np.float64) if target_list else None
+    target_norm = np.linalg.norm(target_vec) if target_vec is not None else 0.0
+
+    best_index, best_score = None, -1.0
+    for i, candidate in enumerate(candidates):
+        score = 0.0
+        candidate_list = convert_embedding_to_list(candidate) if target_norm else None
+        if candidate_list and len(candidate_list) == len(target_list):
+            vec = np.asarray(candidate_list, dtype=np.float64)
+            norm = np.linalg.norm(vec)
+            if norm != 0:
+                score = float(np.dot(target_vec, vec) / (target_norm * norm))
+                if np.isnan(score):
+                    score = 0.0
+        if score > best_score:
+            best_index, best_score = i, score
+    return best_index, best_score
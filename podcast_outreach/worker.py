@@ -0,0 +1,123 @@
+# podcast_outreach/worker.py
+
+"""
+Background worker process: python -m podcast_outreach.worker
+
+Runs the task scheduler, the pipeline job workers, the event consumers and
+the tasks queued by API processes, without serving HTTP. Deploy it next to
+API processes started with PROCESS_ROLE=web, so pipeline runs (transcription,
+RSS parsing, audio decoding, LLM calls) no longer share an event loop and GIL
+with request handling, and scale each independently. Several worker
+processes may run at once: one leads the scheduler and all share the queues.
+
+Process pool workers are spawned, and spawned processes re-import this module
+as __mp_main__. Only the standard library is imported at module level: the
+application is imported, and logging set up, when the worker starts.
+"""
+
+import asyncio
+import signal
+
+from podcast_outreach.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+async def start_worker():
+    """Start everything a worker process runs."""
+    from podcast_outreach.config import NOTIFICATION_PG_BRIDGE_ENABLED, PIPELINE_JOB_QUEUE_ENABLED
+    from podcast_outreach.database.connection import init_db_pool
+    from podcast_outreach.services.tasks.manager import task_manager
+    from podcast_outreach.services.tasks.task_queue import task_queue_worker
+    from podcast_outreach.services.tasks.process_pool import process_pool
+    from podcast_outreach.services.scheduler.task_scheduler import initialize_scheduler
+    from podcast_outreach.services.events.event_bus import initialize_event_handlers
+
+    await init_db_pool()
+    await task_manager.initialize()
+
+    from podcast_outreach.services.ai.token_counter import token_counter
+    token_counter.warm_up()
+    from podcast_outreach.services.ai.template_registry import template_registry
+    template_registry.load_all()
+
+    initialize_event_handlers()
+    await process_pool.warm_up()
+
+    # Notifications raised here reach the users connected to the API processes
+    from podcast_outreach.services.events.notification_service import get_notification_service
+    notification_service = get_notification_service()
+    if NOTIFICATION_PG_BRIDGE_ENABLED:
+        await notification_service.start_bridge()
+    else:
+        logger.warning("NOTIFICATION_PG_BRIDGE_ENABLED is false: notifications raised by this worker "
+                       "will not reach clients connected to API processes")
+
+    scheduler = initialize_scheduler(task_manager)
+    await scheduler.start()
+
+    if PIPELINE_JOB_QUEUE_ENABLED:
+        from podcast_outreach.services.tasks.pipeline_worker import pipeline_worker
+        await pipeline_worker.start()
+
+    await task_queue_worker.start()
+    logger.info("Background worker started.")
+
+async def stop_worker():
+    """Stop in reverse order; work cut short is recorded or becomes visible again for other workers."""
+    from podcast_outreach.config import PIPELINE_JOB_QUEUE_ENABLED
+    from podcast_outreach.database.connection import close_db_pool, close_analytics_pool
+    from podcast_outreach.services.tasks.manager import task_manager
+    from podcast_outreach.services.tasks.task_queue import task_queue_worker
+    from podcast_outreach.services.tasks.process_pool import process_pool
+    from podcast_outreach.services.scheduler.task_scheduler import get_scheduler
+
+    try:
+        await task_queue_worker.stop()
+
+        scheduler = get_scheduler()
+        if scheduler:
+            await scheduler.stop()
+
+        if PIPELINE_JOB_QUEUE_ENABLED:
+            from podcast_outreach.services.tasks.pipeline_worker import pipeline_worker
+            await pipeline_worker.stop()
+
+        from podcast_outreach.services.events.notification_service import get_notification_service
+        await get_notification_service().stop_bridge()
+
+        await task_manager.cleanup()
+        await asyncio.to_thread(process_pool.shutdown)
+        await close_db_pool()
+        await close_analytics_pool()
+        logger.info("Background worker stopped.")
+    except Exception as e:
+        logger.error(f"Error during worker shutdown: {e}", exc_info=True)
+
+async def main():
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop_event.set)
+        except (NotImplementedError, RuntimeError):
+            # Windows: KeyboardInterrupt ends asyncio.run instead
+            pass
+
+    await start_worker()
+    try:
+        await stop_event.wait()
+    finally:
+        await stop_worker()
+
+if __name__ == "__main__":
+    # IMPORTANT: Apply Windows optimizations FIRST, before the application is imported
+    from podcast_outreach.windows_socket_config import apply_windows_optimizations
+    apply_windows_optimizations()
+
+    from podcast_outreach.logging_config import setup_logging
+    setup_logging()
+
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass